@@ -560,6 +560,11 @@ build_provenance = parse_json_env("BUILD_PROVENANCE_JSON")
 if isinstance(build_provenance, dict):
     data["provenance"] = build_provenance
 
+for data_key, env_key in (("internal_timings_ms", "INTERNAL_TIMINGS_MS_JSON"), ("internal_timings_ms_stdev", "INTERNAL_TIMINGS_MS_STDEV_JSON")):
+    internal_timings = parse_json_env(env_key)
+    if isinstance(internal_timings, dict) and internal_timings:
+        data[data_key] = internal_timings
+
 statistical_tests = parse_json_env("STATISTICAL_TESTS_JSON")
 if isinstance(statistical_tests, dict):
     data["statistical_tests"] = statistical_tests
@@ -744,7 +749,7 @@ if not isinstance(dynamic_match_counts, dict) and algorithm == "subgraph":
             },
         }
 if algorithm == "subgraph" and env.get("SUBGRAPH_PHASE", "").strip().lower() == "glasgow":
-    for key in ("timings_ms", "timings_ms_stdev", "memory_kb", "memory_kb_stdev"):
+    for key in ("timings_ms", "timings_ms_stdev", "internal_timings_ms", "internal_timings_ms_stdev", "memory_kb", "memory_kb_stdev"):
         if key in data and isinstance(data[key], dict):
             data[key] = {k: v for k, v in data[key].items() if not k.startswith("vf3_")}
     if "match_counts" in data and isinstance(data["match_counts"], dict):
@@ -771,7 +776,7 @@ if algorithm == "subgraph" and env.get("SUBGRAPH_PHASE", "").strip().lower() ==
                 data["output"] = previous.get("output")
             if previous.get("visualization_error") and "visualization" not in data and "visualization_error" not in data:
                 data["visualization_error"] = previous.get("visualization_error")
-            for key in ("timings_ms", "timings_ms_stdev", "memory_kb", "memory_kb_stdev", "match_counts"):
+            for key in ("timings_ms", "timings_ms_stdev", "internal_timings_ms", "internal_timings_ms_stdev", "memory_kb", "memory_kb_stdev", "match_counts"):
                 if key in previous:
                     merged = dict(previous.get(key, {}))
                     merged.update(data.get(key, {}))
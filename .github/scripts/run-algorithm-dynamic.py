@@ -9,7 +9,6 @@
 from __future__ import annotations
 
 import json
-import math
 import os
 import random
 import re
@@ -35,6 +34,9 @@ if str(REPO_ROOT) not in sys.path:
 
 from utilities import generate_graphs as generator_mod
 from utilities.benchmark_provenance import collect_runtime_provenance
+from utilities.benchmark_statistics import summarize_runtime_comparisons
+from utilities.benchmark_validation import parse_internal_timings
+from utilities.process_supervisor import get_process_supervisor
 
 
 def load_solver_discovery_module():
@@ -76,13 +78,6 @@ def parse_float_env(name: str, default: float, minimum: float | None = None, max
     return value
 
 
-def parse_last_line_paths(raw: str) -> list[str]:
-    lines = [line.strip() for line in str(raw or "").splitlines() if line.strip()]
-    if not lines:
-        return []
-    return [part.strip() for part in lines[-1].split(",") if part.strip()]
-
-
 def median_and_stdev(samples: list[float]) -> tuple[float | None, float]:
     if not samples:
         return None, 0.0
@@ -91,278 +86,6 @@ def median_and_stdev(samples: list[float]) -> tuple[float | None, float]:
     return float(statistics.median(samples)), float(statistics.stdev(samples))
 
 
-def _simpson_integral(func, a: float, b: float) -> float:
-    c = (a + b) * 0.5
-    h = b - a
-    return (h / 6.0) * (func(a) + (4.0 * func(c)) + func(b))
-
-
-def _adaptive_simpson(func, a: float, b: float, eps: float, whole: float, depth: int) -> float:
-    c = (a + b) * 0.5
-    left = _simpson_integral(func, a, c)
-    right = _simpson_integral(func, c, b)
-    delta = left + right - whole
-    if depth <= 0 or abs(delta) <= 15.0 * eps:
-        return left + right + (delta / 15.0)
-    return (
-        _adaptive_simpson(func, a, c, eps * 0.5, left, depth - 1)
-        + _adaptive_simpson(func, c, b, eps * 0.5, right, depth - 1)
-    )
-
-
-def student_t_two_sided_p_value(t_stat: float, degrees_of_freedom: int) -> float | None:
-    if not math.isfinite(t_stat):
-        return None
-    df = int(degrees_of_freedom)
-    if df <= 0:
-        return None
-    x = abs(float(t_stat))
-    if x <= 0.0:
-        return 1.0
-    if x >= 50.0:
-        return 0.0
-    if df >= 200:
-        tail = 0.5 * math.erfc(x / math.sqrt(2.0))
-        return max(0.0, min(1.0, 2.0 * tail))
-
-    log_c = math.lgamma((df + 1.0) * 0.5) - math.lgamma(df * 0.5) - 0.5 * math.log(df * math.pi)
-    c = math.exp(log_c)
-
-    def pdf(val: float) -> float:
-        return c * ((1.0 + ((val * val) / float(df))) ** (-(df + 1.0) * 0.5))
-
-    whole = _simpson_integral(pdf, 0.0, x)
-    area_0_to_x = _adaptive_simpson(pdf, 0.0, x, 1e-8, whole, depth=20)
-    cdf = max(0.0, min(1.0, 0.5 + area_0_to_x))
-    return max(0.0, min(1.0, 2.0 * (1.0 - cdf)))
-
-
-def student_t_critical_two_sided(alpha: float, degrees_of_freedom: int) -> float | None:
-    df = int(degrees_of_freedom)
-    if df <= 0:
-        return None
-    target = float(alpha)
-    if not math.isfinite(target) or target <= 0.0 or target >= 1.0:
-        return None
-    lo = 0.0
-    hi = 1.0
-    p_hi = student_t_two_sided_p_value(hi, df)
-    guard = 0
-    while (p_hi is None or p_hi > target) and hi < 1_000_000.0:
-        lo = hi
-        hi *= 2.0
-        p_hi = student_t_two_sided_p_value(hi, df)
-        guard += 1
-        if guard > 80:
-            break
-    if p_hi is None:
-        return None
-    for _ in range(64):
-        mid = (lo + hi) * 0.5
-        p_mid = student_t_two_sided_p_value(mid, df)
-        if p_mid is None:
-            return None
-        if p_mid > target:
-            lo = mid
-        else:
-            hi = mid
-    return hi
-
-
-def normal_two_sided_p_value_from_z(z_score: float) -> float | None:
-    if not math.isfinite(z_score):
-        return None
-    tail = 0.5 * math.erfc(abs(float(z_score)) / math.sqrt(2.0))
-    return max(0.0, min(1.0, 2.0 * tail))
-
-
-def cliffs_delta(left: list[float], right: list[float]) -> float | None:
-    a = [float(v) for v in left if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    b = [float(v) for v in right if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    if not a or not b:
-        return None
-    greater = 0
-    less = 0
-    for x in a:
-        for y in b:
-            if x > y:
-                greater += 1
-            elif x < y:
-                less += 1
-    denom = len(a) * len(b)
-    if denom <= 0:
-        return None
-    return float(greater - less) / float(denom)
-
-
-def mann_whitney_u_test(left: list[float], right: list[float]) -> dict:
-    x = [float(v) for v in left if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    y = [float(v) for v in right if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    nx = len(x)
-    ny = len(y)
-    if nx == 0 or ny == 0:
-        return {
-            "u_stat": None,
-            "u_stat_alt": None,
-            "z_score": None,
-            "p_value_two_sided": None,
-        }
-
-    combined = [(val, 0) for val in x] + [(val, 1) for val in y]
-    combined.sort(key=lambda item: item[0])
-    rank_sum_x = 0.0
-    tie_sizes: list[int] = []
-    idx = 0
-    while idx < len(combined):
-        j = idx + 1
-        while j < len(combined) and combined[j][0] == combined[idx][0]:
-            j += 1
-        avg_rank = (float(idx + 1) + float(j)) * 0.5
-        block = combined[idx:j]
-        tie_sizes.append(len(block))
-        rank_sum_x += avg_rank * float(sum(1 for _value, grp in block if grp == 0))
-        idx = j
-
-    u_x = rank_sum_x - (float(nx) * float(nx + 1) * 0.5)
-    u_y = float(nx * ny) - u_x
-    u_stat = min(u_x, u_y)
-    mean_u = float(nx * ny) * 0.5
-
-    n_total = nx + ny
-    tie_term = sum(float(t * t * t - t) for t in tie_sizes)
-    denom = float(n_total * n_total * n_total - n_total)
-    tie_correction = 1.0 - (tie_term / denom) if denom > 0.0 else 1.0
-    sigma_sq = float(nx * ny * (n_total + 1)) / 12.0
-    sigma_sq *= max(0.0, tie_correction)
-
-    if sigma_sq <= 0.0:
-        if abs(u_stat - mean_u) <= 1e-12:
-            z_score = 0.0
-            p_value = 1.0
-        else:
-            z_score = math.copysign(float("inf"), u_stat - mean_u)
-            p_value = 0.0
-    else:
-        sigma = math.sqrt(sigma_sq)
-        z_score = (u_stat - mean_u) / sigma
-        p_value = normal_two_sided_p_value_from_z(z_score)
-
-    return {
-        "u_stat": float(u_stat),
-        "u_stat_alt": float(max(u_x, u_y)),
-        "z_score": None if z_score is None else float(z_score),
-        "p_value_two_sided": None if p_value is None else float(p_value),
-    }
-
-
-def summarize_runtime_comparison(
-    *,
-    variant_samples_ms: list[float],
-    baseline_samples_ms: list[float],
-    alpha: float = 0.05,
-) -> dict:
-    variant = [float(v) for v in variant_samples_ms if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    baseline = [float(v) for v in baseline_samples_ms if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    pair_count = min(len(variant), len(baseline))
-    if pair_count <= 0:
-        return {
-            "n": 0,
-            "mean_delta_ms": None,
-            "median_delta_ms": None,
-            "stdev_delta_ms": None,
-            "delta_ci_95_ms": {"low": None, "high": None},
-            "paired_t_test": {"t_stat": None, "degrees_of_freedom": 0, "p_value_two_sided": None},
-            "mann_whitney_u": mann_whitney_u_test(variant, baseline),
-            "effect_sizes": {
-                "cohen_d": None,
-                "hedges_g": None,
-                "cliffs_delta": cliffs_delta(variant, baseline),
-            },
-            "direction": "insufficient_data",
-            "significant_at_alpha": None,
-            "alpha": float(alpha),
-        }
-
-    deltas = [variant[i] - baseline[i] for i in range(pair_count)]
-    mean_delta = float(statistics.mean(deltas))
-    median_delta = float(statistics.median(deltas))
-    if pair_count >= 2:
-        sd_delta = float(statistics.stdev(deltas))
-    else:
-        sd_delta = 0.0
-
-    if pair_count < 2:
-        t_stat = None
-        p_value = None
-        ci_low = None
-        ci_high = None
-    elif sd_delta <= 0.0:
-        if abs(mean_delta) <= 1e-12:
-            t_stat = 0.0
-            p_value = 1.0
-        else:
-            t_stat = math.copysign(float("inf"), mean_delta)
-            p_value = 0.0
-        ci_low = mean_delta
-        ci_high = mean_delta
-    else:
-        se = sd_delta / math.sqrt(float(pair_count))
-        t_stat = mean_delta / se
-        p_value = student_t_two_sided_p_value(t_stat, pair_count - 1)
-        t_crit = student_t_critical_two_sided(alpha, pair_count - 1)
-        if t_crit is None:
-            ci_low = None
-            ci_high = None
-        else:
-            half = float(t_crit) * se
-            ci_low = mean_delta - half
-            ci_high = mean_delta + half
-
-    if pair_count < 2:
-        cohen_d = None
-    elif sd_delta <= 0.0:
-        cohen_d = 0.0 if abs(mean_delta) <= 1e-12 else math.copysign(float("inf"), mean_delta)
-    else:
-        cohen_d = mean_delta / sd_delta
-    if cohen_d is None:
-        hedges_g = None
-    else:
-        correction = 1.0 if pair_count <= 2 else (1.0 - (3.0 / ((4.0 * float(pair_count)) - 5.0)))
-        hedges_g = float(cohen_d) * correction
-
-    if abs(mean_delta) <= 1e-12:
-        direction = "equal"
-    elif mean_delta > 0.0:
-        direction = "slower"
-    else:
-        direction = "faster"
-
-    return {
-        "n": int(pair_count),
-        "mean_delta_ms": float(mean_delta),
-        "median_delta_ms": float(median_delta),
-        "stdev_delta_ms": float(sd_delta),
-        "delta_ci_95_ms": {
-            "low": None if ci_low is None else float(ci_low),
-            "high": None if ci_high is None else float(ci_high),
-        },
-        "paired_t_test": {
-            "t_stat": None if t_stat is None else float(t_stat),
-            "degrees_of_freedom": int(max(0, pair_count - 1)),
-            "p_value_two_sided": None if p_value is None else float(p_value),
-        },
-        "mann_whitney_u": mann_whitney_u_test(variant, baseline),
-        "effect_sizes": {
-            "cohen_d": None if cohen_d is None else float(cohen_d),
-            "hedges_g": None if hedges_g is None else float(hedges_g),
-            "cliffs_delta": cliffs_delta(variant, baseline),
-        },
-        "direction": direction,
-        "significant_at_alpha": None if p_value is None else bool(p_value < float(alpha)),
-        "alpha": float(alpha),
-    }
-
-
 def build_runtime_statistical_tests(
     *,
     by_role: list["SolverRow"],
@@ -372,28 +95,26 @@ def build_runtime_statistical_tests(
     alpha: float = 0.05,
 ) -> dict:
     mode_order = ["single"] if selected_family in {"dijkstra", "sp_via"} else ["first", "all"]
+    compared = [(row, mode) for row in by_role if row.role != "baseline" for mode in mode_order]
+    summaries = summarize_runtime_comparisons(
+        [
+            (list(per_solver_times.get((row.variant_id, mode), [])), list(per_solver_times.get((baseline_row.variant_id, mode), [])))
+            for row, mode in compared
+        ],
+        alpha=alpha,
+    )
     rows: list[dict] = []
-    for row in by_role:
-        if row.role == "baseline":
-            continue
-        for mode in mode_order:
-            baseline_samples = list(per_solver_times.get((baseline_row.variant_id, mode), []))
-            variant_samples = list(per_solver_times.get((row.variant_id, mode), []))
-            summary = summarize_runtime_comparison(
-                variant_samples_ms=variant_samples,
-                baseline_samples_ms=baseline_samples,
-                alpha=alpha,
-            )
-            rows.append(
-                {
-                    "variant_id": row.variant_id,
-                    "variant_label": row.label,
-                    "baseline_variant_id": baseline_row.variant_id,
-                    "baseline_label": baseline_row.label,
-                    "mode": mode,
-                    **summary,
-                }
-            )
+    for (row, mode), summary in zip(compared, summaries):
+        rows.append(
+            {
+                "variant_id": row.variant_id,
+                "variant_label": row.label,
+                "baseline_variant_id": baseline_row.variant_id,
+                "baseline_label": baseline_row.label,
+                "mode": mode,
+                **summary,
+            }
+        )
     return {
         "metric": "runtime_ms",
         "alpha": float(alpha),
@@ -740,49 +461,28 @@ def try_resolve_binary(path_str: str) -> Path | None:
 
 
 def run_with_peak_rss(command: list[str]) -> tuple[float, int, str, str, int]:
-    def read_rss_bytes(pid: int) -> int:
-        status_path = Path(f"/proc/{pid}/status")
-        if not status_path.is_file():
-            return 0
-        try:
-            for line in status_path.read_text(encoding="utf-8", errors="replace").splitlines():
-                if not line.startswith("VmRSS:"):
-                    continue
-                parts = line.split()
-                if len(parts) < 2:
-                    return 0
-                return max(0, int(parts[1])) * 1024
-        except Exception:
-            return 0
-        return 0
-
     started = time.perf_counter()
     proc = subprocess.Popen(
         command,
         cwd=str(REPO_ROOT),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
     )
-    peak = 0
-    while proc.poll() is None:
-        rss = read_rss_bytes(proc.pid)
-        if rss > peak:
-            peak = rss
-        time.sleep(0.005)
-    stdout, stderr = proc.communicate()
-    rss = read_rss_bytes(proc.pid)
-    if rss > peak:
-        peak = rss
-    ended = time.perf_counter()
+    # The shared supervisor reaps via wait4 (exact rusage) and drains output without polling.
+    handle = get_process_supervisor().watch(proc, started=started)
+    if not handle.drains_pipes:
+        stdout_bytes, stderr_bytes = proc.communicate()
+        handle.stdout_chunks.append(stdout_bytes or b"")
+        handle.stderr_chunks.append(stderr_bytes or b"")
+    handle.wait()
+    stdout, stderr = handle.take_output()
+    ended = handle.ended if handle.ended is not None else time.perf_counter()
     duration_ms = max(0.0, (ended - started) * 1000.0)
-    peak_kb = max(0, int(round(peak / 1024.0)))
+    peak_kb = max(0, int(round(handle.monitor.peak_kb())))
     return duration_ms, peak_kb, stdout, stderr, int(proc.returncode)
 
 
-def generate_inputs_for_iteration(
+def generation_request_for_iteration(
     algorithm: str,
     iteration_index: int,
     n: int,
@@ -790,66 +490,57 @@ def generate_inputs_for_iteration(
     density: float,
     base_seed: int,
     graph_family: str,
-) -> dict[str, Path]:
+) -> generator_mod.GenerationRequest:
     out_dir = OUTPUTS_DIR / "generated" / algorithm / f"iter_{iteration_index + 1}"
     out_dir.mkdir(parents=True, exist_ok=True)
-    seed = base_seed + iteration_index
-    if algorithm in {"dijkstra", "sp_via"}:
-        cmd = [
-            sys.executable,
-            "utilities/generate_graphs.py",
-            "--algorithm",
-            algorithm,
-            "--n",
-            str(n),
-            "--density",
-            str(density),
-            "--graph-family",
-            str(graph_family),
-            "--seed",
-            str(seed),
-            "--out-dir",
-            str(out_dir),
-        ]
-        done = subprocess.run(cmd, cwd=str(REPO_ROOT), check=True, stdout=subprocess.PIPE, text=True, encoding="utf-8", errors="replace")
-        paths = parse_last_line_paths(done.stdout)
-        if not paths:
-            raise RuntimeError("Generator did not return shortest-path input path")
-        graph_path = Path(paths[0]).resolve()
-        return {"seed": Path(str(seed)), "dijkstra": graph_path, "sp_via": graph_path}
-
-    cmd = [
-        sys.executable,
-        "utilities/generate_graphs.py",
-        "--algorithm",
-        "subgraph",
-        "--n",
-        str(n),
-        "--k",
-        str(k),
-        "--density",
-        str(density),
-        "--graph-family",
-        str(graph_family),
-        "--seed",
-        str(seed),
-        "--out-dir",
-        str(out_dir),
-    ]
-    done = subprocess.run(cmd, cwd=str(REPO_ROOT), check=True, stdout=subprocess.PIPE, text=True, encoding="utf-8", errors="replace")
-    paths = parse_last_line_paths(done.stdout)
-    if len(paths) < 4:
-        raise RuntimeError("Generator did not return subgraph paths")
-    lad_pattern, lad_target, vf_pattern, vf_target = [Path(p).resolve() for p in paths[:4]]
+    shortest_path = algorithm in {"dijkstra", "sp_via"}
+    return generator_mod.GenerationRequest(
+        algorithm=algorithm if shortest_path else "subgraph",
+        out_dir=out_dir,
+        n=n,
+        k=None if shortest_path else k,
+        density=density,
+        seed=base_seed + iteration_index,
+        graph_family=graph_family,
+    )
+
+
+def iteration_inputs_from_generated(generated: generator_mod.GeneratedInputs) -> dict[str, Path]:
+    seed = Path(str(generated.request.seed))
+    paths = {name: Path(path).resolve() for name, path in generated.paths.items()}
+    if generated.request.algorithm in {"dijkstra", "sp_via"}:
+        graph_path = paths[generated.request.algorithm]
+        return {"seed": seed, "dijkstra": graph_path, "sp_via": graph_path}
     return {
-        "seed": Path(str(seed)),
-        "lad_pattern": lad_pattern,
-        "lad_target": lad_target,
-        "vf_pattern": vf_pattern,
-        "vf_target": vf_target,
+        "seed": seed,
+        "lad_pattern": paths["lad_pattern"],
+        "lad_target": paths["lad_target"],
+        "vf_pattern": paths["vf_pattern"],
+        "vf_target": paths["vf_target"],
     }
 
 
+def generate_inputs_for_iterations(
+    algorithm: str,
+    iterations: int,
+    n: int,
+    k: int,
+    density: float,
+    base_seed: int,
+    graph_family: str,
+    max_workers: int = 1,
+) -> list[dict[str, Path]]:
+    # In-process (optionally pooled) generation; one interpreter per iteration used to dominate small runs.
+    requests = [
+        generation_request_for_iteration(algorithm, idx, n, k, density, base_seed, graph_family)
+        for idx in range(iterations)
+    ]
+    return [
+        iteration_inputs_from_generated(generated)
+        for generated in generator_mod.generate_inputs_batch(requests, max_workers=max_workers)
+    ]
+
+
 def get_premade_inputs(algorithm: str, input_files: list[str]) -> dict[str, Path]:
     files = [Path(item).resolve() for item in input_files if item]
     if algorithm in {"dijkstra", "sp_via"}:
@@ -1594,6 +1285,9 @@ def main() -> int:
     started = time.perf_counter()
     timings_ms: dict[str, float] = {}
     timings_ms_stdev: dict[str, float] = {}
+    # Solver-reported timings (parsed from output) under the same keys as timings_ms.
+    internal_timings_ms: dict[str, float] = {}
+    internal_timings_ms_stdev: dict[str, float] = {}
     memory_kb: dict[str, int] = {}
     memory_kb_stdev: dict[str, int] = {}
     match_counts: dict[str, dict] = {}
@@ -1667,20 +1361,28 @@ def main() -> int:
         per_solver_outputs: dict[tuple[str, str], list[str]] = {
             (row.variant_id, mode): [] for row in by_role for mode in mode_order
         }
+        per_solver_internal_times: dict[tuple[str, str], list[float]] = {
+            (row.variant_id, mode): [] for row in by_role for mode in mode_order
+        }
         per_iteration_inputs: list[dict[str, Path]] = []
         first_only_fallback_rows: set[str] = set()
 
+        generated_inputs: list[dict[str, Path]] = []
+        if input_mode == "generate":
+            generated_inputs = generate_inputs_for_iterations(
+                algorithm=algorithm_input if algorithm_input in {"dijkstra", "sp_via"} else "subgraph",
+                iterations=iterations,
+                n=n,
+                k=k,
+                density=density,
+                base_seed=base_seed,
+                graph_family=graph_family,
+                max_workers=parse_int_env("GENERATOR_WORKERS", 1, minimum=1),
+            )
+
         for iter_idx in range(iterations):
             if input_mode == "generate":
-                inputs = generate_inputs_for_iteration(
-                    algorithm=algorithm_input if algorithm_input in {"dijkstra", "sp_via"} else "subgraph",
-                    iteration_index=iter_idx,
-                    n=n,
-                    k=k,
-                    density=density,
-                    base_seed=base_seed,
-                    graph_family=graph_family,
-                )
+                inputs = generated_inputs[iter_idx]
             else:
                 inputs = get_premade_inputs(selected_family, input_files)
             per_iteration_inputs.append(dict(inputs))
@@ -1754,6 +1456,9 @@ def main() -> int:
                     per_solver_times[(row.variant_id, mode)].append(dur_ms)
                     per_solver_mem[(row.variant_id, mode)].append(peak_kb)
                     per_solver_outputs[(row.variant_id, mode)].append((stdout or "") + ("\n" + stderr if stderr else ""))
+                    internal_ms = parse_internal_timings(per_solver_outputs[(row.variant_id, mode)][-1], row.family)["internal_runtime_ms"]
+                    if internal_ms is not None:
+                        per_solver_internal_times[(row.variant_id, mode)].append(float(internal_ms))
 
         for row in by_role:
             key = build_variant_metric_key(row)
@@ -1767,6 +1472,10 @@ def main() -> int:
                 if median_kb is not None:
                     memory_kb[metric_key] = int(round(median_kb))
                     memory_kb_stdev[metric_key] = int(round(stdev_kb))
+                median_internal_ms, stdev_internal_ms = median_and_stdev(per_solver_internal_times[(row.variant_id, "single")])
+                if median_internal_ms is not None:
+                    internal_timings_ms[metric_key] = float(median_internal_ms)
+                    internal_timings_ms_stdev[metric_key] = float(stdev_internal_ms)
                 if row.variant_id == "dijkstra_chatgpt":
                     if metric_key in timings_ms:
                         timings_ms["llm"] = timings_ms[metric_key]
@@ -1812,6 +1521,11 @@ def main() -> int:
                 if median_all_kb is not None:
                     memory_kb[key_all] = int(round(median_all_kb))
                     memory_kb_stdev[key_all] = int(round(stdev_all_kb))
+                for mode_key, mode in ((key_first, "first"), (key_all, "all")):
+                    median_internal_ms, stdev_internal_ms = median_and_stdev(per_solver_internal_times[(row.variant_id, mode)])
+                    if median_internal_ms is not None:
+                        internal_timings_ms[mode_key] = float(median_internal_ms)
+                        internal_timings_ms_stdev[mode_key] = float(stdev_internal_ms)
                 variant_metadata.append(
                     {
                         "variant_id": row.variant_id,
@@ -1979,6 +1693,14 @@ def main() -> int:
                         timings_ms_stdev.get(metric_key),
                     )
                 )
+                if metric_key in internal_timings_ms:
+                    output_lines.append(
+                        fmt_labeled_median_stdev(
+                            "Internal Runtime (ms)",
+                            internal_timings_ms.get(metric_key),
+                            internal_timings_ms_stdev.get(metric_key),
+                        )
+                    )
                 output_lines.append(
                     fmt_labeled_median_stdev(
                         "Peak RSS (KB)",
@@ -2030,6 +1752,16 @@ def main() -> int:
                         timings_ms_stdev.get(f"{metric_prefix}_all"),
                     )
                 )
+                for mode in ("first", "all"):
+                    internal_key = f"{metric_prefix}_{mode}"
+                    if internal_key in internal_timings_ms:
+                        output_lines.append(
+                            fmt_labeled_median_stdev(
+                                f"Internal Runtime {mode.title()} (ms)",
+                                internal_timings_ms.get(internal_key),
+                                internal_timings_ms_stdev.get(internal_key),
+                            )
+                        )
                 output_lines.append(
                     fmt_labeled_median_stdev(
                         "Peak RSS First (KB)",
@@ -2097,6 +1829,8 @@ def main() -> int:
         "SUBGRAPH_PHASE": subgraph_phase if algorithm_input == "subgraph" else "",
         "TIMINGS_MS_JSON": json.dumps(timings_ms, separators=(",", ":"), sort_keys=True),
         "TIMINGS_MS_STDEV_JSON": json.dumps(timings_ms_stdev, separators=(",", ":"), sort_keys=True),
+        "INTERNAL_TIMINGS_MS_JSON": json.dumps(internal_timings_ms, separators=(",", ":"), sort_keys=True),
+        "INTERNAL_TIMINGS_MS_STDEV_JSON": json.dumps(internal_timings_ms_stdev, separators=(",", ":"), sort_keys=True),
         "MEMORY_KB_JSON": json.dumps(memory_kb, separators=(",", ":"), sort_keys=True),
         "MEMORY_KB_STDEV_JSON": json.dumps(memory_kb_stdev, separators=(",", ":"), sort_keys=True),
         "MATCH_COUNTS_JSON": json.dumps(match_counts, separators=(",", ":"), sort_keys=True),
@@ -18,10 +18,14 @@ import datetime as dt
 import importlib.util
 import argparse
 import gzip
+import functools
 import hashlib
-import io
+import inspect
+import itertools
 import json
 import math
+import multiprocessing
+import operator
 import os
 import random
 import re
@@ -30,6 +34,7 @@ import statistics
 import subprocess
 import sys
 import tarfile
+import tempfile
 import threading
 import time
 import textwrap
@@ -37,6 +42,7 @@ import urllib.error
 import urllib.request
 import webbrowser
 import zipfile
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -44,9 +50,19 @@ import psutil
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
+from utilities import csr_graph as csr_mod
 from utilities import generate_graphs as generator_mod
-from utilities.benchmark_validation import extract_path_tokens
+from utilities.benchmark_validation import extract_path_tokens, parse_internal_timings
 from utilities.benchmark_provenance import collect_runtime_provenance
+from utilities.benchmark_statistics import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    bootstrap_median_ratio_cis,
+    summarize_runtime_comparisons,
+)
+from utilities.input_cache import InputCache, cache_key
+from utilities.input_prefetch import InputPrefetcher, PrefetchJob
+from utilities.session_store import SESSION_STORE_NAME, SessionStore, open_session_store
+from utilities.process_supervisor import OUTCOME_ABORTED, OUTCOME_TIMEOUT, get_process_supervisor
 
 try:
     import winreg  # type: ignore
@@ -58,6 +74,7 @@ from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
+from matplotlib.ticker import FuncFormatter
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 
 try:
@@ -75,6 +92,32 @@ DEFAULT_WIDTH = 1500
 DEFAULT_HEIGHT = 980
 DEFAULT_DISCARDED_WARMUP_TRIALS = 5
 DEFAULT_OUTLIER_MIN_SAMPLES = 7
+# Timed no-op and trivial-input solver runs per variant before measured datapoints.
+DEFAULT_SPAWN_CALIBRATION_TRIALS = 15
+# Upcoming iteration input sets generated ahead in worker processes, and the disk they may hold.
+DEFAULT_PREFETCH_LOOKAHEAD = 2
+DEFAULT_PREFETCH_DISK_BUDGET_MB = 1024
+# Shared cache of generated inputs (LRU-evicted above this size; 0 disables).
+DEFAULT_INPUT_CACHE_MAX_MB = 2048
+# Bump when generator output changes in a way the source hash cannot see (e.g. frozen builds).
+INPUT_GENERATOR_VERSION = 1
+# Subgraph target generation: a fresh target per datapoint, or one target per iteration
+# shared by every k at the same (N, density) ("shared").
+SUBGRAPH_TARGET_MODES = ("per_point", "shared")
+DEFAULT_SUBGRAPH_TARGET_MODE = "per_point"
+# Per-trial kernel rusage counters and solver-reported timings promoted to per-datapoint
+# metrics: (metric_id, unit suffix, label).
+# Datapoint rows carry `<metric_id>_median[_unit]`, `_stdev`, `_samples_n` and `_samples`.
+RESOURCE_METRIC_SPECS = (
+    ("internal_runtime", "ms", "Solver-Reported Runtime (ms)"),
+    ("cpu_time", "ms", "CPU Time, user+system (ms)"),
+    ("user_cpu", "ms", "User CPU (ms)"),
+    ("system_cpu", "ms", "System CPU (ms)"),
+    ("minor_faults", "", "Minor Page Faults"),
+    ("major_faults", "", "Major Page Faults"),
+    ("voluntary_ctx_switches", "", "Voluntary Context Switches"),
+    ("involuntary_ctx_switches", "", "Involuntary Context Switches"),
+)
 DEFAULT_3D_ELEV = 30.0
 # Keep x=min and y=min corner toward the viewer in the default isometric view.
 DEFAULT_3D_AZIM = -135.0
@@ -284,276 +327,89 @@ def filter_outlier_samples(samples: list[float], mode: str, min_samples: int = D
     return values
 
 
-def _simpson_integral(func, a: float, b: float) -> float:
-    c = (a + b) * 0.5
-    h = b - a
-    return (h / 6.0) * (func(a) + (4.0 * func(c)) + func(b))
-
-
-def _adaptive_simpson(func, a: float, b: float, eps: float, whole: float, depth: int) -> float:
-    c = (a + b) * 0.5
-    left = _simpson_integral(func, a, c)
-    right = _simpson_integral(func, c, b)
-    delta = left + right - whole
-    if depth <= 0 or abs(delta) <= 15.0 * eps:
-        return left + right + (delta / 15.0)
-    return (
-        _adaptive_simpson(func, a, c, eps * 0.5, left, depth - 1)
-        + _adaptive_simpson(func, c, b, eps * 0.5, right, depth - 1)
-    )
-
-
-def student_t_two_sided_p_value(t_stat: float, degrees_of_freedom: int) -> float | None:
-    if not math.isfinite(t_stat):
-        return None
-    df = int(degrees_of_freedom)
-    if df <= 0:
-        return None
-    x = abs(float(t_stat))
-    if x <= 0.0:
-        return 1.0
-    if x >= 50.0:
-        return 0.0
-
-    # For very large df the normal approximation is accurate and cheaper.
-    if df >= 200:
-        tail = 0.5 * math.erfc(x / math.sqrt(2.0))
-        return max(0.0, min(1.0, 2.0 * tail))
-
-    # Student-t PDF normalizing constant.
-    log_c = math.lgamma((df + 1.0) * 0.5) - math.lgamma(df * 0.5) - 0.5 * math.log(df * math.pi)
-    c = math.exp(log_c)
-
-    def pdf(val: float) -> float:
-        return c * ((1.0 + ((val * val) / float(df))) ** (-(df + 1.0) * 0.5))
-
-    whole = _simpson_integral(pdf, 0.0, x)
-    area_0_to_x = _adaptive_simpson(pdf, 0.0, x, 1e-8, whole, depth=20)
-    cdf = max(0.0, min(1.0, 0.5 + area_0_to_x))
-    return max(0.0, min(1.0, 2.0 * (1.0 - cdf)))
-
-
-def student_t_critical_two_sided(alpha: float, degrees_of_freedom: int) -> float | None:
-    df = int(degrees_of_freedom)
-    if df <= 0:
-        return None
-    target = float(alpha)
-    if not math.isfinite(target) or target <= 0.0 or target >= 1.0:
-        return None
-    lo = 0.0
-    hi = 1.0
-    p_hi = student_t_two_sided_p_value(hi, df)
-    guard = 0
-    while (p_hi is None or p_hi > target) and hi < 1_000_000.0:
-        lo = hi
-        hi *= 2.0
-        p_hi = student_t_two_sided_p_value(hi, df)
-        guard += 1
-        if guard > 80:
-            break
-    if p_hi is None:
-        return None
-    for _ in range(64):
-        mid = (lo + hi) * 0.5
-        p_mid = student_t_two_sided_p_value(mid, df)
-        if p_mid is None:
-            return None
-        if p_mid > target:
-            lo = mid
-        else:
-            hi = mid
-    return hi
-
-
-def normal_two_sided_p_value_from_z(z_score: float) -> float | None:
-    if not math.isfinite(z_score):
-        return None
-    tail = 0.5 * math.erfc(abs(float(z_score)) / math.sqrt(2.0))
-    return max(0.0, min(1.0, 2.0 * tail))
-
-
-def cliffs_delta(left: list[float], right: list[float]) -> float | None:
-    a = [float(v) for v in left if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    b = [float(v) for v in right if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    if not a or not b:
-        return None
-    greater = 0
-    less = 0
-    for x in a:
-        for y in b:
-            if x > y:
-                greater += 1
-            elif x < y:
-                less += 1
-    denom = len(a) * len(b)
-    if denom <= 0:
-        return None
-    return float(greater - less) / float(denom)
+def resource_metrics_from_rusage(rusage: dict | None) -> dict[str, float]:
+    if not isinstance(rusage, dict):
+        return {}
+    source_keys = {
+        "user_cpu": "user_cpu_ms",
+        "system_cpu": "system_cpu_ms",
+        "minor_faults": "minor_faults",
+        "major_faults": "major_faults",
+        "voluntary_ctx_switches": "voluntary_context_switches",
+        "involuntary_ctx_switches": "involuntary_context_switches",
+    }
+    metrics: dict[str, float] = {}
+    for metric_id, source_key in source_keys.items():
+        value = rusage.get(source_key)
+        if isinstance(value, (int, float)) and math.isfinite(float(value)):
+            metrics[metric_id] = float(value)
+    if "user_cpu" in metrics and "system_cpu" in metrics:
+        metrics["cpu_time"] = metrics["user_cpu"] + metrics["system_cpu"]
+    return metrics
+
+
+def resource_metric_field(metric_id: str, kind: str) -> str:
+    unit = next((spec[1] for spec in RESOURCE_METRIC_SPECS if spec[0] == metric_id), "")
+    if kind == "samples_n":
+        return f"{metric_id}_samples_n"
+    return f"{metric_id}_{kind}_{unit}" if unit else f"{metric_id}_{kind}"
+
+
+def summarize_resource_metric_samples(samples_by_metric: dict[str, list[float]], outlier_mode: str) -> dict:
+    fields: dict = {}
+    for metric_id, _unit, _label in RESOURCE_METRIC_SPECS:
+        raw = [float(value) for value in list(samples_by_metric.get(metric_id) or [])]
+        filtered = filter_outlier_samples(raw, outlier_mode)
+        fields[resource_metric_field(metric_id, "median")] = median_or_none(filtered)
+        fields[resource_metric_field(metric_id, "stdev")] = safe_stdev(filtered)
+        fields[resource_metric_field(metric_id, "samples_n")] = len(filtered)
+        fields[resource_metric_field(metric_id, "samples")] = [float(value) for value in filtered]
+    return fields
+
+
+RESOURCE_CSV_COLUMNS = tuple(
+    resource_metric_field(metric_id, kind)
+    for metric_id, _unit, _label in RESOURCE_METRIC_SPECS
+    for kind in ("median", "stdev")
+)
+CORRECTED_RUNTIME_CSV_COLUMNS = ("runtime_overhead_ms", "runtime_corrected_median_ms", "runtime_corrected_stdev_ms")
 
 
-def mann_whitney_u_test(left: list[float], right: list[float]) -> dict:
-    x = [float(v) for v in left if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    y = [float(v) for v in right if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    nx = len(x)
-    ny = len(y)
-    if nx == 0 or ny == 0:
+def summarize_corrected_runtime(runtimes: list[float], overhead_ms: float | None) -> dict:
+    # Corrected samples subtract the calibrated spawn/startup cost and clamp at zero.
+    if overhead_ms is None:
         return {
-            "u_stat": None,
-            "u_stat_alt": None,
-            "z_score": None,
-            "p_value_two_sided": None,
+            "runtime_overhead_ms": None,
+            "runtime_corrected_median_ms": None,
+            "runtime_corrected_stdev_ms": None,
+            "runtime_corrected_samples_ms": [],
         }
-
-    combined = [(val, 0) for val in x] + [(val, 1) for val in y]
-    combined.sort(key=lambda item: item[0])
-    rank_sum_x = 0.0
-    tie_sizes: list[int] = []
-    idx = 0
-    while idx < len(combined):
-        j = idx + 1
-        while j < len(combined) and combined[j][0] == combined[idx][0]:
-            j += 1
-        avg_rank = (float(idx + 1) + float(j)) * 0.5
-        block = combined[idx:j]
-        tie_sizes.append(len(block))
-        rank_sum_x += avg_rank * float(sum(1 for _value, grp in block if grp == 0))
-        idx = j
-
-    u_x = rank_sum_x - (float(nx) * float(nx + 1) * 0.5)
-    u_y = float(nx * ny) - u_x
-    u_stat = min(u_x, u_y)
-    mean_u = float(nx * ny) * 0.5
-
-    n_total = nx + ny
-    tie_term = sum(float(t * t * t - t) for t in tie_sizes)
-    denom = float(n_total * n_total * n_total - n_total)
-    tie_correction = 1.0 - (tie_term / denom) if denom > 0.0 else 1.0
-    sigma_sq = float(nx * ny * (n_total + 1)) / 12.0
-    sigma_sq *= max(0.0, tie_correction)
-
-    if sigma_sq <= 0.0:
-        if abs(u_stat - mean_u) <= 1e-12:
-            z_score = 0.0
-            p_value = 1.0
-        else:
-            z_score = math.copysign(float("inf"), u_stat - mean_u)
-            p_value = 0.0
-    else:
-        sigma = math.sqrt(sigma_sq)
-        z_score = (u_stat - mean_u) / sigma
-        p_value = normal_two_sided_p_value_from_z(z_score)
-
+    corrected = [max(0.0, float(value) - float(overhead_ms)) for value in runtimes]
     return {
-        "u_stat": float(u_stat),
-        "u_stat_alt": float(max(u_x, u_y)),
-        "z_score": None if z_score is None else float(z_score),
-        "p_value_two_sided": None if p_value is None else float(p_value),
+        "runtime_overhead_ms": float(overhead_ms),
+        "runtime_corrected_median_ms": median_or_none(corrected),
+        "runtime_corrected_stdev_ms": safe_stdev(corrected),
+        "runtime_corrected_samples_ms": corrected,
     }
 
 
-def summarize_runtime_comparison(
-    *,
-    variant_samples_ms: list[float],
-    baseline_samples_ms: list[float],
-    alpha: float = 0.05,
-) -> dict:
-    variant = [float(v) for v in variant_samples_ms if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    baseline = [float(v) for v in baseline_samples_ms if isinstance(v, (int, float)) and math.isfinite(float(v))]
-    pair_count = min(len(variant), len(baseline))
-    if pair_count <= 0:
-        return {
-            "n": 0,
-            "mean_delta_ms": None,
-            "median_delta_ms": None,
-            "stdev_delta_ms": None,
-            "delta_ci_95_ms": {"low": None, "high": None},
-            "paired_t_test": {"t_stat": None, "degrees_of_freedom": 0, "p_value_two_sided": None},
-            "mann_whitney_u": mann_whitney_u_test(variant, baseline),
-            "effect_sizes": {
-                "cohen_d": None,
-                "hedges_g": None,
-                "cliffs_delta": cliffs_delta(variant, baseline),
-            },
-            "direction": "insufficient_data",
-            "significant_at_alpha": None,
-            "alpha": float(alpha),
-        }
-
-    deltas = [variant[i] - baseline[i] for i in range(pair_count)]
-    mean_delta = float(statistics.mean(deltas))
-    median_delta = float(statistics.median(deltas))
-    sd_delta = float(statistics.stdev(deltas)) if pair_count >= 2 else 0.0
-
-    if pair_count < 2:
-        t_stat = None
-        p_value = None
-        ci_low = None
-        ci_high = None
-    elif sd_delta <= 0.0:
-        if abs(mean_delta) <= 1e-12:
-            t_stat = 0.0
-            p_value = 1.0
-        else:
-            t_stat = math.copysign(float("inf"), mean_delta)
-            p_value = 0.0
-        ci_low = mean_delta
-        ci_high = mean_delta
-    else:
-        se = sd_delta / math.sqrt(float(pair_count))
-        t_stat = mean_delta / se
-        p_value = student_t_two_sided_p_value(t_stat, pair_count - 1)
-        t_crit = student_t_critical_two_sided(alpha, pair_count - 1)
-        if t_crit is None:
-            ci_low = None
-            ci_high = None
-        else:
-            half = float(t_crit) * se
-            ci_low = mean_delta - half
-            ci_high = mean_delta + half
-
-    if pair_count < 2:
-        cohen_d = None
-    elif sd_delta <= 0.0:
-        cohen_d = 0.0 if abs(mean_delta) <= 1e-12 else math.copysign(float("inf"), mean_delta)
-    else:
-        cohen_d = mean_delta / sd_delta
-    if cohen_d is None:
-        hedges_g = None
-    else:
-        correction = 1.0 if pair_count <= 2 else (1.0 - (3.0 / ((4.0 * float(pair_count)) - 5.0)))
-        hedges_g = float(cohen_d) * correction
+STATISTICS_FAMILY_BASELINES = {
+    "vf3": "vf3_baseline",
+    "glasgow": "glasgow_baseline",
+    "dijkstra": "dijkstra_baseline",
+    "sp_via": "sp_via_baseline",
+}
 
-    if abs(mean_delta) <= 1e-12:
-        direction = "equal"
-    elif mean_delta > 0.0:
-        direction = "slower"
-    else:
-        direction = "faster"
 
-    return {
-        "n": int(pair_count),
-        "mean_delta_ms": float(mean_delta),
-        "median_delta_ms": float(median_delta),
-        "stdev_delta_ms": float(sd_delta),
-        "delta_ci_95_ms": {
-            "low": None if ci_low is None else float(ci_low),
-            "high": None if ci_high is None else float(ci_high),
-        },
-        "paired_t_test": {
-            "t_stat": None if t_stat is None else float(t_stat),
-            "degrees_of_freedom": int(max(0, pair_count - 1)),
-            "p_value_two_sided": None if p_value is None else float(p_value),
-        },
-        "mann_whitney_u": mann_whitney_u_test(variant, baseline),
-        "effect_sizes": {
-            "cohen_d": None if cohen_d is None else float(cohen_d),
-            "hedges_g": None if hedges_g is None else float(hedges_g),
-            "cliffs_delta": cliffs_delta(variant, baseline),
-        },
-        "direction": direction,
-        "significant_at_alpha": None if p_value is None else bool(p_value < float(alpha)),
-        "alpha": float(alpha),
-    }
+def family_baseline_pairs(selected_variants: list[str]) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for variant_id in selected_variants:
+        if variant_id.endswith("_baseline"):
+            continue
+        baseline_variant_id = STATISTICS_FAMILY_BASELINES.get(variant_family_from_id(variant_id))
+        if baseline_variant_id:
+            pairs.append((variant_id, baseline_variant_id))
+    return pairs
 
 
 def build_desktop_runtime_statistical_tests(
@@ -562,33 +418,23 @@ def build_desktop_runtime_statistical_tests(
     point_states: dict[int, dict],
     selected_variants: list[str],
     alpha: float = 0.05,
+    metric: str = "runtime_ms",
 ) -> dict:
-    family_to_baseline = {
-        "vf3": "vf3_baseline",
-        "glasgow": "glasgow_baseline",
-        "dijkstra": "dijkstra_baseline",
-        "sp_via": "sp_via_baseline",
-    }
     pair_samples: dict[str, dict[str, list[float] | str]] = {}
-    for variant_id in selected_variants:
-        if variant_id.endswith("_baseline"):
-            continue
-        family = variant_family_from_id(variant_id)
-        baseline_variant_id = family_to_baseline.get(family)
-        if not baseline_variant_id:
-            continue
+    for variant_id, baseline_variant_id in family_baseline_pairs(selected_variants):
         pair_samples[variant_id] = {
             "baseline_variant_id": baseline_variant_id,
             "variant_samples": [],
             "baseline_samples": [],
         }
 
+    # Matched per-iteration samples live under `iter_<metric>` (e.g. iter_runtime_ms, iter_cpu_time_ms).
     for state in point_states.values():
-        iter_runtime_ms = state.get("iter_runtime_ms", {})
-        if not isinstance(iter_runtime_ms, dict):
+        iter_metric_values = state.get(f"iter_{metric}", {})
+        if not isinstance(iter_metric_values, dict):
             continue
         for iter_idx in range(int(config.get("iterations", 0))):
-            iter_map = iter_runtime_ms.get(iter_idx, {})
+            iter_map = iter_metric_values.get(iter_idx, {})
             if not isinstance(iter_map, dict):
                 continue
             for variant_id, holder in pair_samples.items():
@@ -601,17 +447,18 @@ def build_desktop_runtime_statistical_tests(
                 holder["variant_samples"].append(float(solver_runtime))
 
     label_lookup = dict(config.get("selected_variant_labels", {}) or {})
+    ordered_ids = [variant_id for variant_id in selected_variants if isinstance(pair_samples.get(variant_id), dict)]
+    summaries = summarize_runtime_comparisons(
+        [
+            (list(pair_samples[variant_id].get("variant_samples", [])), list(pair_samples[variant_id].get("baseline_samples", [])))
+            for variant_id in ordered_ids
+        ],
+        alpha=alpha,
+    )
     rows: list[dict] = []
-    for variant_id in selected_variants:
-        holder = pair_samples.get(variant_id)
-        if not isinstance(holder, dict):
-            continue
+    for variant_id, summary in zip(ordered_ids, summaries):
+        holder = pair_samples[variant_id]
         baseline_variant_id = str(holder.get("baseline_variant_id", "") or "")
-        summary = summarize_runtime_comparison(
-            variant_samples_ms=list(holder.get("variant_samples", [])),
-            baseline_samples_ms=list(holder.get("baseline_samples", [])),
-            alpha=alpha,
-        )
         rows.append(
             {
                 "variant_id": variant_id,
@@ -624,18 +471,132 @@ def build_desktop_runtime_statistical_tests(
         )
 
     return {
-        "metric": "runtime_ms",
+        "metric": metric,
         "alpha": float(alpha),
         "pairs": rows,
         "notes": [
             "paired_t_test uses matched iteration deltas (variant - baseline).",
-            "mann_whitney_u compares the two runtime distributions.",
+            "mann_whitney_u compares the two sample distributions.",
             "cohen_d and hedges_g are standardized effect sizes on paired deltas.",
             "cliffs_delta is the probability dominance effect size.",
         ],
     }
 
 
+def _ratio_direction(ci: dict) -> str:
+    if ci.get("estimate") is None:
+        return "insufficient_data"
+    if ci.get("ci_high") is not None and float(ci["ci_high"]) < 1.0:
+        return "faster"
+    if ci.get("ci_low") is not None and float(ci["ci_low"]) > 1.0:
+        return "slower"
+    return "inconclusive"
+
+
+def build_datapoint_ratio_comparisons(
+    *,
+    config: dict,
+    point_states: dict[int, dict],
+    selected_variants: list[str],
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    alpha: float = 0.05,
+    max_processes: int | None = None,
+) -> dict | None:
+    """Per-datapoint (and, for dataset runs, per-dataset) median ratios vs the family baseline.
+
+    Each comparison carries percentile bootstrap CIs for the runtime and peak
+    memory median ratios; ``None`` when ``resamples`` is 0.
+    """
+    if int(resamples or 0) <= 0:
+        return None
+    outlier_mode = str(config.get("outlier_filter") or "none").strip().lower()
+    label_lookup = dict(config.get("selected_variant_labels", {}) or {})
+    pairs = family_baseline_pairs(selected_variants)
+    is_datasets = str(config.get("input_mode") or "independent").strip().lower() == "datasets"
+
+    scopes: list[tuple[str, dict, dict[str, dict[str, list[float]]]]] = []
+    dataset_scopes: dict[str, tuple[dict, dict[str, dict[str, list[float]]]]] = {}
+    for _point_idx, state in sorted(point_states.items()):
+        samples = {
+            metric: {
+                variant_id: filter_outlier_samples(list((state.get(key) or {}).get(variant_id) or []), outlier_mode)
+                for variant_id in selected_variants
+            }
+            for metric, key in (("runtime", "samples_runtime"), ("memory", "samples_memory"))
+        }
+        point_meta = {
+            "point_label": str(state.get("point_label") or ""),
+            "x_value": state.get("x_value"),
+            "y_value": state.get("y_value"),
+            "dataset_id": state.get("dataset_id"),
+            "dataset_name": state.get("dataset_name"),
+            "dataset_pair_id": state.get("dataset_pair_id"),
+        }
+        scopes.append(("datapoint", point_meta, samples))
+        dataset_id = str(state.get("dataset_id") or "")
+        if is_datasets and dataset_id:
+            meta, pooled = dataset_scopes.setdefault(
+                dataset_id,
+                (
+                    {"dataset_id": dataset_id, "dataset_name": state.get("dataset_name"), "datapoint_count": 0},
+                    {metric: {variant_id: [] for variant_id in selected_variants} for metric in ("runtime", "memory")},
+                ),
+            )
+            meta["datapoint_count"] += 1
+            for metric, by_variant in samples.items():
+                for variant_id, values in by_variant.items():
+                    pooled[metric][variant_id].extend(values)
+    for meta, pooled in dataset_scopes.values():
+        scopes.append(("dataset", meta, pooled))
+
+    rows: list[tuple[str, dict]] = []
+    jobs: list[tuple[list[float], list[float]]] = []
+    for scope, meta, samples in scopes:
+        for variant_id, baseline_variant_id in pairs:
+            rows.append(
+                (
+                    scope,
+                    {
+                        **meta,
+                        "variant_id": variant_id,
+                        "variant_label": str(label_lookup.get(variant_id, variant_id)),
+                        "baseline_variant_id": baseline_variant_id,
+                        "baseline_label": str(label_lookup.get(baseline_variant_id, baseline_variant_id)),
+                    },
+                )
+            )
+            for metric in ("runtime", "memory"):
+                jobs.append((samples[metric].get(variant_id, []), samples[metric].get(baseline_variant_id, [])))
+
+    base_seed = config.get("base_seed")
+    cis = bootstrap_median_ratio_cis(
+        jobs,
+        resamples=int(resamples),
+        alpha=alpha,
+        seed=int(base_seed) if isinstance(base_seed, int) else 0,
+        max_processes=max_processes,
+    )
+    result = {
+        "statistic": "median_ratio",
+        "resamples": int(resamples),
+        "alpha": float(alpha),
+        "datapoints": [],
+        "datasets": [],
+        "notes": [
+            "ratios are median(variant) / median(baseline) on outlier-filtered samples; below 1 is faster or leaner.",
+            "CIs are percentile bootstrap intervals resampling both groups independently.",
+            "direction is faster/slower only when the runtime ratio CI excludes 1.",
+        ],
+    }
+    for idx, (scope, row) in enumerate(rows):
+        runtime_ci = cis[2 * idx]
+        row["runtime_ratio"] = runtime_ci
+        row["memory_ratio"] = cis[(2 * idx) + 1]
+        row["direction"] = _ratio_direction(runtime_ci)
+        result["datapoints" if scope == "datapoint" else "datasets"].append(row)
+    return result
+
+
 def number_or_blank(value: float | None) -> str:
     if value is None or not math.isfinite(value):
         return ""
@@ -733,6 +694,20 @@ def _summarize_name_list(items: list[str], *, max_items: int = 4) -> str:
 
 
 def _metric_metadata(metric: str) -> tuple[str, str, str, str]:
+    if str(metric).strip().lower() == "runtime_corrected":
+        return (
+            "runtime_corrected_median_ms",
+            "runtime_corrected_stdev_ms",
+            "Runtime minus Spawn Overhead (ms)",
+            "Startup-Corrected Runtime by Independent Variable",
+        )
+    if str(metric).strip().lower() == "cpu":
+        return (
+            "cpu_time_median_ms",
+            "cpu_time_stdev_ms",
+            "Child Process CPU Time, user+system (ms)",
+            "CPU Time by Independent Variable",
+        )
     if str(metric).strip().lower() == "memory":
         return (
             "memory_median_kb",
@@ -934,7 +909,7 @@ def _plot_independent_metric_lines(ax, payload: dict, metric: str, datapoints: l
 
 def _build_run_detail_lines(payload: dict, metric: str) -> list[str]:
     config = dict(payload.get("run_config") or {})
-    metric_label = "Runtime (ms)" if str(metric).strip().lower() != "memory" else "Peak Memory (KiB)"
+    metric_label = {"memory": "Peak Memory (KiB)", "cpu": "CPU Time (ms)", "runtime_corrected": "Corrected Runtime (ms)"}.get(str(metric).strip().lower(), "Runtime (ms)")
     lines: list[str] = ["Run Details", f"Metric: {metric_label}"]
     plot_scope = str(config.get("plot_scope_label") or "").strip()
     if plot_scope:
@@ -1011,7 +986,9 @@ def _build_run_detail_lines(payload: dict, metric: str) -> list[str]:
     return lines
 
 
-def iter_plot_export_datapoints(payload: dict):
+def iter_plot_export_datapoints(payload: dict, columns=None, *, include_samples: bool = True):
+    # In-memory rows first, then the columnar session store (only the requested
+    # columns are decoded), then the NDJSON stream for sessions written without one.
     datapoints = payload.get("datapoints")
     if isinstance(datapoints, list) and datapoints:
         for row in datapoints:
@@ -1019,6 +996,13 @@ def iter_plot_export_datapoints(payload: dict):
                 yield row
         return
 
+    store = open_session_store(payload.get("session_store_path"))
+    if store is not None:
+        with store:
+            if store.count("datapoints"):
+                yield from store.iter_rows("datapoints", columns, include_samples=include_samples)
+                return
+
     datapoints_path = payload.get("datapoints_path")
     if not datapoints_path:
         return
@@ -1039,7 +1023,8 @@ def iter_plot_export_datapoints(payload: dict):
 
 
 def collect_plot_export_datapoints(payload: dict) -> list[dict]:
-    return [row for row in iter_plot_export_datapoints(payload)]
+    # Exported figures only draw medians and spreads, never the raw sample lists.
+    return [row for row in iter_plot_export_datapoints(payload, include_samples=False)]
 
 
 def build_metric_summary_figure(payload: dict, metric: str) -> Figure:
@@ -1135,8 +1120,16 @@ def _stats_export_row_color(row: dict) -> str:
     return "#E8EEF7"
 
 
-def _build_stats_export_rows(payload: dict) -> tuple[list[list[str]], list[str], dict]:
-    stats_block = payload.get("statistical_tests") if isinstance(payload, dict) else None
+# Session payload key and figure title per exported statistics metric.
+STATS_EXPORT_BLOCKS = {
+    "runtime": ("statistical_tests", "Runtime"),
+    "cpu": ("cpu_time_statistical_tests", "CPU Time"),
+}
+
+
+def _build_stats_export_rows(payload: dict, metric: str = "runtime") -> tuple[list[list[str]], list[str], dict]:
+    stats_key = STATS_EXPORT_BLOCKS.get(metric, STATS_EXPORT_BLOCKS["runtime"])[0]
+    stats_block = payload.get(stats_key) if isinstance(payload, dict) else None
     if not isinstance(stats_block, dict):
         return [], [], {"alpha": 0.05, "significant_count": 0}
 
@@ -1180,8 +1173,9 @@ def _build_stats_export_rows(payload: dict) -> tuple[list[list[str]], list[str],
     }
 
 
-def build_stats_summary_figure(payload: dict) -> Figure:
-    rows, row_colors, meta = _build_stats_export_rows(payload)
+def build_stats_summary_figure(payload: dict, metric: str = "runtime") -> Figure:
+    rows, row_colors, meta = _build_stats_export_rows(payload, metric)
+    metric_title = STATS_EXPORT_BLOCKS.get(metric, STATS_EXPORT_BLOCKS["runtime"])[1]
     alpha = float(meta.get("alpha") or 0.05)
     heading_map = stats_column_heading_map()
     headings = [heading_map.get(col, col) for col in STATS_EXPORT_COLUMNS]
@@ -1192,12 +1186,12 @@ def build_stats_summary_figure(payload: dict) -> Figure:
     ax = fig.add_subplot(111)
     ax.set_axis_off()
 
-    title = "Runtime Statistical Tests vs Family Baseline"
+    title = f"{metric_title} Statistical Tests vs Family Baseline"
     summary = (
         f"Comparisons: {len(rows)} | significant (p < {alpha:.3f}): "
         f"{int(meta.get('significant_count') or 0)}"
     )
-    blurb = "Runtime deltas are variant - baseline. Negative mean delta means faster; positive means slower."
+    blurb = f"{metric_title} deltas are variant - baseline. Negative mean delta means faster; positive means slower."
     fig.text(0.025, 0.975, title, ha="left", va="top", fontsize=15, weight="bold", color="#1F2933")
     fig.text(0.025, 0.935, summary, ha="left", va="top", fontsize=10.5, color="#374151")
     fig.text(0.025, 0.905, blurb, ha="left", va="top", fontsize=9.5, color="#4B5563")
@@ -1252,24 +1246,107 @@ def build_stats_summary_figure(payload: dict) -> Figure:
     return fig
 
 
+def _ratio_comparison_rows(payload: dict) -> list[dict]:
+    block = payload.get("datapoint_comparisons") if isinstance(payload, dict) else None
+    if not isinstance(block, dict):
+        return []
+    rows = [dict(row, scope="datapoint") for row in list(block.get("datapoints") or []) if isinstance(row, dict)]
+    rows += [dict(row, scope="dataset") for row in list(block.get("datasets") or []) if isinstance(row, dict)]
+    return rows
+
+
+def build_ratio_summary_figure(payload: dict) -> Figure:
+    rows = _ratio_comparison_rows(payload)
+    block = dict(payload.get("datapoint_comparisons") or {}) if isinstance(payload, dict) else {}
+    alpha = float(block.get("alpha") or 0.05)
+    positions: dict[str, int] = {}
+    for row in rows:
+        if row["scope"] == "dataset":
+            key = f"{row.get('dataset_name') or row.get('dataset_id')} (pooled)"
+        else:
+            key = str(row.get("point_label") or "")
+        row["_position_label"] = key
+        positions.setdefault(key, len(positions))
+    variant_ids = list(dict.fromkeys(str(row.get("variant_id") or "") for row in rows))
+
+    fig = Figure(figsize=(max(10.0, min(28.0, 3.0 + (0.35 * len(positions)))), 8.6), dpi=120)
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(2, 1, sharex=True)
+    fig.text(0.02, 0.985, "Median Ratio vs Family Baseline per Datapoint", ha="left", va="top", fontsize=14, weight="bold", color="#1F2933")
+    fig.text(
+        0.02,
+        0.955,
+        f"Bars are {100.0 * (1.0 - alpha):.0f}% bootstrap CIs ({int(block.get('resamples') or 0)} resamples). Below 1 is faster / leaner than the baseline.",
+        ha="left",
+        va="top",
+        fontsize=9.5,
+        color="#4B5563",
+    )
+    spread = 0.6 / max(1, len(variant_ids))
+    for ax, metric_key, title in ((axes[0], "runtime_ratio", "Runtime ratio"), (axes[1], "memory_ratio", "Peak memory ratio")):
+        ax.axhline(1.0, color="#6B7280", linewidth=0.9, linestyle="--")
+        ax.set_ylabel(title)
+        lowest = None
+        for variant_idx, variant_id in enumerate(variant_ids):
+            xs, ys, lows, highs = [], [], [], []
+            label = variant_id
+            for row in rows:
+                ci = row.get(metric_key) if isinstance(row.get(metric_key), dict) else {}
+                if row.get("variant_id") != variant_id or ci.get("estimate") is None:
+                    continue
+                label = str(row.get("variant_label") or variant_id)
+                estimate = float(ci["estimate"])
+                low = float(ci["ci_low"]) if ci.get("ci_low") is not None else estimate
+                high = float(ci["ci_high"]) if ci.get("ci_high") is not None else estimate
+                xs.append(positions[row["_position_label"]] + ((variant_idx - ((len(variant_ids) - 1) * 0.5)) * spread))
+                ys.append(estimate)
+                lows.append(max(0.0, estimate - low))
+                highs.append(max(0.0, high - estimate))
+            if xs:
+                ax.errorbar(xs, ys, yerr=[lows, highs], fmt="o", markersize=4, capsize=2.5, linewidth=1.0, label=label)
+                variant_lowest = min(y - low for y, low in zip(ys, lows))
+                lowest = variant_lowest if lowest is None else min(lowest, variant_lowest)
+        # Ratios are multiplicative, so 0.5x and 2x sit symmetrically around 1 on a log axis.
+        if lowest is not None and lowest > 0.0:
+            ax.set_yscale("log")
+            ax.yaxis.set_major_formatter(FuncFormatter(lambda value, _pos: f"{value:g}x"))
+            ax.yaxis.set_minor_formatter(FuncFormatter(lambda value, _pos: f"{value:g}x"))
+        ax.grid(True, axis="y", color="#E5E7EB", linewidth=0.6)
+    if not rows:
+        axes[0].text(0.5, 0.5, "No per-datapoint comparisons were recorded for this run.", ha="center", va="center", transform=axes[0].transAxes)
+    elif variant_ids:
+        axes[0].legend(loc="upper left", bbox_to_anchor=(1.0, 1.0), fontsize=8.5, frameon=False)
+    axes[1].set_xticks(list(positions.values()))
+    axes[1].set_xticklabels(list(positions.keys()), rotation=45, ha="right", fontsize=8)
+    fig.subplots_adjust(left=0.07, right=0.82, top=0.91, bottom=0.22, hspace=0.08)
+    return fig
+
+
 def save_session_stats_exports(payload: dict, out_dir: Path) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    fig = build_stats_summary_figure(payload)
-    try:
-        for suffix, kwargs in (
-            ("png", {"dpi": 160}),
-            ("svg", {}),
-            ("pdf", {}),
-        ):
-            try:
-                fig.savefig(out_dir / f"stats-summary.{suffix}", **kwargs)
-            except Exception as exc:
-                print(f"Warning: failed to export stats-summary.{suffix}: {exc}", file=sys.stderr)
-    finally:
+    exports = [("stats-summary", lambda: build_stats_summary_figure(payload, "runtime"))]
+    cpu_block = payload.get("cpu_time_statistical_tests") if isinstance(payload, dict) else None
+    if isinstance(cpu_block, dict) and list(cpu_block.get("pairs") or []):
+        exports.append(("stats-summary-cpu", lambda: build_stats_summary_figure(payload, "cpu")))
+    if _ratio_comparison_rows(payload):
+        exports.append(("stats-ratios", lambda: build_ratio_summary_figure(payload)))
+    for stem, build_figure in exports:
+        fig = build_figure()
         try:
-            fig.clear()
-        except Exception:
-            pass
+            for suffix, kwargs in (
+                ("png", {"dpi": 160}),
+                ("svg", {}),
+                ("pdf", {}),
+            ):
+                try:
+                    fig.savefig(out_dir / f"{stem}.{suffix}", **kwargs)
+                except Exception as exc:
+                    print(f"Warning: failed to export {stem}.{suffix}: {exc}", file=sys.stderr)
+        finally:
+            try:
+                fig.clear()
+            except Exception:
+                pass
 
 
 def _filtered_payload_for_variants(payload: dict, variant_ids: list[str], scope_label: str) -> dict:
@@ -1323,20 +1400,31 @@ def save_session_plot_exports(payload: dict, out_dir: Path) -> None:
     for suffix, export_payload in exports:
         runtime_fig = build_metric_summary_figure(export_payload, "runtime")
         memory_fig = build_metric_summary_figure(export_payload, "memory")
+        # CPU time is only recorded where the kernel reports rusage (not on Windows).
+        has_cpu = any(isinstance(row.get("cpu_time_median_ms"), (int, float)) for row in export_payload.get("datapoints") or [])
+        cpu_fig = build_metric_summary_figure(export_payload, "cpu") if has_cpu else None
+        # Corrected runtimes only exist when the session ran spawn calibration.
+        has_corrected = any(isinstance(row.get("runtime_corrected_median_ms"), (int, float)) for row in export_payload.get("datapoints") or [])
+        corrected_fig = build_metric_summary_figure(export_payload, "runtime_corrected") if has_corrected else None
         try:
             runtime_fig.savefig(out_dir / f"runtime-2d{suffix}.png", dpi=150)
             memory_fig.savefig(out_dir / f"memory-2d{suffix}.png", dpi=150)
             runtime_fig.savefig(out_dir / f"runtime-2d{suffix}.svg")
             memory_fig.savefig(out_dir / f"memory-2d{suffix}.svg")
+            if cpu_fig is not None:
+                cpu_fig.savefig(out_dir / f"cpu-2d{suffix}.png", dpi=150)
+                cpu_fig.savefig(out_dir / f"cpu-2d{suffix}.svg")
+            if corrected_fig is not None:
+                corrected_fig.savefig(out_dir / f"runtime-corrected-2d{suffix}.png", dpi=150)
+                corrected_fig.savefig(out_dir / f"runtime-corrected-2d{suffix}.svg")
         finally:
-            try:
-                runtime_fig.clear()
-            except Exception:
-                pass
-            try:
-                memory_fig.clear()
-            except Exception:
-                pass
+            for fig in (runtime_fig, memory_fig, cpu_fig, corrected_fig):
+                if fig is None:
+                    continue
+                try:
+                    fig.clear()
+                except Exception:
+                    pass
 
 
 def figure_has_plottable_data(fig: Figure | None) -> bool:
@@ -1461,6 +1549,8 @@ def parse_dijkstra_distance(output_text: str) -> str | None:
 
 VISUALIZER_SOLUTION_CAP = 2000
 VISUALIZER_PREFETCH_RADIUS = 10
+# Datapoint fields the visualizer reads; session-store loads decode nothing else.
+VISUALIZER_DATAPOINT_COLUMNS = ("variant_id", "variant_label", "point_label", "dataset_id", "dataset_name", "x_value", "y_value", "seeds")
 
 
 def parse_int_tokens(line: str) -> list[int]:
@@ -1505,16 +1595,20 @@ def parse_vf_graph(path: Path) -> list[list[int]]:
 
 
 def parse_lad_graph(path: Path) -> list[list[int]]:
+    return parse_lad_text(path.read_text(encoding="utf-8", errors="replace"), source=str(path))
+
+
+def parse_lad_text(text: str, source: str = "<memory>") -> list[list[int]]:
     lines = [
         line.strip()
-        for line in path.read_text(encoding="utf-8", errors="replace").splitlines()
+        for line in text.splitlines()
         if line.strip() and not line.lstrip().startswith("#")
     ]
     if not lines:
-        raise RuntimeError(f"Empty LAD graph file: {path}")
+        raise RuntimeError(f"Empty LAD graph file: {source}")
     n_tokens = parse_int_tokens(lines[0])
     if not n_tokens:
-        raise RuntimeError(f"Invalid LAD header in {path}")
+        raise RuntimeError(f"Invalid LAD header in {source}")
     n = max(0, int(n_tokens[0]))
     adj: list[set[int]] = [set() for _ in range(n)]
     for u in range(n):
@@ -2540,47 +2634,35 @@ def pick_connected_nodes(undirected_adj, k: int, rng: random.Random):
     return list(selected)
 
 
+# Writers delegate to the single-buffer serializers in utilities/generate_graphs.py.
 def write_dijkstra_csv(path: Path, edges, labels):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as fh:
-        fh.write(f"# start={labels[0]} target={labels[-1]}\n")
-        writer = csv.writer(fh)
-        writer.writerow(["source", "target", "weight"])
-        for u, v, w in edges:
-            writer.writerow([labels[u], labels[v], w])
+    generator_mod.write_dijkstra_csv(path, edges, labels)
 
 
 def write_vf(path: Path, adj, labels):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        fh.write(f"{len(adj)}\n")
-        for i, label in enumerate(labels):
-            fh.write(f"{i} {label}\n")
-        for i, neighbors in enumerate(adj):
-            fh.write(f"{len(neighbors)}\n")
-            for v in neighbors:
-                fh.write(f"{i} {v}\n")
+    generator_mod.write_vf(path, adj, labels)
 
 
 def write_vertex_labelled_lad(path: Path, adj, labels):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        fh.write(f"{len(adj)}\n")
-        for i, neighbors in enumerate(adj):
-            line = f"{labels[i]} {len(neighbors)}"
-            if neighbors:
-                line += " " + " ".join(str(v) for v in neighbors)
-            fh.write(line + "\n")
+    generator_mod.write_vertex_labelled_lad(path, adj, labels)
 
 
 def write_unlabelled_lad(path: Path, adj):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        fh.write(f"{len(adj)}\n")
-        for neighbors in adj:
-            row = [str(len(neighbors))]
-            row.extend(str(int(v)) for v in neighbors)
-            fh.write(" ".join(row) + "\n")
+    generator_mod.write_lad(path, [[int(v) for v in neighbors] for neighbors in adj])
+
+
+# Input format each subgraph solver family reads; other families need no subgraph files.
+SUBGRAPH_FAMILY_FORMATS = {"vf3": "vf", "glasgow": "lad"}
+
+
+def subgraph_input_formats(variant_ids) -> tuple[str, ...]:
+    formats = {
+        SUBGRAPH_FAMILY_FORMATS[family]
+        for family in (variant_family_from_id(variant_id) for variant_id in (variant_ids or []))
+        if family in SUBGRAPH_FAMILY_FORMATS
+    }
+    # Without a recognised subgraph variant, keep writing every format.
+    return generator_mod.normalize_subgraph_formats(formats or None)
 
 
 def generate_dijkstra_inputs(
@@ -2589,12 +2671,24 @@ def generate_dijkstra_inputs(
     density: float,
     seed: int,
     graph_family: str = "random_density",
+    generator_engine: str = generator_mod.DEFAULT_GENERATOR_ENGINE,
+    streaming: bool = False,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
 ) -> Path:
     rng = random.Random(seed)
-    labels = [f"v{i}" for i in range(n)]
-    edges = generator_mod.generate_directed_edges(n, rng, density, graph_family=graph_family)
     path = out_dir / "dijkstra_generated.csv"
-    write_dijkstra_csv(path, edges, labels)
+    generator_backend = generator_mod.resolve_generator_backend(generator_backend)
+    # The numpy backend always writes through the streaming CSV path; record what actually ran.
+    streaming = bool(streaming) or generator_backend == "numpy"
+    if streaming:
+        edges = generator_mod.stream_directed_edges(
+            n, rng, density, graph_family=graph_family, engine=generator_engine, backend=generator_backend
+        )
+        edge_count = generator_mod.write_dijkstra_csv_stream(path, edges, n)
+    else:
+        edges = generator_mod.generate_directed_edges(n, rng, density, graph_family=graph_family, engine=generator_engine)
+        write_dijkstra_csv(path, edges, [f"v{i}" for i in range(n)])
+        edge_count = len(edges)
     max_edges = n * (n - 1)
     metadata = {
         "algorithm": "dijkstra",
@@ -2602,29 +2696,42 @@ def generate_dijkstra_inputs(
         "n": int(n),
         "k": None,
         "density": float(density),
-        "actual_density": 0.0 if max_edges <= 0 else float(len(edges)) / float(max_edges),
+        "actual_density": 0.0 if max_edges <= 0 else float(edge_count) / float(max_edges),
         "seed": int(seed),
+        "generator_engine": generator_mod.normalize_generator_engine(generator_engine),
+        "generator_algorithm": generator_mod.generator_algorithm(
+            graph_family, generator_engine, directed=True, streaming=streaming, backend=generator_backend
+        ),
+        "generator_streaming": bool(streaming),
+        "generator_backend": generator_backend,
+        "generator_rng": generator_mod.generator_rng_semantics(generator_backend),
         "files": [path.as_posix()],
     }
     (out_dir / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
     return path
 
 
-def generate_subgraph_inputs(
-    out_dir: Path,
+def build_subgraph_target(
     n: int,
-    k: int,
     density: float,
-    seed: int,
-    graph_family: str = "random_density",
+    rng: random.Random,
+    graph_family: str,
+    generator_engine: str,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
 ):
-    if k >= n:
-        raise ValueError("k must be smaller than N")
-    rng = random.Random(seed)
-    target_adj = generator_mod.generate_adjacency(n, rng, density, graph_family=graph_family)
+    target_adj = generator_mod.generate_adjacency(
+        n, rng, density, graph_family=graph_family, engine=generator_engine, backend=generator_backend
+    )
     undirected = sanitize_undirected_simple_adj(build_undirected_adj(target_adj))
+    return undirected, subgraph_target_labels(n)
+
+
+def subgraph_target_labels(n: int) -> list[int]:
+    return [i % 4 for i in range(n)]
+
+
+def extract_subgraph_pattern(undirected, labels, k: int, rng: random.Random):
     nodes = pick_connected_nodes(undirected, k, rng)
-    labels = [i % 4 for i in range(n)]
     node_set = set(nodes)
     pattern_map = {node: idx for idx, node in enumerate(nodes)}
     pattern_adj = []
@@ -2632,45 +2739,509 @@ def generate_subgraph_inputs(
         neighbors = [pattern_map[v] for v in undirected[node] if v in node_set]
         pattern_adj.append(sorted(neighbors))
     pattern_adj = sanitize_undirected_simple_adj(pattern_adj)
-    pattern_labels = [labels[node] for node in nodes]
+    return nodes, pattern_adj, [labels[node] for node in nodes]
 
-    vf_target = out_dir / "vf3_target.vf"
-    vf_pattern = out_dir / "vf3_pattern.vf"
-    lad_target = out_dir / "glasgow_target.lad"
-    lad_pattern = out_dir / "glasgow_pattern.lad"
 
-    write_vf(vf_target, undirected, labels)
-    write_vf(vf_pattern, pattern_adj, pattern_labels)
-    write_vertex_labelled_lad(lad_target, undirected, labels)
-    write_vertex_labelled_lad(lad_pattern, pattern_adj, pattern_labels)
+def _subgraph_graph_metadata(
+    algorithm: str,
+    undirected,
+    n: int,
+    density: float,
+    seed: int,
+    graph_family: str,
+    generator_engine: str,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
+) -> dict:
+    generator_backend = generator_mod.resolve_generator_backend(generator_backend)
     actual_edges = count_adj_edges(undirected) // 2
     max_edges = (n * (n - 1)) // 2
-    metadata = {
-        "algorithm": "subgraph",
+    return {
+        "algorithm": algorithm,
         "graph_family": generator_mod.normalize_graph_family(graph_family),
         "n": int(n),
-        "k": int(k),
         "density": float(density),
         "actual_density": 0.0 if max_edges <= 0 else float(actual_edges) / float(max_edges),
         "seed": int(seed),
-        "pattern_nodes": [int(node) for node in nodes],
-        "files": [
-            lad_pattern.as_posix(),
-            lad_target.as_posix(),
-            vf_pattern.as_posix(),
-            vf_target.as_posix(),
-        ],
+        "generator_engine": generator_mod.normalize_generator_engine(generator_engine),
+        "generator_algorithm": generator_mod.generator_algorithm(graph_family, generator_engine, directed=False, backend=generator_backend),
+        "generator_backend": generator_backend,
+        "generator_rng": generator_mod.generator_rng_semantics(generator_backend),
     }
+
+
+def generate_subgraph_inputs(
+    out_dir: Path,
+    n: int,
+    k: int,
+    density: float,
+    seed: int,
+    graph_family: str = "random_density",
+    generator_engine: str = generator_mod.DEFAULT_GENERATOR_ENGINE,
+    formats=None,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
+):
+    if k >= n:
+        raise ValueError("k must be smaller than N")
+    rng = random.Random(seed)
+    undirected, labels = build_subgraph_target(n, density, rng, graph_family, generator_engine, generator_backend)
+    nodes, pattern_adj, pattern_labels = extract_subgraph_pattern(undirected, labels, k, rng)
+
+    formats = generator_mod.normalize_subgraph_formats(formats)
+    written = generator_mod.write_subgraph_formats(
+        out_dir,
+        target_adj=undirected,
+        pattern_adj=pattern_adj,
+        target_labels=labels,
+        pattern_labels=pattern_labels,
+        formats=formats,
+    )
+    metadata = _subgraph_graph_metadata("subgraph", undirected, n, density, seed, graph_family, generator_engine, generator_backend)
+    metadata.update({
+        "k": int(k),
+        "target_mode": "per_point",
+        "pattern_nodes": [int(node) for node in nodes],
+        "formats": list(formats),
+        "files": [path.as_posix() for path in written.values()],
+    })
     (out_dir / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+    result: dict[str, Path | str] = dict(written)
+    if "lad" in formats:
+        result["lad_format"] = "vertexlabelledlad"
+    return result
+
+
+def normalize_subgraph_target_mode(value) -> str:
+    mode = str(value or DEFAULT_SUBGRAPH_TARGET_MODE).strip().lower()
+    if mode not in SUBGRAPH_TARGET_MODES:
+        raise ValueError(f"subgraph_target_mode must be one of: {', '.join(SUBGRAPH_TARGET_MODES)}")
+    return mode
+
+
+def shared_target_seed(base_seed: int, iter_idx: int) -> int:
+    # Independent of the datapoint, so every k at one (N, density) shares the iteration's target.
+    seed = int((int(base_seed) + 900_000_000 + int(iter_idx)) % 2_147_483_647)
+    return seed if seed > 0 else int(iter_idx) + 1
+
+
+def load_shared_subgraph_target(target_dir: Path, formats) -> tuple[list[list[int]], list[int]]:
+    """Read a published shared target back into the adjacency ``build_subgraph_target`` returns."""
+    fmt = "vf" if "vf" in formats else "lad"
+    path = Path(target_dir) / generator_mod.SUBGRAPH_FORMAT_FILES[fmt]["target"][1]
+    adj = parse_vf_graph(path) if fmt == "vf" else parse_vertex_labelled_lad_graph(path)
+    undirected = sanitize_undirected_simple_adj(adj)
+    return undirected, subgraph_target_labels(len(undirected))
+
+
+def shared_subgraph_target(
+    n: int,
+    density: float,
+    target_seed: int,
+    graph_family: str,
+    generator_engine: str,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
+    *,
+    target_dir: Path,
+    formats,
+):
+    # Runners loop over datapoints outside iterations, so later k values of an iteration
+    # find its target already published (possibly by a prefetch worker process) and read it
+    # back instead of regenerating it; adjacency rows are sorted either way, so patterns match.
+    if (Path(target_dir) / "metadata.json").exists():
+        return load_shared_subgraph_target(target_dir, formats)
+    return build_subgraph_target(n, density, random.Random(target_seed), graph_family, generator_engine, generator_backend)
+
+
+def _ensure_shared_subgraph_target(input_cache: InputCache | None, params: dict, target_dir: Path, build) -> None:
+    if (target_dir / "metadata.json").exists():
+        return
+    # Built beside the final directory and renamed into place, so concurrent prefetch
+    # workers never expose (or relink) a target file a solver is already reading.
+    staging_dir = target_dir.with_name(f"{target_dir.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+    try:
+        materialize_generated_inputs(input_cache, params, staging_dir, build)
+        metadata_path = staging_dir / "metadata.json"
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        metadata["files"] = [(target_dir / Path(str(item)).name).as_posix() for item in metadata.get("files") or []]
+        metadata_path.unlink()
+        metadata_path.write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+        try:
+            os.rename(staging_dir, target_dir)
+        except OSError:
+            if not (target_dir / "metadata.json").exists():
+                raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def generate_shared_target_subgraph_inputs(
+    out_dir: Path,
+    n: int,
+    k: int,
+    density: float,
+    seed: int,
+    *,
+    target_seed: int,
+    target_root: Path,
+    graph_family: str = "random_density",
+    generator_engine: str = generator_mod.DEFAULT_GENERATOR_ENGINE,
+    formats=None,
+    input_cache: InputCache | None = None,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
+) -> dict[str, Path | str]:
+    """Write a k-specific pattern against the target shared by every k of one iteration.
+
+    The target depends only on ``(n, density, graph_family, generator_engine, generator_backend, target_seed)``
+    and lives once under ``target_root``; ``seed`` only drives pattern extraction.
+    """
+    if k >= n:
+        raise ValueError("k must be smaller than N")
+    formats = generator_mod.normalize_subgraph_formats(formats)
+    graph_family = generator_mod.normalize_graph_family(graph_family)
+    generator_engine = generator_mod.normalize_generator_engine(generator_engine)
+    generator_backend = generator_mod.resolve_generator_backend(generator_backend)
+    target_params = {
+        "builder": "subgraph_target",
+        "graph_family": graph_family,
+        "n": int(n),
+        "density": float(density),
+        "seed": int(target_seed),
+        "generator_engine": generator_engine,
+        "formats": list(formats),
+    }
+    if generator_backend != generator_mod.DEFAULT_GENERATOR_BACKEND:
+        target_params["generator_backend"] = generator_backend
+    target_dir = Path(target_root) / cache_key(target_params, "shared-target")[:16]
+    target_graph: list[tuple[list[list[int]], list[int]]] = []
+
+    def _target():
+        # Built (or read back) only when the target or the pattern is missing from the cache/store.
+        if not target_graph:
+            target_graph.append(shared_subgraph_target(
+                int(n), float(density), int(target_seed), graph_family, generator_engine, generator_backend, target_dir=target_dir, formats=formats
+            ))
+        return target_graph[0]
+
+    def _build_target(build_dir: Path) -> dict[str, Path | str]:
+        undirected, labels = _target()
+        written = generator_mod.write_subgraph_graph(build_dir, "target", undirected, labels, formats)
+        metadata = _subgraph_graph_metadata(
+            "subgraph_target", undirected, n, density, target_seed, graph_family, generator_engine, generator_backend
+        )
+        metadata.update({"formats": list(formats), "files": [path.as_posix() for path in written.values()]})
+        (build_dir / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+        return dict(written)
+
+    def _build_pattern(build_dir: Path) -> dict[str, Path | str]:
+        undirected, labels = _target()
+        nodes, pattern_adj, pattern_labels = extract_subgraph_pattern(undirected, labels, k, random.Random(seed))
+        written = generator_mod.write_subgraph_graph(build_dir, "pattern", pattern_adj, pattern_labels, formats)
+        metadata = _subgraph_graph_metadata("subgraph", undirected, n, density, seed, graph_family, generator_engine, generator_backend)
+        metadata.update({
+            "k": int(k),
+            "target_mode": "shared",
+            "target_seed": int(target_seed),
+            "pattern_seed": int(seed),
+            "pattern_nodes": [int(node) for node in nodes],
+            "formats": list(formats),
+            "files": [path.as_posix() for path in written.values()],
+        })
+        (build_dir / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+        return dict(written)
+
+    target_dir.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_shared_subgraph_target(input_cache, target_params, target_dir, _build_target)
+
+    pattern_params = {"builder": "subgraph_shared_pattern", "target": target_params, "k": int(k), "seed": int(seed)}
+    written = materialize_generated_inputs(input_cache, pattern_params, out_dir, _build_pattern)
+    target_files = {
+        key: target_dir / name
+        for key, name in (generator_mod.SUBGRAPH_FORMAT_FILES[fmt]["target"] for fmt in formats)
+    }
+    # The target directory belongs to this run, so it is added after the (possibly cached) pattern.
+    metadata_path = out_dir / "metadata.json"
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata["target_dir"] = target_dir.as_posix()
+    metadata["target_files"] = [path.as_posix() for path in target_files.values()]
+    metadata_path.unlink()
+    metadata_path.write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+    result: dict[str, Path | str] = {**written, **target_files}
+    if "lad" in formats:
+        result["lad_format"] = "vertexlabelledlad"
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def generator_code_version(*extra_builders) -> str:
+    digest = hashlib.sha256(f"v{INPUT_GENERATOR_VERSION}".encode("utf-8"))
+    for obj in (
+        generator_mod,
+        build_undirected_adj,
+        sanitize_undirected_simple_adj,
+        pick_connected_nodes,
+        write_dijkstra_csv,
+        write_vf,
+        write_vertex_labelled_lad,
+        generate_dijkstra_inputs,
+        build_subgraph_target,
+        extract_subgraph_pattern,
+        generate_subgraph_inputs,
+        generate_shared_target_subgraph_inputs,
+        *extra_builders,
+    ):
+        try:
+            digest.update(inspect.getsource(obj).encode("utf-8"))
+        except (OSError, TypeError):
+            # Frozen builds ship without sources; INPUT_GENERATOR_VERSION alone keys them.
+            digest.update(str(getattr(obj, "__qualname__", getattr(obj, "__name__", obj))).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def input_cache_from_config(config: dict) -> InputCache | None:
+    raw_max_mb = config.get("input_cache_max_mb", DEFAULT_INPUT_CACHE_MAX_MB)
+    try:
+        max_mb = float(raw_max_mb) if raw_max_mb is not None else 0.0
+    except (TypeError, ValueError):
+        max_mb = 0.0
+    if max_mb <= 0:
+        return None
+    raw_dir = str(config.get("input_cache_dir") or "").strip()
+    root = Path(raw_dir).expanduser() if raw_dir else input_cache_root()
+    return InputCache(root, max_bytes=int(max_mb * 1024 * 1024))
+
+
+def materialize_generated_inputs(
+    input_cache: InputCache | None,
+    params: dict,
+    out_dir: Path,
+    build,
+    extra_builders: tuple = (),
+) -> dict[str, Path | str]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if input_cache is None:
+        return build(out_dir)
+    key = cache_key(params, generator_code_version(*extra_builders))
+    result = input_cache.materialize(key, out_dir, build)
+    metadata_path = out_dir / "metadata.json"
+    try:
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return result
+    # The linked copy is shared with the cache entry, so replace it rather than write through it.
+    metadata["files"] = [(out_dir / Path(str(item)).name).as_posix() for item in metadata.get("files") or []]
+    metadata["input_cache_key"] = key
+    metadata_path.unlink()
+    metadata_path.write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+    return result
+
+
+def visualizer_generator_engine(run_config: dict) -> str:
+    # Sessions recorded before the engine was configurable were generated by the legacy engine.
+    return generator_mod.normalize_generator_engine(run_config.get("generator_engine") or "legacy")
+
+
+def visualizer_target_kwargs(run_config: dict, selected_family: str, iter_idx: int, target_root: Path) -> dict:
+    # Shared-target sessions regenerate the iteration's shared target, not a per-datapoint one.
+    if selected_family in {"dijkstra", "sp_via"} or normalize_subgraph_target_mode(run_config.get("subgraph_target_mode")) != "shared":
+        return {}
+    return {"target_seed": shared_target_seed(int(run_config.get("seed") or 0), iter_idx), "target_root": target_root}
+
+
+def generate_iteration_inputs(
+    tab_id: str,
+    out_dir: Path,
+    n: int,
+    k: int,
+    density: float,
+    seed: int,
+    graph_family: str = "random_density",
+    input_cache: InputCache | None = None,
+    generator_engine: str = generator_mod.DEFAULT_GENERATOR_ENGINE,
+    formats=None,
+    target_seed: int | None = None,
+    target_root: Path | None = None,
+    streaming: bool = False,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
+) -> dict[str, Path | str]:
+    subgraph_formats = generator_mod.normalize_subgraph_formats(formats)
+    generator_backend = generator_mod.resolve_generator_backend(generator_backend)
+    if tab_id != "shortest_path" and target_seed is not None:
+        return generate_shared_target_subgraph_inputs(
+            out_dir,
+            n,
+            k,
+            density,
+            seed,
+            target_seed=target_seed,
+            target_root=target_root if target_root is not None else out_dir / "shared_targets",
+            graph_family=graph_family,
+            generator_engine=generator_engine,
+            formats=subgraph_formats,
+            input_cache=input_cache,
+            generator_backend=generator_backend,
+        )
+
+    def _build(target_dir: Path) -> dict[str, Path | str]:
+        if tab_id == "shortest_path":
+            return {
+                "dijkstra_file": generate_dijkstra_inputs(
+                    target_dir,
+                    n,
+                    density,
+                    seed,
+                    graph_family=graph_family,
+                    generator_engine=generator_engine,
+                    streaming=streaming,
+                    generator_backend=generator_backend,
+                )
+            }
+        return generate_subgraph_inputs(
+            target_dir,
+            n,
+            k,
+            density,
+            seed,
+            graph_family=graph_family,
+            generator_engine=generator_engine,
+            formats=subgraph_formats,
+            generator_backend=generator_backend,
+        )
+
+    params = {
+        "builder": "dijkstra" if tab_id == "shortest_path" else "subgraph",
+        "graph_family": generator_mod.normalize_graph_family(graph_family),
+        "n": int(n),
+        "k": None if tab_id == "shortest_path" else int(k),
+        "density": float(density),
+        "seed": int(seed),
+        "generator_engine": generator_mod.normalize_generator_engine(generator_engine),
+    }
+    if tab_id != "shortest_path":
+        params["formats"] = list(subgraph_formats)
+    elif streaming:
+        params["streaming"] = True
+    if generator_backend != generator_mod.DEFAULT_GENERATOR_BACKEND:
+        # Only non-default backends enter the key, so existing python cache entries stay valid.
+        params["generator_backend"] = generator_backend
+    return materialize_generated_inputs(input_cache, params, out_dir, _build)
+
+
+def build_solver_command(variant_id: str, binary: Path, inputs: dict[str, Path | str]) -> list[str]:
+    family = variant_family_from_id(variant_id)
+    if family in {"dijkstra", "sp_via"}:
+        return [str(binary), str(inputs["dijkstra_file"])]
+    if family == "vf3":
+        if variant_id == "vf3_baseline":
+            # Generated subgraph benchmarks are non-induced and undirected.
+            return [str(binary), "-u", "-r", "0", "-e", str(inputs["vf_pattern"]), str(inputs["vf_target"])]
+        return [str(binary), str(inputs["vf_pattern"]), str(inputs["vf_target"])]
+    if family == "glasgow":
+        lad_format = str(inputs.get("lad_format") or "lad").strip() or "lad"
+        if variant_id == "glasgow_baseline":
+            return [str(binary), "--count-solutions", "--format", lad_format, str(inputs["lad_pattern"]), str(inputs["lad_target"])]
+        return [str(binary), str(inputs["lad_pattern"]), str(inputs["lad_target"])]
+    raise ValueError(f"Unsupported variant: {variant_id}")
+
+
+def noop_calibration_command() -> list[str] | None:
+    if sys.platform.startswith("win"):
+        comspec = os.environ.get("COMSPEC") or shutil.which("cmd")
+        return [comspec, "/c", "exit 0"] if comspec else None
+    true_path = shutil.which("true")
+    return [true_path] if true_path else None
+
+
+def _calibration_distribution(samples: list[float]) -> dict:
+    ordered = sorted(float(value) for value in samples)
+    return {
+        "n": len(ordered),
+        "median_ms": median_or_none(ordered),
+        "mean_ms": float(statistics.fmean(ordered)) if ordered else None,
+        "stdev_ms": safe_stdev(ordered),
+        "min_ms": ordered[0] if ordered else None,
+        "p05_ms": percentile(ordered, 0.05) if ordered else None,
+        "p95_ms": percentile(ordered, 0.95) if ordered else None,
+        "samples_ms": ordered,
+    }
+
+
+def run_spawn_calibration(
+    run_process,
+    *,
+    selected_variants: list[str],
+    binary_paths: dict[str, Path],
+    trivial_inputs: dict[str, Path | str],
+    trials: int,
+    cwd: Path,
+) -> dict:
+    """Time a no-op binary and every solver on a trivial input.
+
+    ``run_process(command, cwd)`` must return the ``_run_process_with_peak_memory``
+    tuple. Rounds are interleaved across commands so drift hits all of them equally.
+    The per-variant median is the spawn/startup overhead subtracted from measured
+    runtimes; a variant that fails calibration falls back to the no-op median.
+    """
+    trials = int(max(0, trials))
+    commands: dict[str, list[str]] = {}
+    errors: dict[str, str] = {}
+    noop_command = noop_calibration_command()
+    for variant_id in selected_variants:
+        try:
+            commands[variant_id] = build_solver_command(variant_id, binary_paths[variant_id], trivial_inputs)
+        except (KeyError, ValueError) as exc:
+            errors[variant_id] = str(exc)
+    samples: dict[str, list[float]] = {variant_id: [] for variant_id in commands}
+    noop_samples: list[float] = []
+    noop_error = None if noop_command else "no no-op binary found"
+    for _round in range(trials):
+        if noop_command and noop_error is None:
+            try:
+                runtime_ms, _peak_kb, return_code, _stdout, _stderr, _measurement = run_process(noop_command, cwd)
+            except (OSError, SolverTimeoutError) as exc:
+                noop_error = str(exc)
+            else:
+                if return_code == 0:
+                    noop_samples.append(float(runtime_ms))
+                else:
+                    noop_error = f"exit code {return_code}"
+        for variant_id, command in commands.items():
+            if variant_id in errors:
+                continue
+            try:
+                runtime_ms, _peak_kb, return_code, _stdout, _stderr, _measurement = run_process(command, Path(command[0]).parent)
+            except (OSError, SolverTimeoutError) as exc:
+                errors[variant_id] = str(exc)
+                continue
+            if return_code != 0:
+                errors[variant_id] = f"exit code {return_code}"
+                continue
+            samples[variant_id].append(float(runtime_ms))
+    variants: dict[str, dict] = {}
+    for variant_id in selected_variants:
+        entry = _calibration_distribution(samples.get(variant_id, []))
+        entry["command"] = commands.get(variant_id)
+        entry["error"] = errors.get(variant_id)
+        variants[variant_id] = entry
+    noop = _calibration_distribution(noop_samples)
+    noop["command"] = noop_command
+    noop["error"] = noop_error
     return {
-        "vf_pattern": vf_pattern,
-        "vf_target": vf_target,
-        "lad_pattern": lad_pattern,
-        "lad_target": lad_target,
-        "lad_format": "vertexlabelledlad",
+        "trials": trials,
+        "noop": noop,
+        "variants": variants,
+        "correction_basis": "variant_trivial_input_median",
     }
 
 
+def spawn_overhead_ms(calibration: dict | None, variant_id: str) -> float | None:
+    if not isinstance(calibration, dict):
+        return None
+    variant_entry = dict(calibration.get("variants") or {}).get(variant_id) or {}
+    if not variant_entry.get("error") and isinstance(variant_entry.get("median_ms"), (int, float)):
+        return float(variant_entry["median_ms"])
+    noop_median = dict(calibration.get("noop") or {}).get("median_ms")
+    return float(noop_median) if isinstance(noop_median, (int, float)) else None
+
+
 def write_dijkstra_csv_with_labels(path: Path, edges: list[tuple[str, str, int]], start_label: str, target_label: str):
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as fh:
@@ -2694,34 +3265,50 @@ def count_adj_edges(adj: list[list[int]]) -> int:
     return int(sum(len(row) for row in adj))
 
 
-def dataset_storage_root() -> Path:
-    override = str(os.environ.get("CAPSTONE_DATASETS_DIR") or "").strip()
+def _user_data_dir(leaf: str, override_env: str) -> Path:
+    override = str(os.environ.get(override_env) or "").strip()
     if override:
         root = Path(override).expanduser()
     elif sys.platform.startswith("win"):
         local_appdata = str(os.environ.get("LOCALAPPDATA") or "").strip()
         if local_appdata:
-            root = Path(local_appdata) / "CapstoneBenchmarkRunner" / "datasets"
+            root = Path(local_appdata) / "CapstoneBenchmarkRunner" / leaf
         else:
-            root = Path.home() / "AppData" / "Local" / "CapstoneBenchmarkRunner" / "datasets"
+            root = Path.home() / "AppData" / "Local" / "CapstoneBenchmarkRunner" / leaf
     elif sys.platform == "darwin":
-        root = Path.home() / "Library" / "Application Support" / "CapstoneBenchmarkRunner" / "datasets"
+        root = Path.home() / "Library" / "Application Support" / "CapstoneBenchmarkRunner" / leaf
     else:
         xdg_data_home = str(os.environ.get("XDG_DATA_HOME") or "").strip()
         if xdg_data_home:
-            root = Path(xdg_data_home) / "capstone-benchmark-runner" / "datasets"
+            root = Path(xdg_data_home) / "capstone-benchmark-runner" / leaf
         else:
-            root = Path.home() / ".local" / "share" / "capstone-benchmark-runner" / "datasets"
+            root = Path.home() / ".local" / "share" / "capstone-benchmark-runner" / leaf
     try:
         root.mkdir(parents=True, exist_ok=True)
         return root
     except OSError:
         # Last-resort fallback keeps behavior working even in restricted environments.
-        fallback = adjacent_output_base() / ".datasets"
+        fallback = adjacent_output_base() / f".{leaf}"
         fallback.mkdir(parents=True, exist_ok=True)
         return fallback
 
 
+def dataset_storage_root() -> Path:
+    return _user_data_dir("datasets", "CAPSTONE_DATASETS_DIR")
+
+
+def input_cache_root() -> Path:
+    return _user_data_dir("input_cache", "CAPSTONE_INPUT_CACHE_DIR")
+
+
+def results_warehouse_root() -> Path:
+    return _user_data_dir("warehouse", "CAPSTONE_RESULTS_WAREHOUSE_DIR")
+
+
+def trial_cache_root() -> Path:
+    return _user_data_dir("trial_cache", "CAPSTONE_TRIAL_CACHE_DIR")
+
+
 def dataset_dir_for_spec(spec: DatasetSpec) -> Path:
     return dataset_storage_root() / spec.tab_id / spec.dataset_id
 
@@ -2928,11 +3515,25 @@ def _decode_text_lines(blob: bytes) -> list[str]:
     return [line.strip() for line in text.replace("\r", "").split("\n") if line.strip()]
 
 
-def _parse_mivia_graph_bytes(data: bytes, labeled: bool) -> tuple[list[list[int]], list[str] | None]:
+def _mivia_words(data) -> memoryview:
+    # MIVIA files are little-endian 16-bit words. On little-endian hosts the payload is
+    # viewed in place; elsewhere it is copied once into a byte-swapped array("H").
+    view = memoryview(data).cast("B")
+    view = view[: len(view) - (len(view) % 2)]
+    if sys.byteorder == "little":
+        return view.cast("H")
+    words = array("H")
+    words.frombytes(view)
+    words.byteswap()
+    return memoryview(words)
+
+
+def _parse_mivia_graph_bytes(data, labeled: bool) -> tuple[list[list[int]], list[str] | None]:
     if len(data) < 2:
         raise RuntimeError("MIVIA graph payload is too small.")
-    words = [int.from_bytes(data[idx : idx + 2], "little", signed=False) for idx in range(0, len(data) - 1, 2)]
-    if not words:
+    words = _mivia_words(data)
+    total = len(words)
+    if not total:
         raise RuntimeError("MIVIA graph payload is empty.")
     n = int(words[0])
     if n <= 0:
@@ -2940,31 +3541,79 @@ def _parse_mivia_graph_bytes(data: bytes, labeled: bool) -> tuple[list[list[int]
     cursor = 1
     labels: list[str] | None = None
     if labeled:
-        if len(words) < 1 + n:
+        if total < 1 + n:
             raise RuntimeError("Labeled MIVIA graph payload is truncated.")
-        labels = [f"label_{int(words[cursor + idx])}" for idx in range(n)]
+        labels = [f"label_{value}" for value in words[cursor : cursor + n].tolist()]
         cursor += n
+    # Labeled rows interleave (destination, edge attribute) words; a strided slice keeps
+    # the destinations without touching the attributes.
+    stride = 2 if labeled else 1
     adj: list[list[int]] = []
     for _node in range(n):
-        if cursor >= len(words):
+        if cursor >= total:
             raise RuntimeError("MIVIA graph payload ended before adjacency rows were complete.")
         degree = int(words[cursor])
         cursor += 1
-        row: list[int] = []
-        for _edge in range(max(0, degree)):
-            if cursor >= len(words):
-                raise RuntimeError("MIVIA graph payload ended during an adjacency row.")
-            dst = int(words[cursor])
-            cursor += 1
-            row.append(dst)
-            if labeled:
-                if cursor >= len(words):
-                    raise RuntimeError("Labeled MIVIA graph payload ended during edge attributes.")
-                cursor += 1
-        adj.append(row)
+        end = cursor + degree * stride
+        if end > total:
+            if labeled and (total - cursor) % 2:
+                raise RuntimeError("Labeled MIVIA graph payload ended during edge attributes.")
+            raise RuntimeError("MIVIA graph payload ended during an adjacency row.")
+        adj.append(words[cursor:end:stride].tolist())
+        cursor = end
     return normalize_adj_lists(adj), labels
 
 
+# Compressed inner ZIPs are spooled before opening; up to this size the copy stays in memory.
+MIVIA_INNER_SPOOL_BYTES = 64 * 1024 * 1024
+
+
+def _read_mivia_pairs(
+    archive_path: Path,
+    pairs: list[tuple[str, str, str]],
+    labeled: bool,
+) -> list[tuple[list[list[int]], list[list[int]], list[str] | None, list[str] | None]]:
+    """Parse ``(inner_zip, graph_a, graph_b)`` pairs from a MIVIA outer archive in one pass.
+
+    Each inner ZIP is opened once for all of its requested pairs, and its members are
+    read in archive order. Opening a ZIP seeks to its central directory and back, which
+    a compressed outer member can only do by decompressing again from the start, so
+    compressed inner ZIPs are first copied forward into a spool (in memory up to
+    ``MIVIA_INNER_SPOOL_BYTES``); stored ones are read through the outer stream.
+    Results keep the order of ``pairs``.
+    """
+    by_inner: dict[str, list[int]] = {}
+    for idx, (inner_name, _graph_a, _graph_b) in enumerate(pairs):
+        by_inner.setdefault(inner_name, []).append(idx)
+    results: list = [None] * len(pairs)
+    with zipfile.ZipFile(archive_path) as outer_zip:
+        for inner_name in sorted(by_inner, key=lambda name: outer_zip.getinfo(name).header_offset):
+            with outer_zip.open(inner_name) as member_stream, tempfile.SpooledTemporaryFile(max_size=MIVIA_INNER_SPOOL_BYTES) as spool:
+                inner_stream = member_stream
+                if outer_zip.getinfo(inner_name).compress_type != zipfile.ZIP_STORED:
+                    shutil.copyfileobj(member_stream, spool, 1024 * 1024)
+                    spool.seek(0)
+                    inner_stream = spool
+                with zipfile.ZipFile(inner_stream) as inner_zip:
+                    members = {Path(info.filename).name: info for info in inner_zip.infolist()}
+                    wanted: dict[str, zipfile.ZipInfo] = {}
+                    for idx in by_inner[inner_name]:
+                        _inner, graph_a, graph_b = pairs[idx]
+                        if graph_a not in members or graph_b not in members:
+                            raise RuntimeError(f"Could not resolve MIVIA pair members for {graph_a} / {graph_b}")
+                        wanted[graph_a] = members[graph_a]
+                        wanted[graph_b] = members[graph_b]
+                    parsed = {
+                        name: _parse_mivia_graph_bytes(inner_zip.read(info), labeled=labeled)
+                        for name, info in sorted(wanted.items(), key=lambda item: item[1].header_offset)
+                    }
+            for idx in by_inner[inner_name]:
+                _inner, graph_a, graph_b = pairs[idx]
+                (pattern_adj, pattern_labels), (target_adj, target_labels) = parsed[graph_a], parsed[graph_b]
+                results[idx] = (pattern_adj, target_adj, pattern_labels, target_labels)
+    return results
+
+
 def _select_mivia_pair(archive_path: Path, prepare: dict) -> tuple[list[list[int]], list[list[int]], list[str] | None, list[str] | None, dict]:
     desired_prefix = str(prepare.get("inner_zip_prefix") or "si2_").strip().lower()
     labeled = bool(prepare.get("labeled", False))
@@ -2992,15 +3641,9 @@ def _select_mivia_pair(archive_path: Path, prepare: dict) -> tuple[list[list[int
         if ".a" not in graph_a_name.lower():
             raise RuntimeError(f"Unexpected MIVIA pair token in {gtr_name}: {graph_a_name}")
         graph_b_name = re.sub(r"\.A", ".B", graph_a_name, count=1, flags=re.IGNORECASE)
-        inner_data = outer_zip.read(inner_name)
-    with zipfile.ZipFile(io.BytesIO(inner_data)) as inner_zip:
-        inner_names = inner_zip.namelist()
-        member_a = next((name for name in inner_names if Path(name).name == graph_a_name), None)
-        member_b = next((name for name in inner_names if Path(name).name == graph_b_name), None)
-        if member_a is None or member_b is None:
-            raise RuntimeError(f"Could not resolve MIVIA pair members for {graph_a_name} / {graph_b_name}")
-        pattern_adj, pattern_labels = _parse_mivia_graph_bytes(inner_zip.read(member_a), labeled=labeled)
-        target_adj, target_labels = _parse_mivia_graph_bytes(inner_zip.read(member_b), labeled=labeled)
+    [(pattern_adj, target_adj, pattern_labels, target_labels)] = _read_mivia_pairs(
+        archive_path, [(inner_name, graph_a_name, graph_b_name)], labeled
+    )
     return pattern_adj, target_adj, pattern_labels, target_labels, {
         "selected_archive": Path(inner_name).name,
         "selected_pair": f"{graph_a_name}|{graph_b_name}",
@@ -3181,11 +3824,280 @@ def _convert_subgraph_from_adj_pair(
     }
 
 
-def _convert_shortest_path_from_edge_list(
+# - Edge-list and DIMACS sources are read as byte blocks of whole lines. A block of
+#   plain "u v" (or "a u v w") lines is parsed with one split and one int() map;
+#   blocks holding comments or odd rows take a per-line path.
+# - The CSV is written front to back once. Its "# start=... target=..." line is
+#   space-padded to a fixed width and overwritten at the end, once the endpoint
+#   labels are known.
+# - With NumPy, the rows are also kept as int64 arrays and saved as a CSR sidecar
+#   (utilities/csr_graph.py) that the oracle, visualizer and metrics can map.
+SHORTEST_PATH_CONVERT_BLOCK_BYTES = 8 * 1024 * 1024
+_DIJKSTRA_HEADER_WIDTH = 64
+_EDGE_LIST_SEPARATORS = bytes.maketrans(b",;", b"  ")
+# The column-slicing fast paths only apply when every line holds exactly one row's
+# tokens; a short or long line anywhere would otherwise pair tokens across lines.
+# Possessive quantifiers keep the check a single backtrack-free scan.
+_TWO_COLUMN_BLOCK = re.compile(rb"(?:[^\S\n]*+\S++[^\S\n]++\S++[^\S\n]*+\n)*+")
+_DIMACS_ARC_BLOCK = re.compile(rb"(?:[^\S\n]*+a[^\S\n]++\S++[^\S\n]++\S++[^\S\n]++\S++[^\S\n]*+\n)*+")
+_DISTINCT_NODE_TRACKING_LIMIT = 1_000_000
+
+
+class _NonIntegerLabels(ValueError):
+    pass
+
+
+def _iter_line_blocks(source_path: Path, block_bytes: int | None = None):
+    block_bytes = int(block_bytes or SHORTEST_PATH_CONVERT_BLOCK_BYTES)
+    opener = gzip.open if source_path.suffix.lower() == ".gz" else open
+    with opener(source_path, "rb") as fh:
+        tail = b""
+        while True:
+            chunk = fh.read(block_bytes)
+            if not chunk:
+                break
+            chunk = tail + chunk if tail else chunk
+            cut = chunk.rfind(b"\n")
+            if cut < 0:
+                tail = chunk
+                continue
+            tail = chunk[cut + 1 :]
+            yield chunk[: cut + 1]
+        if tail.strip():
+            yield tail + b"\n"
+
+
+def _parse_edge_list_block(block: bytes, state: dict) -> tuple[list[int], list[int], None]:
+    text = block.translate(_EDGE_LIST_SEPARATORS)
+    try:
+        if b"#" not in text and b"%" not in text:
+            if _TWO_COLUMN_BLOCK.fullmatch(text):
+                values = list(map(int, text.split()))
+                return values[0::2], values[1::2], None
+        sources: list[int] = []
+        targets: list[int] = []
+        for raw_line in text.split(b"\n"):
+            line = raw_line.strip()
+            if not line:
+                continue
+            if line[:1] in {b"#", b"%"}:
+                if state.get("announced_nodes", 0) <= 0:
+                    node_match = re.search(rb"Nodes:\s*(\d+)", line, flags=re.IGNORECASE)
+                    if node_match:
+                        state["announced_nodes"] = int(node_match.group(1))
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            sources.append(int(parts[0]))
+            targets.append(int(parts[1]))
+        return sources, targets, None
+    except ValueError as exc:
+        raise _NonIntegerLabels(str(exc)) from exc
+
+
+def _parse_dimacs_block(block: bytes, state: dict) -> tuple[list[int], list[int], list[int]]:
+    if _DIMACS_ARC_BLOCK.fullmatch(block):
+        tokens = block.split()
+        try:
+            return list(map(int, tokens[1::4])), list(map(int, tokens[2::4])), list(map(int, tokens[3::4]))
+        except ValueError:
+            pass
+    sources: list[int] = []
+    targets: list[int] = []
+    weights: list[int] = []
+    for raw_line in block.split(b"\n"):
+        line = raw_line.strip()
+        if not line:
+            continue
+        token = line[:1].lower()
+        if token == b"p":
+            parts = line.split()
+            if len(parts) >= 4:
+                try:
+                    state["declared_nodes"] = int(parts[2])
+                except ValueError:
+                    state["declared_nodes"] = 0
+            continue
+        if token != b"a":
+            continue
+        parts = line.split()
+        if len(parts) < 4:
+            continue
+        try:
+            src = int(parts[1])
+            dst = int(parts[2])
+            weight = int(float(parts[3]))
+        except ValueError:
+            continue
+        sources.append(src)
+        targets.append(dst)
+        weights.append(weight)
+    return sources, targets, weights
+
+
+def _stream_integer_edges_to_dijkstra_csv(source_path: Path, dijkstra_csv: Path, parse_block, *, undirected: bool) -> dict:
+    """Write every non-loop row of ``source_path`` to ``dijkstra_csv`` in one pass.
+
+    The header line is a padded placeholder until ``_finish_dijkstra_csv_header``.
+    Returns row/label statistics and, when NumPy can build a sidecar, the rows as arrays.
+    """
+    keep_rows = csr_mod.np is not None
+    row_src = array("q")
+    row_dst = array("q")
+    row_weight = array("q")
+    state: dict = {}
+    rows = 0
+    min_id: int | None = None
+    max_id: int | None = None
+    distinct: set[int] | None = None if keep_rows else set()
+    with dijkstra_csv.open("wb") as out_fh:
+        out_fh.write(b" " * _DIJKSTRA_HEADER_WIDTH + b"\nsource,target,weight\n")
+        for block in _iter_line_blocks(source_path):
+            sources, targets, weights = parse_block(block, state)
+            keep = list(map(operator.ne, sources, targets))
+            if not all(keep):
+                sources = list(itertools.compress(sources, keep))
+                targets = list(itertools.compress(targets, keep))
+                weights = None if weights is None else list(itertools.compress(weights, keep))
+            count = len(sources)
+            if not count:
+                continue
+            if weights is None and undirected:
+                flat = [0] * (4 * count)
+                flat[0::4] = sources
+                flat[1::4] = targets
+                flat[2::4] = targets
+                flat[3::4] = sources
+                out_fh.write((b"%d,%d,1\n" * (2 * count)) % tuple(flat))
+                rows += 2 * count
+            elif weights is None:
+                flat = [0] * (2 * count)
+                flat[0::2] = sources
+                flat[1::2] = targets
+                out_fh.write((b"%d,%d,1\n" * count) % tuple(flat))
+                rows += count
+            else:
+                flat = [0] * (3 * count)
+                flat[0::3] = sources
+                flat[1::3] = targets
+                flat[2::3] = weights
+                out_fh.write((b"%d,%d,%d\n" * count) % tuple(flat))
+                rows += count
+            if keep_rows:
+                row_src.extend(sources)
+                row_dst.extend(targets)
+                if weights is not None:
+                    row_weight.extend(weights)
+            low = min(min(sources), min(targets))
+            high = max(max(sources), max(targets))
+            min_id = low if min_id is None else min(min_id, low)
+            max_id = high if max_id is None else max(max_id, high)
+            if distinct is not None:
+                distinct.update(sources)
+                distinct.update(targets)
+                if len(distinct) > _DISTINCT_NODE_TRACKING_LIMIT:
+                    distinct = None
+    return {
+        "rows": rows,
+        "min_id": min_id,
+        "max_id": max_id,
+        "distinct_nodes": None if distinct is None else len(distinct),
+        "state": state,
+        "undirected": bool(undirected),
+        "arrays": (row_src, row_dst, row_weight) if keep_rows else None,
+    }
+
+
+def _finish_dijkstra_csv_header(dijkstra_csv: Path, start_label: str, target_label: str) -> None:
+    header = f"# start={start_label} target={target_label}".encode("utf-8")
+    if len(header) > _DIJKSTRA_HEADER_WIDTH:
+        raise RuntimeError("Shortest-path endpoint labels do not fit the reserved CSV header.")
+    with dijkstra_csv.open("r+b") as fh:
+        fh.write(header.ljust(_DIJKSTRA_HEADER_WIDTH))
+
+
+def _write_dijkstra_csr_sidecar(dijkstra_csv: Path, streamed: dict, start_label: str, target_label: str) -> Path | None:
+    if streamed["arrays"] is None:
+        return None
+    np = csr_mod.np
+    row_src, row_dst, row_weight = (np.frombuffer(values, dtype=np.int64) for values in streamed["arrays"])
+    if streamed["undirected"]:
+        # CSV rows alternate (u, v), (v, u); the stable CSR sort keeps that per-source order.
+        pairs = np.empty((2, 2 * len(row_src)), dtype=np.int64)
+        pairs[0, 0::2] = row_src
+        pairs[0, 1::2] = row_dst
+        pairs[1, 0::2] = row_dst
+        pairs[1, 1::2] = row_src
+        row_src, row_dst = pairs
+    weights = row_weight if len(row_weight) else np.ones(len(row_src), dtype=np.int64)
+    arrays = csr_mod.build_csr_arrays(row_src, row_dst, weights)
+    streamed["distinct_nodes"] = int(len(arrays["labels"]))
+    return csr_mod.write_csr_sidecar(dijkstra_csv, **arrays, start_label=start_label, target_label=target_label)
+
+
+def _shortest_path_conversion_payload(source_kind: str, dijkstra_csv: Path, csr_path: Path | None, n_nodes: int, edge_count: int, start_label: str, target_label: str) -> dict:
+    density = 0.0
+    if n_nodes > 1:
+        density = min(1.0, float(edge_count) / float(n_nodes * (n_nodes - 1)))
+    payload = {
+        "raw_ready": True,
+        "converted_ready": True,
+        "source_kind": source_kind,
+        "inputs": {
+            "dijkstra_file": str(dijkstra_csv),
+        },
+        "graph_file_count": 1,
+        "pair_count": 1,
+        "nodes": int(n_nodes),
+        "edges": int(edge_count),
+        "density": float(density),
+        "start_label": start_label,
+        "target_label": target_label,
+    }
+    if csr_path is not None:
+        payload["csr_file"] = str(csr_path)
+    return payload
+
+
+def _convert_shortest_path_from_edge_list(
+    dataset_dir: Path,
+    source_path: Path,
+    assume_undirected: bool,
+) -> dict:
+    converted_dir = dataset_dir / "converted"
+    converted_dir.mkdir(parents=True, exist_ok=True)
+    dijkstra_csv = converted_dir / "dijkstra_input.csv"
+    csr_mod.sidecar_path_for(dijkstra_csv).unlink(missing_ok=True)
+    try:
+        streamed = _stream_integer_edges_to_dijkstra_csv(
+            source_path, dijkstra_csv, _parse_edge_list_block, undirected=assume_undirected
+        )
+    except _NonIntegerLabels:
+        return _convert_shortest_path_from_labeled_edge_list(dataset_dir, source_path, assume_undirected)
+    if streamed["rows"] <= 0:
+        dijkstra_csv.unlink(missing_ok=True)
+        raise RuntimeError(f"No parseable edges found in {source_path}.")
+    start_label = str(streamed["min_id"])
+    target_label = str(streamed["max_id"])
+    _finish_dijkstra_csv_header(dijkstra_csv, start_label, target_label)
+    csr_path = _write_dijkstra_csr_sidecar(dijkstra_csv, streamed, start_label, target_label)
+    announced_nodes = int(streamed["state"].get("announced_nodes") or 0)
+    if announced_nodes > 0:
+        n_nodes = announced_nodes
+    elif streamed["distinct_nodes"] is not None:
+        n_nodes = int(streamed["distinct_nodes"])
+    else:
+        n_nodes = int(streamed["max_id"] - streamed["min_id"] + 1)
+    return _shortest_path_conversion_payload("edge_list", dijkstra_csv, csr_path, n_nodes, streamed["rows"], start_label, target_label)
+
+
+def _convert_shortest_path_from_labeled_edge_list(
     dataset_dir: Path,
     source_path: Path,
     assume_undirected: bool,
 ) -> dict:
+    # Fallback for edge lists whose node labels are not all integers.
     converted_dir = dataset_dir / "converted"
     converted_dir.mkdir(parents=True, exist_ok=True)
     dijkstra_csv = converted_dir / "dijkstra_input.csv"
@@ -3330,110 +4242,26 @@ def _convert_shortest_path_from_dimacs_gr(
     converted_dir = dataset_dir / "converted"
     converted_dir.mkdir(parents=True, exist_ok=True)
     dijkstra_csv = converted_dir / "dijkstra_input.csv"
-    temp_edges = converted_dir / "edge_rows.tmp.csv"
-
-    opener = gzip.open if source_path.suffix.lower() == ".gz" else open
-    declared_nodes = 0
-    min_node_id: int | None = None
-    max_node_id: int | None = None
-    edge_count = 0
-    with opener(source_path, "rt", encoding="utf-8", errors="replace") as in_fh, temp_edges.open(
-        "w",
-        encoding="utf-8",
-        newline="",
-    ) as out_fh:
-        for raw_line in in_fh:
-            line = str(raw_line or "").strip()
-            if not line:
-                continue
-            token = line[0].lower()
-            if token == "c":
-                continue
-            if token == "p":
-                parts = line.split()
-                if len(parts) >= 4:
-                    try:
-                        declared_nodes = int(parts[2])
-                    except ValueError:
-                        declared_nodes = 0
-                continue
-            if token != "a":
-                continue
-            parts = line.split()
-            if len(parts) < 4:
-                continue
-            try:
-                src = int(parts[1])
-                dst = int(parts[2])
-                weight = int(float(parts[3]))
-            except ValueError:
-                continue
-            if src == dst:
-                continue
-            out_fh.write(f"{src},{dst},{weight}\n")
-            edge_count += 1
-            low = src if src <= dst else dst
-            high = dst if dst >= src else src
-            min_node_id = low if min_node_id is None else min(min_node_id, low)
-            max_node_id = high if max_node_id is None else max(max_node_id, high)
-
-    if edge_count <= 0:
-        try:
-            temp_edges.unlink()
-        except OSError:
-            pass
+    csr_mod.sidecar_path_for(dijkstra_csv).unlink(missing_ok=True)
+    streamed = _stream_integer_edges_to_dijkstra_csv(source_path, dijkstra_csv, _parse_dimacs_block, undirected=False)
+    if streamed["rows"] <= 0:
+        dijkstra_csv.unlink(missing_ok=True)
         raise RuntimeError(f"No parseable arc rows found in DIMACS source {source_path}.")
-
+    declared_nodes = int(streamed["state"].get("declared_nodes") or 0)
     if declared_nodes > 0:
         n_nodes = declared_nodes
         start_label = "1"
         target_label = str(declared_nodes)
-    elif min_node_id is not None and max_node_id is not None and max_node_id >= min_node_id:
-        n_nodes = int((max_node_id - min_node_id) + 1)
-        start_label = str(min_node_id)
-        target_label = str(max_node_id)
     else:
-        try:
-            temp_edges.unlink()
-        except OSError:
-            pass
-        raise RuntimeError("Could not derive node range for DIMACS conversion.")
+        n_nodes = int(streamed["max_id"] - streamed["min_id"] + 1)
+        start_label = str(streamed["min_id"])
+        target_label = str(streamed["max_id"])
     if n_nodes < 2 or start_label == target_label:
-        try:
-            temp_edges.unlink()
-        except OSError:
-            pass
+        dijkstra_csv.unlink(missing_ok=True)
         raise RuntimeError("DIMACS conversion produced an invalid node range.")
-
-    with dijkstra_csv.open("w", encoding="utf-8", newline="") as out_fh:
-        out_fh.write(f"# start={start_label} target={target_label}\n")
-        out_fh.write("source,target,weight\n")
-        with temp_edges.open("r", encoding="utf-8", errors="replace") as in_fh:
-            shutil.copyfileobj(in_fh, out_fh, length=1024 * 1024)
-    try:
-        temp_edges.unlink()
-    except OSError:
-        pass
-
-    density = 0.0
-    if n_nodes > 1:
-        density = min(1.0, float(edge_count) / float(n_nodes * (n_nodes - 1)))
-
-    return {
-        "raw_ready": True,
-        "converted_ready": True,
-        "source_kind": "dimacs_gr",
-        "inputs": {
-            "dijkstra_file": str(dijkstra_csv),
-        },
-        "graph_file_count": 1,
-        "pair_count": 1,
-        "nodes": int(n_nodes),
-        "edges": int(edge_count),
-        "density": float(density),
-        "start_label": start_label,
-        "target_label": target_label,
-    }
+    _finish_dijkstra_csv_header(dijkstra_csv, start_label, target_label)
+    csr_path = _write_dijkstra_csr_sidecar(dijkstra_csv, streamed, start_label, target_label)
+    return _shortest_path_conversion_payload("dimacs_gr", dijkstra_csv, csr_path, n_nodes, streamed["rows"], start_label, target_label)
 
 
 def prepare_dataset(spec: DatasetSpec) -> dict:
@@ -3583,6 +4411,253 @@ def prepare_dataset(spec: DatasetSpec) -> dict:
     return payload
 
 
+# - A pair index turns a multi-pair archive into a random-access catalog: one
+#   sequential pass records every pattern/target pair with its class, node and
+#   edge counts, and where its bytes live in a decompressed cache beside it.
+# - SIP members are appended to one flat file (offset/size); MIVIA inner ZIPs
+#   are copied out once, after which any member is a central-directory lookup.
+# - Sampled pairs convert independently into pairs/pair_NNNNNN/ and are reused
+#   across runs, so only the first run that picks a pair pays for it.
+DATASET_PAIR_INDEX_SCHEMA_VERSION = "dataset-pair-index-v1"
+DATASET_PAIR_INDEX_KINDS = ("subgraph_pair_from_tgz_members", "subgraph_pair_from_mivia_archive")
+
+
+def dataset_supports_pair_index(spec: DatasetSpec) -> bool:
+    return str(dict(spec.prepare or {}).get("kind") or "").strip().lower() in DATASET_PAIR_INDEX_KINDS
+
+
+def _dataset_pair_index_dir(dataset_dir: Path) -> Path:
+    return dataset_dir / "pair_index"
+
+
+def _archive_fingerprint(archive_path: Path) -> dict:
+    stat = archive_path.stat()
+    return {"name": archive_path.name, "size_bytes": int(stat.st_size), "mtime_ns": int(stat.st_mtime_ns)}
+
+
+def _index_graph_entry(adj: list[list[int]], **location) -> dict:
+    return {**location, "nodes": len(adj), "edges": count_adj_edges(adj)}
+
+
+def _index_sip_pairs(archive_path: Path, index_dir: Path) -> list[dict]:
+    # Streaming tar mode reads the .tgz front to back exactly once.
+    blob_path = index_dir / "members.bin"
+    members: dict[str, dict[str, dict]] = {}
+    with tarfile.open(archive_path, "r|gz") as tf, blob_path.open("wb") as blob:
+        for member in tf:
+            role = Path(member.name).name
+            if not member.isfile() or role not in {"pattern", "target"}:
+                continue
+            extracted = tf.extractfile(member)
+            if extracted is None:
+                continue
+            data = extracted.read()
+            offset = blob.tell()
+            blob.write(data)
+            adj = normalize_adj_lists(parse_lad_text(data.decode("utf-8", errors="replace"), source=member.name))
+            members.setdefault(str(Path(member.name).parent.as_posix()), {})[role] = _index_graph_entry(
+                adj, member=member.name, offset=offset, size=len(data)
+            )
+    pairs: list[dict] = []
+    for pair_dir in sorted(members):
+        roles = members[pair_dir]
+        if "pattern" not in roles or "target" not in roles:
+            continue
+        parts = Path(pair_dir).parts
+        pairs.append(
+            {
+                "pair_id": pair_dir,
+                "class": parts[1] if len(parts) >= 3 else parts[0],
+                "family": parts[-2] if len(parts) >= 2 else parts[0],
+                "pattern": roles["pattern"],
+                "target": roles["target"],
+            }
+        )
+    return pairs
+
+
+def _index_mivia_pairs(archive_path: Path, index_dir: Path, labeled: bool) -> list[dict]:
+    inner_dir = index_dir / "inner"
+    inner_dir.mkdir(parents=True, exist_ok=True)
+    pairs: list[dict] = []
+    with zipfile.ZipFile(archive_path) as outer_zip:
+        names = outer_zip.namelist()
+        gtr_by_stem = {Path(name).stem.lower(): name for name in names if name.lower().endswith(".gtr")}
+        for inner_name in sorted(name for name in names if name.lower().endswith(".zip")):
+            stem = Path(inner_name).stem
+            gtr_name = gtr_by_stem.get(stem.lower())
+            if gtr_name is None:
+                continue
+            cached_inner = inner_dir / Path(inner_name).name
+            with outer_zip.open(inner_name) as src, cached_inner.open("wb") as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+            graph_a_names: list[str] = []
+            for line in _decode_text_lines(outer_zip.read(gtr_name)):
+                token = str(line.split()[0]).strip()
+                if ".a" in token.lower() and token not in graph_a_names:
+                    graph_a_names.append(token)
+            with zipfile.ZipFile(cached_inner) as inner_zip:
+                infos = {Path(info.filename).name: info for info in inner_zip.infolist()}
+                for graph_a in graph_a_names:
+                    graph_b = re.sub(r"\.A", ".B", graph_a, count=1, flags=re.IGNORECASE)
+                    if graph_a not in infos or graph_b not in infos:
+                        continue
+                    entries = {}
+                    for role, name in (("pattern", graph_a), ("target", graph_b)):
+                        info = infos[name]
+                        adj, _labels = _parse_mivia_graph_bytes(inner_zip.read(info), labeled=labeled)
+                        entries[role] = _index_graph_entry(
+                            adj,
+                            archive=f"inner/{cached_inner.name}",
+                            member=info.filename,
+                            offset=int(info.header_offset),
+                            size=int(info.file_size),
+                        )
+                    pairs.append(
+                        {
+                            "pair_id": f"{stem}/{graph_a}",
+                            "class": stem.split("_", 1)[0].lower(),
+                            "family": stem,
+                            **entries,
+                        }
+                    )
+    return pairs
+
+
+def build_dataset_pair_index(spec: DatasetSpec, *, rebuild: bool = False) -> dict:
+    """Return the pair index of a multi-pair subgraph dataset, building it on first use.
+
+    The raw archive is downloaded if needed. A stored index is reused while the
+    archive's size and mtime match the ones recorded when it was built.
+    """
+    if not dataset_supports_pair_index(spec):
+        raise RuntimeError(f"Dataset {spec.dataset_id} does not support pair indexing.")
+    dataset_dir = dataset_dir_for_spec(spec)
+    _download_dataset_raw_files(spec, dataset_dir)
+    prepare = dict(spec.prepare or {})
+    kind = str(prepare.get("kind") or "").strip().lower()
+    archive_path = dataset_dir / str(prepare.get("archive_relative_path") or "").strip()
+    labeled = bool(prepare.get("labeled", False))
+    index_dir = _dataset_pair_index_dir(dataset_dir)
+    index_path = index_dir / "index.json"
+    fingerprint = _archive_fingerprint(archive_path)
+    if not rebuild and index_path.is_file():
+        try:
+            existing = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            existing = {}
+        if (
+            existing.get("schema_version") == DATASET_PAIR_INDEX_SCHEMA_VERSION
+            and existing.get("archive") == fingerprint
+            and bool(existing.get("labeled")) == labeled
+        ):
+            return existing
+    shutil.rmtree(index_dir, ignore_errors=True)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    if kind == "subgraph_pair_from_tgz_members":
+        source_kind = "sip_tgz"
+        pairs = _index_sip_pairs(archive_path, index_dir)
+    else:
+        source_kind = "mivia_zip"
+        pairs = _index_mivia_pairs(archive_path, index_dir, labeled)
+    for position, pair in enumerate(pairs):
+        pair["index"] = position
+    index = {
+        "schema_version": DATASET_PAIR_INDEX_SCHEMA_VERSION,
+        "dataset_id": spec.dataset_id,
+        "source_kind": source_kind,
+        "labeled": labeled,
+        "archive": fingerprint,
+        "index_build_ms": (time.perf_counter() - started) * 1000.0,
+        "pair_count": len(pairs),
+        "classes": sorted({pair["class"] for pair in pairs}),
+        "pairs": pairs,
+    }
+    tmp_path = index_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(index, separators=(",", ":")) + "\n", encoding="utf-8")
+    tmp_path.replace(index_path)
+    return index
+
+
+def sample_dataset_pairs(
+    index: dict,
+    count: int,
+    *,
+    classes: list[str] | None = None,
+    min_nodes: int | None = None,
+    max_nodes: int | None = None,
+    seed: int = 0,
+) -> list[dict]:
+    """Pick up to ``count`` pairs; ``classes`` match a pair's class or family, nodes bound the target."""
+    wanted = {str(item).strip().lower() for item in list(classes or []) if str(item).strip()}
+    eligible = [
+        pair
+        for pair in list(index.get("pairs") or [])
+        if (not wanted or str(pair.get("class")).lower() in wanted or str(pair.get("family")).lower() in wanted)
+        and (min_nodes is None or int(pair["target"]["nodes"]) >= int(min_nodes))
+        and (max_nodes is None or int(pair["target"]["nodes"]) <= int(max_nodes))
+    ]
+    if count >= len(eligible):
+        return eligible
+    chosen = random.Random(int(seed)).sample(range(len(eligible)), int(max(0, count)))
+    return [eligible[idx] for idx in sorted(chosen)]
+
+
+def _read_indexed_graph(index_dir: Path, source_kind: str, entry: dict) -> bytes:
+    if source_kind == "sip_tgz":
+        with (index_dir / "members.bin").open("rb") as fh:
+            fh.seek(int(entry["offset"]))
+            return fh.read(int(entry["size"]))
+    with zipfile.ZipFile(index_dir / str(entry["archive"])) as inner_zip:
+        return inner_zip.read(str(entry["member"]))
+
+
+def _convert_indexed_pair(dataset_dir: str, source_kind: str, labeled: bool, pair: dict) -> dict:
+    dataset_root = Path(dataset_dir)
+    pair_dir = dataset_root / "pairs" / f"pair_{int(pair['index']):06d}"
+    existing = read_dataset_meta(pair_dir)
+    if existing.get("converted_ready") and existing.get("pair_id") == pair["pair_id"]:
+        return existing
+    index_dir = _dataset_pair_index_dir(dataset_root)
+    pattern_blob = _read_indexed_graph(index_dir, source_kind, pair["pattern"])
+    target_blob = _read_indexed_graph(index_dir, source_kind, pair["target"])
+    if source_kind == "sip_tgz":
+        pattern_adj = parse_lad_text(pattern_blob.decode("utf-8", errors="replace"), source=pair["pattern"]["member"])
+        target_adj = parse_lad_text(target_blob.decode("utf-8", errors="replace"), source=pair["target"]["member"])
+        pattern_labels = target_labels = None
+    else:
+        pattern_adj, pattern_labels = _parse_mivia_graph_bytes(pattern_blob, labeled=labeled)
+        target_adj, target_labels = _parse_mivia_graph_bytes(target_blob, labeled=labeled)
+    meta = _convert_subgraph_from_adj_pair(
+        pair_dir,
+        pattern_adj,
+        target_adj,
+        source_kind=f"{source_kind}_indexed_pair",
+        pattern_labels=pattern_labels,
+        target_labels=target_labels,
+        extra_meta={"pair_id": pair["pair_id"], "pair_class": pair["class"], "pair_family": pair["family"]},
+    )
+    write_dataset_meta(pair_dir, meta)
+    return meta
+
+
+def convert_dataset_pairs(spec: DatasetSpec, index: dict, pairs: list[dict], *, max_processes: int = 1) -> list[dict]:
+    """Convert sampled index pairs to VF/LAD inputs, in parallel when ``max_processes`` > 1.
+
+    Returns one dataset-meta dict per pair, in the order of ``pairs``.
+    """
+    dataset_dir = str(dataset_dir_for_spec(spec))
+    source_kind = str(index.get("source_kind") or "")
+    labeled = bool(index.get("labeled"))
+    processes = int(max(1, min(int(max_processes or 1), len(pairs))))
+    if processes <= 1:
+        return [_convert_indexed_pair(dataset_dir, source_kind, labeled, pair) for pair in pairs]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(_convert_indexed_pair, dataset_dir, source_kind, labeled, pair) for pair in pairs]
+        return [future.result() for future in futures]
+
+
 class BenchmarkRunnerApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -3600,6 +4675,8 @@ class BenchmarkRunnerApp(tk.Tk):
         self.dataset_spec_by_id = {spec.dataset_id: spec for spec in self.dataset_specs}
         self.stop_event = threading.Event()
         self.pause_event = threading.Event()
+        # Wakes the _run_worker scheduler on trial completion, resume and abort.
+        self.scheduler_wake_event = threading.Event()
         self.worker_thread: threading.Thread | None = None
         self.active_proc_lock = threading.Lock()
         self.active_procs: set[subprocess.Popen] = set()
@@ -5796,6 +6873,12 @@ class BenchmarkRunnerApp(tk.Tk):
             "timeout_as_missing": bool(config.get("timeout_as_missing", True)),
             "delete_generated_inputs": bool(config.get("delete_generated_inputs", True)),
         }
+        if config.get("subgraph_target_mode"):
+            manifest["subgraph_target_mode"] = normalize_subgraph_target_mode(config.get("subgraph_target_mode"))
+        if config.get("generator_streaming"):
+            manifest["generator_streaming"] = True
+        if config.get("generator_backend") and config.get("generator_backend") != generator_mod.DEFAULT_GENERATOR_BACKEND:
+            manifest["generator_backend"] = generator_mod.normalize_generator_backend(config.get("generator_backend"))
         solver_timeout = config.get("solver_timeout_seconds")
         if solver_timeout not in {None, ""}:
             manifest["solver_timeout_seconds"] = float(solver_timeout)
@@ -6032,6 +7115,12 @@ class BenchmarkRunnerApp(tk.Tk):
         return f"{label} fixed={self._format_point_value(var_id, float(start), config)}"
 
     def _shortest_metrics_from_csv(self, path: Path) -> tuple[int, float]:
+        graph = csr_mod.load_csr_sidecar(path)
+        if graph is not None:
+            with graph:
+                n_nodes, edge_count = graph.nodes, graph.edges
+            density = min(1.0, float(edge_count) / float(n_nodes * (n_nodes - 1))) if n_nodes > 1 else 0.0
+            return n_nodes, density
         nodes: set[str] = set()
         edge_count = 0
         with path.open("r", encoding="utf-8", errors="replace", newline="") as fh:
@@ -6231,6 +7320,14 @@ class BenchmarkRunnerApp(tk.Tk):
             "detected_logical_cores": detected_cores,
             "delete_generated_inputs": False,
             "warmup_trials": 0,
+            "spawn_calibration_trials": 0,
+            "prefetch_lookahead": 0,
+            "prefetch_disk_budget_mb": None,
+            "input_cache_max_mb": 0,
+            "bootstrap_resamples": 0,
+            "generator_engine": generator_mod.DEFAULT_GENERATOR_ENGINE,
+            "generator_streaming": False,
+            "generator_backend": generator_mod.DEFAULT_GENERATOR_BACKEND,
         }
 
     def _validate_and_build_config(self):
@@ -6515,6 +7612,15 @@ class BenchmarkRunnerApp(tk.Tk):
             "detected_logical_cores": detected_cores,
             "delete_generated_inputs": bool(self.delete_generated_inputs_var.get()),
             "warmup_trials": int(DEFAULT_DISCARDED_WARMUP_TRIALS),
+            "spawn_calibration_trials": int(DEFAULT_SPAWN_CALIBRATION_TRIALS),
+            "prefetch_lookahead": int(DEFAULT_PREFETCH_LOOKAHEAD),
+            "prefetch_disk_budget_mb": float(DEFAULT_PREFETCH_DISK_BUDGET_MB),
+            "input_cache_max_mb": float(DEFAULT_INPUT_CACHE_MAX_MB),
+            "bootstrap_resamples": int(DEFAULT_BOOTSTRAP_RESAMPLES),
+            "generator_engine": generator_mod.DEFAULT_GENERATOR_ENGINE,
+            "generator_streaming": False,
+            "generator_backend": generator_mod.DEFAULT_GENERATOR_BACKEND,
+            "subgraph_target_mode": DEFAULT_SUBGRAPH_TARGET_MODE,
         }
 
     def _start_run(self):
@@ -6603,12 +7709,14 @@ class BenchmarkRunnerApp(tk.Tk):
         with self.active_proc_lock:
             procs = list(self.active_procs)
         for proc in procs:
-            if proc.poll() is not None:
+            # Reaping (and rusage collection) belongs to the process supervisor.
+            if proc.returncode is not None:
                 continue
             try:
                 proc.terminate()
             except Exception:
                 pass
+        self.scheduler_wake_event.set()
         self._append_log("Abort requested.")
 
     def _toggle_pause(self):
@@ -6617,6 +7725,7 @@ class BenchmarkRunnerApp(tk.Tk):
         if self.pause_event.is_set():
             self._set_process_pause_state(paused=False)
             self.pause_event.clear()
+            self.scheduler_wake_event.set()
             self.pause_btn.configure(text="Pause")
             self._append_log("Run resumed.", level="notice")
         else:
@@ -6631,7 +7740,7 @@ class BenchmarkRunnerApp(tk.Tk):
             procs = list(self.active_procs)
         if paused:
             for proc in procs:
-                if proc.poll() is not None:
+                if proc.returncode is not None:
                     continue
                 try:
                     psutil.Process(proc.pid).suspend()
@@ -6863,6 +7972,7 @@ class BenchmarkRunnerApp(tk.Tk):
         generated_root.mkdir(parents=True, exist_ok=True)
         datapoints_stream_path = self.session_output_dir / "benchmark-datapoints.ndjson"
         datapoints_stream_fh = None
+        session_store: SessionStore | None = None
         try:
             if datapoints_stream_path.exists():
                 datapoints_stream_path.unlink()
@@ -6890,6 +8000,12 @@ class BenchmarkRunnerApp(tk.Tk):
         warmup_trials = int(max(0, config.get("warmup_trials", 0)))
         if input_mode == "datasets":
             warmup_trials = 0
+        spawn_calibration_trials = int(max(0, config.get("spawn_calibration_trials", 0)))
+        spawn_calibration: dict | None = None
+        prefetch_lookahead = int(max(0, config.get("prefetch_lookahead", 0)))
+        prefetcher: InputPrefetcher | None = None
+        input_cache = input_cache_from_config(config) if input_mode != "datasets" else None
+        input_formats = subgraph_input_formats(selected_variants)
         failure_policy = str(config.get("failure_policy", "stop")).strip().lower()
         retry_failed_trials = int(max(0, config.get("retry_failed_trials", 0)))
         timeout_as_missing = bool(config.get("timeout_as_missing", True))
@@ -6916,6 +8032,7 @@ class BenchmarkRunnerApp(tk.Tk):
 
         try:
             datapoints_stream_fh = datapoints_stream_path.open("w", encoding="utf-8", newline="\n")
+            session_store = SessionStore(self.session_output_dir / SESSION_STORE_NAME)
             if warmup_trials > 0:
                 try:
                     _warmup_point_idx, warmup_point = next(self._iter_config_datapoints(config))
@@ -6938,29 +8055,22 @@ class BenchmarkRunnerApp(tk.Tk):
                             warmup_seed = warmup_iter + 1
                         warmup_dir = warmup_root / f"trial_{warmup_iter + 1:03d}"
                         warmup_dir.mkdir(parents=True, exist_ok=True)
-                        n_value = int(round(warmup_point["n"]))
-                        density_value = float(warmup_point["density"])
-                        k_value = int(round(warmup_point.get("k_nodes", 1)))
                         if str(config.get("input_mode") or "independent").strip().lower() == "datasets":
                             generated_warmup = self._resolve_dataset_inputs_for_run(warmup_point)
-                        elif config["tab_id"] == "shortest_path":
-                            generated_warmup = {
-                                "dijkstra_file": generate_dijkstra_inputs(
-                                    warmup_dir,
-                                    n_value,
-                                    density_value,
-                                    warmup_seed,
-                                    graph_family=str(config.get("graph_family") or "random_density"),
-                                )
-                            }
                         else:
-                            generated_warmup = generate_subgraph_inputs(
+                            generated_warmup = generate_iteration_inputs(
+                                config["tab_id"],
                                 warmup_dir,
-                                n_value,
-                                k_value,
-                                density_value,
+                                int(round(warmup_point["n"])),
+                                int(round(warmup_point.get("k_nodes", 1))),
+                                float(warmup_point["density"]),
                                 warmup_seed,
                                 graph_family=str(config.get("graph_family") or "random_density"),
+                                input_cache=input_cache,
+                                generator_engine=str(config.get("generator_engine") or generator_mod.DEFAULT_GENERATOR_ENGINE),
+                                streaming=bool(config.get("generator_streaming", False)),
+                                generator_backend=str(config.get("generator_backend") or generator_mod.DEFAULT_GENERATOR_BACKEND),
+                                formats=input_formats,
                             )
                         for variant_id in selected_variants:
                             while self.pause_event.is_set():
@@ -6996,6 +8106,13 @@ class BenchmarkRunnerApp(tk.Tk):
                             )
                     self._clear_live_log_line_threadsafe(token=warmup_token)
                     self._append_log_threadsafe("Warm-up complete. Beginning measured datapoints.", level="notice")
+            if spawn_calibration_trials > 0:
+                spawn_calibration = self._run_spawn_calibration(
+                    config,
+                    generated_root / "_calibration",
+                    spawn_calibration_trials,
+                    solver_timeout_seconds,
+                )
 
             point_states: dict[int, dict] = {}
             datapoint_iter = self._iter_config_datapoints(config)
@@ -7012,6 +8129,12 @@ class BenchmarkRunnerApp(tk.Tk):
                 "iter_seed": None,
             }
 
+            scheduler_wake = self.scheduler_wake_event
+            scheduler_wake.clear()
+
+            def _wake_scheduler(_future: concurrent.futures.Future):
+                scheduler_wake.set()
+
             def _record_trial_completion():
                 nonlocal completed_trials
                 completed_trials += 1
@@ -7034,6 +8157,7 @@ class BenchmarkRunnerApp(tk.Tk):
                 x_value = float(state["x_value"])
                 y_value = float(state["y_value"]) if state["y_value"] is not None else None
                 outlier_mode = str(config.get("outlier_filter", "none")).strip().lower()
+                point_rows: list[dict] = []
                 for variant_id in selected_variants:
                     runtimes_raw = [float(v) for v in state["samples_runtime"][variant_id]]
                     memories_raw = [float(v) for v in state["samples_memory"][variant_id]]
@@ -7071,8 +8195,12 @@ class BenchmarkRunnerApp(tk.Tk):
                         "answer_kind": next((item.get("answer_kind") for item in answer_rows if item.get("answer_kind")), None),
                         "path_length_median": median_or_none([float(item.get("path_length")) for item in answer_rows if isinstance(item.get("path_length"), (int, float))]),
                     }
+                    row.update(summarize_resource_metric_samples(state["samples_resource"][variant_id], outlier_mode))
+                    row.update(summarize_corrected_runtime(runtimes, spawn_overhead_ms(spawn_calibration, variant_id)))
                     datapoints_stream_fh.write(json.dumps(row, default=serialize_for_json) + "\n")
+                    point_rows.append(row)
                     streamed_datapoint_rows += 1
+                session_store.append("datapoints", point_rows)
 
                 combined_runtime_samples: list[float] = []
                 for variant_id in selected_variants:
@@ -7141,6 +8269,52 @@ class BenchmarkRunnerApp(tk.Tk):
                 if isinstance(state, dict):
                     state["submission_done"] = True
 
+            def _iteration_input_args(point_idx: int, point: dict, iter_idx: int) -> tuple:
+                return (
+                    config["tab_id"],
+                    generated_root / f"point_{point_idx + 1:05d}" / f"iter_{iter_idx + 1:03d}",
+                    int(round(point["n"])),
+                    int(round(point.get("k_nodes", 1))),
+                    float(point["density"]),
+                    int(config["base_seed"]) + (point_idx * 100000) + iter_idx,
+                )
+
+            def _shared_target_kwargs(iter_idx: int) -> dict:
+                if config["tab_id"] != "subgraph" or normalize_subgraph_target_mode(config.get("subgraph_target_mode")) != "shared":
+                    return {}
+                return {
+                    "target_seed": shared_target_seed(int(config["base_seed"]), iter_idx),
+                    "target_root": generated_root / "shared_targets",
+                }
+
+            def _prefetch_jobs():
+                for point_idx, point in self._iter_config_datapoints(config):
+                    for iter_idx in range(int(config["iterations"])):
+                        args = _iteration_input_args(point_idx, point, iter_idx)
+                        yield PrefetchJob(
+                            key=(point_idx, iter_idx),
+                            out_dir=args[1],
+                            fn=generate_iteration_inputs,
+                            args=args,
+                            kwargs={
+                                "graph_family": str(config.get("graph_family") or "random_density"),
+                                "input_cache": input_cache,
+                                "generator_engine": str(config.get("generator_engine") or generator_mod.DEFAULT_GENERATOR_ENGINE),
+                                "streaming": bool(config.get("generator_streaming", False)),
+                                "generator_backend": str(config.get("generator_backend") or generator_mod.DEFAULT_GENERATOR_BACKEND),
+                                "formats": input_formats,
+                                **_shared_target_kwargs(iter_idx),
+                            },
+                        )
+
+            if input_mode != "datasets" and prefetch_lookahead > 0:
+                prefetch_budget_mb = config.get("prefetch_disk_budget_mb")
+                prefetcher = InputPrefetcher(
+                    _prefetch_jobs(),
+                    lookahead=prefetch_lookahead,
+                    disk_budget_bytes=None if prefetch_budget_mb is None else int(float(prefetch_budget_mb) * 1024 * 1024),
+                )
+
             def _next_trial():
                 while True:
                     if cursor["point"] is None:
@@ -7180,6 +8354,11 @@ class BenchmarkRunnerApp(tk.Tk):
                             "iter_solution_counts": {iter_idx: {} for iter_idx in range(config["iterations"])},
                             "iter_answer_signatures": {iter_idx: {} for iter_idx in range(config["iterations"])},
                             "iter_runtime_ms": {iter_idx: {} for iter_idx in range(config["iterations"])},
+                            "iter_cpu_time_ms": {iter_idx: {} for iter_idx in range(config["iterations"])},
+                            "samples_resource": {
+                                variant_id: {spec[0]: [] for spec in RESOURCE_METRIC_SPECS}
+                                for variant_id in selected_variants
+                            },
                             "iter_success_count": {iter_idx: 0 for iter_idx in range(config["iterations"])},
                             "answer_rows": {variant_id: [] for variant_id in selected_variants},
                             "inputs_deleted": False,
@@ -7215,30 +8394,17 @@ class BenchmarkRunnerApp(tk.Tk):
                         if str(config.get("input_mode") or "independent").strip().lower() == "datasets":
                             generated = self._resolve_dataset_inputs_for_run(point)
                         else:
-                            point_dir = cursor["state"]["point_dir"]
-                            iter_dir = point_dir / f"iter_{iter_idx + 1:03d}"
-                            iter_dir.mkdir(parents=True, exist_ok=True)
-                            n_value = int(round(point["n"]))
-                            density_value = float(point["density"])
-                            k_value = int(round(point.get("k_nodes", 1)))
-                            if config["tab_id"] == "shortest_path":
-                                generated = {
-                                    "dijkstra_file": generate_dijkstra_inputs(
-                                        iter_dir,
-                                        n_value,
-                                        density_value,
-                                        iter_seed,
-                                        graph_family=str(config.get("graph_family") or "random_density"),
-                                    )
-                                }
-                            else:
-                                generated = generate_subgraph_inputs(
-                                    iter_dir,
-                                    n_value,
-                                    k_value,
-                                    density_value,
-                                    iter_seed,
+                            generated = prefetcher.take((point_idx, iter_idx)) if prefetcher is not None else None
+                            if generated is None:
+                                generated = generate_iteration_inputs(
+                                    *_iteration_input_args(point_idx, point, iter_idx),
                                     graph_family=str(config.get("graph_family") or "random_density"),
+                                    input_cache=input_cache,
+                                    generator_engine=str(config.get("generator_engine") or generator_mod.DEFAULT_GENERATOR_ENGINE),
+                                    streaming=bool(config.get("generator_streaming", False)),
+                                    generator_backend=str(config.get("generator_backend") or generator_mod.DEFAULT_GENERATOR_BACKEND),
+                                    formats=input_formats,
+                                    **_shared_target_kwargs(iter_idx),
                                 )
                         cursor["generated"] = generated
                         cursor["iter_seed"] = iter_seed
@@ -7318,25 +8484,22 @@ class BenchmarkRunnerApp(tk.Tk):
                         trial["heartbeat_label"],
                         solver_timeout_seconds,
                     )
+                    future.add_done_callback(_wake_scheduler)
                     future_map[future] = trial
 
                 if fatal_error is not None:
                     break
-                if not future_map:
-                    if submission_closed:
-                        break
-                    if self.pause_event.is_set():
-                        time.sleep(0.1)
-                        continue
-                    time.sleep(0.05)
-                    continue
+                if not future_map and submission_closed:
+                    break
 
-                done, _pending = concurrent.futures.wait(
-                    set(future_map.keys()),
-                    timeout=0.2,
-                    return_when=concurrent.futures.FIRST_COMPLETED,
-                )
+                done = {future for future in future_map if future.done()}
                 if not done:
+                    # Block until a trial completes, the run is resumed/aborted, or the timed limit is due.
+                    wait_timeout = None
+                    if deadline is not None and not submission_closed and not self.pause_event.is_set():
+                        wait_timeout = max(0.0, deadline - time.monotonic())
+                    scheduler_wake.wait(wait_timeout)
+                    scheduler_wake.clear()
                     continue
 
                 for future in done:
@@ -7351,10 +8514,11 @@ class BenchmarkRunnerApp(tk.Tk):
                     answer_details = None
                     runtime_ms = 0.0
                     peak_kb = 0.0
+                    resource_metrics: dict[str, float] = {}
                     handled_failure = False
 
                     try:
-                        runtime_ms, peak_kb, solution_count, answer_signature, answer_details = future.result()
+                        runtime_ms, peak_kb, solution_count, answer_signature, answer_details, resource_metrics = future.result()
                         success = True
                     except SolverTimeoutError as exc:
                         if attempt < retry_failed_trials and not self.stop_event.is_set() and not timed_out and not aborted:
@@ -7370,6 +8534,7 @@ class BenchmarkRunnerApp(tk.Tk):
                                 retry_trial["heartbeat_label"],
                                 solver_timeout_seconds,
                             )
+                            retry_future.add_done_callback(_wake_scheduler)
                             future_map[retry_future] = retry_trial
                             self._append_log_threadsafe(
                                 f"Retry {attempt + 1}/{retry_failed_trials} after timeout for "
@@ -7410,6 +8575,7 @@ class BenchmarkRunnerApp(tk.Tk):
                                 retry_trial["heartbeat_label"],
                                 solver_timeout_seconds,
                             )
+                            retry_future.add_done_callback(_wake_scheduler)
                             future_map[retry_future] = retry_trial
                             self._append_log_threadsafe(
                                 f"Retry {attempt + 1}/{retry_failed_trials} after failure for "
@@ -7438,6 +8604,10 @@ class BenchmarkRunnerApp(tk.Tk):
                         state["seed_records"][variant_id].append(int(trial["iter_seed"]))
                         state["iter_success_count"][iter_idx] = int(state["iter_success_count"][iter_idx]) + 1
                         state["iter_runtime_ms"][iter_idx][variant_id] = float(runtime_ms)
+                        for metric_id, value in resource_metrics.items():
+                            state["samples_resource"][variant_id][metric_id].append(float(value))
+                        if "cpu_time" in resource_metrics:
+                            state["iter_cpu_time_ms"][iter_idx][variant_id] = float(resource_metrics["cpu_time"])
                         if solution_count is not None:
                             state["iter_solution_counts"][iter_idx][variant_id] = solution_count
                         if answer_signature is not None:
@@ -7509,6 +8679,19 @@ class BenchmarkRunnerApp(tk.Tk):
                 selected_variants=selected_variants,
                 alpha=0.05,
             )
+            cpu_time_statistical_tests = build_desktop_runtime_statistical_tests(
+                config=config,
+                point_states=point_states,
+                selected_variants=selected_variants,
+                alpha=0.05,
+                metric="cpu_time_ms",
+            )
+            datapoint_comparisons = build_datapoint_ratio_comparisons(
+                config=config,
+                point_states=point_states,
+                selected_variants=selected_variants,
+                resamples=int(config.get("bootstrap_resamples") or 0),
+            )
             payload = self._build_payload(
                 config,
                 started_at,
@@ -7520,7 +8703,13 @@ class BenchmarkRunnerApp(tk.Tk):
                 datapoints_stream_path,
                 streamed_datapoint_rows,
                 statistical_tests=statistical_tests,
+                cpu_time_statistical_tests=cpu_time_statistical_tests,
+                spawn_calibration=spawn_calibration,
+                datapoint_comparisons=datapoint_comparisons,
+                session_store_path=session_store.path,
             )
+            session_store.set_payload(payload)
+            session_store.close()
             self.last_run_payload = payload
             self.last_plot_context = payload
             self.after(0, lambda: self._render_plots(payload))
@@ -7624,11 +8813,23 @@ class BenchmarkRunnerApp(tk.Tk):
                     datapoints_stream_fh.close()
             except Exception:
                 pass
+            try:
+                if session_store is not None:
+                    session_store.close()
+            except Exception:
+                pass
             if executor is not None:
                 try:
                     executor.shutdown(wait=False, cancel_futures=True)
                 except Exception:
                     pass
+            if prefetcher is not None:
+                try:
+                    prefetcher.close(delete_untaken=bool(config.get("delete_generated_inputs", True)))
+                except Exception:
+                    pass
+            if config.get("delete_generated_inputs", True):
+                shutil.rmtree(generated_root / "shared_targets", ignore_errors=True)
             self._set_process_pause_state(paused=False)
             with self.active_proc_lock:
                 self.active_procs.clear()
@@ -7664,6 +8865,47 @@ class BenchmarkRunnerApp(tk.Tk):
             self.visualizer_status_var.set("No run payload available yet.")
         self._update_visualizer_autoplay_controls()
 
+    def _run_spawn_calibration(
+        self,
+        config: dict,
+        work_dir: Path,
+        trials: int,
+        solver_timeout_seconds: float | None,
+    ) -> dict:
+        token = "calibration-progress"
+        self._set_live_log_line_threadsafe(token, "Calibrating process spawn overhead...", level="notice")
+        work_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            if config["tab_id"] == "shortest_path":
+                trivial_inputs = {"dijkstra_file": generate_dijkstra_inputs(work_dir, 4, 0.5, 1)}
+            else:
+                trivial_inputs = generate_subgraph_inputs(work_dir, 6, 3, 0.5, 1)
+            calibration = run_spawn_calibration(
+                lambda command, cwd: self._run_process_with_peak_memory(
+                    command,
+                    cwd=cwd,
+                    solver_timeout_seconds=solver_timeout_seconds,
+                ),
+                selected_variants=list(config["selected_variants"]),
+                binary_paths=self.binary_paths,
+                trivial_inputs=trivial_inputs,
+                trials=trials,
+                cwd=work_dir,
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            self._clear_live_log_line_threadsafe(token=token)
+        noop_median = calibration["noop"].get("median_ms")
+        summary = [f"no-op={noop_median:.3f} ms" if noop_median is not None else "no-op=n/a"]
+        for variant_id, entry in calibration["variants"].items():
+            label = config["selected_variant_labels"].get(variant_id, variant_id)
+            if entry.get("error"):
+                self._append_log_threadsafe(f"Update: spawn calibration failed for {label}: {entry['error']}", level="warn")
+            elif entry.get("median_ms") is not None:
+                summary.append(f"{label}={entry['median_ms']:.3f} ms")
+        self._append_log_threadsafe(f"Spawn overhead calibration ({trials} runs each): " + ", ".join(summary), level="notice")
+        return calibration
+
     def _run_solver_variant(
         self,
         variant_id: str,
@@ -7676,24 +8918,9 @@ class BenchmarkRunnerApp(tk.Tk):
             raise FileNotFoundError(f"Missing binary for {variant_id}: {binary}")
 
         family = variant_family_from_id(variant_id)
-        if family in {"dijkstra", "sp_via"}:
-            command = [str(binary), str(generated["dijkstra_file"])]
-        elif family == "vf3":
-            if variant_id == "vf3_baseline":
-                # Generated subgraph benchmarks are non-induced and undirected.
-                command = [str(binary), "-u", "-r", "0", "-e", str(generated["vf_pattern"]), str(generated["vf_target"])]
-            else:
-                command = [str(binary), str(generated["vf_pattern"]), str(generated["vf_target"])]
-        elif family == "glasgow":
-            lad_format = str(generated.get("lad_format") or "lad").strip() or "lad"
-            if variant_id == "glasgow_baseline":
-                command = [str(binary), "--count-solutions", "--format", lad_format, str(generated["lad_pattern"]), str(generated["lad_target"])]
-            else:
-                command = [str(binary), str(generated["lad_pattern"]), str(generated["lad_target"])]
-        else:
-            raise ValueError(f"Unsupported variant: {variant_id}")
+        command = build_solver_command(variant_id, binary, generated)
 
-        runtime_ms, peak_kb, return_code, stdout_text, stderr_text = self._run_process_with_peak_memory(
+        runtime_ms, peak_kb, return_code, stdout_text, stderr_text, measurement = self._run_process_with_peak_memory(
             command,
             cwd=binary.parent,
             heartbeat_label=heartbeat_label,
@@ -7741,7 +8968,11 @@ class BenchmarkRunnerApp(tk.Tk):
             "answer_value": answer_value,
             "path_length": max(0, len(path_tokens) - 1) if path_tokens else None,
         }
-        return runtime_ms, peak_kb, solution_count, answer_signature, answer_details
+        resource_metrics = resource_metrics_from_rusage(measurement.get("rusage"))
+        internal_runtime_ms = parse_internal_timings(combined_output, family)["internal_runtime_ms"]
+        if internal_runtime_ms is not None:
+            resource_metrics["internal_runtime"] = float(internal_runtime_ms)
+        return runtime_ms, peak_kb, solution_count, answer_signature, answer_details, resource_metrics
 
     def _run_process_with_peak_memory(
         self,
@@ -7750,20 +8981,12 @@ class BenchmarkRunnerApp(tk.Tk):
         heartbeat_label: str | None = None,
         solver_timeout_seconds: float | None = None,
     ):
-        started = time.perf_counter()
         heartbeat_token = f"hb-{threading.get_ident()}-{time.perf_counter_ns()}"
-        last_heartbeat_second = -1
-        paused_accumulated = 0.0
-        paused_since = None
-        heartbeat_hidden_for_pause = False
         popen_kwargs = {
             "args": command,
             "cwd": str(cwd),
             "stdout": subprocess.PIPE,
             "stderr": subprocess.PIPE,
-            "text": True,
-            "encoding": "utf-8",
-            "errors": "replace",
             "env": runtime_env_for_binary(Path(command[0])),
         }
         if sys.platform.startswith("win"):
@@ -7773,88 +8996,53 @@ class BenchmarkRunnerApp(tk.Tk):
             popen_kwargs["startupinfo"] = startupinfo
             popen_kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
+        def _on_heartbeat(elapsed_seconds: int) -> None:
+            self._set_live_log_line_threadsafe(
+                heartbeat_token,
+                f"Update: {heartbeat_label} running for {self._format_hms(elapsed_seconds)}",
+                level="notice",
+            )
+
+        def _on_pause() -> None:
+            self._clear_live_log_line_threadsafe(token=heartbeat_token)
+
+        started = time.perf_counter()
         proc = subprocess.Popen(**popen_kwargs)
         with self.active_proc_lock:
             self.active_procs.add(proc)
-
-        peak_bytes = 0
-        ps_proc = None
-        try:
-            ps_proc = psutil.Process(proc.pid)
-        except psutil.Error:
-            # Child can exit before psutil attaches; continue without peak memory sampling.
-            ps_proc = None
+        # The shared supervisor thread handles exit, output, timeout, heartbeat and pause/abort
+        # for every in-flight solver; this thread only blocks until an outcome is known.
+        handle = get_process_supervisor().watch(
+            proc,
+            started=started,
+            stop_event=self.stop_event,
+            pause_event=self.pause_event,
+            timeout_seconds=solver_timeout_seconds,
+            on_heartbeat=_on_heartbeat if heartbeat_label else None,
+            on_pause=_on_pause if heartbeat_label else None,
+        )
         try:
-            while True:
-                if self.stop_event.is_set():
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=2)
-                    except Exception:
-                        pass
-                    raise RunAbortedError("Abort requested")
-
-                now = time.perf_counter()
-                if self.pause_event.is_set():
-                    if paused_since is None:
-                        paused_since = now
-                    if heartbeat_label and not heartbeat_hidden_for_pause:
-                        self._clear_live_log_line_threadsafe(token=heartbeat_token)
-                        heartbeat_hidden_for_pause = True
-                    ret = proc.poll()
-                    if ret is not None:
-                        break
-                    time.sleep(0.05)
-                    continue
-                if paused_since is not None:
-                    paused_accumulated += max(0.0, now - paused_since)
-                    paused_since = None
-                    last_heartbeat_second = -1
-                    heartbeat_hidden_for_pause = False
-
-                elapsed_seconds = max(0.0, now - started - paused_accumulated)
-                if solver_timeout_seconds is not None and elapsed_seconds >= float(solver_timeout_seconds):
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=2)
-                    except Exception:
-                        try:
-                            proc.kill()
-                        except Exception:
-                            pass
-                    raise SolverTimeoutError(float(solver_timeout_seconds), float(elapsed_seconds))
-
-                if heartbeat_label:
-                    elapsed_seconds_int = int(elapsed_seconds)
-                    if elapsed_seconds_int >= 15 and elapsed_seconds_int != last_heartbeat_second:
-                        self._set_live_log_line_threadsafe(
-                            heartbeat_token,
-                            f"Update: {heartbeat_label} running for {self._format_hms(elapsed_seconds_int)}",
-                            level="notice",
-                        )
-                        last_heartbeat_second = elapsed_seconds_int
-
-                ret = proc.poll()
-                if ps_proc is not None:
-                    try:
-                        mem_info = ps_proc.memory_info()
-                        candidate = getattr(mem_info, "peak_wset", None)
-                        if candidate is None:
-                            candidate = mem_info.rss
-                        if isinstance(candidate, (int, float)):
-                            peak_bytes = max(peak_bytes, int(candidate))
-                    except psutil.Error:
-                        ps_proc = None
-
-                if ret is not None:
-                    break
-                time.sleep(0.02)
-
-            stdout_text, stderr_text = proc.communicate()
-            ended = time.perf_counter()
+            if not handle.drains_pipes:
+                stdout_bytes, stderr_bytes = proc.communicate()
+                handle.stdout_chunks.append(stdout_bytes or b"")
+                handle.stderr_chunks.append(stderr_bytes or b"")
+            outcome = handle.wait()
+            if outcome == OUTCOME_ABORTED:
+                raise RunAbortedError("Abort requested")
+            if outcome == OUTCOME_TIMEOUT:
+                raise SolverTimeoutError(float(solver_timeout_seconds), float(handle.timeout_elapsed_seconds or 0.0))
+
+            stdout_text, stderr_text = handle.take_output()
+            ended = handle.ended if handle.ended is not None else time.perf_counter()
             runtime_ms = max(0.0, (ended - started) * 1000.0)
-            peak_kb = max(0.0, peak_bytes / 1024.0)
-            return runtime_ms, peak_kb, int(proc.returncode or 0), stdout_text, stderr_text
+            return (
+                runtime_ms,
+                handle.monitor.peak_kb(),
+                int(proc.returncode or 0),
+                stdout_text,
+                stderr_text,
+                handle.monitor.measurement(),
+            )
         finally:
             if heartbeat_label:
                 self._clear_live_log_line_threadsafe(token=heartbeat_token)
@@ -7873,6 +9061,10 @@ class BenchmarkRunnerApp(tk.Tk):
         datapoints_path: Path,
         streamed_datapoint_rows: int,
         statistical_tests: dict | None = None,
+        cpu_time_statistical_tests: dict | None = None,
+        spawn_calibration: dict | None = None,
+        datapoint_comparisons: dict | None = None,
+        session_store_path: Path | None = None,
     ):
         duration_ms = (ended_at - started_at).total_seconds() * 1000.0
         payload = {
@@ -7919,14 +9111,30 @@ class BenchmarkRunnerApp(tk.Tk):
                 "show_trendlines_only": config.get("show_trendlines_only"),
                 "delete_generated_inputs": config.get("delete_generated_inputs"),
                 "warmup_trials": config.get("warmup_trials", 0),
+                "spawn_calibration_trials": config.get("spawn_calibration_trials", 0),
+                "prefetch_lookahead": config.get("prefetch_lookahead", 0),
+                "prefetch_disk_budget_mb": config.get("prefetch_disk_budget_mb"),
+                "input_cache_max_mb": config.get("input_cache_max_mb", 0),
+                "bootstrap_resamples": int(config.get("bootstrap_resamples") or 0),
+                "generator_engine": config.get("generator_engine", generator_mod.DEFAULT_GENERATOR_ENGINE),
+                "generator_streaming": bool(config.get("generator_streaming", False)),
+                "generator_backend": generator_mod.resolve_generator_backend(config.get("generator_backend")),
+                "subgraph_target_mode": config.get("subgraph_target_mode", DEFAULT_SUBGRAPH_TARGET_MODE),
             },
             "datapoints": [],
             "datapoints_path": str(datapoints_path),
+            "session_store_path": None if session_store_path is None else str(session_store_path),
             "streamed_datapoint_rows": int(streamed_datapoint_rows),
             "provenance": collect_runtime_provenance(repo_root=Path(__file__).resolve().parents[1]),
         }
         if isinstance(statistical_tests, dict):
             payload["statistical_tests"] = statistical_tests
+        if isinstance(cpu_time_statistical_tests, dict):
+            payload["cpu_time_statistical_tests"] = cpu_time_statistical_tests
+        if isinstance(spawn_calibration, dict):
+            payload["spawn_calibration"] = spawn_calibration
+        if isinstance(datapoint_comparisons, dict):
+            payload["datapoint_comparisons"] = datapoint_comparisons
         return payload
 
     def _render_figure_in_frame(
@@ -7986,33 +9194,11 @@ class BenchmarkRunnerApp(tk.Tk):
                 pass
             setattr(self, fig_attr, None)
 
-    def _iter_payload_datapoints(self, payload: dict):
-        datapoints = payload.get("datapoints")
-        if isinstance(datapoints, list) and datapoints:
-            for row in datapoints:
-                if isinstance(row, dict):
-                    yield row
-            return
-        datapoints_path = payload.get("datapoints_path")
-        if not datapoints_path:
-            return
-        path = Path(datapoints_path)
-        if not path.exists():
-            return
-        with path.open("r", encoding="utf-8") as fh:
-            for raw_line in fh:
-                line = raw_line.strip()
-                if not line:
-                    continue
-                try:
-                    row = json.loads(line)
-                except Exception:
-                    continue
-                if isinstance(row, dict):
-                    yield row
+    def _iter_payload_datapoints(self, payload: dict, columns=None):
+        yield from iter_plot_export_datapoints(payload, columns)
 
-    def _collect_payload_datapoints(self, payload: dict):
-        return list(self._iter_payload_datapoints(payload))
+    def _collect_payload_datapoints(self, payload: dict, columns=None):
+        return list(self._iter_payload_datapoints(payload, columns))
 
     def _make_dataset_metric_bar_figure(self, payload: dict, metric: str, datapoints: list[dict]):
         fig = Figure(figsize=(7.5, 5.0), dpi=100)
@@ -9165,7 +10351,7 @@ class BenchmarkRunnerApp(tk.Tk):
             self.visualizer_status_var.set("Ready. Choose a datapoint tuple and click Load In Tab.")
 
     def _collect_visualizer_point_rows(self, payload: dict, family: str) -> list[dict]:
-        datapoints = self._collect_payload_datapoints(payload)
+        datapoints = self._collect_payload_datapoints(payload, VISUALIZER_DATAPOINT_COLUMNS)
         if not datapoints:
             return []
         run_config = payload.get("run_config")
@@ -9688,27 +10874,21 @@ class BenchmarkRunnerApp(tk.Tk):
 
         seed = int(seeds[iteration_index])
         iter_dir = cache_dir / "inputs" / f"iter_{iteration_index + 1:03d}"
-        iter_dir.mkdir(parents=True, exist_ok=True)
-
-        if selected_family in {"dijkstra", "sp_via"}:
-            inputs = {
-                "dijkstra_file": generate_dijkstra_inputs(
-                    iter_dir,
-                    int(round(float(datapoint["n"]))),
-                    float(datapoint["density"]),
-                    int(seed),
-                    graph_family=str(run_config.get("graph_family") or "random_density"),
-                )
-            }
-        else:
-            inputs = generate_subgraph_inputs(
-                iter_dir,
-                int(round(float(datapoint["n"]))),
-                int(round(float(datapoint["k_nodes"]))),
-                float(datapoint["density"]),
-                int(seed),
-                graph_family=str(run_config.get("graph_family") or "random_density"),
-            )
+        inputs = generate_iteration_inputs(
+            "shortest_path" if selected_family in {"dijkstra", "sp_via"} else "subgraph",
+            iter_dir,
+            int(round(float(datapoint["n"]))),
+            int(round(float(datapoint.get("k_nodes") or 1))),
+            float(datapoint["density"]),
+            int(seed),
+            graph_family=str(run_config.get("graph_family") or "random_density"),
+            input_cache=input_cache_from_config(run_config),
+            generator_engine=visualizer_generator_engine(run_config),
+            streaming=bool(run_config.get("generator_streaming", False)),
+            generator_backend=str(run_config.get("generator_backend") or generator_mod.DEFAULT_GENERATOR_BACKEND),
+            formats=subgraph_input_formats([*variant_ids, selected_family]),
+            **visualizer_target_kwargs(run_config, selected_family, iteration_index, cache_dir / "inputs" / "shared_targets"),
+        )
 
         outputs: dict[str, str] = {}
         for variant_id in variant_ids:
@@ -10930,29 +12110,24 @@ class BenchmarkRunnerApp(tk.Tk):
         iteration_payloads: list[dict] = []
         count_by_variant: dict[str, list[str]] = {vid: [] for vid in variant_ids}
 
+        input_cache = input_cache_from_config(run_config)
         for iter_idx, seed in enumerate(seeds):
             iter_dir = vis_inputs / f"iter_{iter_idx + 1:03d}"
-            iter_dir.mkdir(parents=True, exist_ok=True)
-
-            if selected_family in {"dijkstra", "sp_via"}:
-                inputs = {
-                    "dijkstra_file": generate_dijkstra_inputs(
-                        iter_dir,
-                        int(round(float(datapoint["n"]))),
-                        float(datapoint["density"]),
-                        int(seed),
-                        graph_family=str(run_config.get("graph_family") or "random_density"),
-                    )
-                }
-            else:
-                inputs = generate_subgraph_inputs(
-                    iter_dir,
-                    int(round(float(datapoint["n"]))),
-                    int(round(float(datapoint["k_nodes"]))),
-                    float(datapoint["density"]),
-                    int(seed),
-                    graph_family=str(run_config.get("graph_family") or "random_density"),
-                )
+            inputs = generate_iteration_inputs(
+                "shortest_path" if selected_family in {"dijkstra", "sp_via"} else "subgraph",
+                iter_dir,
+                int(round(float(datapoint["n"]))),
+                int(round(float(datapoint.get("k_nodes") or 1))),
+                float(datapoint["density"]),
+                int(seed),
+                graph_family=str(run_config.get("graph_family") or "random_density"),
+                input_cache=input_cache,
+                generator_engine=visualizer_generator_engine(run_config),
+                streaming=bool(run_config.get("generator_streaming", False)),
+                generator_backend=str(run_config.get("generator_backend") or generator_mod.DEFAULT_GENERATOR_BACKEND),
+                formats=subgraph_input_formats([*variant_ids, selected_family]),
+                **visualizer_target_kwargs(run_config, selected_family, iter_idx, vis_inputs / "shared_targets"),
+            )
 
             outputs: dict[str, str] = {}
             for variant_id in variant_ids:
@@ -11300,7 +12475,7 @@ class BenchmarkRunnerApp(tk.Tk):
         run_config = payload.get("run_config")
         if not isinstance(run_config, dict):
             raise RuntimeError("Run config is missing from payload.")
-        datapoints = self._collect_payload_datapoints(payload)
+        datapoints = self._collect_payload_datapoints(payload, VISUALIZER_DATAPOINT_COLUMNS)
         if not datapoints:
             raise RuntimeError("No datapoints were found in the run payload.")
 
@@ -11693,6 +12868,9 @@ class BenchmarkRunnerApp(tk.Tk):
         }
 
     def _parse_dijkstra_input_for_visualizer(self, path: Path):
+        graph = csr_mod.load_csr_sidecar(path)
+        if graph is not None:
+            return self._dijkstra_visualizer_input_from_csr(graph)
         lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
         start_label = None
         target_label = None
@@ -11749,6 +12927,28 @@ class BenchmarkRunnerApp(tk.Tk):
             all_edges.add(ek)
         return unique_labels, label_to_id, label_to_id_lower, all_edges, start_label, target_label
 
+    def _dijkstra_visualizer_input_from_csr(self, graph):
+        # Same shape as the CSV parse; node ids follow the sidecar's sorted labels.
+        with graph:
+            unique_labels = [str(label) for label in graph.labels]
+            start_label = str(graph.header.get("start_label") or "") or None
+            target_label = str(graph.header.get("target_label") or "") or None
+            indptr = graph.indptr
+            indices = graph.indices
+            all_edges: set[tuple[int, int]] = set()
+            for u in range(graph.nodes):
+                for edge in range(indptr[u], indptr[u + 1]):
+                    ek = edge_key(u, int(indices[edge]))
+                    if ek is not None:
+                        all_edges.add(ek)
+        # Endpoints absent from every edge (e.g. an isolated declared DIMACS node) still get ids.
+        for key, label in (("start", start_label), ("target", target_label)):
+            if label and int(graph.header.get(key, -1)) < 0 and label not in unique_labels[graph.nodes :]:
+                unique_labels.append(label)
+        label_to_id: dict[str, int] = {label: idx for idx, label in enumerate(unique_labels)}
+        label_to_id_lower: dict[str, int] = {label.lower(): idx for idx, label in enumerate(unique_labels)}
+        return unique_labels, label_to_id, label_to_id_lower, all_edges, start_label, target_label
+
     def _extract_dijkstra_path_nodes(self, output_text: str, label_to_id: dict[str, int], label_to_id_lower: dict[str, int], node_count: int):
         lines = [str(line or "").strip() for line in str(output_text or "").replace("\r", "").split("\n")]
         first = ""
@@ -12086,6 +13286,8 @@ class BenchmarkRunnerApp(tk.Tk):
                 "memory_median_kb", "memory_stdev_kb", "memory_samples_n", "completed_iterations", "requested_iterations",
                 "outlier_filter_mode", "outlier_filter_min_samples", "runtime_samples_total_n", "memory_samples_total_n",
                 "runtime_samples_json", "memory_samples_json", "runtime_samples_raw_json", "memory_samples_raw_json", "seeds_json",
+                *RESOURCE_CSV_COLUMNS,
+                *CORRECTED_RUNTIME_CSV_COLUMNS,
             ])
             for row in self._iter_payload_datapoints(payload):
                 writer.writerow([
@@ -12110,6 +13312,8 @@ class BenchmarkRunnerApp(tk.Tk):
                     json.dumps(row.get("runtime_samples_raw_ms", row.get("runtime_samples_ms", []))),
                     json.dumps(row.get("memory_samples_raw_kb", row.get("memory_samples_kb", []))),
                     json.dumps(row["seeds"]),
+                    *[number_or_blank(row.get(column)) for column in RESOURCE_CSV_COLUMNS],
+                    *[number_or_blank(row.get(column)) for column in CORRECTED_RUNTIME_CSV_COLUMNS],
                 ])
 
         save_session_plot_exports(payload, out_dir)
@@ -12144,6 +13348,8 @@ class BenchmarkRunnerApp(tk.Tk):
 
 
 def main():
+    # Input prefetch uses spawned worker processes; frozen builds must route them here.
+    multiprocessing.freeze_support()
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--headless", action="store_true")
     parser.add_argument("--visualizer-webview-url", dest="visualizer_webview_url", default=None)
@@ -17,6 +17,7 @@ import csv
 import datetime as dt
 import importlib.util
 import json
+import multiprocessing
 import os
 import random
 import re
@@ -27,15 +28,27 @@ from pathlib import Path
 from typing import Any
 
 from desktop_runner import app as app_mod
+from desktop_runner import results_warehouse as warehouse_mod
 from utilities import generate_graphs as generator_mod
-from utilities.benchmark_provenance import collect_runtime_provenance
+from utilities.benchmark_provenance import collect_host_fingerprint, collect_runtime_provenance
+from utilities.benchmark_validation import parse_internal_timings
+from utilities.input_cache import InputCache
+from utilities.input_prefetch import InputPrefetcher, PrefetchJob
+from utilities.session_store import SESSION_STORE_NAME, SessionStore
+from utilities.trial_cache import TrialCache
 
 MANIFEST_SCHEMA_VERSION = "capstone-benchmark-manifest-v1"
 SESSION_SCHEMA_VERSION = "desktop-benchmark-v2"
 TRIAL_SCHEMA_VERSION = "desktop-benchmark-trial-v1"
 DATASET_INFO_SCHEMA_VERSION = "desktop-dataset-selection-v1"
 COLLECTION_RUN_SCHEMA_VERSION = "desktop-benchmark-collection-v1"
+PREGENERATE_SCHEMA_VERSION = "desktop-input-pregeneration-v1"
+PREGENERATE_SUMMARY_NAME = "pregenerate-summary.json"
+# Config keys build_generated_inputs reads; only these are pickled to worker processes.
+GENERATION_CONFIG_KEYS = ("tab_id", "selected_variants", "graph_family", "generator_engine", "generator_streaming", "generator_backend")
 DEFAULT_COLLECTION_DIR_NAME = "data_collection"
+# With the trial cache on, baseline trials of this many leading iterations per datapoint still run fresh.
+DEFAULT_TRIAL_CACHE_FRESH_BASELINES = 1
 
 PRESET_DEFAULTS: dict[str, dict[str, Any]] = {
     "smoke": {
@@ -46,6 +59,11 @@ PRESET_DEFAULTS: dict[str, dict[str, Any]] = {
         "timeout_as_missing": True,
         "outlier_filter": "none",
         "delete_generated_inputs": True,
+        "spawn_calibration_trials": 0,
+        "prefetch_lookahead": 0,
+        "prefetch_disk_budget_mb": app_mod.DEFAULT_PREFETCH_DISK_BUDGET_MB,
+        "input_cache_max_mb": 0,
+        "bootstrap_resamples": 0,
     },
     "standard": {
         "iterations": 3,
@@ -55,6 +73,11 @@ PRESET_DEFAULTS: dict[str, dict[str, Any]] = {
         "timeout_as_missing": True,
         "outlier_filter": "mad",
         "delete_generated_inputs": True,
+        "spawn_calibration_trials": app_mod.DEFAULT_SPAWN_CALIBRATION_TRIALS,
+        "prefetch_lookahead": app_mod.DEFAULT_PREFETCH_LOOKAHEAD,
+        "prefetch_disk_budget_mb": app_mod.DEFAULT_PREFETCH_DISK_BUDGET_MB,
+        "input_cache_max_mb": app_mod.DEFAULT_INPUT_CACHE_MAX_MB,
+        "bootstrap_resamples": app_mod.DEFAULT_BOOTSTRAP_RESAMPLES,
     },
     "full": {
         "iterations": 7,
@@ -64,6 +87,11 @@ PRESET_DEFAULTS: dict[str, dict[str, Any]] = {
         "timeout_as_missing": True,
         "outlier_filter": "mad",
         "delete_generated_inputs": True,
+        "spawn_calibration_trials": app_mod.DEFAULT_SPAWN_CALIBRATION_TRIALS,
+        "prefetch_lookahead": app_mod.DEFAULT_PREFETCH_LOOKAHEAD,
+        "prefetch_disk_budget_mb": app_mod.DEFAULT_PREFETCH_DISK_BUDGET_MB,
+        "input_cache_max_mb": app_mod.DEFAULT_INPUT_CACHE_MAX_MB,
+        "bootstrap_resamples": app_mod.DEFAULT_BOOTSTRAP_RESAMPLES,
     },
 }
 
@@ -261,6 +289,38 @@ def build_manifest_from_args(args: argparse.Namespace) -> dict[str, Any]:
         manifest["retry_failed_trials"] = int(args.retry_failed_trials)
     if args.no_delete_generated_inputs:
         manifest["delete_generated_inputs"] = False
+    if args.spawn_calibration_trials is not None:
+        manifest["spawn_calibration_trials"] = int(args.spawn_calibration_trials)
+    if args.prefetch_lookahead is not None:
+        manifest["prefetch_lookahead"] = int(args.prefetch_lookahead)
+    if args.prefetch_disk_budget_mb is not None:
+        manifest["prefetch_disk_budget_mb"] = float(args.prefetch_disk_budget_mb)
+    if args.input_cache_max_mb is not None:
+        manifest["input_cache_max_mb"] = float(args.input_cache_max_mb)
+    if args.bootstrap_resamples is not None:
+        manifest["bootstrap_resamples"] = int(args.bootstrap_resamples)
+    if args.bootstrap_processes is not None:
+        manifest["bootstrap_processes"] = int(args.bootstrap_processes)
+    if args.input_cache_dir:
+        manifest["input_cache_dir"] = str(args.input_cache_dir)
+    if args.generator_engine:
+        manifest["generator_engine"] = str(args.generator_engine)
+    if args.generator_streaming:
+        manifest["generator_streaming"] = True
+    if args.generator_backend:
+        manifest["generator_backend"] = str(args.generator_backend)
+    if args.subgraph_target_mode:
+        manifest["subgraph_target_mode"] = str(args.subgraph_target_mode)
+    if args.input_store:
+        manifest["input_store"] = str(args.input_store)
+    manifest.update(build_trial_cache_overrides_from_args(args))
+    if args.dataset_pairs:
+        manifest["dataset_pairs"] = {
+            "count": int(args.dataset_pairs),
+            "classes": parse_csv_items(args.dataset_pair_classes),
+            "min_nodes": args.dataset_pair_min_nodes,
+            "max_nodes": args.dataset_pair_max_nodes,
+        }
     if args.parallel_auto:
         manifest["parallel_auto"] = True
     if args.max_workers is not None:
@@ -278,8 +338,22 @@ def build_manifest_from_args(args: argparse.Namespace) -> dict[str, Any]:
     return manifest
 
 
+def build_trial_cache_overrides_from_args(args: argparse.Namespace) -> dict[str, Any]:
+    overrides: dict[str, Any] = {}
+    if args.trial_cache or args.trial_cache_dir:
+        overrides["trial_cache"] = True
+    if args.trial_cache_dir:
+        overrides["trial_cache_dir"] = str(args.trial_cache_dir)
+    if args.trial_cache_fresh_baselines is not None:
+        overrides["trial_cache_fresh_baselines"] = int(args.trial_cache_fresh_baselines)
+    return overrides
+
+
 def build_manifest_overrides_from_args(args: argparse.Namespace) -> dict[str, Any]:
     overrides: dict[str, Any] = {}
+    if args.input_store:
+        overrides["input_store"] = str(args.input_store)
+    overrides.update(build_trial_cache_overrides_from_args(args))
     if args.parallel_auto:
         overrides["parallel_auto"] = True
     if args.max_workers is not None:
@@ -412,6 +486,74 @@ def build_independent_config(tab_id: str, payload: dict[str, Any]) -> tuple[list
     return datapoints, var_ranges, fixed_values, primary_var, secondary_var
 
 
+def normalize_dataset_pair_sample(raw: Any) -> dict[str, Any] | None:
+    if raw is None or raw == "" or raw is False:
+        return None
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        raw = {"count": int(raw)}
+    if not isinstance(raw, dict):
+        raise ValueError("dataset_pairs must be a pair count or an object with a count")
+    count = int(raw.get("count") or 0)
+    if count <= 0:
+        return None
+    classes = raw.get("classes") or []
+    if isinstance(classes, str):
+        classes = parse_csv_items(classes)
+    return {
+        "count": count,
+        "classes": [str(item).strip().lower() for item in classes if str(item).strip()],
+        "min_nodes": None if raw.get("min_nodes") in {None, ""} else int(raw["min_nodes"]),
+        "max_nodes": None if raw.get("max_nodes") in {None, ""} else int(raw["max_nodes"]),
+        "seed": None if raw.get("seed") in {None, ""} else int(raw["seed"]),
+        "processes": None if raw.get("processes") in {None, ""} else max(1, int(raw["processes"])),
+    }
+
+
+def build_dataset_pair_points(spec: app_mod.DatasetSpec, payload: dict[str, Any], pair_sample: dict[str, Any], logger) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    logger(f"Indexing dataset pairs for {spec.dataset_id} ({spec.name})")
+    index = app_mod.build_dataset_pair_index(spec)
+    seed = pair_sample["seed"] if pair_sample["seed"] is not None else int(payload.get("base_seed") or 0)
+    pairs = app_mod.sample_dataset_pairs(
+        index,
+        pair_sample["count"],
+        classes=pair_sample["classes"],
+        min_nodes=pair_sample["min_nodes"],
+        max_nodes=pair_sample["max_nodes"],
+        seed=seed,
+    )
+    if not pairs:
+        raise ValueError(f"No indexed pairs of {spec.dataset_id} match the dataset_pairs filters")
+    processes = pair_sample["processes"] or detect_logical_cores()
+    logger(f"Converting {len(pairs)} of {index['pair_count']} indexed pairs ({processes} processes)")
+    metas = app_mod.convert_dataset_pairs(spec, index, pairs, max_processes=processes)
+    k_percent = str(payload.get("k_mode") or "absolute").strip().lower() != "absolute"
+    points: list[dict[str, Any]] = []
+    for meta in metas:
+        n_nodes = int(meta["target_nodes"])
+        k_nodes = int(meta["pattern_nodes"])
+        density = min(1.0, float(meta["target_edges"]) / float(n_nodes * (n_nodes - 1))) if n_nodes > 1 else 0.0
+        points.append({
+            "n": float(n_nodes),
+            "density": float(max(0.000001, density)),
+            "k": float((100.0 * k_nodes) / float(n_nodes)) if k_percent else float(k_nodes),
+            "k_nodes": k_nodes,
+            "dataset_id": spec.dataset_id,
+            "dataset_name": spec.name,
+            "dataset_pair_id": meta["pair_id"],
+            "dataset_inputs": {key: str(value) for key, value in dict(meta["inputs"]).items()},
+        })
+    selection = {
+        "schema_version": DATASET_INFO_SCHEMA_VERSION,
+        "dataset_id": spec.dataset_id,
+        "dataset_name": spec.name,
+        "selected_source_kind": f"{index['source_kind']}_indexed_pair",
+        "indexed_pair_count": int(index["pair_count"]),
+        "pair_sample": {**pair_sample, "seed": seed},
+        "selected_pairs": [meta["pair_id"] for meta in metas],
+    }
+    return points, selection
+
+
 def build_dataset_config(tab_id: str, payload: dict[str, Any], logger) -> tuple[list[dict[str, Any]], dict[str, list[float]], dict[str, float], str, str | None, list[dict[str, Any]]]:
     catalog = {spec.dataset_id: spec for spec in app_mod.load_dataset_catalog()}
     selected_specs: list[app_mod.DatasetSpec] = []
@@ -428,7 +570,17 @@ def build_dataset_config(tab_id: str, payload: dict[str, Any], logger) -> tuple[
     observed_density: list[float] = []
     observed_k: list[float] = []
     dataset_selection: list[dict[str, Any]] = []
+    pair_sample = normalize_dataset_pair_sample(payload.get("dataset_pairs"))
     for spec in selected_specs:
+        if pair_sample is not None and tab_id == "subgraph" and app_mod.dataset_supports_pair_index(spec):
+            pair_points, selection = build_dataset_pair_points(spec, payload, pair_sample, logger)
+            dataset_selection.append(selection)
+            for point in pair_points:
+                datapoints.append(point)
+                observed_n.append(float(point["n"]))
+                observed_density.append(float(point["density"]))
+                observed_k.append(float(point["k"]))
+            continue
         if payload.get("prepare_datasets", True) or not app_mod.dataset_converted_ready(spec):
             logger(f"Preparing dataset {spec.dataset_id} ({spec.name})")
             app_mod.prepare_dataset(spec)
@@ -487,13 +639,16 @@ def build_dataset_config(tab_id: str, payload: dict[str, Any], logger) -> tuple[
     return datapoints, var_ranges, fixed_values, "n", None, dataset_selection
 
 
-def build_runtime_config(payload: dict[str, Any], logger) -> dict[str, Any]:
+def build_runtime_config(payload: dict[str, Any], logger, *, require_binaries: bool = True) -> dict[str, Any]:
     merged = merge_preset_defaults(payload)
     tab_id = str(merged.get("tab_id") or "").strip().lower()
     if tab_id not in {"subgraph", "shortest_path"}:
         raise ValueError("Manifest requires tab_id=subgraph or tab_id=shortest_path")
     selected_variants, injected_baselines = enforce_baselines(tab_id, [str(item).strip().lower() for item in list(merged.get("selected_variants") or []) if str(item).strip()])
-    selected_variants, skipped_missing_variants = resolve_selected_variants(selected_variants)
+    skipped_missing_variants: list[dict[str, Any]] = []
+    if require_binaries:
+        # Pre-generation skips this: inputs depend on variant families, which the injected baselines keep.
+        selected_variants, skipped_missing_variants = resolve_selected_variants(selected_variants)
     if skipped_missing_variants:
         logger("Skipping missing optional solver binaries for this run:")
         for row in skipped_missing_variants:
@@ -522,11 +677,27 @@ def build_runtime_config(payload: dict[str, Any], logger) -> dict[str, Any]:
         "outlier_filter": str(merged.get("outlier_filter") or "none").strip().lower(),
         "k_mode": str(merged.get("k_mode") or "absolute").strip().lower() or "absolute",
         "delete_generated_inputs": bool(merged.get("delete_generated_inputs", True)),
+        "spawn_calibration_trials": int(max(0, int(merged.get("spawn_calibration_trials") or 0))),
+        "prefetch_lookahead": int(max(0, int(merged.get("prefetch_lookahead") or 0))),
+        "prefetch_disk_budget_mb": None if merged.get("prefetch_disk_budget_mb") in {None, ""} else float(merged.get("prefetch_disk_budget_mb")),
+        "input_cache_max_mb": float(max(0.0, float(merged.get("input_cache_max_mb") or 0))),
+        "input_cache_dir": str(merged.get("input_cache_dir") or "").strip() or None,
+        "bootstrap_resamples": int(max(0, int(merged.get("bootstrap_resamples") or 0))),
+        "bootstrap_processes": None if merged.get("bootstrap_processes") in {None, "", 0} else int(max(1, int(merged.get("bootstrap_processes")))),
+        "generator_engine": generator_mod.normalize_generator_engine(merged.get("generator_engine")),
+        "subgraph_target_mode": app_mod.normalize_subgraph_target_mode(merged.get("subgraph_target_mode")),
+        "generator_streaming": bool(merged.get("generator_streaming", False)),
+        "generator_backend": generator_mod.normalize_generator_backend(merged.get("generator_backend")),
+        "input_store": str(merged.get("input_store") or "").strip() or None,
+        "dataset_pairs": normalize_dataset_pair_sample(merged.get("dataset_pairs")),
+        "trial_cache": bool(merged.get("trial_cache", False)),
+        "trial_cache_dir": str(merged.get("trial_cache_dir") or "").strip() or None,
+        "trial_cache_fresh_baselines": int(max(0, int(DEFAULT_TRIAL_CACHE_FRESH_BASELINES if merged.get("trial_cache_fresh_baselines") in {None, ""} else merged.get("trial_cache_fresh_baselines")))),
         "dataset_selection": [],
     }
     config.update(resolve_parallel_settings(merged))
     if config["input_mode"] == "datasets":
-        datapoints, var_ranges, fixed_values, primary_var, secondary_var, dataset_selection = build_dataset_config(tab_id, merged, logger)
+        datapoints, var_ranges, fixed_values, primary_var, secondary_var, dataset_selection = build_dataset_config(tab_id, {**merged, "base_seed": config["base_seed"]}, logger)
         config["dataset_selection"] = dataset_selection
     else:
         datapoints, var_ranges, fixed_values, primary_var, secondary_var = build_independent_config(tab_id, merged)
@@ -617,28 +788,18 @@ class Runner:
         return app_mod.BenchmarkRunnerApp._run_process_with_peak_memory(self, command, cwd, heartbeat_label=heartbeat_label, solver_timeout_seconds=solver_timeout_seconds)
 
     def build_command(self, variant_id: str, inputs: dict[str, Path | str]) -> list[str]:
-        binary = self.binary_paths[variant_id]
-        family = app_mod.variant_family_from_id(variant_id)
-        if family in {"dijkstra", "sp_via"}:
-            return [str(binary), str(inputs["dijkstra_file"])]
-        if family == "vf3":
-            if variant_id == "vf3_baseline":
-                return [str(binary), "-u", "-r", "0", "-e", str(inputs["vf_pattern"]), str(inputs["vf_target"])]
-            return [str(binary), str(inputs["vf_pattern"]), str(inputs["vf_target"])]
-        lad_format = str(inputs.get("lad_format") or "lad").strip() or "lad"
-        if variant_id == "glasgow_baseline":
-            return [str(binary), "--count-solutions", "--format", lad_format, str(inputs["lad_pattern"]), str(inputs["lad_target"])]
-        return [str(binary), str(inputs["lad_pattern"]), str(inputs["lad_target"])]
+        return app_mod.build_solver_command(variant_id, self.binary_paths[variant_id], inputs)
 
     def run_trial(self, *, tab_id: str, variant_id: str, inputs: dict[str, Path | str], solver_timeout_seconds: float | None, output_dir: Path) -> dict[str, Any]:
         binary = self.binary_paths[variant_id]
         command = self.build_command(variant_id, inputs)
         family = app_mod.variant_family_from_id(variant_id)
         try:
-            runtime_ms, peak_kb, return_code, stdout_text, stderr_text = self.run_process(command, binary.parent, variant_id, solver_timeout_seconds)
+            runtime_ms, peak_kb, return_code, stdout_text, stderr_text, measurement = self.run_process(command, binary.parent, variant_id, solver_timeout_seconds)
             timed_out = False
         except app_mod.SolverTimeoutError as exc:
             runtime_ms, peak_kb, return_code, stdout_text, stderr_text, timed_out = float(exc.elapsed_seconds) * 1000.0, None, None, "", str(exc), True
+            measurement = {}
         output_dir.mkdir(parents=True, exist_ok=True)
         stdout_path = output_dir / f"{variant_id}.stdout.txt"
         stderr_path = output_dir / f"{variant_id}.stderr.txt"
@@ -659,6 +820,7 @@ class Runner:
             if distance_value is not None:
                 answer_kind, answer_value, answer_signature = "distance", str(distance_value), ("distance", str(distance_value))
         path_tokens = app_mod.extract_path_tokens(combined) if family in {"dijkstra", "sp_via"} else []
+        internal_timings = parse_internal_timings(combined, family)
         status = "timeout" if timed_out else ("failed" if return_code not in {None, 0} else "ok")
         return {
             "schema_version": TRIAL_SCHEMA_VERSION,
@@ -668,8 +830,12 @@ class Runner:
             "command": command,
             "cwd": str(binary.parent),
             "runtime_ms": None if runtime_ms is None else float(runtime_ms),
+            "internal_runtime_ms": internal_timings["internal_runtime_ms"],
+            "internal_first_solution_ms": internal_timings["internal_first_solution_ms"],
             "peak_kb": None if peak_kb is None else float(peak_kb),
             "return_code": return_code,
+            "memory_backend": measurement.get("memory_backend"),
+            "rusage": measurement.get("rusage"),
             "stdout_path": stdout_path,
             "stderr_path": stderr_path,
             "normalized_result": {
@@ -691,26 +857,30 @@ def build_shortest_path_input(
     density: float,
     seed: int,
     graph_family: str,
+    generator_engine: str = generator_mod.DEFAULT_GENERATOR_ENGINE,
+    streaming: bool = False,
+    generator_backend: str = generator_mod.DEFAULT_GENERATOR_BACKEND,
 ) -> dict[str, Path | str]:
     rng = random.Random(seed)
-    labels = [f"v{i}" for i in range(n)]
-    edges = generator_mod.generate_directed_edges(n, rng, density, graph_family=graph_family)
+    generator_backend = generator_mod.resolve_generator_backend(generator_backend)
+    # The numpy backend always writes through the streaming CSV path; record what actually ran.
+    streaming = bool(streaming) or generator_backend == "numpy"
     via_label = None
     if family == "sp_via":
         via_index = max(0, min(n - 1, n // 2))
         if n > 2 and via_index in {0, n - 1}:
             via_index = 1
-        via_label = labels[via_index]
+        via_label = f"v{via_index}"
     path = out_dir / ("sp_via_generated.csv" if family == "sp_via" else "dijkstra_generated.csv")
-    with path.open("w", newline="", encoding="utf-8") as fh:
-        header = f"# start={labels[0]} target={labels[-1]}"
-        if via_label:
-            header += f" via={via_label}"
-        fh.write(header + "\n")
-        writer = csv.writer(fh)
-        writer.writerow(["source", "target", "weight"])
-        for u, v, weight in edges:
-            writer.writerow([labels[u], labels[v], weight])
+    if streaming:
+        edges = generator_mod.stream_directed_edges(
+            n, rng, density, graph_family=graph_family, engine=generator_engine, backend=generator_backend
+        )
+        edge_count = generator_mod.write_dijkstra_csv_stream(path, edges, n, via_label=via_label)
+    else:
+        edges = generator_mod.generate_directed_edges(n, rng, density, graph_family=graph_family, engine=generator_engine)
+        generator_mod.write_dijkstra_csv(path, edges, [f"v{i}" for i in range(n)], via_label=via_label)
+        edge_count = len(edges)
     max_edges = n * (n - 1)
     metadata = {
         "algorithm": family,
@@ -718,8 +888,15 @@ def build_shortest_path_input(
         "n": int(n),
         "k": None,
         "density": float(density),
-        "actual_density": 0.0 if max_edges <= 0 else float(len(edges)) / float(max_edges),
+        "actual_density": 0.0 if max_edges <= 0 else float(edge_count) / float(max_edges),
         "seed": int(seed),
+        "generator_engine": generator_mod.normalize_generator_engine(generator_engine),
+        "generator_algorithm": generator_mod.generator_algorithm(
+            graph_family, generator_engine, directed=True, streaming=streaming, backend=generator_backend
+        ),
+        "generator_streaming": bool(streaming),
+        "generator_backend": generator_backend,
+        "generator_rng": generator_mod.generator_rng_semantics(generator_backend),
         "files": [path.as_posix()],
     }
     if via_label:
@@ -728,31 +905,215 @@ def build_shortest_path_input(
     return {"dijkstra_file": path}
 
 
-def build_generated_inputs(config: dict[str, Any], point: dict[str, Any], point_dir: Path, iter_seed: int) -> dict[str, Path | str]:
+def build_generated_inputs(
+    config: dict[str, Any],
+    point: dict[str, Any],
+    point_dir: Path,
+    iter_seed: int,
+    input_cache: InputCache | None = None,
+    target_seed: int | None = None,
+    target_root: Path | None = None,
+) -> dict[str, Path | str]:
+    graph_family = str(config.get("graph_family") or "random_density")
+    generator_engine = generator_mod.normalize_generator_engine(config.get("generator_engine"))
+    generator_backend = generator_mod.resolve_generator_backend(config.get("generator_backend"))
     if config["tab_id"] == "subgraph":
-        return app_mod.generate_subgraph_inputs(
+        return app_mod.generate_iteration_inputs(
+            "subgraph",
             point_dir,
             int(round(point["n"])),
             int(point.get("k_nodes") or round(point.get("k") or 0)),
             float(point["density"]),
             int(iter_seed),
-            graph_family=str(config.get("graph_family") or "random_density"),
+            graph_family=graph_family,
+            input_cache=input_cache,
+            generator_engine=generator_engine,
+            formats=app_mod.subgraph_input_formats(config.get("selected_variants")),
+            target_seed=target_seed,
+            target_root=target_root,
+            generator_backend=generator_backend,
         )
     families = {app_mod.variant_family_from_id(variant_id) for variant_id in config["selected_variants"]}
     family = "sp_via" if "sp_via" in families else "dijkstra"
-    return build_shortest_path_input(
+    params = {
+        "builder": f"headless_{family}",
+        "graph_family": generator_mod.normalize_graph_family(graph_family),
+        "n": int(round(point["n"])),
+        "k": None,
+        "density": float(point["density"]),
+        "seed": int(iter_seed),
+        "generator_engine": generator_engine,
+    }
+    streaming = bool(config.get("generator_streaming", False))
+    if streaming:
+        params["streaming"] = True
+    if generator_backend != generator_mod.DEFAULT_GENERATOR_BACKEND:
+        params["generator_backend"] = generator_backend
+    return app_mod.materialize_generated_inputs(
+        input_cache,
+        params,
         point_dir,
-        family=family,
-        n=int(round(point["n"])),
-        density=float(point["density"]),
-        seed=int(iter_seed),
-        graph_family=str(config.get("graph_family") or "random_density"),
+        lambda target_dir: build_shortest_path_input(
+            target_dir,
+            family=family,
+            n=params["n"],
+            density=params["density"],
+            seed=params["seed"],
+            graph_family=graph_family,
+            generator_engine=generator_engine,
+            streaming=streaming,
+            generator_backend=generator_backend,
+        ),
+        extra_builders=(build_shortest_path_input,),
     )
 
 
+def iteration_seed(base_seed: int, point_idx: int, iter_idx: int) -> int:
+    iter_seed = int((int(base_seed) + point_idx + iter_idx) % 2_147_483_647)
+    if iter_seed <= 0:
+        iter_seed = point_idx + iter_idx + 1
+    return iter_seed
+
+
+def shared_target_kwargs(config: dict[str, Any], generated_root: Path, iter_idx: int) -> dict[str, Any]:
+    if config["tab_id"] != "subgraph" or config.get("subgraph_target_mode") != "shared":
+        return {}
+    return {
+        "target_seed": app_mod.shared_target_seed(config["base_seed"], iter_idx),
+        "target_root": generated_root / "shared_targets",
+    }
+
+
+def build_prefetch_jobs(config: dict[str, Any], generated_root: Path, input_cache: InputCache | None = None):
+    job_config = {key: config.get(key) for key in GENERATION_CONFIG_KEYS}
+    for point_idx, point in enumerate(config["datapoints"]):
+        for iter_idx in range(int(config["iterations"])):
+            point_dir = generated_root / f"point_{point_idx + 1:05d}" / f"iter_{iter_idx + 1:03d}"
+            yield PrefetchJob(
+                key=(point_idx, iter_idx),
+                out_dir=point_dir,
+                fn=build_generated_inputs,
+                args=(job_config, point, point_dir, iteration_seed(config["base_seed"], point_idx, iter_idx)),
+                kwargs={"input_cache": input_cache, **shared_target_kwargs(config, generated_root, iter_idx)},
+            )
+
+
+def open_trial_cache(config: dict[str, Any]) -> TrialCache | None:
+    if not config.get("trial_cache"):
+        return None
+    raw_dir = str(config.get("trial_cache_dir") or "").strip()
+    root = Path(raw_dir).expanduser() if raw_dir else app_mod.trial_cache_root()
+    return TrialCache(root, context={"host": collect_host_fingerprint()})
+
+
+def open_input_store(config: dict[str, Any]) -> InputCache | None:
+    raw = str(config.get("input_store") or "").strip()
+    if not raw or config["input_mode"] == "datasets":
+        return None
+    root = Path(raw).expanduser()
+    if not root.is_dir():
+        raise FileNotFoundError(f"Input store does not exist: {root}")
+    return InputCache(root, max_bytes=None, read_only=True)
+
+
+def _pregenerate_input_set(
+    job_config: dict[str, Any],
+    point: dict[str, Any],
+    iter_seed: int,
+    target_seed: int | None,
+    store_root: str,
+    scratch_dir: str,
+) -> dict[str, int]:
+    store = InputCache(Path(store_root), max_bytes=None)
+    target_kwargs = {} if target_seed is None else {"target_seed": target_seed, "target_root": Path(scratch_dir) / "shared_targets"}
+    try:
+        build_generated_inputs(job_config, point, Path(scratch_dir) / "inputs", iter_seed, input_cache=store, **target_kwargs)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    return dict(store.stats)
+
+
+def pregenerate_inputs(
+    manifests: list[tuple[str, dict[str, Any]]],
+    store_dir: Path,
+    logger,
+    *,
+    max_processes: int | None = None,
+) -> dict[str, Any]:
+    """Generate every ``(point, iteration)`` input set of ``manifests`` into ``store_dir``.
+
+    The store is an uncapped InputCache keyed exactly as ``execute_manifest`` looks
+    inputs up, so a run with ``input_store`` set links them instead of generating.
+    Identical input sets shared between manifests are generated once.
+    """
+    store_dir = Path(store_dir).resolve()
+    store_dir.mkdir(parents=True, exist_ok=True)
+    scratch_root = store_dir / "tmp" / f"pregenerate-{os.getpid()}-{dt.datetime.now().strftime('%Y%m%d%H%M%S')}"
+    started_at = dt.datetime.now(dt.timezone.utc)
+    records: list[dict[str, Any]] = []
+    jobs: dict[str, tuple] = {}
+    for name, manifest in manifests:
+        record = {"manifest_name": name, "status": "ok", "error": None, "input_sets": 0}
+        try:
+            if merge_preset_defaults(manifest).get("base_seed") is None:
+                raise ValueError("pre-generation needs a fixed base_seed")
+            config = build_runtime_config(manifest, logger, require_binaries=False)
+            if config["input_mode"] == "datasets":
+                record["status"] = "skipped"
+                record["error"] = "dataset manifests have no generated inputs"
+            else:
+                job_config = {key: config.get(key) for key in GENERATION_CONFIG_KEYS}
+                for point_idx, point in enumerate(config["datapoints"]):
+                    for iter_idx in range(int(config["iterations"])):
+                        target_seed = shared_target_kwargs(config, scratch_root, iter_idx).get("target_seed")
+                        args = (job_config, point, iteration_seed(config["base_seed"], point_idx, iter_idx), target_seed)
+                        jobs.setdefault(json.dumps(args, sort_keys=True, default=str), args)
+                        record["input_sets"] += 1
+        except Exception as exc:
+            record["status"] = "error"
+            record["error"] = str(exc)
+            logger(f"[error] {name}: {exc}")
+        records.append(record)
+
+    totals = {"hits": 0, "misses": 0}
+    if jobs:
+        processes = int(max(1, min(len(jobs), max_processes or os.cpu_count() or 1)))
+        logger(f"Pre-generating {len(jobs)} input set(s) with {processes} process(es) into {store_dir}")
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = [
+                    executor.submit(_pregenerate_input_set, *args, str(store_dir), str(scratch_root / f"job_{idx:06d}"))
+                    for idx, args in enumerate(jobs.values())
+                ]
+                for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                    stats = future.result()
+                    totals["hits"] += int(stats.get("hits") or 0)
+                    totals["misses"] += int(stats.get("misses") or 0)
+                    if done % 50 == 0 or done == len(futures):
+                        logger(f"Pre-generated {done}/{len(futures)} input set(s)")
+        finally:
+            shutil.rmtree(scratch_root, ignore_errors=True)
+    ended_at = dt.datetime.now(dt.timezone.utc)
+    summary = {
+        "schema_version": PREGENERATE_SCHEMA_VERSION,
+        "store_dir": store_dir.as_posix(),
+        "generator_code_version": app_mod.generator_code_version(),
+        "run_started_utc": started_at.isoformat(),
+        "run_ended_utc": ended_at.isoformat(),
+        "run_duration_ms": max(0.0, (ended_at - started_at).total_seconds() * 1000.0),
+        "unique_input_sets": len(jobs),
+        "generated_entries": int(totals["misses"]),
+        "existing_entries": int(totals["hits"]),
+        "manifests": records,
+    }
+    write_json(store_dir / PREGENERATE_SUMMARY_NAME, summary)
+    return summary
+
+
 def build_point_label(config: dict[str, Any], point: dict[str, Any]) -> str:
     if config["input_mode"] == "datasets":
-        return str(point.get("dataset_name") or point.get("dataset_id") or "dataset")
+        label = str(point.get("dataset_name") or point.get("dataset_id") or "dataset")
+        return f"{label} [{point['dataset_pair_id']}]" if point.get("dataset_pair_id") else label
     primary = config["primary_var"]
     label = f"{primary}={app_mod.format_point_value_for_config(primary, float(point[primary]), config)}"
     secondary = config["secondary_var"]
@@ -761,6 +1122,12 @@ def build_point_label(config: dict[str, Any], point: dict[str, Any]) -> str:
     return label
 
 
+def corrected_runtime_ms(runtime_ms: Any, overhead_ms: float | None) -> float | None:
+    if not isinstance(runtime_ms, (int, float)) or overhead_ms is None:
+        return None
+    return max(0.0, float(runtime_ms) - float(overhead_ms))
+
+
 def aggregate_metric(values: list[Any]) -> float | None:
     samples = [float(value) for value in values if isinstance(value, (int, float))]
     if not samples:
@@ -768,7 +1135,7 @@ def aggregate_metric(values: list[Any]) -> float | None:
     return float(app_mod.statistics.median(samples))
 
 
-def finalize_point(config: dict[str, Any], state: dict[str, Any], stream) -> list[dict[str, Any]]:
+def finalize_point(config: dict[str, Any], state: dict[str, Any], stream, spawn_calibration: dict[str, Any] | None = None) -> list[dict[str, Any]]:
     outlier_mode = str(config.get("outlier_filter") or "none").strip().lower()
     rows: list[dict[str, Any]] = []
     for variant_id in config["selected_variants"]:
@@ -785,6 +1152,7 @@ def finalize_point(config: dict[str, Any], state: dict[str, Any], stream) -> lis
             "point_label": state["point_label"],
             "dataset_id": state.get("dataset_id"),
             "dataset_name": state.get("dataset_name"),
+            "dataset_pair_id": state.get("dataset_pair_id"),
             "outlier_filter_mode": outlier_mode,
             "outlier_filter_min_samples": int(app_mod.DEFAULT_OUTLIER_MIN_SAMPLES),
             "runtime_median_ms": app_mod.median_or_none(runtimes),
@@ -802,9 +1170,12 @@ def finalize_point(config: dict[str, Any], state: dict[str, Any], stream) -> lis
             "runtime_samples_raw_ms": [float(value) for value in runtimes_raw],
             "memory_samples_kb": [float(value) for value in memories],
             "memory_samples_raw_kb": [float(value) for value in memories_raw],
+            "cached_samples_n": int(dict(state.get("cached_samples") or {}).get(variant_id, 0)),
             "answer_kind": next((item.get("answer_kind") for item in answer_rows if item.get("answer_kind")), None),
             "path_length_median": aggregate_metric([item.get("path_length") for item in answer_rows]),
         }
+        row.update(app_mod.summarize_resource_metric_samples(state["samples_resource"][variant_id], outlier_mode))
+        row.update(app_mod.summarize_corrected_runtime(runtimes, app_mod.spawn_overhead_ms(spawn_calibration, variant_id)))
         stream.write(json.dumps(row, default=app_mod.serialize_for_json) + "\n")
         rows.append(row)
     stream.flush()
@@ -841,6 +1212,7 @@ def write_session_csv(path: Path, rows: list[dict[str, Any]]) -> None:
             "variant_id", "variant_label", "dataset_id", "dataset_name", "x_value", "y_value", "runtime_median_ms", "runtime_stdev_ms", "runtime_samples_n",
             "memory_median_kb", "memory_stdev_kb", "memory_samples_n", "completed_iterations", "requested_iterations", "answer_kind", "path_length_median",
             "runtime_samples_json", "memory_samples_json", "runtime_samples_raw_json", "memory_samples_raw_json", "seeds_json",
+            *app_mod.RESOURCE_CSV_COLUMNS, *app_mod.CORRECTED_RUNTIME_CSV_COLUMNS,
         ])
         for row in rows:
             writer.writerow([
@@ -850,9 +1222,39 @@ def write_session_csv(path: Path, rows: list[dict[str, Any]]) -> None:
                 app_mod.number_or_blank(row.get("memory_stdev_kb")), row.get("memory_samples_n"), row.get("completed_iterations"), row.get("requested_iterations"),
                 row.get("answer_kind") or "", app_mod.number_or_blank(row.get("path_length_median")), json.dumps(row.get("runtime_samples_ms", [])),
                 json.dumps(row.get("memory_samples_kb", [])), json.dumps(row.get("runtime_samples_raw_ms", [])), json.dumps(row.get("memory_samples_raw_kb", [])), json.dumps(row.get("seeds", [])),
+                *[app_mod.number_or_blank(row.get(column)) for column in (*app_mod.RESOURCE_CSV_COLUMNS, *app_mod.CORRECTED_RUNTIME_CSV_COLUMNS)],
             ])
 
 
+def run_spawn_calibration(config: dict[str, Any], runner: Runner, work_dir: Path, logger) -> dict[str, Any] | None:
+    trials = int(config.get("spawn_calibration_trials") or 0)
+    if trials <= 0:
+        return None
+    work_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        trivial_point = {"n": 6, "density": 0.5, "k_nodes": 3}
+        trivial_inputs = build_generated_inputs(config, trivial_point, work_dir, 1)
+        calibration = app_mod.run_spawn_calibration(
+            lambda command, cwd: runner.run_process(command, cwd, None, config.get("solver_timeout_seconds")),
+            selected_variants=list(config["selected_variants"]),
+            binary_paths=runner.binary_paths,
+            trivial_inputs=trivial_inputs,
+            trials=trials,
+            cwd=work_dir,
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    noop_median = calibration["noop"].get("median_ms")
+    parts = [f"no-op={noop_median:.3f} ms" if noop_median is not None else "no-op=n/a"]
+    for variant_id, entry in calibration["variants"].items():
+        if entry.get("error"):
+            logger(f"Spawn calibration failed for {variant_id}: {entry['error']}")
+        elif entry.get("median_ms") is not None:
+            parts.append(f"{variant_id}={entry['median_ms']:.3f} ms")
+    logger(f"Spawn overhead calibration ({trials} runs each): " + ", ".join(parts))
+    return calibration
+
+
 def execute_manifest(manifest: dict[str, Any], manifest_path: Path | None, output_dir: Path | None, logger) -> Path:
     config = build_runtime_config(manifest, logger)
     runner = Runner(output_dir=output_dir, logger=logger)
@@ -865,6 +1267,7 @@ def execute_manifest(manifest: dict[str, Any], manifest_path: Path | None, outpu
     outputs_root.mkdir(parents=True, exist_ok=True)
     datapoints_path = out_dir / "benchmark-datapoints.ndjson"
     trials_path = out_dir / "benchmark-trials.ndjson"
+    session_store = SessionStore(out_dir / SESSION_STORE_NAME)
     started_at = dt.datetime.now(dt.timezone.utc)
     datapoint_rows: list[dict[str, Any]] = []
     point_states: dict[int, dict[str, Any]] = {}
@@ -875,118 +1278,275 @@ def execute_manifest(manifest: dict[str, Any], manifest_path: Path | None, outpu
         f"{int(config['max_workers'])}/{int(config['detected_logical_cores'])} "
         f"(requested={int(config['requested_workers'])}, enabled={'yes' if config['parallel_requested'] else 'no'})"
     )
-    with datapoints_path.open("w", encoding="utf-8", newline="\n") as datapoint_stream, trials_path.open("w", encoding="utf-8", newline="\n") as trial_stream, concurrent.futures.ThreadPoolExecutor(
-        max_workers=int(max(1, config.get("max_workers", 1))),
-        thread_name_prefix="headless-solver",
-    ) as executor:
-        for point_idx, point in enumerate(config["datapoints"]):
+    spawn_calibration = run_spawn_calibration(config, runner, generated_root / "_calibration", logger)
+    max_workers = int(max(1, config.get("max_workers", 1)))
+    iterations = int(config["iterations"])
+    # - One global queue across datapoints and iterations keeps up to max_workers trials in
+    #   flight; inputs for an iteration are generated when its first trial is submitted.
+    # - Results are flushed strictly in submission order (point, iteration, variant), so
+    #   NDJSON rows, sample lists and seeds do not depend on completion order.
+    work_items = ((point_idx, point, iter_idx, variant_id) for point_idx, point in enumerate(config["datapoints"]) for iter_idx in range(iterations) for variant_id in config["selected_variants"])
+    open_iterations: dict[tuple[int, int], dict[str, Any]] = {}
+    # A pre-generated store replaces the per-user cache and is only ever read.
+    input_store = open_input_store(config)
+    input_cache = input_store or (app_mod.input_cache_from_config(config) if config["input_mode"] != "datasets" else None)
+    prefetcher: InputPrefetcher | None = None
+    if config["input_mode"] != "datasets" and int(config.get("prefetch_lookahead") or 0) > 0:
+        budget_mb = config.get("prefetch_disk_budget_mb")
+        prefetcher = InputPrefetcher(
+            build_prefetch_jobs(config, generated_root, input_cache),
+            lookahead=int(config["prefetch_lookahead"]),
+            disk_budget_bytes=None if budget_mb is None else int(float(budget_mb) * 1024 * 1024),
+        )
+    flush_order: list[tuple[int, int]] = []
+    stop_failure: TrialFailure | None = None
+    # - With the trial cache on, a trial whose slot holds a stored sample is never
+    #   scheduled; its cached result completes the iteration in submission order.
+    # - Baseline variants still run fresh for the leading iterations of every
+    #   datapoint, so each session keeps a current reference next to reused samples.
+    trial_cache = open_trial_cache(config)
+    fresh_baselines = int(config.get("trial_cache_fresh_baselines") or 0)
+    baseline_ids = set(FAMILY_BASELINES.values())
+
+    def _run_variant_attempts(variant_id: str, iteration: dict[str, Any]) -> dict[str, Any]:
+        trial = None
+        for attempt_idx in range(int(config.get("retry_failed_trials") or 0) + 1):
+            trial = runner.run_trial(
+                tab_id=config["tab_id"],
+                variant_id=variant_id,
+                inputs=iteration["inputs"],
+                solver_timeout_seconds=config.get("solver_timeout_seconds"),
+                output_dir=outputs_root / f"point_{iteration['point_idx'] + 1:05d}" / f"iter_{iteration['iter_idx'] + 1:03d}" / f"attempt_{attempt_idx + 1:02d}",
+            )
+            if trial.get("status") == "ok":
+                break
+        if trial is None:
+            raise TrialFailure(f"No trial result produced for {variant_id}")
+        return trial
+
+    def _cached_trial(variant_id: str, iteration: dict[str, Any]) -> dict[str, Any] | None:
+        if trial_cache is None:
+            return None
+        binary_path = runner.binary_paths[variant_id]
+        slot = iteration["cache_slots"][variant_id] = trial_cache.slot(variant_id, binary_path, iteration["inputs"])
+        if slot is None:
+            return None
+        if variant_id in baseline_ids and iteration["iter_idx"] < fresh_baselines:
+            trial_cache.stats["forced_fresh"] += 1
+            return None
+        sample = trial_cache.load(*slot)
+        if sample is None:
+            return None
+        cached_from = {"cached_at_utc": sample.pop("cached_at_utc", None), **dict(sample.pop("source", None) or {})}
+        return {
+            **sample,
+            "status": "ok",
+            "variant_id": variant_id,
+            "family": app_mod.variant_family_from_id(variant_id),
+            "command": runner.build_command(variant_id, iteration["inputs"]),
+            "cwd": str(binary_path.parent),
+            "stdout_path": None,
+            "stderr_path": None,
+            "cached": True,
+            "cached_from": cached_from,
+        }
+
+    def _open_iteration(point_idx: int, point: dict[str, Any], iter_idx: int) -> dict[str, Any]:
+        if iter_idx == 0:
             point_label = build_point_label(config, point)
-            state = {
+            point_states[point_idx] = {
                 "point_label": point_label,
                 "dataset_id": point.get("dataset_id"),
                 "dataset_name": point.get("dataset_name"),
+                "dataset_pair_id": point.get("dataset_pair_id"),
                 "x_value": float(point[config["primary_var"]]),
                 "y_value": float(point[config["secondary_var"]]) if config["secondary_var"] else None,
                 "samples_runtime": {variant_id: [] for variant_id in config["selected_variants"]},
                 "samples_memory": {variant_id: [] for variant_id in config["selected_variants"]},
                 "seed_records": {variant_id: [] for variant_id in config["selected_variants"]},
-                "iter_answer_signatures": {iter_idx: {} for iter_idx in range(config["iterations"])},
-                "iter_runtime_ms": {iter_idx: {} for iter_idx in range(config["iterations"])},
+                "iter_answer_signatures": {idx: {} for idx in range(iterations)},
+                "iter_runtime_ms": {idx: {} for idx in range(iterations)},
+                "iter_cpu_time_ms": {idx: {} for idx in range(iterations)},
+                "samples_resource": {variant_id: {spec[0]: [] for spec in app_mod.RESOURCE_METRIC_SPECS} for variant_id in config["selected_variants"]},
                 "answer_rows": {variant_id: [] for variant_id in config["selected_variants"]},
+                "cached_samples": {variant_id: 0 for variant_id in config["selected_variants"]},
                 "completed_iterations": 0,
             }
-            point_states[point_idx] = state
             logger(f"Datapoint {point_idx + 1}/{len(config['datapoints'])}: {point_label}")
-            for iter_idx in range(config["iterations"]):
-                iter_seed = int((int(config["base_seed"]) + point_idx + iter_idx) % 2_147_483_647)
-                if iter_seed <= 0:
-                    iter_seed = point_idx + iter_idx + 1
-                if config["input_mode"] == "datasets":
-                    inputs = {key: (Path(value) if key != "lad_format" else str(value)) for key, value in dict(point.get("dataset_inputs") or {}).items()}
-                    point_dir = None
-                else:
-                    point_dir = generated_root / f"point_{point_idx + 1:05d}" / f"iter_{iter_idx + 1:03d}"
-                    point_dir.mkdir(parents=True, exist_ok=True)
-                    inputs = build_generated_inputs(config, point, point_dir, iter_seed)
-                all_ok = True
-                stop_failure: TrialFailure | None = None
-
-                def _run_variant_attempts(variant_id: str) -> dict[str, Any]:
-                    trial = None
-                    for attempt_idx in range(int(config.get("retry_failed_trials") or 0) + 1):
-                        trial = runner.run_trial(
-                            tab_id=config["tab_id"],
-                            variant_id=variant_id,
-                            inputs=inputs,
-                            solver_timeout_seconds=config.get("solver_timeout_seconds"),
-                            output_dir=outputs_root / f"point_{point_idx + 1:05d}" / f"iter_{iter_idx + 1:03d}" / f"attempt_{attempt_idx + 1:02d}",
-                        )
-                        if trial.get("status") == "ok":
-                            break
-                    if trial is None:
-                        raise TrialFailure(f"No trial result produced for {variant_id}")
-                    return trial
-
-                future_map = {
-                    executor.submit(_run_variant_attempts, variant_id): variant_id
-                    for variant_id in config["selected_variants"]
+        iter_seed = iteration_seed(config["base_seed"], point_idx, iter_idx)
+        if config["input_mode"] == "datasets":
+            inputs = {key: (Path(value) if key != "lad_format" else str(value)) for key, value in dict(point.get("dataset_inputs") or {}).items()}
+            point_dir = None
+        else:
+            point_dir = generated_root / f"point_{point_idx + 1:05d}" / f"iter_{iter_idx + 1:03d}"
+            inputs = prefetcher.take((point_idx, iter_idx)) if prefetcher is not None else None
+            if inputs is None:
+                point_dir.mkdir(parents=True, exist_ok=True)
+                inputs = build_generated_inputs(
+                    config,
+                    point,
+                    point_dir,
+                    iter_seed,
+                    input_cache=input_cache,
+                    **shared_target_kwargs(config, generated_root, iter_idx),
+                )
+        return {
+            "point_idx": point_idx,
+            "point": point,
+            "iter_idx": iter_idx,
+            "seed": iter_seed,
+            "inputs": inputs,
+            "point_dir": point_dir,
+            "pending": len(config["selected_variants"]),
+            "trials": {},
+            "cache_slots": {},
+        }
+
+    def _flush_iteration(iteration: dict[str, Any]) -> None:
+        nonlocal completed_trials, stop_failure
+        point_idx = iteration["point_idx"]
+        iter_idx = iteration["iter_idx"]
+        iter_seed = iteration["seed"]
+        point = iteration["point"]
+        state = point_states[point_idx]
+        point_label = state["point_label"]
+        all_ok = True
+        trial_rows: list[dict[str, Any]] = []
+        for variant_id in config["selected_variants"]:
+            trial = iteration["trials"][variant_id]
+            trial_rows.append({
+                "schema_version": TRIAL_SCHEMA_VERSION,
+                "status": trial.get("status"),
+                "cached": bool(trial.get("cached")),
+                "cached_from": trial.get("cached_from"),
+                "point_index": int(point_idx),
+                "iteration_index": int(iter_idx),
+                "point_label": point_label,
+                "seed": int(iter_seed),
+                "dataset_id": point.get("dataset_id"),
+                "dataset_name": point.get("dataset_name"),
+                "dataset_pair_id": point.get("dataset_pair_id"),
+                "variant_id": trial.get("variant_id"),
+                "family": trial.get("family"),
+                "command": list(trial.get("command") or []),
+                "cwd": trial.get("cwd"),
+                "runtime_ms": trial.get("runtime_ms"),
+                "internal_runtime_ms": trial.get("internal_runtime_ms"),
+                "internal_first_solution_ms": trial.get("internal_first_solution_ms"),
+                "runtime_corrected_ms": corrected_runtime_ms(trial.get("runtime_ms"), app_mod.spawn_overhead_ms(spawn_calibration, variant_id)),
+                "peak_kb": trial.get("peak_kb"),
+                "return_code": trial.get("return_code"),
+                "memory_backend": trial.get("memory_backend"),
+                "rusage": trial.get("rusage"),
+                "stdout_path": trial.get("stdout_path"),
+                "stderr_path": trial.get("stderr_path"),
+                "normalized_result": dict(trial.get("normalized_result") or {}),
+            })
+            trial_stream.write(json.dumps(trial_rows[-1], default=app_mod.serialize_for_json) + "\n")
+            completed_trials += 1
+            cache_slot = iteration["cache_slots"].get(variant_id)
+            if trial.get("cached"):
+                state["cached_samples"][variant_id] += 1
+            elif trial_cache is not None and cache_slot is not None and trial.get("status") == "ok":
+                trial_cache.store(*cache_slot, trial, source={"session_dir": str(out_dir), "run_started_utc": started_at.isoformat()})
+            normalized = dict(trial.get("normalized_result") or {})
+            state["answer_rows"][variant_id].append(
+                {
+                    "answer_kind": normalized.get("answer_kind"),
+                    "path_length": normalized.get("path_length"),
                 }
-                for future in concurrent.futures.as_completed(future_map):
-                    trial = future.result()
-                    variant_id = str(trial.get("variant_id") or future_map[future])
-                    trial_stream.write(json.dumps({
-                        "schema_version": TRIAL_SCHEMA_VERSION,
-                        "status": trial.get("status"),
-                        "point_index": int(point_idx),
-                        "iteration_index": int(iter_idx),
-                        "point_label": point_label,
-                        "seed": int(iter_seed),
-                        "dataset_id": point.get("dataset_id"),
-                        "dataset_name": point.get("dataset_name"),
-                        "variant_id": trial.get("variant_id"),
-                        "family": trial.get("family"),
-                        "command": list(trial.get("command") or []),
-                        "cwd": trial.get("cwd"),
-                        "runtime_ms": trial.get("runtime_ms"),
-                        "peak_kb": trial.get("peak_kb"),
-                        "return_code": trial.get("return_code"),
-                        "stdout_path": trial.get("stdout_path"),
-                        "stderr_path": trial.get("stderr_path"),
-                        "normalized_result": dict(trial.get("normalized_result") or {}),
-                    }, default=app_mod.serialize_for_json) + "\n")
-                    trial_stream.flush()
-                    completed_trials += 1
-                    normalized = dict(trial.get("normalized_result") or {})
-                    state["answer_rows"][variant_id].append(
-                        {
-                            "answer_kind": normalized.get("answer_kind"),
-                            "path_length": normalized.get("path_length"),
-                        }
-                    )
-                    state["seed_records"][variant_id].append(int(iter_seed))
-                    state["iter_answer_signatures"][iter_idx][variant_id] = trial.get("answer_signature")
-                    if isinstance(trial.get("runtime_ms"), (int, float)):
-                        state["samples_runtime"][variant_id].append(float(trial["runtime_ms"]))
-                        state["iter_runtime_ms"][iter_idx][variant_id] = float(trial["runtime_ms"])
-                    if isinstance(trial.get("peak_kb"), (int, float)):
-                        state["samples_memory"][variant_id].append(float(trial["peak_kb"]))
-                    if trial.get("status") != "ok":
-                        all_ok = False
-                        logger(
-                            f"{variant_id} {trial.get('status')} for {point_label} iteration {iter_idx + 1} "
-                            f"| return_code={trial.get('return_code')} "
-                            f"| stdout={trial.get('stdout_path')} "
-                            f"| stderr={trial.get('stderr_path')}"
-                        )
-                        if config.get("failure_policy") == "stop" and stop_failure is None:
-                            stop_failure = TrialFailure(f"{variant_id} returned status={trial.get('status')} for {point_label} iteration {iter_idx + 1}")
+            )
+            state["seed_records"][variant_id].append(int(iter_seed))
+            state["iter_answer_signatures"][iter_idx][variant_id] = trial.get("answer_signature")
+            if isinstance(trial.get("runtime_ms"), (int, float)):
+                state["samples_runtime"][variant_id].append(float(trial["runtime_ms"]))
+                state["iter_runtime_ms"][iter_idx][variant_id] = float(trial["runtime_ms"])
+            if isinstance(trial.get("peak_kb"), (int, float)):
+                state["samples_memory"][variant_id].append(float(trial["peak_kb"]))
+            trial_metrics = app_mod.resource_metrics_from_rusage(trial.get("rusage"))
+            if isinstance(trial.get("internal_runtime_ms"), (int, float)):
+                trial_metrics["internal_runtime"] = float(trial["internal_runtime_ms"])
+            for metric_id, value in trial_metrics.items():
+                state["samples_resource"][variant_id][metric_id].append(value)
+                if metric_id == "cpu_time":
+                    state["iter_cpu_time_ms"][iter_idx][variant_id] = value
+            if trial.get("status") != "ok":
+                all_ok = False
+                logger(
+                    f"{variant_id} {trial.get('status')} for {point_label} iteration {iter_idx + 1} "
+                    f"| return_code={trial.get('return_code')} "
+                    f"| stdout={trial.get('stdout_path')} "
+                    f"| stderr={trial.get('stderr_path')}"
+                )
+                if config.get("failure_policy") == "stop" and stop_failure is None:
+                    stop_failure = TrialFailure(f"{variant_id} returned status={trial.get('status')} for {point_label} iteration {iter_idx + 1}")
+        trial_stream.flush()
+        session_store.append("trials", trial_rows)
+        if all_ok:
+            state["completed_iterations"] += 1
+        if iter_idx == iterations - 1:
+            point_rows = finalize_point(config, state, datapoint_stream, spawn_calibration)
+            session_store.append("datapoints", point_rows)
+            datapoint_rows.extend(point_rows)
+
+    try:
+        with datapoints_path.open("w", encoding="utf-8", newline="\n") as datapoint_stream, trials_path.open("w", encoding="utf-8", newline="\n") as trial_stream, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="headless-solver",
+        ) as executor:
+            in_flight: dict[concurrent.futures.Future, tuple[tuple[int, int], str]] = {}
+            submission_open = True
+
+            def _complete(key: tuple[int, int], variant_id: str, trial: dict[str, Any]) -> None:
+                iteration = open_iterations[key]
+                iteration["trials"][variant_id] = trial
+                iteration["pending"] -= 1
+                # Inputs are released as soon as their own trials drain, even if flushing waits.
+                if iteration["pending"] == 0 and iteration["point_dir"] is not None and config.get("delete_generated_inputs", True):
+                    shutil.rmtree(iteration["point_dir"], ignore_errors=True)
+                while flush_order and open_iterations[flush_order[0]]["pending"] == 0:
+                    _flush_iteration(open_iterations.pop(flush_order.pop(0)))
+
+            while in_flight or submission_open:
+                while submission_open and stop_failure is None and len(in_flight) < max_workers:
+                    item = next(work_items, None)
+                    if item is None:
+                        submission_open = False
+                        break
+                    point_idx, point, iter_idx, variant_id = item
+                    key = (point_idx, iter_idx)
+                    iteration = open_iterations.get(key)
+                    if iteration is None:
+                        iteration = open_iterations[key] = _open_iteration(point_idx, point, iter_idx)
+                        flush_order.append(key)
+                    cached = _cached_trial(variant_id, iteration)
+                    if cached is not None:
+                        _complete(key, variant_id, cached)
+                        continue
+                    in_flight[executor.submit(_run_variant_attempts, variant_id, iteration)] = (key, variant_id)
                 if stop_failure is not None:
-                    raise stop_failure
-                if all_ok:
-                    state["completed_iterations"] += 1
-                if point_dir is not None and config.get("delete_generated_inputs", True):
-                    shutil.rmtree(point_dir, ignore_errors=True)
-            datapoint_rows.extend(finalize_point(config, state, datapoint_stream))
+                    submission_open = False
+                if not in_flight:
+                    continue
+                done, _pending = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    key, variant_id = in_flight.pop(future)
+                    _complete(key, variant_id, future.result())
+            if stop_failure is not None:
+                raise stop_failure
+    except BaseException:
+        session_store.close()
+        raise
+    finally:
+        if prefetcher is not None:
+            prefetcher.close(delete_untaken=bool(config.get("delete_generated_inputs", True)))
+        if config.get("delete_generated_inputs", True):
+            shutil.rmtree(generated_root / "shared_targets", ignore_errors=True)
+    if trial_cache is not None:
+        logger(
+            f"Trial cache: {trial_cache.stats['hits']} reused, {trial_cache.stats['stored']} stored, "
+            f"{trial_cache.stats['forced_fresh']} baseline trials forced fresh ({trial_cache.root})"
+        )
     ended_at = dt.datetime.now(dt.timezone.utc)
     payload = {
         "schema_version": SESSION_SCHEMA_VERSION,
@@ -999,6 +1559,7 @@ def execute_manifest(manifest: dict[str, Any], manifest_path: Path | None, outpu
         "manifest_path": str(manifest_path) if manifest_path else None,
         "datapoints_path": str(datapoints_path),
         "trials_path": str(trials_path),
+        "session_store_path": str(session_store.path),
         "run_config": {
             "preset": config.get("preset"), "tab_id": config["tab_id"], "input_mode": config["input_mode"], "graph_family": str(config.get("graph_family") or "random_density"),
             "selected_variants_requested": list(config.get("selected_variants_requested") or []), "selected_variants": list(config["selected_variants"]),
@@ -1011,12 +1572,40 @@ def execute_manifest(manifest: dict[str, Any], manifest_path: Path | None, outpu
             "max_workers": int(config.get("max_workers", 1)), "detected_logical_cores": int(config.get("detected_logical_cores", 1)),
             "k_mode": config.get("k_mode", "absolute"), "primary_variable": config["primary_var"], "secondary_variable": config["secondary_var"],
             "var_ranges": config["var_ranges"], "fixed_values": config["fixed_values"], "delete_generated_inputs": config.get("delete_generated_inputs", True),
+            "spawn_calibration_trials": int(config.get("spawn_calibration_trials") or 0),
+            "prefetch_lookahead": int(config.get("prefetch_lookahead") or 0), "prefetch_disk_budget_mb": config.get("prefetch_disk_budget_mb"),
+            "input_cache_max_mb": float(config.get("input_cache_max_mb") or 0),
+            "bootstrap_resamples": int(config.get("bootstrap_resamples") or 0),
+            "bootstrap_processes": config.get("bootstrap_processes"),
+            "generator_engine": config.get("generator_engine", generator_mod.DEFAULT_GENERATOR_ENGINE),
+            "subgraph_target_mode": config.get("subgraph_target_mode", app_mod.DEFAULT_SUBGRAPH_TARGET_MODE),
+            "generator_streaming": bool(config.get("generator_streaming", False)),
+            "generator_backend": generator_mod.resolve_generator_backend(config.get("generator_backend")),
+            "input_store": config.get("input_store"),
+            "dataset_pairs": config.get("dataset_pairs"),
+            "trial_cache": bool(config.get("trial_cache", False)),
+            "trial_cache_fresh_baselines": int(config.get("trial_cache_fresh_baselines") or 0),
         },
         "dataset_selection": list(config.get("dataset_selection") or []),
         "provenance": collect_runtime_provenance(repo_root=Path(__file__).resolve().parents[1]),
         "statistical_tests": app_mod.build_desktop_runtime_statistical_tests(config=config, point_states=point_states, selected_variants=list(config["selected_variants"])),
+        "cpu_time_statistical_tests": app_mod.build_desktop_runtime_statistical_tests(config=config, point_states=point_states, selected_variants=list(config["selected_variants"]), metric="cpu_time_ms"),
+        "datapoint_comparisons": app_mod.build_datapoint_ratio_comparisons(
+            config=config,
+            point_states=point_states,
+            selected_variants=list(config["selected_variants"]),
+            resamples=int(config.get("bootstrap_resamples") or 0),
+            max_processes=config.get("bootstrap_processes"),
+        ),
+        "spawn_calibration": spawn_calibration,
+        "input_prefetch": None if prefetcher is None else dict(prefetcher.stats),
+        "input_cache": None if input_cache is None or input_store is not None else {"root": input_cache.root.as_posix(), **input_cache.stats},
+        "input_store": None if input_store is None else {"root": input_store.root.as_posix(), "hits": input_store.stats["hits"], "misses": input_store.stats["misses"]},
+        "trial_cache": None if trial_cache is None else {"root": trial_cache.root.as_posix(), **trial_cache.stats},
         "datapoints": datapoint_rows,
     }
+    session_store.set_payload(payload)
+    session_store.close()
     write_session_json(out_dir / "benchmark-session.json", payload)
     write_session_csv(out_dir / "benchmark-session.csv", datapoint_rows)
     app_mod.save_session_plot_exports(payload, out_dir)
@@ -1105,6 +1694,10 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--graph-family", default="random_density", choices=list(generator_mod.GRAPH_FAMILIES), help="Synthetic graph family for generated runs.")
     parser.add_argument("--variants", default="", help="Comma-separated variant ids.")
     parser.add_argument("--datasets", default="", help="Comma-separated dataset ids.")
+    parser.add_argument("--dataset-pairs", type=int, default=None, help="For indexed multi-pair datasets (SIP, MIVIA), sample this many pairs instead of the single representative pair.")
+    parser.add_argument("--dataset-pair-classes", default="", help="Comma-separated pair classes or families to sample from (e.g. si,scalefree).")
+    parser.add_argument("--dataset-pair-min-nodes", type=int, default=None, help="Smallest target node count of sampled pairs.")
+    parser.add_argument("--dataset-pair-max-nodes", type=int, default=None, help="Largest target node count of sampled pairs.")
     parser.add_argument("--n-values", default="", help="Comma-separated N values for independent runs.")
     parser.add_argument("--density-values", default="", help="Comma-separated density values for independent runs.")
     parser.add_argument("--k-values", default="", help="Comma-separated k values for subgraph runs.")
@@ -1115,15 +1708,41 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--failure-policy", default="", choices=["", "stop", "continue"], help="Stop or continue on failed trials.")
     parser.add_argument("--outlier-filter", default="", choices=["", "none", "mad", "iqr"], help="Outlier filter.")
     parser.add_argument("--retry-failed-trials", type=int, default=None, help="Retry count for failed trials.")
+    parser.add_argument("--spawn-calibration-trials", type=int, default=None, help="Override preset spawn-overhead calibration runs per variant (0 disables).")
+    parser.add_argument("--prefetch-lookahead", type=int, default=None, help="Override how many upcoming iterations' inputs are generated ahead in background processes (0 disables).")
+    parser.add_argument("--prefetch-disk-budget-mb", type=float, default=None, help="Override the disk budget for prefetched but not yet used inputs.")
+    parser.add_argument("--bootstrap-resamples", type=int, default=None, help="Override preset bootstrap resamples for per-datapoint median ratio CIs (0 disables).")
+    parser.add_argument("--bootstrap-processes", type=int, default=None, help="Worker processes for the bootstrap (default: all logical CPUs when the resampling work is large).")
+    parser.add_argument("--input-cache-max-mb", type=float, default=None, help="Override the size cap of the shared generated-input cache (0 disables).")
+    parser.add_argument("--generator-backend", choices=list(generator_mod.GENERATOR_BACKENDS), help="Graph generator backend; numpy builds CSR arrays with vectorized sampling and falls back to python when NumPy is missing.")
+    parser.add_argument("--generator-streaming", action="store_true", help="Stream shortest-path edges to the CSV in chunks so generation memory stays bounded at large N (random_density and erdos_renyi).")
+    parser.add_argument("--subgraph-target-mode", default=None, choices=list(app_mod.SUBGRAPH_TARGET_MODES), help="'shared' builds one target per iteration and (N, density), reused by every k; patterns still use the per-datapoint seed.")
+    parser.add_argument("--generator-engine", default=None, choices=list(generator_mod.GENERATOR_ENGINES), help="Undirected generator engine for random_density/grid targets; 'legacy' reproduces graphs from earlier releases.")
+    parser.add_argument("--pregenerate", action="store_true", help="Generate every input set of --manifest or --manifest-dir into --input-store across a process pool, then exit.")
+    parser.add_argument("--input-store", default=None, help="Shared pre-generated input store; --pregenerate fills it, runs read generated inputs from it without writing.")
+    parser.add_argument("--pregenerate-processes", type=int, default=None, help="Worker processes for --pregenerate (default: all logical CPUs).")
+    parser.add_argument("--trial-cache", action="store_true", help="Reuse earlier measurements of trials whose solver binary, input files and host are all unchanged; only new or changed variants run.")
+    parser.add_argument("--trial-cache-dir", default=None, help="Directory for the trial cache (implies --trial-cache; default: per-user data directory or CAPSTONE_TRIAL_CACHE_DIR).")
+    parser.add_argument("--trial-cache-fresh-baselines", type=int, default=None, help=f"With the trial cache, always re-run baseline variants for this many leading iterations of each datapoint (default: {DEFAULT_TRIAL_CACHE_FRESH_BASELINES}).")
+    parser.add_argument("--input-cache-dir", default=None, help="Directory for the shared generated-input cache (default: per-user data directory or CAPSTONE_INPUT_CACHE_DIR).")
     parser.add_argument("--parallel-auto", action="store_true", help="Use the headless default parallelism policy for this run (half of logical CPU threads, minimum 1).")
     parser.add_argument("--max-workers", type=int, default=None, help="Override headless worker count. Use 1 to force serial execution.")
     parser.add_argument("--out-dir", default="", help="Optional benchmark output directory.")
     parser.add_argument("--no-delete-generated-inputs", action="store_true", help="Keep generated input files after the run.")
     parser.add_argument("--no-prepare-datasets", action="store_true", help="Assume selected datasets are already prepared.")
     parser.add_argument("--continue-on-error", action="store_true", help="For --manifest-dir runs, continue to the next manifest after a failure.")
+    parser.add_argument("--warehouse", default=None, help="After the run, ingest its session directories into this results warehouse SQLite file (see scripts/results-warehouse.py).")
     return parser
 
 
+def ingest_into_warehouse(db_path: str | None, out_dir: Path, logger) -> None:
+    if not db_path:
+        return
+    with warehouse_mod.ResultsWarehouse(Path(db_path).expanduser().resolve()) as warehouse:
+        counts = warehouse.ingest([out_dir])
+    logger(f"Results warehouse {warehouse.path}: {counts['ingested']} ingested, {counts['replaced']} replaced")
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -1144,6 +1763,22 @@ def main(argv: list[str] | None = None) -> int:
     if manifest_dir is not None and args.write_manifest:
         parser.error("--write-manifest is only supported for single-manifest or argument-built runs.")
     output_dir = Path(args.out_dir).resolve() if args.out_dir else None
+    if args.pregenerate:
+        if not args.input_store:
+            parser.error("--pregenerate requires --input-store.")
+        if manifest_dir is not None:
+            paths = list_collection_manifest_paths(manifest_dir)
+        elif args.manifest:
+            paths = [Path(args.manifest).resolve()]
+        else:
+            parser.error("--pregenerate requires --manifest or --manifest-dir.")
+        manifests = [(path.name, apply_manifest_overrides(load_manifest(path), manifest_overrides)) for path in paths]
+        summary = pregenerate_inputs(manifests, Path(args.input_store), print, max_processes=args.pregenerate_processes)
+        print(
+            f"Input store ready: {summary['store_dir']} "
+            f"({summary['generated_entries']} generated, {summary['existing_entries']} already present)"
+        )
+        return 1 if any(row["status"] == "error" for row in summary["manifests"]) else 0
     if manifest_dir is not None:
         manifest_paths = list_collection_manifest_paths(manifest_dir)
         if not args.run:
@@ -1159,6 +1794,7 @@ def main(argv: list[str] | None = None) -> int:
             continue_on_error=bool(args.continue_on_error),
             manifest_overrides=manifest_overrides,
         )
+        ingest_into_warehouse(args.warehouse, out_dir, print)
         failures = [row for row in list(summary.get("runs") or []) if str(row.get("status") or "") != "ok"]
         if failures:
             print(f"Data Collection run completed with failures: {out_dir}")
@@ -1177,6 +1813,7 @@ def main(argv: list[str] | None = None) -> int:
         print("Resolved manifest. Use --run to execute it.")
         return 0
     out_dir = execute_manifest(manifest, manifest_path, output_dir, print)
+    ingest_into_warehouse(args.warehouse, out_dir, print)
     print(f"Benchmark run complete: {out_dir}")
     return 0
 
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""Cross-session results warehouse: ingest benchmark session directories and query them."""
+
+# - The warehouse is one SQLite file holding every ingested session's datapoint
+#   rows, keyed by the dimensions comparisons are made over (variant, family,
+#   git sha, host, n, density, k, dataset), each with its own index.
+# - Session directories stay the source of truth; the warehouse can always be
+#   rebuilt from them. Ingest reads the columnar session store when a session
+#   has one and benchmark-session.json otherwise.
+# - Ingest is incremental: a session whose source file is unchanged since it was
+#   last ingested is skipped without being parsed, and a changed or moved one
+#   replaces its earlier rows.
+# - Host and toolchain dimensions come from the session's recorded provenance,
+#   not from the machine doing the ingest.
+# - `k` is always a pattern node count. Percent-mode sessions sweep k as a share
+#   of N; ingest converts it with the runner's rounding and keeps the share in
+#   `k_percent`, so one k filter never mixes the two scales.
+# - A warehouse written by an older schema version is dropped and rebuilt from
+#   its sessions on the next ingest rather than migrated in place.
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import hashlib
+import json
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+from desktop_runner import app as app_mod
+from utilities import session_store as store_mod
+
+WAREHOUSE_SCHEMA_VERSION = "capstone-results-warehouse-v2"
+WAREHOUSE_FILE_NAME = "results.sqlite"
+SESSION_JSON_NAME = "benchmark-session.json"
+
+# Query dimension -> SQL column; every one of them is indexed.
+DIMENSIONS = {
+    "variant": "d.variant_id",
+    "family": "d.family",
+    "git_sha": "s.git_sha",
+    "host": "s.host",
+    "n": "d.n",
+    "density": "d.density",
+    "k": "d.k",
+    "dataset": "d.dataset_id",
+    "tab": "s.tab_id",
+    "graph_family": "s.graph_family",
+    "session": "s.session_id",
+}
+DATAPOINT_COLUMNS = (
+    "variant_id", "variant_label", "point_label", "dataset_id", "dataset_name", "dataset_pair_id", "x_value", "y_value",
+    "runtime_median_ms", "runtime_stdev_ms", "runtime_samples_n", "memory_median_kb", "memory_stdev_kb", "memory_samples_n",
+    "cpu_time_median_ms", "internal_runtime_median_ms", "runtime_corrected_median_ms", "completed_iterations", "requested_iterations",
+    "runtime_samples_ms", "memory_samples_kb",
+)
+_SAMPLE_COLUMNS = ("runtime_samples_ms", "memory_samples_kb")
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS warehouse_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    """CREATE TABLE IF NOT EXISTS sessions (
+        session_id INTEGER PRIMARY KEY,
+        session_key TEXT NOT NULL UNIQUE,
+        session_dir TEXT NOT NULL,
+        source_fingerprint TEXT NOT NULL,
+        ingested_at_utc TEXT NOT NULL,
+        schema_version TEXT, run_started_utc TEXT, run_ended_utc TEXT, run_duration_ms REAL,
+        collection_dir TEXT, manifest_name TEXT, preset TEXT, tab_id TEXT, input_mode TEXT, graph_family TEXT,
+        seed INTEGER, iterations INTEGER, outlier_filter TEXT, k_mode TEXT,
+        git_sha TEXT, git_ref TEXT, host TEXT, os TEXT, machine TEXT, processor TEXT,
+        logical_cores INTEGER, physical_cores INTEGER, memory_total_bytes INTEGER,
+        python_version TEXT, compiler TEXT, build_flags TEXT, run_config TEXT, provenance TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS datapoints (
+        datapoint_id INTEGER PRIMARY KEY,
+        session_id INTEGER NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+        variant_id TEXT NOT NULL, variant_label TEXT, family TEXT,
+        point_label TEXT, dataset_id TEXT, dataset_name TEXT, dataset_pair_id TEXT,
+        n REAL, density REAL, k REAL, k_percent REAL, x_value REAL, y_value REAL,
+        runtime_median_ms REAL, runtime_stdev_ms REAL, runtime_samples_n INTEGER,
+        memory_median_kb REAL, memory_stdev_kb REAL, memory_samples_n INTEGER,
+        cpu_time_median_ms REAL, internal_runtime_median_ms REAL, runtime_corrected_median_ms REAL,
+        completed_iterations INTEGER, requested_iterations INTEGER,
+        runtime_samples_ms BLOB, memory_samples_kb BLOB
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_git_sha ON sessions(git_sha)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_host ON sessions(host)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_dir ON sessions(session_dir)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_session ON datapoints(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_variant ON datapoints(variant_id)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_family ON datapoints(family)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_n ON datapoints(n)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_density ON datapoints(density)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_k ON datapoints(k)",
+    "CREATE INDEX IF NOT EXISTS idx_datapoints_dataset ON datapoints(dataset_id)",
+)
+
+
+def default_warehouse_path() -> Path:
+    return app_mod.results_warehouse_root() / WAREHOUSE_FILE_NAME
+
+
+def _session_source(session_dir: Path) -> Path | None:
+    store_path = session_dir / store_mod.SESSION_STORE_NAME
+    if store_path.is_file():
+        return store_path
+    json_path = session_dir / SESSION_JSON_NAME
+    return json_path if json_path.is_file() else None
+
+
+def discover_session_dirs(paths: Iterable[Path]) -> list[Path]:
+    """Session directories at or below ``paths`` (a session has a store or a session JSON)."""
+    found: set[Path] = set()
+    for raw in paths:
+        root = Path(raw).resolve()
+        if root.is_file():
+            root = root.parent
+        if not root.is_dir():
+            continue
+        for name in (store_mod.SESSION_STORE_NAME, SESSION_JSON_NAME):
+            found.update(path.parent for path in root.rglob(name))
+    return sorted(found)
+
+
+def _fingerprint(source: Path) -> str:
+    stat = source.stat()
+    return f"{source.name}:{int(stat.st_size)}:{int(stat.st_mtime_ns)}"
+
+
+def _load_session(session_dir: Path) -> tuple[dict, list[dict]] | None:
+    payload = store_mod.load_session_payload(session_dir)
+    if payload is not None:
+        with store_mod.open_session_store(session_dir) as reader:
+            return payload, list(reader.iter_rows("datapoints", DATAPOINT_COLUMNS))
+    json_path = session_dir / SESSION_JSON_NAME
+    try:
+        payload = json.loads(json_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    # Recorded stream paths may point at another machine; read the copy beside the JSON.
+    located = {**payload, "session_store_path": None, "datapoints_path": str(session_dir / "benchmark-datapoints.ndjson")}
+    rows = [row for row in app_mod.iter_plot_export_datapoints(located) if isinstance(row, dict)]
+    return payload, rows
+
+
+def _host_fields(provenance: dict) -> dict[str, Any]:
+    environment = dict(provenance.get("runtime_environment") or {})
+    platform_info = dict(environment.get("platform") or {})
+    hardware = dict(environment.get("hardware") or {})
+    git = dict(environment.get("git") or {})
+    toolchains = dict(provenance.get("toolchains") or {})
+    compiler = next((dict(toolchains[name]).get("version") for name in ("g++", "clang++", "gcc", "clang") if isinstance(toolchains.get(name), dict)), None)
+    # Older sessions predate the recorded node name; fall back to an OS/CPU signature.
+    host = platform_info.get("node") or "-".join(str(part) for part in (platform_info.get("system"), platform_info.get("machine"), hardware.get("logical_cores")) if part) or None
+    return {
+        "git_sha": git.get("sha"),
+        "git_ref": git.get("ref"),
+        "host": host,
+        "os": platform_info.get("platform") or platform_info.get("system"),
+        "machine": platform_info.get("machine"),
+        "processor": platform_info.get("processor"),
+        "logical_cores": hardware.get("logical_cores"),
+        "physical_cores": hardware.get("physical_cores"),
+        "memory_total_bytes": hardware.get("memory_total_bytes"),
+        "python_version": dict(environment.get("python") or {}).get("version"),
+        "compiler": compiler,
+        "build_flags": json.dumps(provenance.get("build_flags") or {}, sort_keys=True),
+    }
+
+
+def _session_key(payload: dict, session_dir: Path) -> str:
+    provenance = dict(payload.get("provenance") or {})
+    identity = [payload.get("run_started_utc"), payload.get("created_at_utc"), provenance.get("captured_at_utc")]
+    if not any(identity):
+        identity = [str(session_dir)]
+    return hashlib.sha256(json.dumps(identity, default=str).encode("utf-8")).hexdigest()
+
+
+def point_dimensions(run_config: dict, row: dict) -> dict[str, float | None]:
+    """``n``/``density``/``k`` of a datapoint row: its swept axes, else the run's fixed values.
+
+    ``k`` is the pattern node count; a percent-mode share of N is converted and
+    also returned as ``k_percent`` (``k`` stays ``None`` when N is unknown).
+    """
+    dims: dict[str, float | None] = {"n": None, "density": None, "k": None}
+    if str(run_config.get("input_mode") or "independent") != "datasets":
+        # Dataset runs record the first dataset's values as "fixed"; they do not describe other rows.
+        for key, value in dict(run_config.get("fixed_values") or {}).items():
+            if key in dims and isinstance(value, (int, float)):
+                dims[key] = float(value)
+    for axis_key, value_key in (("primary_variable", "x_value"), ("secondary_variable", "y_value")):
+        axis = run_config.get(axis_key)
+        if axis in dims and isinstance(row.get(value_key), (int, float)):
+            dims[axis] = float(row[value_key])
+    dims["k_percent"] = None
+    if str(run_config.get("k_mode") or "absolute").strip().lower() == "percent" and dims["k"] is not None:
+        dims["k_percent"] = dims["k"]
+        dims["k"] = None
+        if dims["n"] is not None:
+            # Same rounding as the headless runner's percent-mode datapoints.
+            n_nodes = int(round(dims["n"]))
+            dims["k"] = float(max(2, min(n_nodes - 1, int(round((dims["k_percent"] / 100.0) * n_nodes)))))
+    return dims
+
+
+def _number(value: Any) -> float | None:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+class ResultsWarehouse:
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(_SCHEMA[0])
+            stored = self.conn.execute("SELECT value FROM warehouse_meta WHERE key = 'schema_version'").fetchone()
+            if stored is not None and stored["value"] != WAREHOUSE_SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS datapoints")
+                self.conn.execute("DROP TABLE IF EXISTS sessions")
+            for statement in _SCHEMA[1:]:
+                self.conn.execute(statement)
+            self.conn.execute("INSERT OR REPLACE INTO warehouse_meta VALUES ('schema_version', ?)", (WAREHOUSE_SCHEMA_VERSION,))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ResultsWarehouse":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def ingest_session(self, session_dir: Path) -> str:
+        """Ingest one session directory; returns ``ingested``, ``replaced``, ``unchanged`` or ``skipped``."""
+        session_dir = Path(session_dir).resolve()
+        source = _session_source(session_dir)
+        if source is None:
+            return "skipped"
+        fingerprint = _fingerprint(source)
+        known = self.conn.execute("SELECT source_fingerprint FROM sessions WHERE session_dir = ?", (str(session_dir),)).fetchone()
+        if known is not None and known["source_fingerprint"] == fingerprint:
+            return "unchanged"
+        loaded = _load_session(session_dir)
+        if loaded is None:
+            return "skipped"
+        payload, rows = loaded
+        run_config = dict(payload.get("run_config") or {})
+        session_key = _session_key(payload, session_dir)
+        collection_dir = session_dir.parent if (session_dir.parent / "collection-run.json").is_file() else None
+        session = {
+            "session_key": session_key,
+            "session_dir": str(session_dir),
+            "source_fingerprint": fingerprint,
+            "ingested_at_utc": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "schema_version": payload.get("schema_version"),
+            "run_started_utc": payload.get("run_started_utc"),
+            "run_ended_utc": payload.get("run_ended_utc"),
+            "run_duration_ms": _number(payload.get("run_duration_ms")),
+            "collection_dir": None if collection_dir is None else str(collection_dir),
+            "manifest_name": Path(str(payload["manifest_path"])).name if payload.get("manifest_path") else None,
+            "preset": run_config.get("preset"),
+            "tab_id": run_config.get("tab_id"),
+            "input_mode": run_config.get("input_mode"),
+            "graph_family": run_config.get("graph_family"),
+            "seed": run_config.get("seed"),
+            "iterations": run_config.get("iterations_per_datapoint"),
+            "outlier_filter": run_config.get("outlier_filter"),
+            "k_mode": run_config.get("k_mode"),
+            **_host_fields(dict(payload.get("provenance") or {})),
+            "run_config": json.dumps(run_config, sort_keys=True, default=str),
+            "provenance": json.dumps(payload.get("provenance"), sort_keys=True, default=str),
+        }
+        datapoints = []
+        for row in rows:
+            variant_id = str(row.get("variant_id") or "")
+            if not variant_id:
+                continue
+            values = {column: row.get(column) for column in DATAPOINT_COLUMNS}
+            for column in _SAMPLE_COLUMNS:
+                samples = [float(value) for value in list(values[column] or [])]
+                values[column] = store_mod.encode_cell("f8", samples) if samples else None
+            values.update(point_dimensions(run_config, row))
+            values["family"] = app_mod.variant_family_from_id(variant_id)
+            datapoints.append(values)
+        with self.conn:
+            replaced = self.conn.execute("DELETE FROM sessions WHERE session_key = ? OR session_dir = ?", (session_key, str(session_dir))).rowcount
+            columns = list(session)
+            cursor = self.conn.execute(f"INSERT INTO sessions ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})", [session[column] for column in columns])
+            session_id = int(cursor.lastrowid)
+            if datapoints:
+                columns = ["session_id", *datapoints[0]]
+                self.conn.executemany(
+                    f"INSERT INTO datapoints ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                    [[session_id, *values.values()] for values in datapoints],
+                )
+        return "replaced" if replaced else "ingested"
+
+    def ingest(self, paths: Iterable[Path], logger=None) -> dict[str, int]:
+        counts = {"ingested": 0, "replaced": 0, "unchanged": 0, "skipped": 0}
+        for session_dir in discover_session_dirs(paths):
+            outcome = self.ingest_session(session_dir)
+            counts[outcome] += 1
+            if logger is not None and outcome in {"ingested", "replaced", "skipped"}:
+                logger(f"{outcome}: {session_dir}")
+        return counts
+
+    def _where(self, filters: dict[str, Any]) -> tuple[str, list[Any]]:
+        clauses, params = [], []
+        for variant in list(filters.get("variant") or []):
+            clauses.append("d.variant_id GLOB ?")
+            params.append(str(variant))
+        if len(clauses) > 1:
+            clauses = ["(" + " OR ".join(clauses) + ")"]
+        for key in ("family", "host", "dataset", "tab", "graph_family"):
+            if filters.get(key):
+                clauses.append(f"{DIMENSIONS[key]} = ?")
+                params.append(str(filters[key]))
+        if filters.get("git_sha"):
+            # Prefix match, so abbreviated shas work; a range keeps the index usable.
+            prefix = str(filters["git_sha"]).lower()
+            clauses.append("s.git_sha >= ? AND s.git_sha < ?")
+            params.extend([prefix, prefix + "\uffff"])
+        for key in ("n", "density", "k"):
+            if filters.get(key) is not None:
+                clauses.append(f"{DIMENSIONS[key]} = ?")
+                params.append(float(filters[key]))
+        if filters.get("since"):
+            clauses.append("s.run_started_utc >= ?")
+            params.append(str(filters["since"]))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, filters: dict[str, Any] | None = None, *, group_by: list[str] | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        """Matching datapoints, or with ``group_by`` one row per group with medians of the datapoint medians."""
+        where, params = self._where(dict(filters or {}))
+        base = (
+            "SELECT s.session_id AS session, s.git_sha, s.host, s.run_started_utc, s.tab_id AS tab, s.graph_family, "
+            "d.variant_id AS variant, d.family, d.dataset_id AS dataset, d.n, d.density, d.k, d.k_percent, d.point_label, "
+            "d.runtime_median_ms, d.memory_median_kb, d.cpu_time_median_ms, d.runtime_samples_n "
+            f"FROM datapoints d JOIN sessions s ON s.session_id = d.session_id{where} "
+            "ORDER BY s.run_started_utc, d.datapoint_id"
+        )
+        rows = [dict(row) for row in self.conn.execute(base, params)]
+        if not group_by:
+            return rows[:limit] if limit else rows
+        unknown = [key for key in group_by if key not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown group-by dimension(s): {', '.join(unknown)}")
+        groups: dict[tuple, list[dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row[key] for key in group_by), []).append(row)
+        out = []
+        for key in sorted(groups, key=lambda values: tuple((value is None, str(value) if not isinstance(value, (int, float)) else value) for value in values)):
+            members = groups[key]
+            summary = dict(zip(group_by, key))
+            summary["datapoints"] = len(members)
+            summary["sessions"] = len({member["session"] for member in members})
+            for metric in ("runtime_median_ms", "memory_median_kb", "cpu_time_median_ms"):
+                values = [float(member[metric]) for member in members if member[metric] is not None]
+                summary[metric] = float(statistics.median(values)) if values else None
+            out.append(summary)
+        return out[:limit] if limit else out
+
+    def sessions(self) -> list[dict[str, Any]]:
+        found = self.conn.execute(
+            "SELECT s.session_id AS session, s.run_started_utc, s.git_sha, s.host, s.tab_id AS tab, s.manifest_name, "
+            "COUNT(d.datapoint_id) AS datapoints, s.session_dir FROM sessions s LEFT JOIN datapoints d ON d.session_id = s.session_id "
+            "GROUP BY s.session_id ORDER BY s.run_started_utc"
+        )
+        return [dict(row) for row in found]
+
+    def sample_values(self, datapoint_id: int, column: str = "runtime_samples_ms") -> list[float]:
+        if column not in _SAMPLE_COLUMNS:
+            raise ValueError(f"Unknown sample column: {column}")
+        found = self.conn.execute(f"SELECT {column} FROM datapoints WHERE datapoint_id = ?", (int(datapoint_id),)).fetchone()
+        return [] if found is None or found[0] is None else store_mod.decode_cell("f8", found[0])
+
+
+def _format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def write_rows(rows: list[dict[str, Any]], fmt: str, stream) -> None:
+    if fmt == "json":
+        stream.write(json.dumps(rows, indent=2) + "\n")
+        return
+    columns = list(rows[0]) if rows else []
+    if fmt == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_format_cell(row[column]) for column in columns])
+        return
+    if not rows:
+        stream.write("No matching rows.\n")
+        return
+    cells = [[_format_cell(row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[idx]) for line in cells)) for idx, column in enumerate(columns)]
+    stream.write("  ".join(column.ljust(width) for column, width in zip(columns, widths)).rstrip() + "\n")
+    for line in cells:
+        stream.write("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() + "\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Cross-session benchmark results warehouse.")
+    parser.add_argument("--db", default=None, help="Warehouse SQLite file (default: CAPSTONE_RESULTS_WAREHOUSE_DIR or the per-user data directory).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="Ingest session directories (searched recursively); unchanged sessions are skipped.")
+    ingest.add_argument("paths", nargs="+", help="Session, manifest-run or collection directories.")
+    query = commands.add_parser("query", help="List matching datapoints, or summarize them per group.")
+    query.add_argument("--variant", action="append", default=[], help="Variant id or glob (e.g. 'glasgow_*'); repeat to OR several.")
+    query.add_argument("--family", default="", help="Solver family (dijkstra, sp_via, vf3, glasgow).")
+    query.add_argument("--git-sha", default="", help="Git sha or sha prefix the session ran at.")
+    query.add_argument("--host", default="", help="Host name recorded in the session provenance.")
+    query.add_argument("--dataset", default="", help="Dataset id.")
+    query.add_argument("--tab", default="", choices=["", "subgraph", "shortest_path"], help="Benchmark tab.")
+    query.add_argument("--graph-family", default="", help="Synthetic graph family.")
+    query.add_argument("--n", type=float, default=None, help="Exact N.")
+    query.add_argument("--density", type=float, default=None, help="Exact density.")
+    query.add_argument("--k", type=float, default=None, help="Exact k in pattern nodes (percent-mode sessions are converted with their N).")
+    query.add_argument("--since", default="", help="Only sessions started at or after this UTC date/time (ISO 8601, e.g. 2025-01-31).")
+    query.add_argument("--group-by", default="", help=f"Comma-separated dimensions: {', '.join(DIMENSIONS)}.")
+    query.add_argument("--limit", type=int, default=None, help="Maximum rows to print.")
+    query.add_argument("--format", default="table", choices=["table", "csv", "json"], help="Output format.")
+    sessions = commands.add_parser("sessions", help="List ingested sessions.")
+    sessions.add_argument("--format", default="table", choices=["table", "csv", "json"], help="Output format.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    db_path = Path(args.db).expanduser().resolve() if args.db else default_warehouse_path()
+    with ResultsWarehouse(db_path) as warehouse:
+        if args.command == "ingest":
+            counts = warehouse.ingest([Path(path) for path in args.paths], print)
+            print(
+                f"Warehouse {db_path}: {counts['ingested']} ingested, {counts['replaced']} replaced, "
+                f"{counts['unchanged']} unchanged, {counts['skipped']} skipped"
+            )
+            return 0
+        if args.command == "sessions":
+            write_rows(warehouse.sessions(), args.format, sys.stdout)
+            return 0
+        group_by = [item.strip() for item in str(args.group_by or "").split(",") if item.strip()]
+        unknown = [key for key in group_by if key not in DIMENSIONS]
+        if unknown:
+            parser.error(f"Unknown --group-by dimension(s): {', '.join(unknown)}")
+        filters = {
+            "variant": args.variant, "family": args.family, "git_sha": args.git_sha, "host": args.host, "dataset": args.dataset,
+            "tab": args.tab, "graph_family": args.graph_family, "n": args.n, "density": args.density, "k": args.k, "since": args.since,
+        }
+        write_rows(warehouse.query(filters, group_by=group_by, limit=args.limit), args.format, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
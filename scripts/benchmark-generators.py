@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Time the synthetic undirected graph generators across input sizes."""
+
+# - Compares the `linear` and `legacy` engines of utilities/generate_graphs and,
+#   for small sizes, the per-attempt recount the legacy engine used to perform.
+# - Each row also checks that `legacy` still reproduces the recount graph, so the
+#   compatibility claim is re-verified whenever the benchmark runs.
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from utilities import generate_graphs as generator_mod
+
+
+def recount_reference(n: int, seed: int, density: float) -> list[list[int]]:
+    # Pre-engine random_density fill: recounts every edge on each sampling attempt.
+    rng = random.Random(seed)
+    adj_sets = [set() for _ in range(n)]
+    for i in range(n - 1):
+        adj_sets[i].add(i + 1)
+        adj_sets[i + 1].add(i)
+    target_edges = max(n - 1, generator_mod._target_edge_budget(n, density, directed=False))
+    attempts = 0
+    max_attempts = max(1, target_edges * 12)
+    while generator_mod._count_undirected_edges(generator_mod._adj_sets_to_lists(adj_sets)) < target_edges and attempts < max_attempts:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        attempts += 1
+        if u == v or v in adj_sets[u]:
+            continue
+        adj_sets[u].add(v)
+        adj_sets[v].add(u)
+    return generator_mod._adj_sets_to_lists(adj_sets)
+
+
+def time_call(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - started) * 1000.0, result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark undirected random_density/grid graph generation.")
+    parser.add_argument("--sizes", default="500,1000,2000,5000,10000", help="Comma-separated N values.")
+    parser.add_argument("--density", type=float, default=0.01)
+    parser.add_argument("--graph-family", default="random_density", choices=["random_density", "grid"])
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--recount-max-n", type=int, default=1000, help="Largest N for the per-attempt recount baseline.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    sizes = [int(token) for token in str(args.sizes).split(",") if token.strip()]
+    print(f"{'N':>8} {'edges':>10} {'linear_ms':>11} {'legacy_ms':>11} {'recount_ms':>11} {'legacy==recount':>16}")
+    mismatches = 0
+    for n in sizes:
+        linear_ms, linear_adj = time_call(
+            lambda: generator_mod.generate_adjacency(n, random.Random(args.seed), args.density, args.graph_family, engine="linear")
+        )
+        legacy_ms, legacy_adj = time_call(
+            lambda: generator_mod.generate_adjacency(n, random.Random(args.seed), args.density, args.graph_family, engine="legacy")
+        )
+        recount_ms = "-"
+        same = "-"
+        if args.graph_family == "random_density" and n <= args.recount_max_n:
+            elapsed_ms, reference_adj = time_call(lambda: recount_reference(n, args.seed, args.density))
+            recount_ms = f"{elapsed_ms:.1f}"
+            same = "yes" if reference_adj == legacy_adj else "NO"
+            mismatches += int(reference_adj != legacy_adj)
+        edges = generator_mod._count_undirected_edges(linear_adj)
+        print(f"{n:>8} {edges:>10} {linear_ms:>11.1f} {legacy_ms:>11.1f} {recount_ms:>11} {same:>16}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import importlib.util
 import os
 import re
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from typing import Any
 
 
 PATTERN_LAD = """3
@@ -134,49 +136,45 @@ def run_vf3_count(cmd: list[str], label: str) -> int:
     return parsed
 
 
+def load_generator_module(generator_script: Path):
+    # Imported in-process: a fresh interpreter per seed cost more than generating the graph.
+    spec = importlib.util.spec_from_file_location("capstone_generate_graphs", generator_script)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load generator script: {generator_script}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_seed_cases(generator_mod, *, seeds: list[int], n: int, k: int, density: float, tmpdir: Path) -> dict[int, Any]:
+    requests = [
+        generator_mod.GenerationRequest(
+            algorithm="subgraph",
+            out_dir=tmpdir / f"generated_seed_{seed}",
+            n=n,
+            k=k,
+            density=density,
+            seed=seed,
+        )
+        for seed in seeds
+    ]
+    return {int(result.request.seed): result for result in generator_mod.generate_inputs_batch(requests)}
+
+
 def run_generated_case(
     *,
-    repo_root: Path,
-    generator_script: Path,
+    generated: Any,
     seed: int,
-    n: int,
-    k: int,
-    density: float,
     baseline_binary: Path,
     chatgpt_binary: Path,
     gemini_binary: Path,
     vf3_binary: Path,
-    tmpdir: Path,
 ) -> dict[str, int]:
-    out_dir = tmpdir / f"generated_seed_{seed}"
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    gen_cmd = [
-        sys.executable,
-        str(generator_script),
-        "--algorithm",
-        "subgraph",
-        "--n",
-        str(n),
-        "--k",
-        str(k),
-        "--density",
-        str(density),
-        "--seed",
-        str(seed),
-        "--out-dir",
-        str(out_dir),
-    ]
-    gen_out = run_cmd(gen_cmd, f"Generator seed={seed}")
-    lines = [line.strip() for line in gen_out.splitlines() if line.strip()]
-    if not lines:
-        raise RuntimeError(f"Generator produced no output for seed={seed}.")
-    parts = [p.strip() for p in lines[-1].split(",")]
-    if len(parts) != 4:
-        raise RuntimeError(
-            f"Generator output parse error for seed={seed}. Expected 4 paths, got: {lines[-1]}"
-        )
-    lad_pattern, lad_target, vf_pattern, vf_target = [Path(p) for p in parts]
+    lad_pattern = generated.paths["lad_pattern"]
+    lad_target = generated.paths["lad_target"]
+    vf_pattern = generated.paths["vf_pattern"]
+    vf_target = generated.paths["vf_target"]
 
     baseline_count = run_count(
         [
@@ -315,19 +313,22 @@ def main() -> int:
             seeds = parse_seed_list(args.generated_seeds)
             if not seeds:
                 raise RuntimeError("generated-seeds is empty while generated checks are enabled.")
+            generated_cases = generate_seed_cases(
+                load_generator_module(generator_script),
+                seeds=seeds,
+                n=args.generated_n,
+                k=args.generated_k,
+                density=args.generated_density,
+                tmpdir=tmpdir,
+            )
             for seed in seeds:
                 result = run_generated_case(
-                    repo_root=repo_root,
-                    generator_script=generator_script,
+                    generated=generated_cases[int(seed)],
                     seed=seed,
-                    n=args.generated_n,
-                    k=args.generated_k,
-                    density=args.generated_density,
                     baseline_binary=baseline_binary,
                     chatgpt_binary=chatgpt_binary,
                     gemini_binary=gemini_binary,
                     vf3_binary=vf3_binary,
-                    tmpdir=tmpdir,
                 )
                 generated_results.append(result)
                 if result["baseline"] != result["vf3"]:
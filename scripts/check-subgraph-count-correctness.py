@@ -18,6 +18,10 @@ from pathlib import Path
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from utilities import generate_graphs as generator_mod
 
 
 def resolve_binary(base_rel: str) -> Path | None:
@@ -76,37 +80,10 @@ def write_case(path_pattern: Path, path_target: Path, pattern_rows: list[str], t
 
 
 def build_generated_case(seed: int, n: int, k: int, density: float, out_dir: Path) -> tuple[Path, Path]:
-    cmd = [
-        sys.executable,
-        "utilities/generate_graphs.py",
-        "--algorithm",
-        "subgraph",
-        "--n",
-        str(n),
-        "--k",
-        str(k),
-        "--density",
-        str(density),
-        "--seed",
-        str(seed),
-        "--out-dir",
-        str(out_dir),
-    ]
-    completed = subprocess.run(
-        cmd,
-        cwd=str(REPO_ROOT),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-        timeout=60,
-        check=True,
+    generated = generator_mod.generate_inputs(
+        generator_mod.GenerationRequest(algorithm="subgraph", out_dir=out_dir, n=n, k=k, density=density, seed=seed)
     )
-    parts = [p.strip() for p in str(completed.stdout or "").strip().split(",") if p.strip()]
-    if len(parts) < 2:
-        raise RuntimeError(f"Generator did not return LAD files for seed {seed}: {completed.stdout}")
-    return Path(parts[0]).resolve(), Path(parts[1]).resolve()
+    return generated.paths["lad_pattern"].resolve(), generated.paths["lad_target"].resolve()
 
 
 def parse_args() -> argparse.Namespace:
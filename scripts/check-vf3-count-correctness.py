@@ -21,6 +21,8 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from utilities import generate_graphs as generator_mod
+
 
 def resolve_binary(base_rel: str) -> Path | None:
     path = (REPO_ROOT / base_rel).resolve()
@@ -89,37 +91,10 @@ def write_vf(path: Path, adj: list[list[int]], labels: list[int]) -> None:
 
 
 def build_generated_case(seed: int, n: int, k: int, density: float, out_dir: Path) -> tuple[Path, Path]:
-    cmd = [
-        sys.executable,
-        "utilities/generate_graphs.py",
-        "--algorithm",
-        "subgraph",
-        "--n",
-        str(n),
-        "--k",
-        str(k),
-        "--density",
-        str(density),
-        "--seed",
-        str(seed),
-        "--out-dir",
-        str(out_dir),
-    ]
-    completed = subprocess.run(
-        cmd,
-        cwd=str(REPO_ROOT),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-        timeout=60,
-        check=True,
+    generated = generator_mod.generate_inputs(
+        generator_mod.GenerationRequest(algorithm="subgraph", out_dir=out_dir, n=n, k=k, density=density, seed=seed)
     )
-    parts = [p.strip() for p in str(completed.stdout or "").strip().split(",") if p.strip()]
-    if len(parts) < 4:
-        raise RuntimeError(f"Generator did not return VF paths for seed {seed}: {completed.stdout}")
-    return Path(parts[2]).resolve(), Path(parts[3]).resolve()
+    return generated.paths["vf_pattern"].resolve(), generated.paths["vf_target"].resolve()
 
 
 def parse_args() -> argparse.Namespace:
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Thin CLI wrapper around desktop_runner.results_warehouse.main()."""
+
+# - Keep this file intentionally small; the ingest and query logic lives in
+#   desktop_runner/results_warehouse.py next to the headless runner it reads.
+
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from desktop_runner.results_warehouse import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+"""Regression tests for the shared runtime-comparison statistics."""
+
+import math
+import random
+import unittest
+from unittest import mock
+
+from utilities import benchmark_statistics as stats_mod
+
+
+def _pairwise_cliffs_delta(left, right):
+    greater = sum(1 for x in left for y in right if x > y)
+    less = sum(1 for x in left for y in right if x < y)
+    return float(greater - less) / float(len(left) * len(right))
+
+
+class BenchmarkStatisticsTests(unittest.TestCase):
+    def test_student_t_tails_match_reference_values(self):
+        # Reference two-sided critical values from standard t tables.
+        for df, alpha, expected in ((1, 0.05, 12.706205), (5, 0.05, 2.570582), (10, 0.01, 3.169273), (30, 0.05, 2.042272), (250, 0.05, 1.969498)):
+            crit = stats_mod.student_t_critical_two_sided(alpha, df)
+            self.assertAlmostEqual(crit, expected, places=5)
+            self.assertAlmostEqual(stats_mod.student_t_two_sided_p_value(crit, df), alpha, places=12)
+        # Cauchy (df=1) has the closed form p = 1 - 2 atan(t) / pi.
+        self.assertAlmostEqual(stats_mod.student_t_two_sided_p_value(3.0, 1), 1.0 - (2.0 * math.atan(3.0) / math.pi), places=14)
+        self.assertEqual(stats_mod.student_t_two_sided_p_value(0.0, 4), 1.0)
+        self.assertIsNone(stats_mod.student_t_two_sided_p_value(float("nan"), 4))
+        self.assertIsNone(stats_mod.student_t_critical_two_sided(0.05, 0))
+
+    def test_vectorized_tails_match_scalar_path(self):
+        rng = random.Random(5)
+        t_stats = [rng.uniform(-8.0, 8.0) for _ in range(300)] + [0.0, float("inf"), 1e-12, 1e200]
+        dfs = [rng.randint(1, 400) for _ in range(300)] + [3, 3, 3, 0]
+        vectorized = stats_mod.student_t_two_sided_p_values(t_stats, dfs)
+        scalar = [stats_mod.student_t_two_sided_p_value(t, df) for t, df in zip(t_stats, dfs)]
+        for got, want in zip(vectorized, scalar):
+            if want is None:
+                self.assertIsNone(got)
+            else:
+                self.assertAlmostEqual(got, want, places=12)
+        with mock.patch.object(stats_mod, "np", None):
+            self.assertEqual(stats_mod.student_t_two_sided_p_values(t_stats, dfs), scalar)
+
+    def test_cliffs_delta_matches_pairwise_definition(self):
+        rng = random.Random(11)
+        for _ in range(200):
+            left = [rng.randint(0, 12) / 4.0 for _ in range(rng.randint(1, 20))]
+            right = [rng.randint(0, 12) / 4.0 for _ in range(rng.randint(1, 20))]
+            expected = _pairwise_cliffs_delta(left, right)
+            self.assertEqual(stats_mod.cliffs_delta(left, right), expected)
+            summary = stats_mod.summarize_runtime_comparison(variant_samples_ms=left, baseline_samples_ms=right)
+            self.assertAlmostEqual(summary["effect_sizes"]["cliffs_delta"], expected, places=12)
+        self.assertIsNone(stats_mod.cliffs_delta([], [1.0]))
+
+    def test_batched_summaries_equal_single_summaries(self):
+        rng = random.Random(3)
+        pairs = [([rng.gauss(10.0, 2.0) for _ in range(12)], [rng.gauss(10.4, 2.0) for _ in range(12)]) for _ in range(150)]
+        pairs += [([1.0, 2.0], [1.0, 2.0]), ([], [1.0]), ([3.0], [1.0])]
+        with mock.patch.object(stats_mod, "_VECTORIZE_MIN_PAIRS", 1):
+            batched = stats_mod.summarize_runtime_comparisons(pairs, alpha=0.05)
+        for (variant, baseline), summary in zip(pairs, batched):
+            single = stats_mod.summarize_runtime_comparison(variant_samples_ms=variant, baseline_samples_ms=baseline, alpha=0.05)
+            self.assertEqual(summary["n"], single["n"])
+            self.assertEqual(summary["direction"], single["direction"])
+            self.assertEqual(summary["significant_at_alpha"], single["significant_at_alpha"])
+            if single["paired_t_test"]["p_value_two_sided"] is None:
+                self.assertIsNone(summary["paired_t_test"]["p_value_two_sided"])
+            else:
+                self.assertAlmostEqual(summary["paired_t_test"]["p_value_two_sided"], single["paired_t_test"]["p_value_two_sided"], places=12)
+        self.assertEqual(batched[-3]["paired_t_test"]["p_value_two_sided"], 1.0)
+        self.assertEqual(batched[-2]["direction"], "insufficient_data")
+        self.assertIsNone(batched[-1]["paired_t_test"]["p_value_two_sided"])
+
+    def test_bootstrap_median_ratio_ci_is_seeded_and_separates_groups(self):
+        rng = random.Random(7)
+        fast = [rng.gauss(8.0, 0.4) for _ in range(25)]
+        slow = [rng.gauss(10.0, 0.4) for _ in range(25)]
+        first = stats_mod.bootstrap_median_ratio_ci(fast, slow, resamples=500, seed=3, position=1)
+        self.assertEqual(first, stats_mod.bootstrap_median_ratio_ci(fast, slow, resamples=500, seed=3, position=1))
+        self.assertNotEqual(first, stats_mod.bootstrap_median_ratio_ci(fast, slow, resamples=500, seed=3, position=2))
+        self.assertAlmostEqual(first["estimate"], sorted(fast)[12] / sorted(slow)[12], places=12)
+        self.assertLess(first["ci_low"], first["estimate"])
+        self.assertLess(first["ci_high"], 1.0)
+        self.assertEqual((first["n_variant"], first["resamples_used"]), (25, 500))
+
+        with mock.patch.object(stats_mod, "np", None):
+            fallback = stats_mod.bootstrap_median_ratio_ci(slow, fast, resamples=300, seed=3)
+        self.assertGreater(fallback["ci_low"], 1.0)
+
+        single = stats_mod.bootstrap_median_ratio_ci([4.0], [2.0, 2.0], resamples=100)
+        self.assertEqual((single["estimate"], single["ci_low"]), (2.0, None))
+        self.assertIsNone(stats_mod.bootstrap_median_ratio_ci([], [1.0])["estimate"])
+
+    def test_bootstrap_batches_match_across_process_counts(self):
+        rng = random.Random(9)
+        pairs = [([rng.uniform(1.0, 3.0) for _ in range(9)], [rng.uniform(1.0, 3.0) for _ in range(8)]) for _ in range(5)]
+        inline = stats_mod.bootstrap_median_ratio_cis(pairs, resamples=200, seed=4, max_processes=1)
+        with mock.patch.object(stats_mod, "_BOOTSTRAP_PARALLEL_MIN_VALUES", 0), mock.patch.object(stats_mod.os, "cpu_count", return_value=2):
+            pooled = stats_mod.bootstrap_median_ratio_cis(pairs, resamples=200, seed=4, max_processes=2)
+        self.assertEqual(pooled, inline)
+        self.assertEqual(inline[3], stats_mod.bootstrap_median_ratio_ci(*pairs[3], resamples=200, seed=4, position=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from utilities.benchmark_validation import validate_shortest_path_result
+from utilities.benchmark_validation import parse_internal_timings, validate_shortest_path_result
 
 
 class BenchmarkValidationTests(unittest.TestCase):
@@ -27,5 +27,16 @@ class BenchmarkValidationTests(unittest.TestCase):
         self.assertTrue(result.get("valid"))
         self.assertTrue(result.get("path_valid"))
 
+    def test_parse_internal_timings_reads_each_family_format(self):
+        self.assertAlmostEqual(parse_internal_timings("6; v0 v1\nRuntime: 0.001500s\n")["internal_runtime_ms"], 1.5)
+        self.assertEqual(parse_internal_timings("Runtime: 12 ms")["internal_runtime_ms"], 12.0)
+        self.assertEqual(parse_internal_timings("status = true\nruntime = 42\n", "glasgow")["internal_runtime_ms"], 42.0)
+        terse = parse_internal_timings("17 0.0005 0.0125\n", "vf3")
+        self.assertAlmostEqual(terse["internal_first_solution_ms"], 0.5)
+        self.assertAlmostEqual(terse["internal_runtime_ms"], 12.5)
+        self.assertIsNone(parse_internal_timings("17 0.0005 0.0125\n", "dijkstra")["internal_runtime_ms"])
+        self.assertIsNone(parse_internal_timings("6; v0 v1\n")["internal_runtime_ms"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+"""Regression tests for the memory-mapped CSR sidecar of converted shortest-path CSVs."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from utilities import benchmark_validation, csr_graph
+
+
+def _write_csv(path: Path, start: str, target: str, rows: list[tuple[int, int, int]]) -> None:
+    body = "".join(f"{u},{v},{w}\n" for u, v, w in rows)
+    path.write_text(f"# start={start} target={target}\nsource,target,weight\n{body}", encoding="utf-8")
+
+
+@unittest.skipIf(csr_graph.np is None, "NumPy is required to build CSR sidecars")
+class CsrSidecarTests(unittest.TestCase):
+    def test_sidecar_round_trips_and_matches_csv_oracle(self):
+        rows = [(10, 30, 4), (10, 20, 1), (20, 30, 1), (30, 40, 7), (20, 40, 9), (50, 10, 2)]
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "graph.csv"
+            _write_csv(csv_path, "10", "40", rows)
+            expected, _via = benchmark_validation.shortest_path_oracle(csv_path)
+            arrays = csr_graph.build_csr_arrays(*zip(*rows))
+            csr_graph.write_csr_sidecar(csv_path, **arrays, start_label="10", target_label="40")
+            with csr_graph.load_csr_sidecar(csv_path) as graph:
+                self.assertEqual((graph.nodes, graph.edges, graph.start, graph.target), (5, 6, 0, 3))
+                self.assertEqual(list(graph.labels), [10, 20, 30, 40, 50])
+                self.assertEqual(list(graph.indptr), [0, 2, 4, 5, 5, 6])
+                # Row order within a source is kept: 10->30 precedes 10->20.
+                self.assertEqual(list(graph.indices), [2, 1, 2, 3, 3, 0])
+                self.assertEqual(list(graph.weights), [4, 1, 1, 9, 7, 2])
+            self.assertEqual(benchmark_validation.shortest_path_oracle(csv_path), (expected, None))
+            self.assertEqual(expected, 9)
+
+    def test_stale_or_unreachable_sidecars(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "graph.csv"
+            rows = [(1, 2, 1), (3, 4, 1)]
+            _write_csv(csv_path, "1", "9", rows)
+            csr_graph.write_csr_sidecar(csv_path, **csr_graph.build_csr_arrays(*zip(*rows)), start_label="1", target_label="9")
+            with csr_graph.load_csr_sidecar(csv_path) as graph:
+                self.assertEqual(graph.target, -1)
+            self.assertEqual(benchmark_validation.shortest_path_oracle(csv_path), (None, None))
+
+            _write_csv(csv_path, "1", "4", rows + [(2, 3, 5)])
+            stat = csv_path.stat()
+            os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertIsNone(csr_graph.load_csr_sidecar(csv_path))
+            self.assertEqual(benchmark_validation.shortest_path_oracle(csv_path), (7, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 """CLI-focused regression tests for the synthetic graph generator."""
 
 import json
+import math
+import random
 import subprocess
 import sys
 import tempfile
@@ -10,6 +12,26 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 GEN_SCRIPT = REPO_ROOT / "utilities" / "generate_graphs.py"
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from utilities import generate_graphs as generator_mod
+
+
+def _recount_reference_fill(adj_sets, rng, target_edges):
+    # Pre-engine fill loop, kept verbatim to pin the legacy engine's output.
+    n = len(adj_sets)
+    attempts = 0
+    max_attempts = max(1, target_edges * 12)
+    while generator_mod._count_undirected_edges(generator_mod._adj_sets_to_lists(adj_sets)) < target_edges and attempts < max_attempts:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        attempts += 1
+        if u == v or v in adj_sets[u]:
+            continue
+        adj_sets[u].add(v)
+        adj_sets[v].add(u)
+    return generator_mod._adj_sets_to_lists(adj_sets)
 
 
 class GenerateGraphsCliTests(unittest.TestCase):
@@ -58,6 +80,7 @@ class GenerateGraphsCliTests(unittest.TestCase):
             self.assertEqual(metadata.get("n"), 12)
             self.assertEqual(metadata.get("seed"), 1337)
             self.assertEqual(len(metadata.get("files", [])), 1)
+            self.assertEqual(metadata.get("generator_algorithm"), "random_density/rejection-fill-v1")
 
     def test_subgraph_generation_is_reproducible_for_fixed_seed(self):
         with tempfile.TemporaryDirectory(prefix="capstone-test-subgraph-a-") as tmp_a, tempfile.TemporaryDirectory(
@@ -140,6 +163,281 @@ class GenerateGraphsCliTests(unittest.TestCase):
             self.assertEqual(metadata.get("algorithm"), "subgraph")
             self.assertIn("actual_density", metadata)
 
+    def test_in_process_api_matches_cli_output(self):
+        with tempfile.TemporaryDirectory(prefix="capstone-test-api-") as tmp:
+            cli_dir = Path(tmp) / "cli"
+            cli_files = self.run_generator(algorithm="subgraph", n=30, k=5, density=0.2, seed=99, out_dir=cli_dir)
+            requests = [
+                generator_mod.GenerationRequest(algorithm="subgraph", out_dir=Path(tmp) / f"api_{seed}", n=30, k=5, density=0.2, seed=seed)
+                for seed in (99, 100)
+            ]
+            sequential = generator_mod.generate_inputs_batch(requests)
+            pooled = generator_mod.generate_inputs_batch(
+                [generator_mod.GenerationRequest(**{**request.__dict__, "out_dir": Path(tmp) / f"pool_{request.seed}"}) for request in requests],
+                max_workers=2,
+            )
+
+            api = sequential[0]
+            self.assertEqual([p.name for p in api.files], [Path(p).name for p in cli_files])
+            for api_path, cli_path in zip(api.files, cli_files):
+                self.assertEqual(api_path.read_text(encoding="utf-8"), Path(cli_path).read_text(encoding="utf-8"))
+            self.assertEqual(api.paths["lad_target"], api.files[1])
+            self.assertEqual(api.metadata["seed"], 99)
+            self.assertEqual(json.loads(api.metadata_path.read_text(encoding="utf-8"))["pattern_nodes"], api.metadata["pattern_nodes"])
+            self.assertEqual([result.request.seed for result in pooled], [99, 100])
+            self.assertEqual(pooled[1].paths["vf_target"].read_text(encoding="utf-8"), sequential[1].paths["vf_target"].read_text(encoding="utf-8"))
+
+        with self.assertRaises(ValueError):
+            generator_mod.generate_inputs(generator_mod.GenerationRequest(algorithm="subgraph", out_dir=Path("."), n=5, k=5, density=0.5, seed=1))
+
+
+class UndirectedEngineTests(unittest.TestCase):
+    def test_legacy_engine_reproduces_recount_graphs(self):
+        for n, density, seed in ((30, 0.1, 1), (60, 0.3, 42), (40, 0.95, 7)):
+            rng = random.Random(seed)
+            adj_sets = [set() for _ in range(n)]
+            for i in range(n - 1):
+                adj_sets[i].add(i + 1)
+                adj_sets[i + 1].add(i)
+            target = max(n - 1, generator_mod._target_edge_budget(n, density, directed=False))
+            expected = _recount_reference_fill(adj_sets, rng, target)
+            actual = generator_mod.generate_adjacency(n, random.Random(seed), density, "random_density", engine="legacy")
+            self.assertEqual(actual, expected)
+
+            grid = generator_mod._generate_grid_undirected(n)
+            grid_target = max(generator_mod._count_undirected_edges(grid), generator_mod._target_edge_budget(n, density, directed=False))
+            expected_grid = _recount_reference_fill([set(row) for row in grid], random.Random(seed), grid_target)
+            actual_grid = generator_mod.generate_adjacency(n, random.Random(seed), density, "grid", engine="legacy")
+            self.assertEqual(actual_grid, expected_grid)
+
+    def test_linear_engine_hits_exact_edge_budget_and_is_deterministic(self):
+        for family in ("random_density", "grid"):
+            for n, density in ((50, 0.05), (50, 0.4), (50, 0.9), (64, 1.0)):
+                adj = generator_mod.generate_adjacency(n, random.Random(3), density, family, engine="linear")
+                generator_mod.assert_undirected_simple_adj(adj, "linear")
+                floor_edges = n - 1 if family == "random_density" else generator_mod._count_undirected_edges(generator_mod._generate_grid_undirected(n))
+                expected = max(floor_edges, generator_mod._target_edge_budget(n, density, directed=False))
+                self.assertEqual(generator_mod._count_undirected_edges(adj), expected, (family, n, density))
+                self.assertEqual(adj, generator_mod.generate_adjacency(n, random.Random(3), density, family, engine="linear"))
+
+    def test_geometric_skip_erdos_renyi_matches_expected_edge_count(self):
+        n, density = 20000, 0.0005
+        adj = generator_mod.generate_adjacency(n, random.Random(11), density, "erdos_renyi")
+        generator_mod.assert_undirected_simple_adj(adj, "er")
+        pairs = n * (n - 1) // 2
+        sampled = generator_mod._count_undirected_edges(adj) - (n - 1)
+        expected = pairs * density
+        self.assertLess(abs(sampled - expected), 5 * (expected ** 0.5) + n * density)
+
+        edges = generator_mod.generate_directed_edges(400, random.Random(5), 0.05, "erdos_renyi")
+        self.assertEqual(len(edges), len({(u, v) for u, v, _w in edges}))
+        self.assertTrue(all(u != v and 1 <= w <= 20 for u, v, w in edges))
+        self.assertLess(abs(len(edges) - 400 * 399 * 0.05), 400)
+        self.assertEqual(edges, generator_mod.generate_directed_edges(400, random.Random(5), 0.05, "erdos_renyi"))
+
+    def test_generator_algorithm_names_distinguish_engines(self):
+        self.assertEqual(generator_mod.generator_algorithm("er", "linear", directed=True), "erdos_renyi/geometric-skip-v1")
+        self.assertEqual(generator_mod.generator_algorithm("er", "legacy", directed=False), "erdos_renyi/bernoulli-scan-v1")
+        self.assertEqual(generator_mod.generator_algorithm("random_density", "linear", directed=False), "random_density/linear-fill-v1")
+        self.assertEqual(generator_mod.generator_algorithm("random_density", "legacy", directed=False), "random_density/rejection-fill-v1")
+        self.assertEqual(generator_mod.generator_algorithm("random_density", "linear", directed=True), "random_density/rejection-fill-v1")
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ValueError):
+            generator_mod.normalize_generator_engine("quadratic")
+
+
+class StreamingDirectedTests(unittest.TestCase):
+    def test_streamed_edges_are_simple_and_keep_the_budget(self):
+        for family in generator_mod.STREAMING_GRAPH_FAMILIES:
+            for n, density in ((2, 1.0), (3, 0.5), (40, 0.1), (40, 0.8), (40, 1.0)):
+                edges = list(generator_mod.stream_directed_edges(n, random.Random(9), density, family))
+                pairs = {(u, v) for u, v, _w in edges}
+                self.assertEqual(len(pairs), len(edges), (family, n, density))
+                self.assertTrue(all(u != v and 0 <= v < n and 1 <= w <= 20 for u, v, w in edges))
+                self.assertTrue(all((i, i + 1) in pairs for i in range(n - 1)))
+                self.assertEqual(edges, list(generator_mod.stream_directed_edges(n, random.Random(9), density, family)))
+                if family == "random_density":
+                    self.assertEqual(len(edges), max(n - 1, generator_mod._target_edge_budget(n, density, directed=True)))
+
+    def test_stream_writer_matches_buffered_writer_and_bounds_memory(self):
+        import tracemalloc
+
+        edges = list(generator_mod.stream_directed_edges(30, random.Random(2), 0.2, "erdos_renyi"))
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            generator_mod.write_dijkstra_csv(root / "buffered.csv", edges, [f"v{i}" for i in range(30)], via_label="v15")
+            count = generator_mod.write_dijkstra_csv_stream(root / "streamed.csv", iter(edges), 30, via_label="v15", chunk_edges=7)
+            self.assertEqual(count, len(edges))
+            self.assertEqual((root / "streamed.csv").read_bytes(), (root / "buffered.csv").read_bytes())
+
+            tracemalloc.start()
+            try:
+                streamed = generator_mod.write_dijkstra_csv_stream(
+                    root / "large.csv", generator_mod.stream_directed_edges(3000, random.Random(4), 0.01, "random_density"), 3000, chunk_edges=1024
+                )
+                _current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(streamed, generator_mod._target_edge_budget(3000, 0.01, directed=True))
+            # ~90k edges would need several MB as tuples; the stream keeps one chunk and one count per source.
+            self.assertLess(peak, 2 * 1024 * 1024)
+
+            result = generator_mod.generate_inputs(
+                generator_mod.GenerationRequest(algorithm="sp_via", out_dir=root / "api", n=50, density=0.1, seed=3, graph_family="er", stream=True)
+            )
+            self.assertTrue(result.metadata["generator_streaming"])
+            self.assertEqual(result.metadata["generator_algorithm"], "erdos_renyi/geometric-skip-stream-v1")
+            self.assertIn("via=v25", result.paths["sp_via"].read_text(encoding="utf-8").splitlines()[0])
+
+
+class NumpyBackendTests(unittest.TestCase):
+    @unittest.skipIf(generator_mod.np is None, "numpy not installed")
+    def test_numpy_graphs_are_simple_deterministic_and_keep_the_budget(self):
+        for family in generator_mod.GRAPH_FAMILIES:
+            for n, density in ((2, 1.0), (12, 0.5), (60, 0.05), (60, 0.9)):
+                adj = generator_mod.generate_adjacency(n, random.Random(5), density, family, backend="numpy")
+                self.assertEqual(adj, generator_mod.generate_adjacency(n, random.Random(5), density, family, backend="numpy"))
+                for u, row in enumerate(adj):
+                    self.assertEqual(row, sorted(set(row)), (family, n, density))
+                    self.assertTrue(all(v != u and u in adj[v] for v in row))
+                edges = generator_mod.generate_directed_edges(n, random.Random(5), density, family, backend="numpy")
+                pairs = {(u, v) for u, v, _w in edges}
+                self.assertEqual(len(pairs), len(edges), (family, n, density))
+                self.assertTrue(all(u != v and 1 <= w <= 20 for u, v, w in edges))
+                if family in {"random_density", "grid"}:
+                    python_adj = generator_mod.generate_adjacency(n, random.Random(5), density, family)
+                    self.assertEqual(
+                        generator_mod._count_undirected_edges(adj), generator_mod._count_undirected_edges(python_adj), (family, n, density)
+                    )
+                if family == "random_density":
+                    self.assertEqual(len(edges), max(n - 1, generator_mod._target_edge_budget(n, density, directed=True)))
+
+    @unittest.skipIf(generator_mod.np is None, "numpy not installed")
+    def test_numpy_backend_records_its_seed_semantics(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = generator_mod.generate_inputs(
+                generator_mod.GenerationRequest(algorithm="dijkstra", out_dir=Path(tmp), n=40, density=0.1, seed=3, backend="numpy")
+            )
+            self.assertEqual(result.metadata["generator_backend"], "numpy")
+            self.assertTrue(result.metadata["generator_rng"].startswith("numpy.random.PCG64"))
+            self.assertEqual(result.metadata["generator_algorithm"], "random_density/numpy-unique-fill-v1")
+            # The numpy backend always writes through the streaming CSV path, even when not requested.
+            self.assertTrue(result.metadata["generator_streaming"])
+            rows = result.paths["dijkstra"].read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(rows) - 2, max(39, generator_mod._target_edge_budget(40, 0.1, directed=True)))
+
+    def test_numpy_backend_falls_back_to_python_without_numpy(self):
+        original = generator_mod.np
+        generator_mod.np = None
+        try:
+            self.assertEqual(generator_mod.resolve_generator_backend("numpy"), "python")
+            self.assertEqual(
+                generator_mod.generate_adjacency(30, random.Random(2), 0.2, "barabasi_albert", backend="numpy"),
+                generator_mod.generate_adjacency(30, random.Random(2), 0.2, "barabasi_albert"),
+            )
+            with tempfile.TemporaryDirectory() as tmp:
+                result = generator_mod.generate_inputs(
+                    generator_mod.GenerationRequest(algorithm="vf3", out_dir=Path(tmp), n=30, k=4, density=0.2, seed=3, backend="numpy")
+                )
+            self.assertEqual(result.metadata["generator_backend"], "python")
+            self.assertEqual(result.metadata["generator_rng"], "random.Random(seed)")
+        finally:
+            generator_mod.np = original
+        with self.assertRaises(ValueError):
+            generator_mod.normalize_generator_backend("cupy")
+
+
+class SkewedAndSpatialFamilyTests(unittest.TestCase):
+    FAMILIES = ("rmat", "random_geometric", "chung_lu")
+
+    def _backends(self):
+        return ("python", "numpy") if generator_mod.np is not None else ("python",)
+
+    def test_new_families_are_simple_deterministic_and_keep_the_budget(self):
+        for backend in self._backends():
+            for family in self.FAMILIES:
+                for n, density in ((2, 1.0), (40, 0.1), (40, 0.9)):
+                    adj = generator_mod.generate_adjacency(n, random.Random(8), density, family, backend=backend)
+                    self.assertEqual(adj, generator_mod.generate_adjacency(n, random.Random(8), density, family, backend=backend))
+                    for u, row in enumerate(adj):
+                        self.assertEqual(row, sorted(set(row)), (backend, family, n, density))
+                        self.assertTrue(all(v != u and u in adj[v] for v in row))
+                    self.assertTrue(all(i + 1 in adj[i] for i in range(n - 1)))
+                    edges = generator_mod.generate_directed_edges(n, random.Random(8), density, family, backend=backend)
+                    self.assertEqual(len({(u, v) for u, v, _w in edges}), len(edges))
+                    self.assertEqual(len(edges), max(n - 1, generator_mod._target_edge_budget(n, density, directed=True)))
+                    if family != "random_geometric":
+                        self.assertEqual(
+                            generator_mod._count_undirected_edges(adj), max(n - 1, generator_mod._target_edge_budget(n, density, directed=False))
+                        )
+
+    def test_skewed_families_have_heavier_hubs_than_uniform_fill(self):
+        for backend in self._backends():
+            uniform = generator_mod.generate_adjacency(2000, random.Random(1), 0.005, "random_density", backend=backend)
+            for family in ("rmat", "chung_lu"):
+                adj = generator_mod.generate_adjacency(2000, random.Random(1), 0.005, family, backend=backend)
+                self.assertGreater(max(map(len, adj)), 5 * max(map(len, uniform)), (backend, family))
+
+    def test_random_geometric_joins_exactly_the_pairs_within_the_radius(self):
+        n, density = 150, 0.05
+        adj = generator_mod.generate_adjacency(n, random.Random(4), density, "rgg")
+        rng = random.Random(4)
+        points = [(rng.random(), rng.random()) for _ in range(n)]
+        radius = generator_mod._geometric_radius(density)
+        cells = generator_mod._geometric_cells(n, radius)
+
+        def snake_key(point):
+            cx, cy = min(cells - 1, int(point[0] * cells)), min(cells - 1, int(point[1] * cells))
+            return (cy, cx, point[0]) if cy % 2 == 0 else (cy, cells - 1 - cx, -point[0])
+
+        points.sort(key=snake_key)
+        expected = [
+            [v for v in range(n) if v != u and (abs(u - v) == 1 or math.dist(points[u], points[v]) <= radius)] for u in range(n)
+        ]
+        self.assertEqual(adj, expected)
+        self.assertAlmostEqual(generator_mod._count_undirected_edges(adj) / (n * (n - 1) / 2), density, delta=0.02)
+
+    def test_family_aliases_and_algorithm_names(self):
+        self.assertEqual(generator_mod.normalize_graph_family("Kronecker"), "rmat")
+        self.assertEqual(generator_mod.normalize_graph_family("r-mat"), "rmat")
+        self.assertEqual(generator_mod.normalize_graph_family("rgg"), "random_geometric")
+        self.assertEqual(generator_mod.normalize_graph_family("power_law"), "chung_lu")
+        self.assertEqual(generator_mod.generator_algorithm("rmat", directed=True), "rmat/rmat-rejection-v1")
+        self.assertEqual(generator_mod.generator_algorithm("rgg", directed=False), "random_geometric/grid-bucket-v1")
+        self.assertEqual(generator_mod.generator_algorithm("cl", directed=False), "chung_lu/chung-lu-rejection-v1")
+
+
+class WriterTests(unittest.TestCase):
+    def test_serializers_match_per_line_reference_output(self):
+        adj = [[1, 2], [0], [0], []]
+        labels = [3, 1, 0, 2]
+        self.assertEqual(generator_mod.serialize_lad(adj), "4\n2 1 2\n1 0\n1 0\n0\n")
+        self.assertEqual(generator_mod.serialize_vertex_labelled_lad(adj, labels), "4\n3 2 1 2\n1 1 0\n0 1 0\n2 0\n")
+        self.assertEqual(
+            generator_mod.serialize_vf(adj, labels),
+            "4\n0 3\n1 1\n2 0\n3 2\n2\n0 1\n0 2\n1\n1 0\n1\n2 0\n0\n",
+        )
+        csv_text = generator_mod.serialize_dijkstra_csv([(0, 1, 4), (1, 2, 7)], ["a", "b", "c"], via_label="b")
+        self.assertEqual(csv_text, "# start=a target=c via=b\nsource,target,weight\r\na,b,4\r\nb,c,7\r\n")
+
+    def test_subgraph_writer_emits_only_requested_formats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            written = generator_mod.write_subgraph_formats(
+                out_dir,
+                target_adj=[[1], [0]],
+                pattern_adj=[[]],
+                target_labels=[0, 1],
+                pattern_labels=[1],
+                formats=["vf"],
+            )
+            self.assertEqual(sorted(written), ["vf_pattern", "vf_target"])
+            self.assertEqual(sorted(path.name for path in out_dir.iterdir()), ["vf3_pattern.vf", "vf3_target.vf"])
+            self.assertEqual(written["vf_target"].read_bytes(), b"2\n0 0\n1 1\n1\n0 1\n1\n1 0\n")
+        with self.assertRaises(ValueError):
+            generator_mod.normalize_subgraph_formats(["dimacs"])
+
 
 if __name__ == "__main__":
     unittest.main()
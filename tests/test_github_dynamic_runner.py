@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -55,6 +56,20 @@ class GithubDynamicRunnerTests(unittest.TestCase):
         self.assertEqual(commands["all"], commands["first"])
         self.assertNotIn("--print-mappings", commands["first"])
 
+    def test_generated_iteration_inputs_use_in_process_generator(self):
+        module = load_dynamic_runner_module()
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(module, "OUTPUTS_DIR", Path(tmp)), mock.patch.object(module.subprocess, "run") as run_mock:
+                subgraph = module.generate_inputs_for_iterations("subgraph", 2, 20, 4, 0.2, 100, "random_density")
+                shortest = module.generate_inputs_for_iterations("sp_via", 1, 12, 1, 0.2, 7, "erdos_renyi")
+            run_mock.assert_not_called()
+
+            self.assertEqual([str(item["seed"]) for item in subgraph], ["100", "101"])
+            self.assertEqual(subgraph[1]["vf_target"], (Path(tmp) / "generated" / "subgraph" / "iter_2" / "vf3_target.vf").resolve())
+            self.assertTrue(all(subgraph[0][key].is_file() for key in ("lad_pattern", "lad_target", "vf_pattern", "vf_target")))
+            self.assertEqual(shortest[0]["sp_via"], shortest[0]["dijkstra"])
+            self.assertEqual(shortest[0]["sp_via"].name, "sp_via_generated.csv")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 ﻿import io
 import tempfile
+import time
 import unittest
 import zipfile
 from pathlib import Path
@@ -10,6 +11,7 @@ import sys
 import io as stdio
 
 from desktop_runner import app, headless_runner
+from utilities import session_store
 
 
 # - These tests cover shared manifest/building behavior that can regress when
@@ -50,6 +52,137 @@ class HeadlessRunnerTests(unittest.TestCase):
         self.assertEqual(config["graph_family"], "erdos_renyi")
         self.assertIn("vf3_baseline", config["selected_variants"])
 
+    def test_generated_subgraph_inputs_follow_selected_variant_formats(self):
+        self.assertEqual(app.subgraph_input_formats(["vf3_baseline", "vf3_chatgpt_control"]), ("vf",))
+        self.assertEqual(app.subgraph_input_formats(["glasgow_baseline"]), ("lad",))
+        self.assertEqual(app.subgraph_input_formats(["dijkstra_baseline"]), ("lad", "vf"))
+        config = {"tab_id": "subgraph", "selected_variants": ["glasgow_baseline"], "graph_family": "random_density"}
+        point = {"n": 30.0, "k_nodes": 5, "density": 0.2}
+        with tempfile.TemporaryDirectory() as tmp:
+            inputs = headless_runner.build_generated_inputs(config, point, Path(tmp) / "lad_only", 7)
+            self.assertEqual(sorted(inputs), ["lad_format", "lad_pattern", "lad_target"])
+            metadata = json.loads((Path(tmp) / "lad_only" / "metadata.json").read_text(encoding="utf-8"))
+            self.assertEqual(metadata["formats"], ["lad"])
+            self.assertFalse((Path(tmp) / "lad_only" / "vf3_target.vf").exists())
+
+            full = app.generate_subgraph_inputs(Path(tmp) / "full", 30, 5, 0.2, 7)
+            self.assertEqual(inputs["lad_target"].read_bytes(), full["lad_target"].read_bytes())
+
+    def test_shared_target_mode_reuses_one_target_across_k(self):
+        config = {"tab_id": "subgraph", "selected_variants": ["vf3_baseline"], "graph_family": "erdos_renyi", "base_seed": 11, "subgraph_target_mode": "shared"}
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            kwargs = headless_runner.shared_target_kwargs(config, root, 2)
+            self.assertEqual(kwargs["target_seed"], app.shared_target_seed(11, 2))
+            cache = app.InputCache(root / "cache", max_bytes=64 * 1024 * 1024)
+            small = headless_runner.build_generated_inputs(config, {"n": 40.0, "k_nodes": 4, "density": 0.2}, root / "p1", 12, input_cache=cache, **kwargs)
+            large = headless_runner.build_generated_inputs(config, {"n": 40.0, "k_nodes": 12, "density": 0.2}, root / "p2", 13, input_cache=cache, **kwargs)
+
+            self.assertEqual(small["vf_target"], large["vf_target"])
+            self.assertEqual(len(list((root / "shared_targets").iterdir())), 1)
+            self.assertEqual(len(app.parse_vf_graph(Path(large["vf_pattern"]))), 12)
+            metadata = json.loads((root / "p2" / "metadata.json").read_text(encoding="utf-8"))
+            self.assertEqual(metadata["target_mode"], "shared")
+            self.assertEqual((metadata["target_seed"], metadata["pattern_seed"]), (kwargs["target_seed"], 13))
+            self.assertEqual(metadata["target_files"], [Path(large["vf_target"]).as_posix()])
+
+            # A later run rebuilds the same target bytes from the cache.
+            again = headless_runner.build_generated_inputs(config, {"n": 40.0, "k_nodes": 4, "density": 0.2}, root / "p3", 12, input_cache=cache, target_seed=kwargs["target_seed"], target_root=root / "other_targets")
+            self.assertEqual(Path(again["vf_target"]).read_bytes(), Path(small["vf_target"]).read_bytes())
+            self.assertEqual(Path(again["vf_pattern"]).read_bytes(), Path(small["vf_pattern"]).read_bytes())
+            # Both the target and the k-specific pattern come from the cache.
+            self.assertEqual(cache.stats["hits"], 2)
+        self.assertEqual(headless_runner.shared_target_kwargs({**config, "subgraph_target_mode": "per_point"}, Path("."), 0), {})
+
+    def test_shared_target_is_built_once_per_iteration_across_a_k_sweep(self):
+        for variant_id in ("vf3_baseline", "glasgow_baseline"):
+            config = {"tab_id": "subgraph", "selected_variants": [variant_id], "graph_family": "random_density", "base_seed": 3, "subgraph_target_mode": "shared"}
+            with tempfile.TemporaryDirectory() as tmp:
+                root = Path(tmp)
+                jobs = [(point_idx, {"n": 30.0, "k_nodes": k, "density": 0.3}, iter_idx) for point_idx, k in enumerate((3, 5, 8)) for iter_idx in range(4)]
+                generated = {}
+                # Datapoints outside, iterations inside, as both runners schedule them.
+                with mock.patch.object(app, "build_subgraph_target", wraps=app.build_subgraph_target) as builds:
+                    for point_idx, point, iter_idx in jobs:
+                        seed = headless_runner.iteration_seed(3, point_idx, iter_idx)
+                        generated[(point_idx, iter_idx)] = headless_runner.build_generated_inputs(config, point, root / f"p{point_idx}_{iter_idx}", seed, **headless_runner.shared_target_kwargs(config, root, iter_idx))
+                self.assertEqual(builds.call_count, 4)
+                # Patterns cut from a target read back from disk match those cut from a freshly built one.
+                for point_idx, point, iter_idx in jobs:
+                    alone = root / f"alone{point_idx}_{iter_idx}"
+                    isolated = headless_runner.build_generated_inputs(config, point, alone, headless_runner.iteration_seed(3, point_idx, iter_idx), **headless_runner.shared_target_kwargs(config, alone, iter_idx))
+                    key = "vf_pattern" if "vf_pattern" in isolated else "lad_pattern"
+                    self.assertEqual(Path(generated[(point_idx, iter_idx)][key]).read_bytes(), Path(isolated[key]).read_bytes())
+
+    def test_pregenerated_store_is_consumed_read_only(self):
+        manifest = {
+            "preset": "smoke",
+            "tab_id": "shortest_path",
+            "selected_variants": ["dijkstra_baseline"],
+            "base_seed": 5,
+            "iterations": 2,
+            "values": {"n": [20, 30], "density": [0.2]},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            # The duplicate manifest shares every input set and must not add jobs.
+            summary = headless_runner.pregenerate_inputs([("a.json", manifest), ("b.json", dict(manifest))], root / "store", lambda _msg: None, max_processes=2)
+            self.assertEqual(summary["unique_input_sets"], 4)
+            self.assertEqual(summary["generated_entries"], 4)
+            self.assertEqual([row["input_sets"] for row in summary["manifests"]], [4, 4])
+            self.assertTrue((root / "store" / headless_runner.PREGENERATE_SUMMARY_NAME).exists())
+            unseeded = headless_runner.pregenerate_inputs([("c.json", {**manifest, "base_seed": None})], root / "store", lambda _msg: None)
+            self.assertEqual(unseeded["manifests"][0]["status"], "error")
+
+            with mock.patch.object(headless_runner, "resolve_selected_variants", side_effect=lambda selected: (selected, [])):
+                config = headless_runner.build_runtime_config({**manifest, "input_store": str(root / "store")}, lambda _msg: None)
+            store = headless_runner.open_input_store(config)
+            self.assertTrue(store.read_only)
+            entries = sorted(path.stat().st_mtime_ns for path in (root / "store" / "entries").glob("*/*/_entry.json"))
+            point = config["datapoints"][1]
+            seed = headless_runner.iteration_seed(5, 1, 1)
+            stored = headless_runner.build_generated_inputs(config, point, root / "run", seed, input_cache=store)
+            fresh = headless_runner.build_generated_inputs(config, point, root / "fresh", seed)
+            self.assertEqual(Path(stored["dijkstra_file"]).read_bytes(), Path(fresh["dijkstra_file"]).read_bytes())
+            missing = headless_runner.build_generated_inputs(config, {"n": 25.0, "density": 0.2}, root / "miss", seed, input_cache=store)
+            self.assertTrue(Path(missing["dijkstra_file"]).exists())
+            self.assertEqual(store.stats, {"hits": 1, "misses": 1, "evictions": 0})
+            self.assertEqual(len(entries), 4)
+            self.assertEqual(entries, sorted(path.stat().st_mtime_ns for path in (root / "store" / "entries").glob("*/*/_entry.json")))
+            with self.assertRaises(FileNotFoundError):
+                headless_runner.open_input_store({**config, "input_store": str(root / "absent")})
+
+    def test_pregenerated_store_serves_shared_target_runs_without_generation(self):
+        manifest = {
+            "preset": "smoke",
+            "tab_id": "subgraph",
+            "selected_variants": ["vf3_baseline"],
+            "base_seed": 9,
+            "iterations": 2,
+            "subgraph_target_mode": "shared",
+            "values": {"n": [30], "density": [0.3], "k": [4, 6]},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            summary = headless_runner.pregenerate_inputs([("06.json", manifest)], root / "store", lambda _msg: None, max_processes=1)
+            self.assertEqual(summary["unique_input_sets"], 4)
+            with mock.patch.object(headless_runner, "resolve_selected_variants", side_effect=lambda selected: (selected, [])):
+                config = headless_runner.build_runtime_config({**manifest, "input_store": str(root / "store")}, lambda _msg: None)
+            store = headless_runner.open_input_store(config)
+            with mock.patch.object(app, "build_subgraph_target", side_effect=AssertionError("target regenerated")):
+                for point_idx, point in enumerate(config["datapoints"]):
+                    for iter_idx in range(2):
+                        seed = headless_runner.iteration_seed(9, point_idx, iter_idx)
+                        stored = headless_runner.build_generated_inputs(config, point, root / "run" / f"{point_idx}_{iter_idx}", seed, input_cache=store, **headless_runner.shared_target_kwargs(config, root / "run", iter_idx))
+            # Two targets and four patterns, all linked from the store.
+            self.assertEqual(store.stats, {"hits": 2 + 4, "misses": 0, "evictions": 0})
+            # The last stored set (second datapoint, second iteration) matches local generation.
+            fresh = headless_runner.build_generated_inputs(config, config["datapoints"][1], root / "fresh" / "p", seed, **headless_runner.shared_target_kwargs(config, root / "fresh", 1))
+            self.assertEqual(Path(stored["vf_pattern"]).read_bytes(), Path(fresh["vf_pattern"]).read_bytes())
+            self.assertEqual(Path(stored["vf_target"]).read_bytes(), Path(fresh["vf_target"]).read_bytes())
+            metadata = json.loads((root / "run" / "1_1" / "metadata.json").read_text(encoding="utf-8"))
+            self.assertEqual(metadata["target_files"], [Path(stored["vf_target"]).as_posix()])
+
     def test_list_collection_manifest_paths_reads_top_level_json_only(self):
         with tempfile.TemporaryDirectory() as td:
             root = Path(td)
@@ -183,7 +316,7 @@ class HeadlessRunnerTests(unittest.TestCase):
         with mock.patch.object(
             runner,
             "run_process",
-            return_value=(12.0, 256.0, 0, "6\nv0->v1->v2->v3\n", ""),
+            return_value=(12.0, 256.0, 0, "6\nv0->v1->v2->v3\n", "", {"memory_backend": "wait4_rusage", "rusage": {"max_rss_kb": 256.0}}),
         ):
             trial = runner.run_trial(
                 tab_id="shortest_path",
@@ -196,6 +329,8 @@ class HeadlessRunnerTests(unittest.TestCase):
         self.assertEqual(trial["status"], "ok")
         self.assertEqual(trial["normalized_result"]["distance"], "6")
         self.assertEqual(trial["normalized_result"]["path_length"], 3)
+        self.assertEqual(trial["memory_backend"], "wait4_rusage")
+        self.assertEqual(trial["rusage"]["max_rss_kb"], 256.0)
 
     def test_runner_live_log_overwrites_console_line(self):
         captured = []
@@ -313,6 +448,316 @@ class HeadlessRunnerTests(unittest.TestCase):
         self.assertEqual(captured["max_workers"], 2)
         self.assertEqual(captured["submit_count"], 2)
 
+    def test_execute_manifest_pipelines_points_with_deterministic_output(self):
+        variants = ["dijkstra_baseline", "dijkstra_chatgpt", "dijkstra_gemini"]
+        config = {
+            "preset": "smoke",
+            "tab_id": "shortest_path",
+            "input_mode": "independent",
+            "graph_family": "erdos_renyi",
+            "selected_variants_requested": list(variants),
+            "selected_variants": list(variants),
+            "selected_variant_labels": {variant_id: variant_id for variant_id in variants},
+            "injected_baselines": [],
+            "skipped_missing_variants": [],
+            "selected_datasets": [],
+            "iterations": 2,
+            "base_seed": 100,
+            "solver_timeout_seconds": None,
+            "failure_policy": "continue",
+            "retry_failed_trials": 0,
+            "timeout_as_missing": True,
+            "outlier_filter": "none",
+            "k_mode": "absolute",
+            "delete_generated_inputs": True,
+            "dataset_selection": [],
+            "parallel_requested": True,
+            "requested_workers": 4,
+            "max_workers": 4,
+            "detected_logical_cores": 8,
+            "datapoints": [{"n": 8.0, "density": 0.2}, {"n": 16.0, "density": 0.2}, {"n": 32.0, "density": 0.2}],
+            "var_ranges": {"n": [8.0, 16.0, 32.0], "density": [0.2]},
+            "fixed_values": {"density": 0.2},
+            "primary_var": "n",
+            "secondary_var": None,
+        }
+        lock = headless_runner.threading.Lock()
+        activity = {"running": 0, "peak": 0}
+
+        def fake_run_trial(**kwargs):
+            variant_id = kwargs["variant_id"]
+            with lock:
+                activity["running"] += 1
+                activity["peak"] = max(activity["peak"], activity["running"])
+            # Later variants finish first so completion order differs from submission order.
+            time.sleep(0.03 * (len(variants) - variants.index(variant_id)))
+            with lock:
+                activity["running"] -= 1
+            return {
+                "status": "ok",
+                "variant_id": variant_id,
+                "family": "dijkstra",
+                "command": [variant_id, str(kwargs["inputs"]["dijkstra_file"])],
+                "runtime_ms": 1.0 + variants.index(variant_id),
+                "peak_kb": 64.0,
+                "return_code": 0,
+                "normalized_result": {"answer_kind": "distance", "path_length": 1},
+                "answer_signature": ("distance", "1"),
+            }
+
+        def fake_inputs(_config, point, point_dir, iter_seed, input_cache=None):
+            return {"dijkstra_file": point_dir / f"n{int(point['n'])}-seed{iter_seed}.csv"}
+
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td) / "out"
+            with mock.patch.object(headless_runner, "build_runtime_config", return_value=config):
+                with mock.patch.object(headless_runner, "build_generated_inputs", side_effect=fake_inputs):
+                    with mock.patch.object(headless_runner.Runner, "run_trial", side_effect=fake_run_trial):
+                        headless_runner.execute_manifest({}, None, out_dir, lambda _msg: None)
+            trials = [json.loads(line) for line in (out_dir / "benchmark-trials.ndjson").read_text(encoding="utf-8").splitlines()]
+            datapoints = [json.loads(line) for line in (out_dir / "benchmark-datapoints.ndjson").read_text(encoding="utf-8").splitlines()]
+            leftover_inputs = list((out_dir / "generated_inputs").glob("point_*/iter_*"))
+            with session_store.open_session_store(out_dir) as store:
+                stored_trials = list(store.iter_rows("trials"))
+                stored_datapoints = list(store.iter_rows("datapoints"))
+            reloaded = session_store.load_session_payload(out_dir / session_store.SESSION_STORE_NAME)
+            plot_rows = app.collect_plot_export_datapoints(reloaded)
+
+        expected_order = [(point_idx, iter_idx, variant_id) for point_idx in range(3) for iter_idx in range(2) for variant_id in variants]
+        self.assertEqual([(row["point_index"], row["iteration_index"], row["variant_id"]) for row in trials], expected_order)
+        self.assertEqual([row["seed"] for row in trials], [100 + point_idx + iter_idx for point_idx, iter_idx, _variant_id in expected_order])
+        self.assertEqual([row["x_value"] for row in datapoints], [8.0] * 3 + [16.0] * 3 + [32.0] * 3)
+        self.assertEqual(datapoints[0]["seeds"], [100, 101])
+        self.assertEqual(stored_trials, trials)
+        self.assertEqual(stored_datapoints, datapoints)
+        self.assertEqual(reloaded["run_config"]["seed"], 100)
+        self.assertEqual([row["runtime_median_ms"] for row in plot_rows], [row["runtime_median_ms"] for row in datapoints])
+        self.assertNotIn("runtime_samples_ms", plot_rows[0])
+        self.assertLessEqual(activity["peak"], 4)
+        self.assertGreater(activity["peak"], len(variants))
+        self.assertEqual(leftover_inputs, [])
+
+    def test_trial_cache_reuses_unchanged_variants_and_reruns_baselines(self):
+        def make_config(variants: list[str], cache_dir: Path) -> dict:
+            return {
+                "preset": "smoke", "tab_id": "shortest_path", "input_mode": "independent", "graph_family": "erdos_renyi",
+                "selected_variants_requested": list(variants), "selected_variants": list(variants),
+                "selected_variant_labels": {variant_id: variant_id for variant_id in variants},
+                "injected_baselines": [], "skipped_missing_variants": [], "selected_datasets": [],
+                "iterations": 2, "base_seed": 100, "solver_timeout_seconds": None, "failure_policy": "continue",
+                "retry_failed_trials": 0, "timeout_as_missing": True, "outlier_filter": "none", "k_mode": "absolute",
+                "delete_generated_inputs": True, "dataset_selection": [], "parallel_requested": False,
+                "requested_workers": 1, "max_workers": 1, "detected_logical_cores": 1,
+                "datapoints": [{"n": 8.0, "density": 0.2}, {"n": 16.0, "density": 0.2}],
+                "var_ranges": {"n": [8.0, 16.0], "density": [0.2]}, "fixed_values": {"density": 0.2},
+                "primary_var": "n", "secondary_var": None,
+                "trial_cache": True, "trial_cache_dir": str(cache_dir), "trial_cache_fresh_baselines": 1,
+            }
+
+        runs: list[tuple[str, int]] = []
+
+        def fake_run_trial(**kwargs):
+            variant_id = kwargs["variant_id"]
+            runs.append((variant_id, len(runs)))
+            return {
+                "status": "ok", "variant_id": variant_id, "family": "dijkstra", "command": [variant_id],
+                "runtime_ms": float(len(runs)), "peak_kb": 64.0, "return_code": 0,
+                "normalized_result": {"answer_kind": "distance", "path_length": 1}, "answer_signature": ("distance", "1"),
+            }
+
+        def fake_inputs(_config, point, point_dir, iter_seed, input_cache=None):
+            path = point_dir / "graph.csv"
+            path.write_text(f"n={point['n']} seed={iter_seed}\n", encoding="utf-8")
+            return {"dijkstra_file": path}
+
+        def run_session(root: Path, name: str, variants: list[str], binaries: dict) -> tuple[list[dict], list[dict], dict]:
+            out_dir = root / name
+            runs.clear()
+            with mock.patch.object(headless_runner, "build_runtime_config", return_value=make_config(variants, root / "cache")), \
+                    mock.patch.object(headless_runner, "build_generated_inputs", side_effect=fake_inputs), \
+                    mock.patch.object(headless_runner.Runner, "run_trial", side_effect=fake_run_trial), \
+                    mock.patch.object(app, "build_binary_path_map", return_value=binaries):
+                headless_runner.execute_manifest({}, None, out_dir, lambda _msg: None)
+            trials = [json.loads(line) for line in (out_dir / "benchmark-trials.ndjson").read_text(encoding="utf-8").splitlines()]
+            datapoints = [json.loads(line) for line in (out_dir / "benchmark-datapoints.ndjson").read_text(encoding="utf-8").splitlines()]
+            return trials, datapoints, json.loads((out_dir / "benchmark-session.json").read_text(encoding="utf-8"))
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            binaries = {}
+            for variant_id in ("dijkstra_baseline", "dijkstra_chatgpt", "dijkstra_gemini"):
+                binaries[variant_id] = root / "bin" / variant_id
+                binaries[variant_id].parent.mkdir(exist_ok=True)
+                binaries[variant_id].write_bytes(variant_id.encode("utf-8"))
+
+            first_trials, _rows, first = run_session(root, "first", ["dijkstra_baseline", "dijkstra_chatgpt"], binaries)
+            self.assertEqual(len(runs), 8)
+            self.assertFalse(any(row["cached"] for row in first_trials))
+            self.assertEqual(first["trial_cache"]["stored"], 8)
+
+            # Adding a variant runs only that variant, plus the forced fresh baseline iteration.
+            trials, datapoints, payload = run_session(root, "second", ["dijkstra_baseline", "dijkstra_chatgpt", "dijkstra_gemini"], binaries)
+            self.assertEqual(sorted(variant_id for variant_id, _idx in runs), ["dijkstra_baseline"] * 2 + ["dijkstra_gemini"] * 4)
+            cached = {(row["point_index"], row["iteration_index"], row["variant_id"]) for row in trials if row["cached"]}
+            self.assertEqual(cached, {(point, iteration, "dijkstra_chatgpt") for point in range(2) for iteration in range(2)} | {(0, 1, "dijkstra_baseline"), (1, 1, "dijkstra_baseline")})
+            first_runtime = {(row["point_index"], row["iteration_index"], row["variant_id"]): row["runtime_ms"] for row in first_trials}
+            for row in trials:
+                if row["cached"]:
+                    self.assertEqual(row["runtime_ms"], first_runtime[(row["point_index"], row["iteration_index"], row["variant_id"])])
+                    self.assertEqual(row["cached_from"]["session_dir"], str(root / "first"))
+                    self.assertIsNone(row["stdout_path"])
+            self.assertEqual([(row["variant_id"], row["cached_samples_n"]) for row in datapoints[:3]], [("dijkstra_baseline", 1), ("dijkstra_chatgpt", 2), ("dijkstra_gemini", 0)])
+            self.assertEqual((payload["trial_cache"]["hits"], payload["trial_cache"]["forced_fresh"]), (6, 2))
+            self.assertTrue(payload["run_config"]["trial_cache"])
+
+            # A rebuilt binary invalidates only that variant's entries.
+            binaries["dijkstra_chatgpt"].write_bytes(b"rebuilt")
+            run_session(root, "third", ["dijkstra_baseline", "dijkstra_chatgpt"], binaries)
+            self.assertEqual(sorted(variant_id for variant_id, _idx in runs), ["dijkstra_baseline"] * 2 + ["dijkstra_chatgpt"] * 4)
+
+    def test_finalize_point_and_stats_carry_rusage_metrics(self):
+        variants = ["dijkstra_baseline", "dijkstra_chatgpt"]
+        config = {
+            "selected_variants": variants,
+            "selected_variant_labels": {variant_id: variant_id for variant_id in variants},
+            "iterations": 2,
+            "outlier_filter": "none",
+        }
+        state = {
+            "x_value": 8.0,
+            "y_value": None,
+            "point_label": "n=8",
+            "samples_runtime": {variant_id: [10.0, 12.0] for variant_id in variants},
+            "samples_memory": {variant_id: [128.0, 128.0] for variant_id in variants},
+            "samples_resource": {variant_id: {spec[0]: [] for spec in app.RESOURCE_METRIC_SPECS} for variant_id in variants},
+            "seed_records": {variant_id: [1, 2] for variant_id in variants},
+            "answer_rows": {variant_id: [] for variant_id in variants},
+            "iter_cpu_time_ms": {0: {}, 1: {}},
+            "completed_iterations": 2,
+        }
+        for iter_idx, (user_ms, system_ms) in enumerate([(4.0, 1.0), (6.0, 1.0)]):
+            for variant_id, scale in zip(variants, (1.0, 2.0)):
+                metrics = app.resource_metrics_from_rusage(
+                    {
+                        "user_cpu_ms": user_ms * scale,
+                        "system_cpu_ms": system_ms * scale,
+                        "minor_faults": 100,
+                        "major_faults": 0,
+                        "voluntary_context_switches": 3,
+                        "involuntary_context_switches": 1,
+                    }
+                )
+                for metric_id, value in metrics.items():
+                    state["samples_resource"][variant_id][metric_id].append(value)
+                state["iter_cpu_time_ms"][iter_idx][variant_id] = metrics["cpu_time"]
+
+        rows = headless_runner.finalize_point(config, state, stdio.StringIO())
+        baseline_row = rows[0]
+        self.assertEqual(baseline_row["cpu_time_median_ms"], 6.0)
+        self.assertEqual(baseline_row["user_cpu_samples_ms"], [4.0, 6.0])
+        self.assertEqual(baseline_row["minor_faults_median"], 100.0)
+        self.assertEqual(baseline_row["involuntary_ctx_switches_samples_n"], 2)
+
+        stats = app.build_desktop_runtime_statistical_tests(
+            config=config,
+            point_states={0: state},
+            selected_variants=variants,
+            metric="cpu_time_ms",
+        )
+        self.assertEqual(stats["metric"], "cpu_time_ms")
+        self.assertEqual(stats["pairs"][0]["n"], 2)
+        self.assertEqual(stats["pairs"][0]["direction"], "slower")
+
+    def test_datapoint_ratio_comparisons_resolve_regime_changes(self):
+        variants = ["vf3_baseline", "vf3_chatgpt_control"]
+        config = {"input_mode": "datasets", "outlier_filter": "none", "base_seed": 5, "selected_variant_labels": {"vf3_baseline": "VF3 Baseline"}}
+
+        def _state(label, dataset_id, baseline_ms, variant_ms):
+            return {
+                "point_label": label,
+                "dataset_id": dataset_id,
+                "dataset_name": dataset_id,
+                "x_value": 0.0,
+                "y_value": None,
+                "samples_runtime": {"vf3_baseline": baseline_ms, "vf3_chatgpt_control": variant_ms},
+                "samples_memory": {"vf3_baseline": [100.0] * len(baseline_ms), "vf3_chatgpt_control": [100.0] * len(variant_ms)},
+            }
+
+        point_states = {
+            0: _state("small", "sip", [10.0, 10.2, 9.9, 10.1, 10.0], [14.0, 14.3, 13.8, 14.1, 14.2]),
+            1: _state("large", "sip", [50.0, 51.0, 49.5, 50.5, 50.2], [30.0, 30.5, 29.8, 30.2, 30.1]),
+            2: _state("tiny", "mivia", [1.0], [1.0]),
+        }
+        result = app.build_datapoint_ratio_comparisons(config=config, point_states=point_states, selected_variants=variants, resamples=400)
+        self.assertIsNone(app.build_datapoint_ratio_comparisons(config=config, point_states=point_states, selected_variants=variants, resamples=0))
+        self.assertEqual([row["direction"] for row in result["datapoints"]], ["slower", "faster", "inconclusive"])
+        self.assertAlmostEqual(result["datapoints"][1]["runtime_ratio"]["estimate"], 30.1 / 50.2)
+        self.assertEqual(result["datapoints"][1]["memory_ratio"]["estimate"], 1.0)
+        self.assertEqual(result["datapoints"][2]["runtime_ratio"]["ci_low"], None)
+        self.assertEqual(result["datapoints"][0]["baseline_label"], "VF3 Baseline")
+        self.assertEqual([(row["dataset_id"], row["datapoint_count"]) for row in result["datasets"]], [("sip", 2), ("mivia", 1)])
+        self.assertEqual(result["datasets"][0]["runtime_ratio"]["n_variant"], 10)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            app.save_session_stats_exports({"datapoint_comparisons": result}, Path(tmp))
+            self.assertTrue((Path(tmp) / "stats-ratios.png").exists())
+            app.save_session_stats_exports({}, Path(tmp) / "none")
+            self.assertFalse((Path(tmp) / "none" / "stats-ratios.png").exists())
+
+    def test_spawn_calibration_feeds_corrected_runtime_rows(self):
+        variants = ["dijkstra_baseline", "dijkstra_chatgpt"]
+        fake_runtimes = {"dijkstra_baseline": 3.0, "dijkstra_chatgpt": 5.0}
+        calls = []
+
+        def fake_run_process(command, cwd):
+            calls.append(command)
+            if len(command) == 1 or command[1:] == ["/c", "exit 0"]:
+                return 1.0, 0.0, 0, "", "", {}
+            variant_id = "dijkstra_chatgpt" if "chatgpt" in command[0] else "dijkstra_baseline"
+            return fake_runtimes[variant_id], 0.0, 0, "", "", {}
+
+        binary_paths = {"dijkstra_baseline": Path("bin/dijkstra_baseline"), "dijkstra_chatgpt": Path("bin/dijkstra_chatgpt")}
+        with mock.patch.object(app, "noop_calibration_command", return_value=["true"]):
+            calibration = app.run_spawn_calibration(
+                fake_run_process,
+                selected_variants=variants,
+                binary_paths=binary_paths,
+                trivial_inputs={"dijkstra_file": Path("tiny.csv")},
+                trials=4,
+                cwd=Path("."),
+            )
+        self.assertEqual(len(calls), 12)
+        self.assertEqual(calibration["noop"]["median_ms"], 1.0)
+        self.assertEqual(calibration["variants"]["dijkstra_chatgpt"]["n"], 4)
+        self.assertEqual(app.spawn_overhead_ms(calibration, "dijkstra_chatgpt"), 5.0)
+        calibration["variants"]["dijkstra_chatgpt"]["error"] = "exit code 1"
+        self.assertEqual(app.spawn_overhead_ms(calibration, "dijkstra_chatgpt"), 1.0)
+
+        config = {
+            "selected_variants": variants,
+            "selected_variant_labels": {variant_id: variant_id for variant_id in variants},
+            "iterations": 2,
+            "outlier_filter": "none",
+        }
+        state = {
+            "x_value": 8.0,
+            "y_value": None,
+            "point_label": "n=8",
+            "samples_runtime": {variant_id: [2.0, 12.0] for variant_id in variants},
+            "samples_memory": {variant_id: [128.0, 128.0] for variant_id in variants},
+            "samples_resource": {variant_id: {spec[0]: [] for spec in app.RESOURCE_METRIC_SPECS} for variant_id in variants},
+            "seed_records": {variant_id: [1, 2] for variant_id in variants},
+            "answer_rows": {variant_id: [] for variant_id in variants},
+            "completed_iterations": 2,
+        }
+        rows = headless_runner.finalize_point(config, state, stdio.StringIO(), calibration)
+        self.assertEqual(rows[0]["runtime_overhead_ms"], 3.0)
+        self.assertEqual(rows[0]["runtime_corrected_samples_ms"], [0.0, 9.0])
+        self.assertEqual(rows[0]["runtime_corrected_median_ms"], 4.5)
+        self.assertEqual(rows[1]["runtime_overhead_ms"], 1.0)
+        uncalibrated = headless_runner.finalize_point(config, state, stdio.StringIO())
+        self.assertIsNone(uncalibrated[0]["runtime_corrected_median_ms"])
+
     def test_save_session_plot_exports_writes_runtime_and_memory_pngs(self):
         payload = {
             "completed_trials": 3,
@@ -757,6 +1202,214 @@ class DatasetConversionTests(unittest.TestCase):
         self.assertIsNone(target_labels)
         self.assertEqual(meta["selected_archive"], "si2_demo.zip")
 
+    @staticmethod
+    def _mivia_labelled_graph(labels, adj):
+        words = [len(adj), *labels]
+        for row in adj:
+            words.append(len(row))
+            for dst in row:
+                words.extend((int(dst), 7))
+        return b"".join(int(word).to_bytes(2, "little", signed=False) for word in words)
+
+    def test_parse_mivia_graph_bytes_decodes_views_and_reports_truncation(self):
+        payload = self._mivia_labelled_graph([3, 4, 5], [[1, 2], [0], [0]])
+        for data in (payload, memoryview(payload), bytearray(payload) + b"\x00"):
+            adj, labels = app._parse_mivia_graph_bytes(data, labeled=True)
+            self.assertEqual(adj, [[1, 2], [0], [0]])
+            self.assertEqual(labels, ["label_3", "label_4", "label_5"])
+        cases = {
+            payload[:-2]: "ended during edge attributes",
+            payload[:-4]: "ended during an adjacency row",
+            payload[:-6]: "before adjacency rows were complete",
+            payload[:4]: "Labeled MIVIA graph payload is truncated",
+        }
+        for data, message in cases.items():
+            with self.assertRaisesRegex(RuntimeError, message):
+                app._parse_mivia_graph_bytes(data, labeled=True)
+        with self.assertRaisesRegex(RuntimeError, "invalid node count"):
+            app._parse_mivia_graph_bytes(b"\x00\x00", labeled=False)
+
+    def test_read_mivia_pairs_converts_many_pairs_in_one_pass(self):
+        graphs = {
+            "si2_a.zip": {"a.A00": [[1], [0]], "a.B00": [[1], [0, 2], [1]], "a.A01": [[], []], "a.B01": [[1], [0]]},
+            "si2_b.zip": {"b.A00": [[1], [0]], "b.B00": [[2], [2], [0, 1]]},
+        }
+        with tempfile.TemporaryDirectory() as td:
+            outer_path = Path(td) / "graphsdb.zip"
+            with zipfile.ZipFile(outer_path, "w") as outer_zip:
+                for inner_name, members in graphs.items():
+                    inner_buffer = io.BytesIO()
+                    with zipfile.ZipFile(inner_buffer, "w", compression=zipfile.ZIP_DEFLATED) as inner_zip:
+                        for member, adj in members.items():
+                            inner_zip.writestr(member, self._mivia_unlabelled_graph(adj))
+                    outer_zip.writestr(inner_name, inner_buffer.getvalue(), compress_type=zipfile.ZIP_DEFLATED)
+            pairs = [
+                ("si2_b.zip", "b.A00", "b.B00"),
+                ("si2_a.zip", "a.A01", "a.B01"),
+                ("si2_a.zip", "a.A00", "a.B00"),
+            ]
+            # Compressed inner ZIPs are spooled, so the outer member stream is never rewound.
+            with mock.patch.object(zipfile.ZipExtFile, "seek", side_effect=AssertionError("outer member stream seeked")):
+                results = app._read_mivia_pairs(outer_path, pairs, labeled=False)
+            with mock.patch.object(app, "MIVIA_INNER_SPOOL_BYTES", 16):
+                self.assertEqual(app._read_mivia_pairs(outer_path, pairs, labeled=False), results)
+            with self.assertRaisesRegex(RuntimeError, "Could not resolve MIVIA pair members"):
+                app._read_mivia_pairs(outer_path, [("si2_a.zip", "a.A09", "a.B09")], labeled=False)
+        self.assertEqual([item[0] for item in results], [[[1], [0]], [[], []], [[1], [0]]])
+        self.assertEqual([item[1] for item in results], [[[2], [2], [0, 1]], [[1], [0]], [[1], [0, 2], [1]]])
+        self.assertTrue(all(item[2] is None and item[3] is None for item in results))
+
+    @staticmethod
+    def _lad_text(adj):
+        return "".join([f"{len(adj)}\n", *(" ".join(str(v) for v in [len(row), *row]) + "\n" for row in adj)])
+
+    @staticmethod
+    def _dataset_spec(dataset_id, prepare, relative_path):
+        return app.DatasetSpec(
+            dataset_id=dataset_id, name=dataset_id, tab_id="subgraph", source="", source_url="", raw_format="", description="",
+            estimated_size_bytes=0, estimated_graph_files=0, estimated_pair_count=0,
+            download={"kind": "single_file", "url": "http://invalid.example/archive", "relative_path": relative_path},
+            prepare={**prepare, "archive_relative_path": relative_path},
+        )
+
+    def _write_sip_archive(self, path):
+        import tarfile
+
+        graphs = {
+            "bench/si/si_fam/p1": ([[1], [0]], [[1], [0, 2], [1]]),
+            "bench/si/si_fam/p2": ([[1], [0]], [[1, 2], [0, 2], [0, 1], []]),
+            "bench/scalefree/sf_fam/p3": ([[1, 2], [0], [0]], [[1, 2], [0, 2], [0, 1], [], []]),
+            "bench/si/si_fam/orphan": ([[1], [0]], None),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(path, "w:gz") as tf:
+            for pair_dir, (pattern, target) in graphs.items():
+                for role, adj in (("pattern", pattern), ("target", target)):
+                    if adj is None:
+                        continue
+                    data = self._lad_text(adj).encode("utf-8")
+                    info = tarfile.TarInfo(f"{pair_dir}/{role}")
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+        return graphs
+
+    def test_sip_pair_index_samples_and_converts_random_access_pairs(self):
+        with tempfile.TemporaryDirectory() as td, mock.patch.dict("os.environ", {"CAPSTONE_DATASETS_DIR": td}):
+            spec = self._dataset_spec("sip_test", {"kind": "subgraph_pair_from_tgz_members"}, "raw/bench.tgz")
+            graphs = self._write_sip_archive(app.dataset_dir_for_spec(spec) / "raw" / "bench.tgz")
+            index = app.build_dataset_pair_index(spec)
+            self.assertEqual([pair["pair_id"] for pair in index["pairs"]], ["bench/scalefree/sf_fam/p3", "bench/si/si_fam/p1", "bench/si/si_fam/p2"])
+            self.assertEqual(index["classes"], ["scalefree", "si"])
+            self.assertEqual(index["pairs"][2]["target"]["nodes"], 4)
+            self.assertEqual(index["pairs"][2]["target"]["edges"], 6)
+            self.assertEqual(app.build_dataset_pair_index(spec)["index_build_ms"], index["index_build_ms"])
+
+            self.assertEqual([pair["pair_id"] for pair in app.sample_dataset_pairs(index, 5, classes=["si"])], ["bench/si/si_fam/p1", "bench/si/si_fam/p2"])
+            self.assertEqual([pair["pair_id"] for pair in app.sample_dataset_pairs(index, 5, min_nodes=4)], ["bench/scalefree/sf_fam/p3", "bench/si/si_fam/p2"])
+            sampled = app.sample_dataset_pairs(index, 2, seed=7)
+            self.assertEqual(sampled, app.sample_dataset_pairs(index, 2, seed=7))
+            self.assertEqual(len(sampled), 2)
+
+            metas = app.convert_dataset_pairs(spec, index, index["pairs"])
+            for meta, pair in zip(metas, index["pairs"]):
+                pattern, target = graphs[pair["pair_id"]]
+                self.assertEqual(app.normalize_adj_lists(app.parse_vf_graph(Path(meta["inputs"]["vf_pattern"]))), app.normalize_adj_lists(pattern))
+                self.assertEqual(app.normalize_adj_lists(app.parse_lad_graph(Path(meta["inputs"]["lad_target"]))), app.normalize_adj_lists(target))
+                self.assertEqual(meta["pair_class"], pair["class"])
+            with mock.patch.object(app, "_convert_subgraph_from_adj_pair", side_effect=AssertionError("reconverted")):
+                self.assertEqual(app.convert_dataset_pairs(spec, index, index["pairs"][:1]), metas[:1])
+
+    def test_mivia_pair_index_converts_pairs_in_parallel(self):
+        with tempfile.TemporaryDirectory() as td, mock.patch.dict("os.environ", {"CAPSTONE_DATASETS_DIR": td}):
+            spec = self._dataset_spec("mivia_test", {"kind": "subgraph_pair_from_mivia_archive", "labeled": False}, "raw/graphsdb.zip")
+            outer_path = app.dataset_dir_for_spec(spec) / "raw" / "graphsdb.zip"
+            outer_path.parent.mkdir(parents=True)
+            inner_buffer = io.BytesIO()
+            with zipfile.ZipFile(inner_buffer, "w", compression=zipfile.ZIP_DEFLATED) as inner_zip:
+                inner_zip.writestr("si2_demo.A00", self._mivia_unlabelled_graph([[1], [0]]))
+                inner_zip.writestr("si2_demo.B00", self._mivia_unlabelled_graph([[1], [0, 2], [1]]))
+                inner_zip.writestr("si2_demo.A01", self._mivia_unlabelled_graph([[], [0]]))
+                inner_zip.writestr("si2_demo.B01", self._mivia_unlabelled_graph([[1], [2], [0]]))
+            with zipfile.ZipFile(outer_path, "w") as outer_zip:
+                outer_zip.writestr("si2_demo.zip", inner_buffer.getvalue())
+                outer_zip.writestr("si2_demo.gtr", "si2_demo.A00 1\nsi2_demo.A01 1\n")
+            index = app.build_dataset_pair_index(spec)
+            self.assertEqual([pair["pair_id"] for pair in index["pairs"]], ["si2_demo/si2_demo.A00", "si2_demo/si2_demo.A01"])
+            self.assertEqual(index["classes"], ["si2"])
+            metas = app.convert_dataset_pairs(spec, index, index["pairs"], max_processes=2)
+            self.assertEqual(app.parse_vf_graph(Path(metas[1]["inputs"]["vf_target"])), [[1], [2], [0]])
+            self.assertEqual([meta["target_nodes"] for meta in metas], [3, 3])
+
+            catalog = [spec]
+            with mock.patch.object(app, "load_dataset_catalog", return_value=catalog):
+                datapoints, _ranges, _fixed, _primary, _secondary, selection = headless_runner.build_dataset_config(
+                    "subgraph",
+                    {"selected_datasets": ["mivia_test"], "dataset_pairs": {"count": 1, "seed": 3, "processes": 1}, "base_seed": 11},
+                    lambda _msg: None,
+                )
+            self.assertEqual(len(datapoints), 1)
+            self.assertIn(datapoints[0]["dataset_pair_id"], selection[0]["selected_pairs"])
+            self.assertEqual(selection[0]["indexed_pair_count"], 2)
+            self.assertEqual(selection[0]["pair_sample"]["seed"], 3)
+            self.assertEqual(
+                headless_runner.build_point_label({"input_mode": "datasets"}, datapoints[0]),
+                f"mivia_test [{datapoints[0]['dataset_pair_id']}]",
+            )
+
+    def test_block_edge_list_conversion_matches_labeled_converter(self):
+        lines = ["# Nodes: 6 Edges: 7", "% comment"]
+        lines += ["10\t20", "20 30", "30,10", "10 10", "40\t50 7", "50\t60", "60 10"]
+        with tempfile.TemporaryDirectory() as td:
+            source = Path(td) / "edges.txt"
+            source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            # A tiny block size forces rows to straddle block boundaries.
+            with mock.patch.object(app, "SHORTEST_PATH_CONVERT_BLOCK_BYTES", 7):
+                fast = app._convert_shortest_path_from_edge_list(Path(td) / "fast", source, True)
+            legacy = app._convert_shortest_path_from_labeled_edge_list(Path(td) / "legacy", source, True)
+
+            fast_csv = Path(fast["inputs"]["dijkstra_file"]).read_text(encoding="utf-8").splitlines()
+            legacy_csv = Path(legacy["inputs"]["dijkstra_file"]).read_text(encoding="utf-8").splitlines()
+            self.assertEqual(fast_csv[0].rstrip(), legacy_csv[0])
+            self.assertEqual(fast_csv[1:], legacy_csv[1:])
+            self.assertEqual({k: v for k, v in fast.items() if k not in {"inputs", "csr_file"}}, {k: v for k, v in legacy.items() if k != "inputs"})
+            if app.csr_mod.np is not None:
+                self.assertTrue(Path(fast["csr_file"]).is_file())
+                with app.csr_mod.load_csr_sidecar(Path(fast["inputs"]["dijkstra_file"])) as graph:
+                    self.assertEqual((graph.nodes, graph.edges, graph.label(graph.start), graph.label(graph.target)), (6, 12, "10", "60"))
+
+    def test_block_parsers_never_pair_tokens_across_lines(self):
+        # Token totals match 2 (or 4) per line, but the rows are ragged: only whole rows count.
+        self.assertEqual(app._parse_edge_list_block(b"1 2 7\n4\n5 6\n", {}), ([1, 5], [2, 6], None))
+        self.assertEqual(app._parse_edge_list_block(b"1 2\n3,4\n", {}), ([1, 3], [2, 4], None))
+        self.assertEqual(app._parse_dimacs_block(b"a 1 2 3 a 4 5 6\n\n", {}), ([1], [2], [3]))
+        self.assertEqual(app._parse_dimacs_block(b"a 1 2 3\na 4 5 6\n", {}), ([1, 4], [2, 5], [3, 6]))
+
+    def test_edge_list_conversion_falls_back_for_non_integer_labels(self):
+        with tempfile.TemporaryDirectory() as td:
+            source = Path(td) / "edges.txt"
+            source.write_text("1 2\n2 b\nb 3\n", encoding="utf-8")
+            payload = app._convert_shortest_path_from_edge_list(Path(td), source, False)
+            self.assertNotIn("csr_file", payload)
+            self.assertEqual(payload["edges"], 3)
+            self.assertFalse(app.csr_mod.sidecar_path_for(Path(payload["inputs"]["dijkstra_file"])).exists())
+
+    def test_dimacs_conversion_oracle_agrees_with_and_without_sidecar(self):
+        from utilities import benchmark_validation
+
+        text = "c roads\np sp 4 5\na 1 2 7\na 1 3 2\na 3 2 3\na 2 4 1\na 3 4 9\n"
+        with tempfile.TemporaryDirectory() as td:
+            source = Path(td) / "roads.gr"
+            source.write_text(text, encoding="utf-8")
+            with mock.patch.object(app, "SHORTEST_PATH_CONVERT_BLOCK_BYTES", 11):
+                payload = app._convert_shortest_path_from_dimacs_gr(Path(td), source)
+            csv_path = Path(payload["inputs"]["dijkstra_file"])
+            self.assertEqual((payload["nodes"], payload["edges"], payload["start_label"], payload["target_label"]), (4, 5, "1", "4"))
+            self.assertEqual(csv_path.read_text(encoding="utf-8").splitlines()[2:], ["1,2,7", "1,3,2", "3,2,3", "2,4,1", "3,4,9"])
+            with_sidecar = benchmark_validation.shortest_path_oracle(csv_path)
+            app.csr_mod.sidecar_path_for(csv_path).unlink(missing_ok=True)
+            self.assertEqual(benchmark_validation.shortest_path_oracle(csv_path), with_sidecar)
+            self.assertEqual(with_sidecar[0], 6)
+
     def test_parse_bigraph_instance_emits_structure_and_labels(self):
         text = """{(0, Child:1),(1, Locale:1),(2, Lion:1),(3, Impala:1)}
 2 4 1
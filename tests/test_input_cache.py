@@ -0,0 +1,82 @@
+"""Regression tests for the content-addressed generated-input cache."""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from desktop_runner import app
+from utilities.input_cache import InputCache, cache_key
+
+
+def _write_blob(size_bytes: int):
+    def _build(target_dir: Path) -> dict:
+        path = target_dir / "blob.bin"
+        path.write_bytes(b"x" * size_bytes)
+        return {"blob": path, "format": "raw"}
+
+    return _build
+
+
+class InputCacheTests(unittest.TestCase):
+    def test_cached_subgraph_inputs_match_uncached_generation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            cache = InputCache(root / "cache", max_bytes=64 * 1024 * 1024)
+            args = ("subgraph", 40, 5, 0.2, 17)
+            uncached = app.generate_iteration_inputs(args[0], root / "plain", *args[1:])
+            first = app.generate_iteration_inputs(args[0], root / "run1", *args[1:], input_cache=cache)
+            second = app.generate_iteration_inputs(args[0], root / "run2", *args[1:], input_cache=cache)
+
+            self.assertEqual(cache.stats["misses"], 1)
+            self.assertEqual(cache.stats["hits"], 1)
+            for name in ("vf_pattern", "vf_target", "lad_pattern", "lad_target"):
+                self.assertEqual(Path(second[name]).parent, root / "run2")
+                self.assertEqual(Path(second[name]).read_bytes(), Path(uncached[name]).read_bytes())
+            self.assertEqual(second["lad_format"], "vertexlabelledlad")
+            self.assertEqual(os.stat(first["vf_target"]).st_ino, os.stat(second["vf_target"]).st_ino)
+
+            metadata = json.loads((root / "run2" / "metadata.json").read_text(encoding="utf-8"))
+            self.assertTrue(all(Path(item).parent == root / "run2" for item in metadata["files"]))
+            self.assertIn("input_cache_key", metadata)
+            entry_metadata = cache.entry_dir(metadata["input_cache_key"]) / "metadata.json"
+            self.assertNotIn("input_cache_key", json.loads(entry_metadata.read_text(encoding="utf-8")))
+
+            shutil.rmtree(root / "run1")
+            shutil.rmtree(root / "run2")
+            third = app.generate_iteration_inputs(args[0], root / "run3", *args[1:], input_cache=cache)
+            self.assertEqual(cache.stats["hits"], 2)
+            self.assertTrue(Path(third["vf_target"]).exists())
+
+    def test_key_changes_with_parameters_and_code_version(self):
+        params = {"builder": "subgraph", "n": 10, "seed": 1}
+        self.assertEqual(cache_key(params, "a"), cache_key(dict(params), "a"))
+        self.assertNotEqual(cache_key(params, "a"), cache_key(params, "b"))
+        self.assertNotEqual(cache_key(params, "a"), cache_key({**params, "seed": 2}, "a"))
+
+    def test_size_cap_evicts_least_recently_used_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            cache = InputCache(root / "cache", max_bytes=2500)
+            cache.materialize("a" * 64, root / "out_a", _write_blob(1000))
+            cache.materialize("b" * 64, root / "out_b", _write_blob(1000))
+            past = time.time() - 60
+            os.utime(cache.entry_dir("b" * 64) / "_entry.json", (past, past))
+            os.utime(cache.entry_dir("a" * 64) / "_entry.json", (past + 30, past + 30))
+            result = cache.materialize("c" * 64, root / "out_c", _write_blob(1000))
+
+            self.assertEqual(result["format"], "raw")
+            self.assertEqual(result["blob"], root / "out_c" / "blob.bin")
+            self.assertEqual(cache.stats["evictions"], 1)
+            self.assertFalse(cache.entry_dir("b" * 64).exists())
+            self.assertTrue(cache.entry_dir("a" * 64).exists())
+            self.assertLessEqual(cache.total_bytes(), 2500)
+            self.assertTrue((root / "out_b" / "blob.bin").exists())
+            self.assertEqual(list((root / "cache" / "tmp").iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
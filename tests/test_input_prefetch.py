@@ -0,0 +1,68 @@
+"""Regression tests for background input-generation prefetch."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from desktop_runner import app
+from utilities.input_prefetch import InputPrefetcher, PrefetchJob
+
+
+def _jobs(root: Path, count: int):
+    for idx in range(count):
+        out_dir = root / f"iter_{idx + 1:03d}"
+        yield PrefetchJob(
+            key=(0, idx),
+            out_dir=out_dir,
+            fn=app.generate_iteration_inputs,
+            args=("shortest_path", out_dir, 12, 1, 0.3, 100 + idx),
+        )
+
+
+class InputPrefetcherTests(unittest.TestCase):
+    def test_prefetched_inputs_match_synchronous_generation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            prefetcher = InputPrefetcher(_jobs(root / "prefetched", 4), lookahead=2, max_processes=2)
+            try:
+                for idx in range(4):
+                    generated = prefetcher.take((0, idx))
+                    self.assertIsNotNone(generated)
+                    expected = app.generate_iteration_inputs(
+                        "shortest_path", root / "sync" / f"iter_{idx + 1:03d}", 12, 1, 0.3, 100 + idx
+                    )
+                    self.assertEqual(
+                        Path(generated["dijkstra_file"]).read_text(encoding="utf-8"),
+                        Path(expected["dijkstra_file"]).read_text(encoding="utf-8"),
+                    )
+            finally:
+                prefetcher.close()
+            self.assertEqual(prefetcher.stats["taken"], 4)
+            self.assertEqual(prefetcher.stats["fallbacks"], 0)
+
+    def test_out_of_order_key_falls_back_and_close_removes_untaken_sets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            prefetcher = InputPrefetcher(_jobs(root, 5), lookahead=2, max_processes=1)
+            self.assertIsNone(prefetcher.take((0, 3)))
+            self.assertIsNotNone(prefetcher.take((0, 0)))
+            prefetcher.close(delete_untaken=True)
+            self.assertEqual(prefetcher.stats["fallbacks"], 1)
+            self.assertTrue((root / "iter_001").exists())
+            self.assertFalse((root / "iter_002").exists())
+            self.assertFalse((root / "iter_003").exists())
+
+    def test_disk_budget_limits_queued_sets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            prefetcher = InputPrefetcher(_jobs(Path(tmp), 4), lookahead=3, disk_budget_bytes=1, max_processes=1)
+            try:
+                self.assertIsNotNone(prefetcher.take((0, 0)))
+                # Once a finished size is known the queue is not refilled to the look-ahead.
+                self.assertLess(len(prefetcher._queue), 3)
+                self.assertGreater(prefetcher.stats["budget_stalls"], 0)
+            finally:
+                prefetcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Regression tests for shared child-process resource accounting."""
+
+import subprocess
+import sys
+import time
+import unittest
+
+from utilities import process_metrics
+
+
+def _run_monitored(code: str):
+    proc = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    monitor = process_metrics.ChildResourceMonitor(proc)
+    while True:
+        monitor.sample()
+        if monitor.poll() is not None:
+            break
+        time.sleep(0.01)
+    stdout, _stderr = proc.communicate()
+    return proc, monitor, stdout
+
+
+class ProcessMetricsTests(unittest.TestCase):
+    def test_monitor_reports_exit_code_and_output(self):
+        proc, monitor, stdout = _run_monitored("import sys; print('ok'); sys.exit(3)")
+        self.assertEqual(proc.returncode, 3)
+        self.assertEqual(stdout.strip(), "ok")
+        self.assertIn(monitor.measurement()["memory_backend"], {
+            process_metrics.MEMORY_BACKEND_WAIT4,
+            process_metrics.MEMORY_BACKEND_PROC_STATUS,
+            process_metrics.MEMORY_BACKEND_PSUTIL,
+            process_metrics.MEMORY_BACKEND_UNAVAILABLE,
+        })
+
+    @unittest.skipUnless(process_metrics.wait4_available(), "os.wait4 is not available on this platform")
+    def test_monitor_collects_rusage_for_short_lived_child(self):
+        _proc, monitor, _stdout = _run_monitored("pass")
+        rusage = monitor.measurement()["rusage"]
+        self.assertIsNotNone(rusage)
+        self.assertGreater(rusage["max_rss_kb"], 0)
+        self.assertGreaterEqual(rusage["user_cpu_ms"], 0.0)
+        self.assertGreaterEqual(rusage["minor_faults"], 0)
+        self.assertGreater(monitor.peak_kb(), 0)
+
+    @unittest.skipUnless(process_metrics.wait4_available(), "os.wait4 is not available on this platform")
+    def test_kernel_peak_is_used_only_above_inherited_floor(self):
+        _proc, monitor, _stdout = _run_monitored("pass")
+        monitor.rusage = dict(monitor.rusage, max_rss_kb=1000.0)
+        monitor.sampled_peak_kb = 400.0
+        monitor.inherited_floor_kb = 2000.0
+        self.assertEqual(monitor.peak_kb(), 400.0)
+        self.assertNotEqual(monitor.memory_backend(), process_metrics.MEMORY_BACKEND_WAIT4)
+        monitor.inherited_floor_kb = 500.0
+        self.assertEqual(monitor.peak_kb(), 1000.0)
+        self.assertEqual(monitor.memory_backend(), process_metrics.MEMORY_BACKEND_WAIT4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Regression tests for the event-driven solver process supervisor."""
+
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utilities import process_supervisor
+
+
+def _spawn(code: str) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+class ProcessSupervisorTests(unittest.TestCase):
+    def setUp(self):
+        self.supervisor = process_supervisor.ProcessSupervisor()
+
+    def _watch(self, proc, **kwargs):
+        handle = self.supervisor.watch(proc, **kwargs)
+        if not handle.drains_pipes:
+            stdout, stderr = proc.communicate()
+            handle.stdout_chunks.append(stdout)
+            handle.stderr_chunks.append(stderr)
+        return handle
+
+    def test_exit_code_output_and_rusage_are_collected(self):
+        proc = _spawn("import sys; print('hello'); print('oops', file=sys.stderr); sys.exit(4)")
+        handle = self._watch(proc)
+        self.assertEqual(handle.wait(), process_supervisor.OUTCOME_EXITED)
+        stdout, stderr = handle.take_output()
+        self.assertEqual(proc.returncode, 4)
+        self.assertEqual(stdout, "hello\n")
+        self.assertEqual(stderr, "oops\n")
+        self.assertIsNotNone(handle.ended)
+        self.assertGreaterEqual(handle.ended, handle.started)
+
+    def test_large_output_does_not_block_the_child(self):
+        proc = _spawn("import sys; sys.stdout.write('x' * 1_000_000)")
+        handle = self._watch(proc)
+        self.assertEqual(handle.wait(), process_supervisor.OUTCOME_EXITED)
+        stdout, _stderr = handle.take_output()
+        self.assertEqual(len(stdout), 1_000_000)
+
+    def test_timeout_terminates_child(self):
+        proc = _spawn("import time; time.sleep(30)")
+        handle = self.supervisor.watch(proc, timeout_seconds=0.2)
+        self.assertEqual(handle.wait(), process_supervisor.OUTCOME_TIMEOUT)
+        self.assertGreaterEqual(handle.timeout_elapsed_seconds, 0.2)
+        proc.wait(timeout=5)
+
+    def test_stop_event_aborts_child(self):
+        stop_event = threading.Event()
+        proc = _spawn("import time; time.sleep(30)")
+        handle = self.supervisor.watch(proc, stop_event=stop_event)
+        stop_event.set()
+        self.assertEqual(handle.wait(), process_supervisor.OUTCOME_ABORTED)
+        proc.wait(timeout=5)
+
+    @unittest.skipUnless(hasattr(signal, "SIGKILL"), "needs POSIX signals")
+    def test_timeout_and_abort_wait_until_a_term_ignoring_child_is_killed(self):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(process_supervisor, "KILL_GRACE_SECONDS", 0.3):
+            for name in ("timeout", "abort"):
+                ready = Path(tmp) / name
+                proc = _spawn(f"import pathlib, signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); pathlib.Path({str(ready)!r}).touch(); time.sleep(30)")
+                stop_event = threading.Event()
+                handle = self._watch(proc, stop_event=stop_event, timeout_seconds=3.0 if name == "timeout" else None)
+                deadline = time.monotonic() + 2.5
+                while not ready.exists() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertTrue(ready.exists())
+                if name == "abort":
+                    stop_event.set()
+                outcome = handle.wait()
+                self.assertEqual(outcome, process_supervisor.OUTCOME_TIMEOUT if name == "timeout" else process_supervisor.OUTCOME_ABORTED)
+                # The child is already reaped when wait() returns, killed after ignoring SIGTERM.
+                self.assertEqual(proc.returncode, -signal.SIGKILL)
+
+    def test_paused_time_does_not_count_toward_timeout(self):
+        pause_event = threading.Event()
+        pause_event.set()
+        paused_calls = []
+        proc = _spawn("import time; time.sleep(0.6)")
+        handle = self._watch(proc, pause_event=pause_event, timeout_seconds=0.4, on_pause=lambda: paused_calls.append(True))
+        threading.Timer(0.5, pause_event.clear).start()
+        self.assertEqual(handle.wait(), process_supervisor.OUTCOME_EXITED)
+        self.assertEqual(paused_calls, [True])
+        self.assertGreater(handle.paused_accumulated, 0.0)
+
+    def test_heartbeat_reports_active_elapsed_seconds(self):
+        beats = []
+        with mock.patch.object(process_supervisor, "HEARTBEAT_AFTER_SECONDS", 1):
+            proc = _spawn("import time; time.sleep(2.3)")
+            handle = self._watch(proc, on_heartbeat=beats.append)
+            self.assertEqual(handle.wait(), process_supervisor.OUTCOME_EXITED)
+        self.assertEqual(beats, [1, 2])
+
+
+class RunnerProcessSupervisionTests(unittest.TestCase):
+    def test_runner_run_process_raises_solver_timeout(self):
+        from desktop_runner import app, headless_runner
+
+        runner = headless_runner.Runner(output_dir=None, logger=lambda _msg: None)
+        started = time.perf_counter()
+        with self.assertRaises(app.SolverTimeoutError):
+            runner.run_process([sys.executable, "-c", "import time; time.sleep(30)"], Path.cwd(), None, 0.3)
+        self.assertLess(time.perf_counter() - started, 10.0)
+
+    def test_runner_run_process_returns_output_and_measurement(self):
+        from desktop_runner import headless_runner
+
+        runner = headless_runner.Runner(output_dir=None, logger=lambda _msg: None)
+        runtime_ms, peak_kb, return_code, stdout, _stderr, measurement = runner.run_process(
+            [sys.executable, "-c", "print('6')"], Path.cwd(), "probe", None
+        )
+        self.assertGreater(runtime_ms, 0.0)
+        self.assertGreaterEqual(peak_kb, 0.0)
+        self.assertEqual(return_code, 0)
+        self.assertEqual(stdout.strip(), "6")
+        self.assertIn("memory_backend", measurement)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Regression tests for the cross-session results warehouse."""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from desktop_runner import results_warehouse
+from utilities import session_store
+
+
+def _payload(sha: str, host: str, started: str, *, primary: str = "n", secondary: str | None = None, fixed: dict | None = None) -> dict:
+    return {
+        "schema_version": "desktop-benchmark-v2",
+        "run_started_utc": started,
+        "manifest_path": "/manifests/04_glasgow.json",
+        "run_config": {
+            "tab_id": "subgraph",
+            "input_mode": "independent",
+            "graph_family": "random_density",
+            "primary_variable": primary,
+            "secondary_variable": secondary,
+            "fixed_values": dict(fixed or {}),
+            "seed": 7,
+        },
+        "provenance": {
+            "captured_at_utc": started,
+            "runtime_environment": {"platform": {"node": host, "system": "Linux", "machine": "x86_64"}, "git": {"sha": sha}},
+            "toolchains": {"g++": {"path": "/usr/bin/g++", "version": "g++ 13.2"}},
+        },
+    }
+
+
+def _row(variant_id: str, x_value: float, runtime: float, y_value: float | None = None) -> dict:
+    return {
+        "variant_id": variant_id,
+        "variant_label": variant_id,
+        "x_value": x_value,
+        "y_value": y_value,
+        "runtime_median_ms": runtime,
+        "memory_median_kb": 1024.0,
+        "runtime_samples_ms": [runtime - 1.0, runtime, runtime + 1.0],
+        "memory_samples_kb": [1024.0],
+    }
+
+
+class ResultsWarehouseTests(unittest.TestCase):
+    def test_ingest_is_incremental_and_queries_by_dimension(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            # A collection run whose session has a columnar store (headless style)...
+            collection = root / "runs" / "run_1"
+            collection.mkdir(parents=True)
+            (collection / "collection-run.json").write_text("{}", encoding="utf-8")
+            with session_store.SessionStore(collection / "04_glasgow" / session_store.SESSION_STORE_NAME) as store:
+                store.append("datapoints", [_row("glasgow_baseline", 64.0, 10.0), _row("glasgow_chatgpt_control", 64.0, 8.0), _row("glasgow_chatgpt_control", 128.0, 30.0)])
+                store.set_payload(_payload("abc123", "lab-1", "2025-01-02T00:00:00+00:00", fixed={"density": 0.1, "k": 8.0}))
+            # ...and an older JSON-only session from another host and commit, sweeping density.
+            legacy = root / "benchmark_output_1"
+            legacy.mkdir()
+            legacy_payload = {
+                **_payload("def456", "lab-2", "2024-12-01T00:00:00+00:00", primary="density", fixed={"n": 64.0, "k": 8.0}),
+                "datapoints": [_row("glasgow_chatgpt_control", 0.1, 12.0), _row("vf3_baseline", 0.1, 5.0)],
+            }
+            (legacy / "benchmark-session.json").write_text(json.dumps(legacy_payload), encoding="utf-8")
+            # An interrupted run has rows but no payload yet and is left for a later ingest.
+            with session_store.SessionStore(root / "partial" / session_store.SESSION_STORE_NAME) as store:
+                store.append("datapoints", [_row("glasgow_baseline", 64.0, 1.0)])
+
+            db_path = root / "warehouse" / "results.sqlite"
+            with results_warehouse.ResultsWarehouse(db_path) as warehouse:
+                self.assertEqual(warehouse.ingest([root]), {"ingested": 2, "replaced": 0, "unchanged": 0, "skipped": 1})
+                self.assertEqual(warehouse.ingest([root])["unchanged"], 2)
+
+                glasgow = warehouse.query({"family": "glasgow", "n": 64.0})
+                self.assertEqual(sorted((row["variant"], row["host"], row["density"]) for row in glasgow), [
+                    ("glasgow_baseline", "lab-1", 0.1), ("glasgow_chatgpt_control", "lab-1", 0.1), ("glasgow_chatgpt_control", "lab-2", 0.1),
+                ])
+                self.assertEqual(len(warehouse.query({"variant": ["glasgow_*"], "git_sha": "ABC"})), 3)
+                self.assertEqual(len(warehouse.query({"variant": ["vf3_*", "glasgow_baseline"]})), 2)
+                self.assertEqual(len(warehouse.query({"since": "2025-01-01"})), 3)
+
+                grouped = warehouse.query({"variant": ["glasgow_chatgpt_control"]}, group_by=["git_sha", "n"])
+                self.assertEqual(
+                    [(row["git_sha"], row["n"], row["datapoints"], row["runtime_median_ms"]) for row in grouped],
+                    [("abc123", 64.0, 1, 8.0), ("abc123", 128.0, 1, 30.0), ("def456", 64.0, 1, 12.0)],
+                )
+                with self.assertRaises(ValueError):
+                    warehouse.query({}, group_by=["colour"])
+
+                sessions = warehouse.sessions()
+                self.assertEqual([(row["host"], row["manifest_name"], row["datapoints"]) for row in sessions], [("lab-2", "04_glasgow.json", 2), ("lab-1", "04_glasgow.json", 3)])
+                collection_row = warehouse.conn.execute("SELECT collection_dir, compiler, k FROM sessions JOIN datapoints USING (session_id) WHERE host = 'lab-1' LIMIT 1").fetchone()
+                self.assertEqual(tuple(collection_row), (str(collection.resolve()), "g++ 13.2", 8.0))
+                datapoint_id = warehouse.conn.execute("SELECT datapoint_id FROM datapoints WHERE runtime_median_ms = 30.0").fetchone()[0]
+                self.assertEqual(warehouse.sample_values(datapoint_id), [29.0, 30.0, 31.0])
+
+                # Rewriting a session replaces its rows instead of duplicating them.
+                legacy_payload["datapoints"] = legacy_payload["datapoints"][:1]
+                (legacy / "benchmark-session.json").write_text(json.dumps(legacy_payload), encoding="utf-8")
+                stat = (legacy / "benchmark-session.json").stat()
+                os.utime(legacy / "benchmark-session.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                self.assertEqual(warehouse.ingest([legacy])["replaced"], 1)
+                self.assertEqual(warehouse.conn.execute("SELECT COUNT(*) FROM datapoints").fetchone()[0], 4)
+
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                code = results_warehouse.main(["--db", str(db_path), "query", "--host", "lab-1", "--group-by", "variant", "--format", "csv"])
+            self.assertEqual(code, 0)
+            lines = stdout.getvalue().splitlines()
+            self.assertEqual(lines[0], "variant,datapoints,sessions,runtime_median_ms,memory_median_kb,cpu_time_median_ms")
+            self.assertEqual(lines[2], "glasgow_chatgpt_control,2,1,19,1024,")
+
+    def test_k_filter_compares_pattern_node_counts_across_k_modes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name, k_mode, started, x_values in (
+                ("absolute", "absolute", "2025-01-01T00:00:00+00:00", (10.0, 25.0)),
+                # 25% of N=40 is a 10-node pattern; 62.5% is a 25-node one.
+                ("percent", "percent", "2025-01-02T00:00:00+00:00", (25.0, 62.5)),
+            ):
+                payload = _payload("abc123", "lab-1", started, primary="k", fixed={"n": 40.0, "density": 0.1})
+                payload["run_config"]["k_mode"] = k_mode
+                payload["datapoints"] = [_row("vf3_baseline", x_value, x_value) for x_value in x_values]
+                (root / name).mkdir()
+                (root / name / "benchmark-session.json").write_text(json.dumps(payload), encoding="utf-8")
+
+            db_path = root / "results.sqlite"
+            with results_warehouse.ResultsWarehouse(db_path) as warehouse:
+                self.assertEqual(warehouse.ingest([root])["ingested"], 2)
+                rows = warehouse.query({"k": 25.0})
+                self.assertEqual(sorted(((row["k"], row["k_percent"], row["runtime_median_ms"]) for row in rows), key=lambda item: item[2]), [(25.0, None, 25.0), (25.0, 62.5, 62.5)])
+                self.assertEqual([row["k_percent"] for row in warehouse.query({"k": 10.0})], [None, 25.0])
+                warehouse.conn.execute("UPDATE warehouse_meta SET value = 'capstone-results-warehouse-v1' WHERE key = 'schema_version'")
+                warehouse.conn.commit()
+            # A warehouse from an older format is emptied and rebuilt from its sessions.
+            with results_warehouse.ResultsWarehouse(db_path) as warehouse:
+                self.assertEqual(warehouse.query({}), [])
+                self.assertEqual(warehouse.ingest([root])["ingested"], 2)
+                self.assertEqual(len(warehouse.query({"k": 25.0})), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
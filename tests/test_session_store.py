@@ -0,0 +1,62 @@
+"""Regression tests for the columnar SQLite session store."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utilities import session_store
+
+
+class SessionStoreTests(unittest.TestCase):
+    def test_rows_round_trip_while_columns_widen(self):
+        first = {"variant_id": "a", "x_value": 8, "y_value": None, "seeds": [1, 2], "runtime_samples_ms": [1.5, 2.5], "rusage": {"user_cpu_ms": 3}, "ok": True}
+        second = {"variant_id": "b", "x_value": 16.5, "y_value": 0.2, "seeds": [], "runtime_samples_ms": [], "rusage": None, "ok": False, "cwd": Path("/tmp/run")}
+        third = {"variant_id": "c", "x_value": "n/a", "seeds": [3.5], "runtime_samples_ms": [4.0]}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / session_store.SESSION_STORE_NAME
+            store = session_store.SessionStore(path)
+            store.append("datapoints", [first])
+            # Readable mid-run, and later appends (new and widened columns) show up in the same reader.
+            reader = session_store.open_session_store(tmp)
+            self.assertEqual(list(reader.iter_rows("datapoints")), [first])
+            self.assertIsNone(reader.payload())
+            store.append("datapoints", [second, third])
+            self.assertEqual(reader.columns("datapoints")["x_value"], "json")
+            self.assertEqual(reader.columns("datapoints")["seeds"], "f8")
+            reader.close()
+            store.set_payload({"schema_version": "v", "datapoints": [first]})
+            store.close()
+            self.assertEqual(sorted(item.name for item in Path(tmp).iterdir()), [session_store.SESSION_STORE_NAME])
+
+            with session_store.open_session_store(path) as reader:
+                rows = list(reader.iter_rows("datapoints"))
+                self.assertEqual(rows[0], {**first, "x_value": 8.0, "cwd": None})
+                self.assertEqual(rows[1], {**second, "cwd": "/tmp/run"})
+                self.assertEqual(rows[2], {**third, "y_value": None, "rusage": None, "ok": None, "cwd": None})
+                self.assertEqual(list(reader.iter_rows("datapoints", ["variant_id", "missing"], equals={"ok": False})), [{"variant_id": "b"}])
+                self.assertEqual(set(next(reader.iter_rows("datapoints", include_samples=False))), {"variant_id", "x_value", "y_value", "rusage", "ok", "cwd"})
+                arrays = reader.sample_arrays("datapoints", "runtime_samples_ms")
+                if session_store.np is not None:
+                    self.assertEqual(arrays[0].dtype, session_store.np.dtype("<f8"))
+                self.assertEqual([list(values) for values in arrays], [[1.5, 2.5], [], [4.0]])
+                with mock.patch.object(session_store, "np", None):
+                    self.assertEqual(reader.sample_arrays("datapoints", "seeds"), [[1.0, 2.0], [], [3.5]])
+                self.assertEqual(reader.count("trials"), 0)
+            payload = session_store.load_session_payload(tmp)
+            self.assertEqual((payload["schema_version"], payload["datapoints"], payload["session_store_path"]), ("v", [], str(path)))
+
+    def test_missing_or_foreign_files_are_not_stores(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(session_store.open_session_store(tmp))
+            self.assertIsNone(session_store.open_session_store(None))
+            junk = Path(tmp) / session_store.SESSION_STORE_NAME
+            junk.write_bytes(b"not a database")
+            self.assertIsNone(session_store.open_session_store(junk))
+            self.assertIsNone(session_store.load_session_payload(tmp))
+            with session_store.SessionStore(Path(tmp) / "s.sqlite") as store, self.assertRaises(ValueError):
+                store.append("other", [{"a": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Regression tests for the trial result cache."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utilities import trial_cache
+
+
+class TrialCacheTests(unittest.TestCase):
+    def test_keys_follow_file_contents_and_slots_hold_one_sample_each(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            binary = root / "solver"
+            binary.write_bytes(b"v1")
+            pattern = root / "pattern.lad"
+            pattern.write_text("3\n", encoding="utf-8")
+            inputs = {"lad_pattern": pattern, "lad_format": "lad"}
+            cache = trial_cache.TrialCache(root / "cache", context={"host": {"node": "lab-1"}})
+            key = cache.trial_key("glasgow_baseline", binary, inputs)
+
+            self.assertNotEqual(key, cache.trial_key("glasgow_baseline", binary, {**inputs, "lad_format": "csv"}))
+            self.assertNotEqual(key, trial_cache.TrialCache(root / "cache", context={"host": {"node": "lab-2"}}).trial_key("glasgow_baseline", binary, inputs))
+            self.assertIsNone(cache.trial_key("glasgow_baseline", binary, {"lad_pattern": root / "missing.lad"}))
+
+            # Repeated trials on identical inputs (dataset iterations) occupy successive slots.
+            first, second = cache.slot("glasgow_baseline", binary, inputs), cache.slot("glasgow_baseline", binary, inputs)
+            self.assertEqual((first, second), ((key, 0), (key, 1)))
+            self.assertIsNone(cache.load(*first))
+            cache.store(*first, {"variant_id": "glasgow_baseline", "runtime_ms": 4.0, "answer_signature": ("solution_count", 2), "stdout_path": root / "x"}, source={"session_dir": "s1"})
+            cache.store(*second, {"variant_id": "glasgow_baseline", "runtime_ms": 5.0}, source={"session_dir": "s1"})
+            sample = cache.load(*first)
+            self.assertEqual((sample["runtime_ms"], sample["answer_signature"], sample["source"]), (4.0, ("solution_count", 2), {"session_dir": "s1"}))
+            self.assertNotIn("stdout_path", sample)
+            self.assertEqual(cache.load(*second)["runtime_ms"], 5.0)
+            self.assertEqual(cache.stats, {"hits": 2, "misses": 1, "stored": 2, "forced_fresh": 0})
+
+            # Rewriting an input changes the key; a corrupt or foreign entry reads as empty.
+            pattern.write_text("4\n", encoding="utf-8")
+            self.assertNotEqual(key, trial_cache.TrialCache(root / "cache", context={"host": {"node": "lab-1"}}).trial_key("glasgow_baseline", binary, inputs))
+            cache.entry_path(key).write_text("{}", encoding="utf-8")
+            self.assertIsNone(cache.load(key, 0))
+
+    def test_runner_build_environment_does_not_change_keys(self):
+        from desktop_runner import headless_runner
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            binary = root / "solver"
+            binary.write_bytes(b"v1")
+            config = {"trial_cache": True, "trial_cache_dir": str(root / "cache")}
+            with mock.patch.dict(os.environ, {"CXXFLAGS": "-O2"}):
+                key = headless_runner.open_trial_cache(config).trial_key("vf3_baseline", binary, {})
+            with mock.patch.dict(os.environ, {"CXXFLAGS": "-O3 -march=native"}):
+                self.assertEqual(headless_runner.open_trial_cache(config).trial_key("vf3_baseline", binary, {}), key)
+            # Only the binary itself says how it was built.
+            binary.write_bytes(b"v1 rebuilt with -O3")
+            self.assertNotEqual(headless_runner.open_trial_cache(config).trial_key("vf3_baseline", binary, {}), key)
+
+
+if __name__ == "__main__":
+    unittest.main()
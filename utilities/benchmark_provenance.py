@@ -70,14 +70,7 @@ def _load_json_if_exists(path: Path) -> dict | None:
     return payload if isinstance(payload, dict) else None
 
 
-def collect_runtime_provenance(
-    *,
-    repo_root: Path | None = None,
-    env: dict[str, str] | None = None,
-    binaries_manifest_path: Path | None = None,
-) -> dict:
-    repo_root = (repo_root or Path.cwd()).resolve()
-    env_map = {str(k): str(v) for k, v in (env or os.environ).items()}
+def _hardware_counts() -> tuple[int | None, int | None, int | None]:
     logical_cores = None
     physical_cores = None
     memory_total_bytes = None
@@ -96,6 +89,45 @@ def collect_runtime_provenance(
             memory_total_bytes = None
     if logical_cores is None:
         logical_cores = int(os.cpu_count() or 0) or None
+    return logical_cores, physical_cores, memory_total_bytes
+
+
+def collect_build_flags(env: dict[str, str] | None = None) -> dict[str, str]:
+    env_map = {str(k): str(v) for k, v in (env or os.environ).items()}
+    build_flags = {
+        "CMAKE_GENERATOR": env_map.get("CMAKE_GENERATOR") or None,
+        "CFLAGS": env_map.get("CFLAGS") or None,
+        "CXXFLAGS": env_map.get("CXXFLAGS") or None,
+        "CPPFLAGS": env_map.get("CPPFLAGS") or None,
+        "LDFLAGS": env_map.get("LDFLAGS") or None,
+    }
+    return {key: value for key, value in build_flags.items() if value not in {None, ""}}
+
+
+def collect_host_fingerprint() -> dict:
+    """The host fields that affect measured runtimes, without the slower toolchain probes."""
+    logical_cores, physical_cores, memory_total_bytes = _hardware_counts()
+    return {
+        "node": platform.node() or None,
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "logical_cores": logical_cores,
+        "physical_cores": physical_cores,
+        "memory_total_bytes": memory_total_bytes,
+    }
+
+
+def collect_runtime_provenance(
+    *,
+    repo_root: Path | None = None,
+    env: dict[str, str] | None = None,
+    binaries_manifest_path: Path | None = None,
+) -> dict:
+    repo_root = (repo_root or Path.cwd()).resolve()
+    env_map = {str(k): str(v) for k, v in (env or os.environ).items()}
+    logical_cores, physical_cores, memory_total_bytes = _hardware_counts()
 
     def tool_info(name: str, version_args: list[str] | None = None) -> dict | None:
         path = shutil.which(name, path=env_map.get("PATH"))
@@ -106,14 +138,7 @@ def collect_runtime_provenance(
             "version": _run_version_command([path, *(version_args or ["--version"])]),
         }
 
-    build_flags = {
-        "CMAKE_GENERATOR": env_map.get("CMAKE_GENERATOR") or None,
-        "CFLAGS": env_map.get("CFLAGS") or None,
-        "CXXFLAGS": env_map.get("CXXFLAGS") or None,
-        "CPPFLAGS": env_map.get("CPPFLAGS") or None,
-        "LDFLAGS": env_map.get("LDFLAGS") or None,
-    }
-    build_flags = {key: value for key, value in build_flags.items() if value not in {None, ""}}
+    build_flags = collect_build_flags(env_map)
 
     git_sha = env_map.get("GITHUB_SHA") or _git_output(repo_root, ["rev-parse", "HEAD"])
     git_ref = (
@@ -138,6 +163,7 @@ def collect_runtime_provenance(
                 "implementation": platform.python_implementation(),
             },
             "platform": {
+                "node": platform.node() or None,
                 "system": platform.system(),
                 "release": platform.release(),
                 "version": platform.version(),
@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+# - Shared by the desktop/headless runners and the CI workflow runner so both
+#   report identical runtime comparisons for identical samples.
+# - Student-t tails use the closed form p = I_x(df/2, 1/2), x = df/(df+t^2), with
+#   the regularized incomplete beta evaluated as a continued fraction; critical
+#   values invert that tail with safeguarded Newton steps and are memoized per
+#   (alpha, df), which repeats across every pair of a session.
+# - `summarize_runtime_comparisons` evaluates all pairs of a session together:
+#   with NumPy and enough pairs the t-test tails come from one vectorized
+#   continued fraction; otherwise the scalar path gives the same numbers.
+# - Cliff's delta is O(n log n): a merge walk over both sorted samples, or
+#   2U/(n*m) - 1 from the Mann-Whitney rank sum the summary computes anyway.
+# - Bootstrap ratio CIs resample both groups independently (percentile method).
+#   With NumPy all replicates of a group are drawn as one index matrix whose
+#   sorted rows give the resampled medians directly; comparisons are seeded by (seed, position), so results do
+#   not depend on how they are spread over worker processes.
+
+import concurrent.futures
+import functools
+import math
+import multiprocessing
+import os
+import random
+import statistics
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+_BETA_CF_MAX_ITER = 300
+_BETA_CF_EPS = 3e-16
+_BETA_CF_TINY = 1e-300
+# Below this many tails the scalar loop beats NumPy's per-call overhead.
+_VECTORIZE_MIN_PAIRS = 128
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+# Resampled values per gathered block; bounds peak memory for long sample lists.
+_BOOTSTRAP_BLOCK_VALUES = 4_000_000
+# Below this many resampled values in total, spawning workers costs more than it saves.
+_BOOTSTRAP_PARALLEL_MIN_VALUES = 100_000_000
+
+
+def _finite_samples(values) -> list[float]:
+    return [float(v) for v in values if isinstance(v, (int, float)) and math.isfinite(float(v))]
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    # Modified Lentz evaluation of the incomplete beta continued fraction.
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    c = 1.0
+    d = 1.0 - (qab * x / qap)
+    if abs(d) < _BETA_CF_TINY:
+        d = _BETA_CF_TINY
+    d = 1.0 / d
+    h = d
+    for m in range(1, _BETA_CF_MAX_ITER + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + (aa * d)
+        if abs(d) < _BETA_CF_TINY:
+            d = _BETA_CF_TINY
+        c = 1.0 + (aa / c)
+        if abs(c) < _BETA_CF_TINY:
+            c = _BETA_CF_TINY
+        d = 1.0 / d
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + (aa * d)
+        if abs(d) < _BETA_CF_TINY:
+            d = _BETA_CF_TINY
+        c = 1.0 + (aa / c)
+        if abs(c) < _BETA_CF_TINY:
+            c = _BETA_CF_TINY
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) <= _BETA_CF_EPS:
+            break
+    return h
+
+
+def regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    """I_x(a, b) for a, b > 0 and 0 <= x <= 1."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + (a * math.log(x)) + (b * math.log1p(-x))
+    # The fraction converges fast only left of the mode; use I_x(a,b) = 1 - I_{1-x}(b,a) beyond it.
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - (math.exp(log_front) * _beta_continued_fraction(b, a, 1.0 - x) / b)
+
+
+def student_t_two_sided_p_value(t_stat: float, degrees_of_freedom: int) -> float | None:
+    if not math.isfinite(t_stat):
+        return None
+    df = int(degrees_of_freedom)
+    if df <= 0:
+        return None
+    x = abs(float(t_stat))
+    if x <= 0.0:
+        return 1.0
+    p_value = regularized_incomplete_beta(df * 0.5, 0.5, df / (df + (x * x)))
+    return max(0.0, min(1.0, p_value))
+
+
+def _student_t_pdf(t: float, df: int) -> float:
+    log_c = math.lgamma((df + 1.0) * 0.5) - math.lgamma(df * 0.5) - 0.5 * math.log(df * math.pi)
+    return math.exp(log_c - ((df + 1.0) * 0.5) * math.log1p((t * t) / float(df)))
+
+
+@functools.lru_cache(maxsize=512)
+def _student_t_critical(alpha: float, df: int) -> float:
+    lo = 0.0
+    hi = 1.0
+    while student_t_two_sided_p_value(hi, df) > alpha and hi < 1e12:
+        lo = hi
+        hi *= 2.0
+    t = (lo + hi) * 0.5
+    for _ in range(100):
+        excess = student_t_two_sided_p_value(t, df) - alpha
+        if excess > 0.0:
+            lo = t
+        else:
+            hi = t
+        # d/dt of the two-sided tail is -2 * pdf(t); fall back to bisection outside the bracket.
+        slope = 2.0 * _student_t_pdf(t, df)
+        next_t = t + (excess / slope) if slope > 0.0 else hi
+        if not lo < next_t < hi:
+            next_t = (lo + hi) * 0.5
+        if abs(next_t - t) <= 1e-13 * max(1.0, t):
+            return next_t
+        t = next_t
+    return hi
+
+
+def student_t_critical_two_sided(alpha: float, degrees_of_freedom: int) -> float | None:
+    df = int(degrees_of_freedom)
+    if df <= 0:
+        return None
+    target = float(alpha)
+    if not math.isfinite(target) or target <= 0.0 or target >= 1.0:
+        return None
+    return _student_t_critical(target, df)
+
+
+def student_t_two_sided_p_values(t_stats, degrees_of_freedom) -> list[float | None]:
+    """Vectorized ``student_t_two_sided_p_value``; scalar loop without NumPy."""
+    t_list = [float(t) for t in t_stats]
+    df_list = [int(df) for df in degrees_of_freedom]
+    if np is None or len(t_list) < _VECTORIZE_MIN_PAIRS:
+        return [student_t_two_sided_p_value(t, df) for t, df in zip(t_list, df_list)]
+    t_arr = np.abs(np.asarray(t_list, dtype=np.float64))
+    df_arr = np.asarray(df_list, dtype=np.float64)
+    valid = np.isfinite(t_arr) & (df_arr > 0)
+    out = np.ones(t_arr.size, dtype=np.float64)
+    with np.errstate(over="ignore", divide="ignore"):
+        x = df_arr / (df_arr + (t_arr * t_arr))
+    # x rounds to 1 for |t| far below 1/sqrt(df); the scalar path returns 1 there too.
+    live = valid & (x < 1.0)
+    if live.any():
+        with np.errstate(divide="ignore"):
+            out[live] = np.clip(_regularized_incomplete_beta_half(df_arr[live] * 0.5, x[live]), 0.0, 1.0)
+    return [float(p) if ok else None for p, ok in zip(out.tolist(), valid.tolist())]
+
+
+def _regularized_incomplete_beta_half(a, x):
+    # NumPy I_x(a, 1/2) for arrays a > 0 and 0 < x < 1, mirroring the scalar path.
+    b = 0.5
+    unique_a, inverse = np.unique(a, return_inverse=True)
+    lgamma_a = np.asarray([math.lgamma(v) for v in unique_a.tolist()])[inverse]
+    lgamma_ab = np.asarray([math.lgamma(v + b) for v in unique_a.tolist()])[inverse]
+    log_front = lgamma_ab - lgamma_a - math.lgamma(b) + (a * np.log(x)) + (b * np.log1p(-x))
+    front = np.exp(log_front)
+    direct = x < (a + 1.0) / (a + b + 2.0)
+    pa = np.where(direct, a, b)
+    pb = np.where(direct, b, a)
+    px = np.where(direct, x, 1.0 - x)
+    fraction = _beta_continued_fraction_array(pa, pb, px)
+    return np.where(direct, front * fraction / a, 1.0 - (front * fraction / b))
+
+
+def _beta_continued_fraction_array(a, b, x):
+    def _guard(v):
+        return np.where(np.abs(v) < _BETA_CF_TINY, _BETA_CF_TINY, v)
+
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    c = np.ones_like(x)
+    d = 1.0 / _guard(1.0 - (qab * x / qap))
+    h = d.copy()
+    active = np.ones(x.shape, dtype=bool)
+    for m in range(1, _BETA_CF_MAX_ITER + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 / _guard(1.0 + (aa * d))
+        c = _guard(1.0 + (aa / c))
+        h = np.where(active, h * d * c, h)
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 / _guard(1.0 + (aa * d))
+        c = _guard(1.0 + (aa / c))
+        delta = d * c
+        h = np.where(active, h * delta, h)
+        active &= np.abs(delta - 1.0) > _BETA_CF_EPS
+        if not active.any():
+            break
+    return h
+
+
+def normal_two_sided_p_value_from_z(z_score: float) -> float | None:
+    if not math.isfinite(z_score):
+        return None
+    tail = 0.5 * math.erfc(abs(float(z_score)) / math.sqrt(2.0))
+    return max(0.0, min(1.0, 2.0 * tail))
+
+
+def cliffs_delta(left: list[float], right: list[float]) -> float | None:
+    a = sorted(_finite_samples(left))
+    b = sorted(_finite_samples(right))
+    if not a or not b:
+        return None
+    # Merge walk over both sorted samples: for each x, `below`/`not_above` count
+    # the right-hand values < x and <= x, and only ever move forward.
+    greater = 0
+    less = 0
+    below = 0
+    not_above = 0
+    for x in a:
+        while below < len(b) and b[below] < x:
+            below += 1
+        not_above = max(not_above, below)
+        while not_above < len(b) and b[not_above] <= x:
+            not_above += 1
+        greater += below
+        less += len(b) - not_above
+    return float(greater - less) / float(len(a) * len(b))
+
+
+def mann_whitney_u_test(left: list[float], right: list[float]) -> dict:
+    return _mann_whitney(_finite_samples(left), _finite_samples(right))[0]
+
+
+def _mann_whitney(x: list[float], y: list[float]) -> tuple[dict, float | None]:
+    # Also returns U of the left sample, from which Cliff's delta is 2U/(nx*ny) - 1.
+    nx = len(x)
+    ny = len(y)
+    if nx == 0 or ny == 0:
+        return {
+            "u_stat": None,
+            "u_stat_alt": None,
+            "z_score": None,
+            "p_value_two_sided": None,
+        }, None
+
+    combined = [(val, 0) for val in x] + [(val, 1) for val in y]
+    combined.sort(key=lambda item: item[0])
+    rank_sum_x = 0.0
+    tie_sizes: list[int] = []
+    idx = 0
+    while idx < len(combined):
+        j = idx + 1
+        while j < len(combined) and combined[j][0] == combined[idx][0]:
+            j += 1
+        avg_rank = (float(idx + 1) + float(j)) * 0.5
+        block = combined[idx:j]
+        tie_sizes.append(len(block))
+        rank_sum_x += avg_rank * float(sum(1 for _value, grp in block if grp == 0))
+        idx = j
+
+    u_x = rank_sum_x - (float(nx) * float(nx + 1) * 0.5)
+    u_y = float(nx * ny) - u_x
+    u_stat = min(u_x, u_y)
+    mean_u = float(nx * ny) * 0.5
+
+    n_total = nx + ny
+    tie_term = sum(float(t * t * t - t) for t in tie_sizes)
+    denom = float(n_total * n_total * n_total - n_total)
+    tie_correction = 1.0 - (tie_term / denom) if denom > 0.0 else 1.0
+    sigma_sq = float(nx * ny * (n_total + 1)) / 12.0
+    sigma_sq *= max(0.0, tie_correction)
+
+    if sigma_sq <= 0.0:
+        if abs(u_stat - mean_u) <= 1e-12:
+            z_score = 0.0
+            p_value = 1.0
+        else:
+            z_score = math.copysign(float("inf"), u_stat - mean_u)
+            p_value = 0.0
+    else:
+        sigma = math.sqrt(sigma_sq)
+        z_score = (u_stat - mean_u) / sigma
+        p_value = normal_two_sided_p_value_from_z(z_score)
+
+    return {
+        "u_stat": float(u_stat),
+        "u_stat_alt": float(max(u_x, u_y)),
+        "z_score": None if z_score is None else float(z_score),
+        "p_value_two_sided": None if p_value is None else float(p_value),
+    }, u_x
+
+
+def _paired_delta_moments(variant: list[float], baseline: list[float]) -> dict | None:
+    pair_count = min(len(variant), len(baseline))
+    if pair_count <= 0:
+        return None
+    deltas = [variant[i] - baseline[i] for i in range(pair_count)]
+    # fsum keeps these correctly rounded without statistics' exact-fraction cost.
+    mean_delta = math.fsum(deltas) / float(pair_count)
+    sd_delta = math.sqrt(math.fsum((d - mean_delta) ** 2 for d in deltas) / float(pair_count - 1)) if pair_count >= 2 else 0.0
+    moments = {
+        "n": pair_count,
+        "mean": mean_delta,
+        "median": float(statistics.median(deltas)),
+        "sd": sd_delta,
+        "se": None,
+        "t_stat": None,
+        "p_value": None,
+    }
+    if pair_count < 2:
+        return moments
+    if sd_delta <= 0.0:
+        if abs(mean_delta) <= 1e-12:
+            moments.update(t_stat=0.0, p_value=1.0)
+        else:
+            moments.update(t_stat=math.copysign(float("inf"), mean_delta), p_value=0.0)
+        return moments
+    se = sd_delta / math.sqrt(float(pair_count))
+    moments.update(se=se, t_stat=mean_delta / se)
+    return moments
+
+
+def _runtime_comparison_summary(variant: list[float], baseline: list[float], moments: dict | None, alpha: float) -> dict:
+    mann_whitney, u_variant = _mann_whitney(variant, baseline)
+    cliffs = None if u_variant is None else ((2.0 * u_variant) - float(len(variant) * len(baseline))) / float(len(variant) * len(baseline))
+    if moments is None:
+        return {
+            "n": 0,
+            "mean_delta_ms": None,
+            "median_delta_ms": None,
+            "stdev_delta_ms": None,
+            "delta_ci_95_ms": {"low": None, "high": None},
+            "paired_t_test": {"t_stat": None, "degrees_of_freedom": 0, "p_value_two_sided": None},
+            "mann_whitney_u": mann_whitney,
+            "effect_sizes": {
+                "cohen_d": None,
+                "hedges_g": None,
+                "cliffs_delta": cliffs,
+            },
+            "direction": "insufficient_data",
+            "significant_at_alpha": None,
+            "alpha": float(alpha),
+        }
+
+    pair_count = int(moments["n"])
+    mean_delta = float(moments["mean"])
+    sd_delta = float(moments["sd"])
+    t_stat = moments["t_stat"]
+    p_value = moments["p_value"]
+    if pair_count < 2:
+        ci_low = None
+        ci_high = None
+    elif moments["se"] is None:
+        ci_low = mean_delta
+        ci_high = mean_delta
+    else:
+        t_crit = student_t_critical_two_sided(alpha, pair_count - 1)
+        if t_crit is None:
+            ci_low = None
+            ci_high = None
+        else:
+            half = float(t_crit) * float(moments["se"])
+            ci_low = mean_delta - half
+            ci_high = mean_delta + half
+
+    if pair_count < 2:
+        cohen_d = None
+    elif sd_delta <= 0.0:
+        cohen_d = 0.0 if abs(mean_delta) <= 1e-12 else math.copysign(float("inf"), mean_delta)
+    else:
+        cohen_d = mean_delta / sd_delta
+    if cohen_d is None:
+        hedges_g = None
+    else:
+        correction = 1.0 if pair_count <= 2 else (1.0 - (3.0 / ((4.0 * float(pair_count)) - 5.0)))
+        hedges_g = float(cohen_d) * correction
+
+    if abs(mean_delta) <= 1e-12:
+        direction = "equal"
+    elif mean_delta > 0.0:
+        direction = "slower"
+    else:
+        direction = "faster"
+
+    return {
+        "n": int(pair_count),
+        "mean_delta_ms": float(mean_delta),
+        "median_delta_ms": float(moments["median"]),
+        "stdev_delta_ms": float(sd_delta),
+        "delta_ci_95_ms": {
+            "low": None if ci_low is None else float(ci_low),
+            "high": None if ci_high is None else float(ci_high),
+        },
+        "paired_t_test": {
+            "t_stat": None if t_stat is None else float(t_stat),
+            "degrees_of_freedom": int(max(0, pair_count - 1)),
+            "p_value_two_sided": None if p_value is None else float(p_value),
+        },
+        "mann_whitney_u": mann_whitney,
+        "effect_sizes": {
+            "cohen_d": None if cohen_d is None else float(cohen_d),
+            "hedges_g": None if hedges_g is None else float(hedges_g),
+            "cliffs_delta": cliffs,
+        },
+        "direction": direction,
+        "significant_at_alpha": None if p_value is None else bool(p_value < float(alpha)),
+        "alpha": float(alpha),
+    }
+
+
+def summarize_runtime_comparisons(
+    pairs: list[tuple[list[float], list[float]]],
+    *,
+    alpha: float = 0.05,
+) -> list[dict]:
+    """``summarize_runtime_comparison`` for many ``(variant_samples, baseline_samples)`` pairs at once."""
+    cleaned = [(_finite_samples(variant), _finite_samples(baseline)) for variant, baseline in pairs]
+    moments = [_paired_delta_moments(variant, baseline) for variant, baseline in cleaned]
+    pending = [item for item in moments if item is not None and item["se"] is not None]
+    p_values = student_t_two_sided_p_values(
+        [item["t_stat"] for item in pending],
+        [item["n"] - 1 for item in pending],
+    )
+    for item, p_value in zip(pending, p_values):
+        item["p_value"] = p_value
+    return [
+        _runtime_comparison_summary(variant, baseline, item, alpha)
+        for (variant, baseline), item in zip(cleaned, moments)
+    ]
+
+
+def summarize_runtime_comparison(
+    *,
+    variant_samples_ms: list[float],
+    baseline_samples_ms: list[float],
+    alpha: float = 0.05,
+) -> dict:
+    return summarize_runtime_comparisons([(variant_samples_ms, baseline_samples_ms)], alpha=alpha)[0]
+
+
+def _empty_ratio_ci(n_variant: int, n_baseline: int) -> dict:
+    return {"estimate": None, "ci_low": None, "ci_high": None, "n_variant": n_variant, "n_baseline": n_baseline, "resamples_used": 0}
+
+
+def _bootstrap_medians_numpy(values: list[float], resamples: int, rng) -> "np.ndarray":
+    # Medians of resamples of sorted data are read off the sorted resampled indices,
+    # which sorts small integers instead of partitioning gathered floats.
+    data = np.sort(np.asarray(values, dtype=np.float64))
+    lo_rank = (data.size - 1) // 2
+    hi_rank = data.size // 2
+    out = np.empty(resamples, dtype=np.float64)
+    block = max(1, _BOOTSTRAP_BLOCK_VALUES // data.size)
+    for start in range(0, resamples, block):
+        stop = min(resamples, start + block)
+        picks = rng.integers(0, data.size, size=(stop - start, data.size))
+        picks.sort(axis=1)
+        out[start:stop] = (data[picks[:, lo_rank]] + data[picks[:, hi_rank]]) * 0.5
+    return out
+
+
+def bootstrap_median_ratio_ci(
+    variant: list[float],
+    baseline: list[float],
+    *,
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    alpha: float = 0.05,
+    seed: int = 0,
+    position: int = 0,
+) -> dict:
+    """Percentile bootstrap CI for median(variant) / median(baseline).
+
+    ``estimate`` is the ratio on the observed samples; the interval needs at
+    least two samples per group and is ``None`` otherwise.
+    """
+    x = _finite_samples(variant)
+    y = _finite_samples(baseline)
+    result = _empty_ratio_ci(len(x), len(y))
+    if not x or not y:
+        return result
+    baseline_median = float(statistics.median(y))
+    if baseline_median <= 0.0:
+        return result
+    result["estimate"] = float(statistics.median(x)) / baseline_median
+    if len(x) < 2 or len(y) < 2 or int(resamples) <= 0:
+        return result
+    resamples = int(resamples)
+    if np is not None:
+        rng = np.random.default_rng(np.random.SeedSequence(int(seed), spawn_key=(int(position),)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = _bootstrap_medians_numpy(x, resamples, rng) / _bootstrap_medians_numpy(y, resamples, rng)
+        ratios = ratios[np.isfinite(ratios)]
+        if ratios.size == 0:
+            return result
+        low, high = np.quantile(ratios, [alpha * 0.5, 1.0 - (alpha * 0.5)])
+        result.update(ci_low=float(low), ci_high=float(high), resamples_used=int(ratios.size))
+        return result
+    rng = random.Random(f"{int(seed)}:{int(position)}")
+    ratios = []
+    for _ in range(resamples):
+        denominator = statistics.median(rng.choices(y, k=len(y)))
+        if denominator > 0.0:
+            ratios.append(statistics.median(rng.choices(x, k=len(x))) / denominator)
+    if not ratios:
+        return result
+    ratios.sort()
+    # Same linear interpolation as numpy.quantile's default.
+    bounds = []
+    for q in (alpha * 0.5, 1.0 - (alpha * 0.5)):
+        pos = q * float(len(ratios) - 1)
+        lo = int(math.floor(pos))
+        hi = min(len(ratios) - 1, lo + 1)
+        bounds.append(ratios[lo] + ((ratios[hi] - ratios[lo]) * (pos - float(lo))))
+    result.update(ci_low=float(bounds[0]), ci_high=float(bounds[1]), resamples_used=len(ratios))
+    return result
+
+
+def _bootstrap_ratio_chunk(jobs: list[tuple[int, list[float], list[float]]], resamples: int, alpha: float, seed: int) -> list[dict]:
+    return [
+        bootstrap_median_ratio_ci(variant, baseline, resamples=resamples, alpha=alpha, seed=seed, position=position)
+        for position, variant, baseline in jobs
+    ]
+
+
+def bootstrap_median_ratio_cis(
+    pairs: list[tuple[list[float], list[float]]],
+    *,
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    alpha: float = 0.05,
+    seed: int = 0,
+    max_processes: int | None = None,
+) -> list[dict]:
+    """``bootstrap_median_ratio_ci`` for every ``(variant, baseline)`` pair, in input order.
+
+    Batches large enough to outweigh worker start-up are split into one chunk
+    per process; ``max_processes`` defaults to (and is capped by) the CPU
+    count and ``1`` keeps everything in-process.
+    """
+    jobs = [(position, list(variant), list(baseline)) for position, (variant, baseline) in enumerate(pairs)]
+    workload = int(resamples) * sum(len(variant) + len(baseline) for _position, variant, baseline in jobs)
+    cpu_count = os.cpu_count() or 1
+    processes = int(max(1, min(len(jobs), cpu_count, max_processes or cpu_count)))
+    if processes <= 1 or workload < _BOOTSTRAP_PARALLEL_MIN_VALUES:
+        return _bootstrap_ratio_chunk(jobs, resamples, alpha, seed)
+    chunks = [jobs[idx::processes] for idx in range(processes)]
+    results: dict[int, dict] = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [(chunk, executor.submit(_bootstrap_ratio_chunk, chunk, resamples, alpha, seed)) for chunk in chunks]
+        for chunk, future in futures:
+            for (position, _variant, _baseline), row in zip(chunk, future.result()):
+                results[position] = row
+    return [results[position] for position in range(len(jobs))]
@@ -10,6 +10,8 @@ import heapq
 import re
 from pathlib import Path
 
+from utilities.csr_graph import load_csr_sidecar
+
 
 INF_DISTANCE = 10**18
 
@@ -91,6 +93,50 @@ def extract_path_tokens(output_text: str) -> list[str]:
     return []
 
 
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+_TIME_UNIT_TO_MS = {
+    "ns": 1e-6,
+    "us": 1e-3,
+    "\u00b5s": 1e-3,
+    "ms": 1.0,
+    "s": 1000.0,
+    "sec": 1000.0,
+    "secs": 1000.0,
+    "seconds": 1000.0,
+}
+
+
+def parse_internal_timings(output_text: str, family: str | None = None) -> dict:
+    """Extract solver-reported timings (milliseconds) from stdout/stderr.
+
+    Recognized forms:
+    - ``Runtime: <value>[unit]`` (generated solvers; bare values are seconds)
+    - ``runtime = <value>[unit]`` (Glasgow; bare values are milliseconds)
+    - VF3 terse ``<solutions> <first_time> <all_time>`` in seconds, only for
+      ``family`` ``vf3`` or ``None`` since bare numeric triples are ambiguous
+    """
+    timings = {"internal_runtime_ms": None, "internal_first_solution_ms": None}
+    lines = [line.strip() for line in str(output_text or "").replace("\r", "").split("\n") if line.strip()]
+    for line in lines:
+        match = re.fullmatch(rf"(?i)(?:total\s+)?runtime\s*([:=])\s*({_NUMBER})\s*([a-z\u00b5]+)?\.?", line)
+        if not match:
+            continue
+        unit = (match.group(3) or ("s" if match.group(1) == ":" else "ms")).lower()
+        scale = _TIME_UNIT_TO_MS.get(unit)
+        if scale is None:
+            continue
+        timings["internal_runtime_ms"] = float(match.group(2)) * scale
+        return timings
+    if family in {None, "vf3"}:
+        for line in lines:
+            match = re.fullmatch(rf"(-?\d+)\s+({_NUMBER})\s+({_NUMBER})", line)
+            if match:
+                timings["internal_first_solution_ms"] = float(match.group(2)) * 1000.0
+                timings["internal_runtime_ms"] = float(match.group(3)) * 1000.0
+                return timings
+    return timings
+
+
 def dijkstra(adj: list[list[tuple[int, int]]], start: int) -> tuple[list[int], list[int]]:
     n = len(adj)
     dist = [INF_DISTANCE] * n
@@ -110,7 +156,34 @@ def dijkstra(adj: list[list[tuple[int, int]]], start: int) -> tuple[list[int], l
     return dist, parent
 
 
+def dijkstra_csr(indptr, indices, weights, start: int, target: int) -> int:
+    """Distance from ``start`` to ``target`` over CSR arrays; stops once ``target`` settles."""
+    dist = {start: 0}
+    pq: list[tuple[int, int]] = [(0, start)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if u == target:
+            return d
+        if d != dist[u]:
+            continue
+        for edge in range(indptr[u], indptr[u + 1]):
+            v = indices[edge]
+            nd = d + weights[edge]
+            if nd < dist.get(v, INF_DISTANCE):
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+    return INF_DISTANCE
+
+
 def shortest_path_oracle(path: Path) -> tuple[int | None, str | None]:
+    graph = load_csr_sidecar(path)
+    if graph is not None:
+        # Converted datasets carry a CSR sidecar (never a via node); skip parsing the CSV.
+        with graph:
+            if graph.start < 0 or graph.target < 0:
+                return None, None
+            distance = dijkstra_csr(graph.indptr, graph.indices, graph.weights, graph.start, graph.target)
+        return (None if distance >= INF_DISTANCE else int(distance)), None
     parsed = parse_shortest_path_input(path)
     labels = list(parsed["labels"])
     label_to_idx = {label: idx for idx, label in enumerate(labels)}
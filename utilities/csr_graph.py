@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+# - A CSR sidecar is a read-only binary copy of a converted shortest-path CSV:
+#   node labels, row offsets, column indices and weights, each a little-endian
+#   section that readers map with mmap and view through memoryview.cast, so
+#   opening a 10^7-edge graph costs no parsing and no copy.
+# - The JSON header records the size and mtime of the CSV it was built from; a
+#   sidecar whose CSV changed since is ignored and readers fall back to the CSV.
+# - Only integer-labelled graphs get a sidecar (labels are int64). Building the
+#   arrays needs NumPy; reading never does.
+
+import json
+import mmap
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+CSR_FORMAT = "capstone-csr-v1"
+CSR_SUFFIX = ".csr"
+_MAGIC = b"CAPCSR1\n"
+_HEADER_BYTES = 4096
+_ALIGN = 64
+
+
+def sidecar_path_for(csv_path: Path) -> Path:
+    return Path(csv_path).with_suffix(CSR_SUFFIX)
+
+
+def _source_fingerprint(csv_path: Path) -> dict[str, int]:
+    stat = Path(csv_path).stat()
+    return {"size_bytes": int(stat.st_size), "mtime_ns": int(stat.st_mtime_ns)}
+
+
+def _typecode(view: memoryview) -> str:
+    # Sized codes only: native "l" is 8 bytes on Linux but 4 on Windows.
+    signed = view.format.lstrip("<=@").islower()
+    codes = {(8, True): "q", (8, False): "Q", (4, True): "i", (4, False): "I"}
+    try:
+        return codes[(view.itemsize, signed)]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported CSR section element format: {view.format}") from exc
+
+
+def build_csr_arrays(src, dst, weights) -> dict[str, Any]:
+    """Group edge rows by source: returns sorted unique ``labels`` and CSR ``indptr``/``indices``/``weights``.
+
+    ``src``/``dst`` are integer node labels, ``weights`` per-row integers; row order
+    within each source is preserved. Requires NumPy.
+    """
+    if np is None:
+        raise RuntimeError("Building a CSR sidecar requires NumPy.")
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    labels = np.unique(np.concatenate((src, dst)))
+    span = int(labels[-1]) - int(labels[0]) + 1 if labels.size else 0
+    if span == labels.size:
+        src_idx = src - labels[0]
+        dst_idx = dst - labels[0]
+    elif span <= 4 * labels.size:
+        # Sparse-but-compact ids (SNAP): a dense lookup table beats two binary searches.
+        lookup = np.full(span, -1, dtype=np.int64)
+        lookup[labels - labels[0]] = np.arange(labels.size, dtype=np.int64)
+        src_idx = lookup[src - labels[0]]
+        dst_idx = lookup[dst - labels[0]]
+    else:
+        src_idx = np.searchsorted(labels, src)
+        dst_idx = np.searchsorted(labels, dst)
+    order = np.argsort(src_idx, kind="stable")
+    indptr = np.zeros(labels.size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src_idx, minlength=labels.size), out=indptr[1:])
+    index_dtype = np.uint32 if labels.size < 2**32 else np.int64
+    weight_dtype = np.int32 if weights.size == 0 or (int(weights.min()) >= -(2**31) and int(weights.max()) < 2**31) else np.int64
+    return {
+        "labels": labels,
+        "indptr": indptr,
+        "indices": dst_idx[order].astype(index_dtype),
+        "weights": weights[order].astype(weight_dtype),
+    }
+
+
+def label_index(labels, label: int | str | None) -> int:
+    """Position of ``label`` in sorted int64 ``labels``, or -1."""
+    try:
+        value = int(str(label))
+    except (TypeError, ValueError):
+        return -1
+    lo, hi = 0, len(labels)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if int(labels[mid]) < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo if lo < len(labels) and int(labels[lo]) == value else -1
+
+
+def write_csr_sidecar(
+    csv_path: Path,
+    *,
+    labels,
+    indptr,
+    indices,
+    weights,
+    start_label: str,
+    target_label: str,
+) -> Path:
+    """Write the sidecar for ``csv_path`` (which must already be complete) and return its path."""
+    if sys.byteorder != "little":
+        raise RuntimeError("CSR sidecars are only written on little-endian hosts.")
+    sections = {"labels": labels, "indptr": indptr, "indices": indices, "weights": weights}
+    views = {name: memoryview(value) for name, value in sections.items()}
+    offset = _HEADER_BYTES
+    layout: dict[str, dict[str, Any]] = {}
+    for name, view in views.items():
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout[name] = {"offset": offset, "typecode": _typecode(view), "count": len(view)}
+        offset += view.nbytes
+    header = {
+        "format": CSR_FORMAT,
+        "nodes": len(views["labels"]),
+        "edges": len(views["indices"]),
+        "start_label": str(start_label),
+        "target_label": str(target_label),
+        "start": label_index(views["labels"].cast("B").cast(layout["labels"]["typecode"]), start_label),
+        "target": label_index(views["labels"].cast("B").cast(layout["labels"]["typecode"]), target_label),
+        "source": _source_fingerprint(csv_path),
+        "sections": layout,
+    }
+    encoded = json.dumps(header, sort_keys=True).encode("utf-8")
+    if len(_MAGIC) + 4 + len(encoded) > _HEADER_BYTES:
+        raise RuntimeError("CSR sidecar header does not fit in its reserved block.")
+    out_path = sidecar_path_for(csv_path)
+    tmp_path = out_path.with_suffix(CSR_SUFFIX + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(_MAGIC + len(encoded).to_bytes(4, "little") + encoded)
+        for name, view in views.items():
+            fh.write(b"\0" * (layout[name]["offset"] - fh.tell()))
+            fh.write(view.cast("B"))
+    tmp_path.replace(out_path)
+    return out_path
+
+
+@dataclass
+class CsrGraph:
+    """Memory-mapped sidecar; sections are memoryviews indexable as Python ints."""
+
+    path: Path
+    header: dict
+    labels: memoryview
+    indptr: memoryview
+    indices: memoryview
+    weights: memoryview
+    _mmap: mmap.mmap
+
+    @property
+    def nodes(self) -> int:
+        return int(self.header["nodes"])
+
+    @property
+    def edges(self) -> int:
+        return int(self.header["edges"])
+
+    @property
+    def start(self) -> int:
+        return int(self.header["start"])
+
+    @property
+    def target(self) -> int:
+        return int(self.header["target"])
+
+    def label(self, idx: int) -> str:
+        return str(self.labels[idx])
+
+    def close(self) -> None:
+        for view in (self.labels, self.indptr, self.indices, self.weights):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "CsrGraph":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def load_csr_sidecar(csv_path: Path) -> CsrGraph | None:
+    """Map the sidecar of ``csv_path``; ``None`` when it is missing, stale or unreadable here."""
+    path = sidecar_path_for(csv_path)
+    if sys.byteorder != "little" or not path.is_file():
+        return None
+    try:
+        with path.open("rb") as fh:
+            head = fh.read(_HEADER_BYTES)
+            if head[: len(_MAGIC)] != _MAGIC:
+                return None
+            length = int.from_bytes(head[len(_MAGIC) : len(_MAGIC) + 4], "little")
+            header = json.loads(head[len(_MAGIC) + 4 : len(_MAGIC) + 4 + length].decode("utf-8"))
+            if header.get("format") != CSR_FORMAT or header.get("source") != _source_fingerprint(csv_path):
+                return None
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    whole = memoryview(mapped)
+    views = {}
+    for name, section in header["sections"].items():
+        typecode = str(section["typecode"])
+        start = int(section["offset"])
+        width = {"q": 8, "Q": 8, "i": 4, "I": 4}[typecode]
+        views[name] = whole[start : start + int(section["count"]) * width].cast(typecode)
+    whole.release()
+    return CsrGraph(path=path, header=header, _mmap=mapped, **views)
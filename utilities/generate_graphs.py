@@ -4,16 +4,60 @@
 #   by the desktop app, headless CLI, CI runner, and generator CLI tests.
 # - If graph-family semantics change here, keep docs and every caller's seed /
 #   parameter handling aligned so benchmark manifests stay interpretable.
+# - Scripts should call `generate_inputs`/`generate_inputs_batch` in-process; the
+#   CLI is a thin wrapper kept for shell use and prints the same file list.
 
 import argparse
+import bisect
+import concurrent.futures
 import csv
+import io
+import itertools
 import json
+import math
 import random
 import time
+from array import array
+from dataclasses import dataclass
 from pathlib import Path
-
-
-GRAPH_FAMILIES = ("random_density", "erdos_renyi", "barabasi_albert", "grid")
+from typing import Iterable
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+GRAPH_FAMILIES = (
+    "random_density",
+    "erdos_renyi",
+    "barabasi_albert",
+    "grid",
+    "rmat",
+    "random_geometric",
+    "chung_lu",
+)
+# - `rmat`: recursive-matrix (Kronecker) edges with the Graph500 quadrant weights.
+# - `random_geometric`: points in the unit square joined within a radius chosen so the
+#   expected edge count matches the density; node ids follow a snake order of the cells.
+# - `chung_lu`: power-law expected degrees (exponent below), sampled endpoint by endpoint.
+# All three add the 0 -> 1 -> ... -> N-1 chain like random_density and erdos_renyi.
+RMAT_PROBABILITIES = (0.57, 0.19, 0.19, 0.05)
+CHUNG_LU_EXPONENT = 2.5
+# - `linear`: expected O(V + E) fill for random_density/grid targets with an exact edge
+#   count, and geometric-skip sampling for erdos_renyi.
+# - `legacy`: reproduces the graphs earlier releases produced for the same seed.
+GENERATOR_ENGINES = ("linear", "legacy")
+DEFAULT_GENERATOR_ENGINE = "linear"
+# Directed families that can be sampled source row by source row and streamed to the
+# CSV without holding the edge set; other families fall back to the in-memory sampler.
+STREAMING_GRAPH_FAMILIES = ("random_density", "erdos_renyi")
+DEFAULT_STREAM_CHUNK_EDGES = 65536
+# - `python`: per-edge sampling with random.Random(seed); the reference backend.
+# - `numpy`: vectorized sampling straight to CSR arrays; different graphs for the same
+#   seed, and falls back to `python` where NumPy is not installed.
+GENERATOR_BACKENDS = ("python", "numpy")
+DEFAULT_GENERATOR_BACKEND = "python"
 
 
 def parse_int(value: str, name: str, minimum: int | None = None) -> int:
@@ -37,6 +81,16 @@ def normalize_graph_family(value: str | None) -> str:
         "ba": "barabasi_albert",
         "barabasi_albert": "barabasi_albert",
         "grid": "grid",
+        "rmat": "rmat",
+        "r_mat": "rmat",
+        "kronecker": "rmat",
+        "random_geometric": "random_geometric",
+        "geometric": "random_geometric",
+        "rgg": "random_geometric",
+        "chung_lu": "chung_lu",
+        "cl": "chung_lu",
+        "power_law": "chung_lu",
+        "configuration": "chung_lu",
     }
     family = aliases.get(token, token)
     if family not in GRAPH_FAMILIES:
@@ -44,6 +98,97 @@ def normalize_graph_family(value: str | None) -> str:
     return family
 
 
+def normalize_generator_engine(value: str | None) -> str:
+    engine = str(value or DEFAULT_GENERATOR_ENGINE).strip().lower()
+    if engine not in GENERATOR_ENGINES:
+        raise ValueError(f"generator engine must be one of: {', '.join(GENERATOR_ENGINES)}")
+    return engine
+
+
+def normalize_generator_backend(value: str | None) -> str:
+    backend = str(value or DEFAULT_GENERATOR_BACKEND).strip().lower()
+    if backend not in GENERATOR_BACKENDS:
+        raise ValueError(f"generator backend must be one of: {', '.join(GENERATOR_BACKENDS)}")
+    return backend
+
+
+def resolve_generator_backend(value: str | None) -> str:
+    """Backend that will actually run: `numpy` degrades to `python` without NumPy."""
+    backend = normalize_generator_backend(value)
+    return "python" if backend == "numpy" and np is None else backend
+
+
+def generator_rng_semantics(backend: str | None) -> str:
+    if resolve_generator_backend(backend) == "numpy":
+        return "numpy.random.PCG64(random.Random(seed).getrandbits(64))"
+    return "random.Random(seed)"
+
+
+def generator_algorithm(
+    graph_family: str | None,
+    engine: str | None = None,
+    *,
+    directed: bool,
+    streaming: bool = False,
+    backend: str | None = None,
+) -> str:
+    """Versioned name of the sampling algorithm behind a (family, engine) pair.
+
+    Recorded in metadata.json; bump the suffix whenever a seed would produce a
+    different graph, so inputs from different algorithms are never compared as equal.
+    """
+    family = normalize_graph_family(graph_family)
+    engine = normalize_generator_engine(engine)
+    if resolve_generator_backend(backend) == "numpy":
+        if family == "erdos_renyi":
+            algorithm = "numpy-binomial-v1"
+        elif family == "barabasi_albert" and not directed:
+            algorithm = "numpy-batagelj-brandes-v1"
+        elif family in {"rmat", "chung_lu"}:
+            algorithm = "numpy-rmat-v1" if family == "rmat" else "numpy-chung-lu-v1"
+        elif family == "random_geometric" and not directed:
+            algorithm = "numpy-grid-bucket-v1"
+        elif directed and family in {"barabasi_albert", "grid", "random_geometric"}:
+            algorithm = "numpy-orient-fill-v1"
+        else:
+            algorithm = "numpy-unique-fill-v1"
+    elif directed and streaming and family in STREAMING_GRAPH_FAMILIES:
+        algorithm = "geometric-skip-stream-v1" if family == "erdos_renyi" else "row-block-stream-v1"
+    elif family == "erdos_renyi":
+        algorithm = "bernoulli-scan-v1" if engine == "legacy" else "geometric-skip-v1"
+    elif family == "barabasi_albert" and not directed:
+        algorithm = "preferential-attachment-v1"
+    elif family in {"rmat", "chung_lu"}:
+        algorithm = "rmat-rejection-v1" if family == "rmat" else "chung-lu-rejection-v1"
+    elif family == "random_geometric" and not directed:
+        algorithm = "grid-bucket-v1"
+    elif directed:
+        algorithm = "rejection-fill-v1"
+    else:
+        algorithm = "rejection-fill-v1" if engine == "legacy" else "linear-fill-v1"
+    return f"{family}/{algorithm}"
+
+
+def _geometric_skip_indices(total_pairs: int, probability: float, rng: random.Random):
+    # Batagelj-Brandes: the gap to the next success of a Bernoulli(p) sequence is
+    # geometric, so only O(expected successes) random draws are needed.
+    if total_pairs <= 0 or probability <= 0.0:
+        return
+    if probability >= 1.0:
+        yield from range(total_pairs)
+        return
+    log_q = math.log1p(-probability)
+    index = -1
+    while True:
+        draw = rng.random()
+        if draw <= 0.0:
+            continue
+        index += int(math.log(draw) / log_q) + 1
+        if index >= total_pairs:
+            return
+        yield index
+
+
 def _target_edge_budget(n: int, density: float, *, directed: bool) -> int:
     max_edges = n * (n - 1) if directed else (n * (n - 1)) // 2
     return max(0, min(max_edges, int(round(float(density) * float(max_edges)))))
@@ -86,12 +231,16 @@ def _add_random_undirected_edges(
     *,
     rng: random.Random,
     target_edges: int,
+    existing_edges: int,
     attempts_multiplier: int = 12,
 ) -> None:
+    # Legacy engine: same draws and attempt cap as before, with the edge count kept
+    # incrementally instead of recounting the whole adjacency on every attempt.
     n = len(adj_sets)
     attempts = 0
     max_attempts = max(1, target_edges * attempts_multiplier)
-    while _count_undirected_edges(_adj_sets_to_lists(adj_sets)) < target_edges and attempts < max_attempts:
+    edge_count = int(existing_edges)
+    while edge_count < target_edges and attempts < max_attempts:
         u = rng.randrange(n)
         v = rng.randrange(n)
         attempts += 1
@@ -99,6 +248,63 @@ def _add_random_undirected_edges(
             continue
         adj_sets[u].add(v)
         adj_sets[v].add(u)
+        edge_count += 1
+
+
+def _fill_random_undirected_edges(
+    adj_sets: list[set[int]],
+    *,
+    rng: random.Random,
+    target_edges: int,
+    existing_edges: int,
+) -> None:
+    # Linear engine: add exactly target - existing uniformly chosen new pairs.
+    # Sparse fills reject already-present pairs (acceptance stays near 1/2 or
+    # better); dense fills instead sample the pairs to leave out and sweep all
+    # pairs once, which is O(V^2) = O(E) in that regime.
+    n = len(adj_sets)
+    max_edges = (n * (n - 1)) // 2
+    missing = min(int(target_edges), max_edges) - int(existing_edges)
+    if missing <= 0:
+        return
+    free_pairs = max_edges - int(existing_edges)
+    if missing * 2 <= free_pairs:
+        while missing > 0:
+            u = rng.randrange(n)
+            v = rng.randrange(n)
+            if u == v or v in adj_sets[u]:
+                continue
+            adj_sets[u].add(v)
+            adj_sets[v].add(u)
+            missing -= 1
+        return
+    left_out: set[tuple[int, int]] = set()
+    while len(left_out) < free_pairs - missing:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        if u == v or v in adj_sets[u]:
+            continue
+        left_out.add((u, v) if u < v else (v, u))
+    for u in range(n):
+        row = adj_sets[u]
+        for v in range(u + 1, n):
+            if v not in row and (u, v) not in left_out:
+                row.add(v)
+                adj_sets[v].add(u)
+
+
+def _fill_undirected_edges(
+    adj_sets: list[set[int]],
+    *,
+    rng: random.Random,
+    target_edges: int,
+    existing_edges: int,
+    engine: str,
+) -> None:
+    if normalize_generator_engine(engine) == "legacy":
+        _add_random_undirected_edges(adj_sets, rng=rng, target_edges=target_edges, existing_edges=existing_edges)
+    else:
+        _fill_random_undirected_edges(adj_sets, rng=rng, target_edges=target_edges, existing_edges=existing_edges)
 
 
 def _generate_random_density_directed_edges(n: int, rng: random.Random, density: float) -> list[tuple[int, int, int]]:
@@ -110,19 +316,49 @@ def _generate_random_density_directed_edges(n: int, rng: random.Random, density:
     return [(u, v, w) for (u, v), w in edges.items()]
 
 
-def _generate_erdos_renyi_directed_edges(n: int, rng: random.Random, density: float) -> list[tuple[int, int, int]]:
+def _generate_erdos_renyi_directed_edges(
+    n: int,
+    rng: random.Random,
+    density: float,
+    engine: str = DEFAULT_GENERATOR_ENGINE,
+) -> list[tuple[int, int, int]]:
     edges: dict[tuple[int, int], int] = {}
     for i in range(n - 1):
         edges[(i, i + 1)] = rng.randint(1, 20)
-    for u in range(n):
-        for v in range(n):
-            if u == v or (u, v) in edges:
-                continue
-            if rng.random() <= density:
-                edges[(u, v)] = rng.randint(1, 20)
+    if normalize_generator_engine(engine) == "legacy":
+        for u in range(n):
+            for v in range(n):
+                if u == v or (u, v) in edges:
+                    continue
+                if rng.random() <= density:
+                    edges[(u, v)] = rng.randint(1, 20)
+        return [(u, v, w) for (u, v), w in edges.items()]
+    # Ordered pairs u != v numbered row-major: index = u * (n - 1) + (v if v < u else v - 1).
+    for index in _geometric_skip_indices(n * (n - 1), float(density), rng):
+        u, col = divmod(index, n - 1)
+        v = col if col < u else col + 1
+        if (u, v) not in edges:
+            edges[(u, v)] = rng.randint(1, 20)
     return [(u, v, w) for (u, v), w in edges.items()]
 
 
+def _add_erdos_renyi_undirected_edges(adj_sets: list[set[int]], *, rng: random.Random, density: float) -> None:
+    # Unordered pairs u < v numbered row-major; sampled indices only increase, so
+    # the row cursor advances at most n times over the whole pass.
+    n = len(adj_sets)
+    u = 0
+    row_start = 0
+    row_width = n - 1
+    for index in _geometric_skip_indices((n * (n - 1)) // 2, float(density), rng):
+        while index >= row_start + row_width:
+            row_start += row_width
+            u += 1
+            row_width -= 1
+        v = u + 1 + (index - row_start)
+        adj_sets[u].add(v)
+        adj_sets[v].add(u)
+
+
 def _generate_barabasi_albert_undirected(n: int, rng: random.Random, density: float) -> list[list[int]]:
     if n <= 1:
         return [[] for _ in range(n)]
@@ -171,6 +407,188 @@ def _generate_grid_undirected(n: int) -> list[list[int]]:
     return _adj_sets_to_lists(adj_sets)
 
 
+def _chain_adj_sets(n: int) -> list[set[int]]:
+    adj_sets = [set() for _ in range(n)]
+    for i in range(n - 1):
+        adj_sets[i].add(i + 1)
+        adj_sets[i + 1].add(i)
+    return adj_sets
+
+
+def _rmat_pair_sampler(n: int, rng: random.Random):
+    # One quadrant choice per bit of the 2^scale x 2^scale adjacency matrix. Draws that
+    # land outside the N x N corner are redrawn; node ids are shuffled so the hubs that
+    # R-MAT concentrates at low indices are not also the chain's start.
+    scale = max(1, (n - 1).bit_length())
+    a, b, c, _d = RMAT_PROBABILITIES
+    ab, abc = a + b, a + b + c
+    perm = list(range(n))
+    rng.shuffle(perm)
+
+    def draw() -> tuple[int, int]:
+        while True:
+            u = v = 0
+            for _ in range(scale):
+                r = rng.random()
+                u <<= 1
+                v <<= 1
+                if r >= abc:
+                    u |= 1
+                    v |= 1
+                elif r >= ab:
+                    u |= 1
+                elif r >= a:
+                    v |= 1
+            if u < n and v < n:
+                return perm[u], perm[v]
+
+    return draw
+
+
+def _chung_lu_weights(n: int) -> list[float]:
+    # Expected degree of the i-th heaviest node ~ (i + 1)^(-1 / (gamma - 1)).
+    exponent = 1.0 / (CHUNG_LU_EXPONENT - 1.0)
+    return [(i + 1) ** -exponent for i in range(n)]
+
+
+def _chung_lu_pair_sampler(n: int, rng: random.Random):
+    # Each endpoint is drawn with probability proportional to its weight, so expected
+    # degrees follow the power law; the edge budget, not the weights, sets the scale.
+    cumulative = list(itertools.accumulate(_chung_lu_weights(n)))
+    total = cumulative[-1]
+    perm = list(range(n))
+    rng.shuffle(perm)
+
+    def draw() -> tuple[int, int]:
+        u = min(n - 1, bisect.bisect_right(cumulative, rng.random() * total))
+        v = min(n - 1, bisect.bisect_right(cumulative, rng.random() * total))
+        return perm[u], perm[v]
+
+    return draw
+
+
+_PAIR_SAMPLERS = {"rmat": _rmat_pair_sampler, "chung_lu": _chung_lu_pair_sampler}
+
+
+def _add_sampled_undirected_edges(
+    adj_sets: list[set[int]],
+    *,
+    rng: random.Random,
+    draw_pair,
+    target_edges: int,
+    existing_edges: int,
+) -> None:
+    # Duplicate and self-loop proposals are rejected. Proposals are capped at a constant
+    # multiple of the budget so the fill stays O(m); whatever saturated hubs cannot
+    # supply is topped up uniformly.
+    n = len(adj_sets)
+    target_edges = min(int(target_edges), (n * (n - 1)) // 2)
+    edges = int(existing_edges)
+    attempts = max(64, 8 * (target_edges - edges))
+    while edges < target_edges and attempts > 0:
+        attempts -= 1
+        u, v = draw_pair()
+        if u == v or v in adj_sets[u]:
+            continue
+        adj_sets[u].add(v)
+        adj_sets[v].add(u)
+        edges += 1
+    _fill_random_undirected_edges(adj_sets, rng=rng, target_edges=target_edges, existing_edges=edges)
+
+
+def _generate_sampled_undirected(n: int, rng: random.Random, density: float, family: str) -> list[list[int]]:
+    adj_sets = _chain_adj_sets(n)
+    if n > 1:
+        _add_sampled_undirected_edges(
+            adj_sets,
+            rng=rng,
+            draw_pair=_PAIR_SAMPLERS[family](n, rng),
+            target_edges=max(n - 1, _target_edge_budget(n, density, directed=False)),
+            existing_edges=n - 1,
+        )
+    return _adj_sets_to_lists(adj_sets)
+
+
+def _generate_sampled_directed_edges(n: int, rng: random.Random, density: float, family: str) -> list[tuple[int, int, int]]:
+    edges: dict[tuple[int, int], int] = {}
+    for i in range(n - 1):
+        edges[(i, i + 1)] = rng.randint(1, 20)
+    if n <= 1:
+        return []
+    target_edges = max(n - 1, _target_edge_budget(n, density, directed=True))
+    draw_pair = _PAIR_SAMPLERS[family](n, rng)
+    attempts = max(64, 8 * (target_edges - len(edges)))
+    while len(edges) < target_edges and attempts > 0:
+        attempts -= 1
+        u, v = draw_pair()
+        if u != v and (u, v) not in edges:
+            edges[(u, v)] = rng.randint(1, 20)
+    _add_random_directed_edges(edges, n=n, rng=rng, target_edges=target_edges)
+    return [(u, v, w) for (u, v), w in edges.items()]
+
+
+def _geometric_radius(density: float) -> float:
+    # Radius whose expected fraction of connected pairs in the unit square equals the
+    # density: P(r) = pi r^2 - 8/3 r^3 + r^4 / 2 for r <= 1 (boundary effects included).
+    density = max(0.0, float(density))
+    if density >= math.pi - 8.0 / 3.0 + 0.5:
+        return math.sqrt(2.0)
+    lo, hi = 0.0, 1.0
+    for _ in range(60):
+        mid = (lo + hi) / 2.0
+        if math.pi * mid ** 2 - 8.0 / 3.0 * mid ** 3 + mid ** 4 / 2.0 < density:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+def _geometric_cells(n: int, radius: float) -> int:
+    # Cells at least one radius wide, and no more of them than nodes.
+    if radius <= 0:
+        return 1
+    return max(1, min(math.isqrt(n) + 1, int(1.0 / radius)))
+
+
+def _generate_random_geometric_undirected(n: int, rng: random.Random, density: float) -> list[list[int]]:
+    # - Points are bucketed into a cells x cells grid; each cell is compared with itself
+    #   and four of its neighbours, so every pair within the radius is seen once, in
+    #   O(N + E) expected time.
+    # - Node ids follow the cells in snake order, so the connectivity chain mostly joins
+    #   spatial neighbours instead of crossing the square.
+    radius = _geometric_radius(density)
+    cells = _geometric_cells(n, radius)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    def cell_of(point: tuple[float, float]) -> tuple[int, int]:
+        return min(cells - 1, int(point[0] * cells)), min(cells - 1, int(point[1] * cells))
+
+    def snake_key(point: tuple[float, float]) -> tuple[int, int, float]:
+        cx, cy = cell_of(point)
+        return (cy, cx, point[0]) if cy % 2 == 0 else (cy, cells - 1 - cx, -point[0])
+
+    points.sort(key=snake_key)
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for node, point in enumerate(points):
+        buckets.setdefault(cell_of(point), []).append(node)
+    adj_sets = _chain_adj_sets(n)
+    radius_sq = radius * radius
+    for (cx, cy), members in buckets.items():
+        for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+            same = dx == 0 and dy == 0
+            others = members if same else buckets.get((cx + dx, cy + dy))
+            if not others:
+                continue
+            for pos, u in enumerate(members):
+                ux, uy = points[u]
+                for v in (others[pos + 1 :] if same else others):
+                    vx, vy = points[v]
+                    if (ux - vx) ** 2 + (uy - vy) ** 2 <= radius_sq:
+                        adj_sets[u].add(v)
+                        adj_sets[v].add(u)
+    return _adj_sets_to_lists(adj_sets)
+
+
 def _directed_edges_from_undirected(
     undirected_adj: list[list[int]],
     *,
@@ -198,26 +616,427 @@ def _directed_edges_from_undirected(
     return [(u, v, w) for (u, v), w in edges.items()]
 
 
+def _np_all_pair_keys(n: int, *, directed: bool):
+    u, v = np.divmod(np.arange(n * n, dtype=np.int64), n)
+    keep = (u != v) if directed else (u < v)
+    return (u * n + v)[keep]
+
+
+def _np_sample_new_pairs(n: int, count: int, existing, np_rng, *, directed: bool):
+    """Sorted keys (``u * n + v``) of ``count`` uniformly chosen pairs not in ``existing``.
+
+    Candidate batches are deduplicated with ``np.unique`` and kept in draw order, which
+    is sequential rejection sampling done a batch at a time; dense requests sample the
+    pairs to leave out instead.
+    """
+    total = n * (n - 1) if directed else (n * (n - 1)) // 2
+    free = total - int(existing.size)
+    count = int(min(max(0, count), free))
+    if count <= 0:
+        return np.empty(0, dtype=np.int64)
+    if count * 2 > free:
+        free_keys = np.setdiff1d(_np_all_pair_keys(n, directed=directed), existing, assume_unique=True)
+        left_out = _np_sample_new_pairs(n, free - count, existing, np_rng, directed=directed)
+        return np.setdiff1d(free_keys, left_out, assume_unique=True)
+    chosen = np.empty(0, dtype=np.int64)
+    while chosen.size < count:
+        need = count - int(chosen.size)
+        batch = need + need // 4 + 16
+        u = np_rng.integers(0, n, size=batch, dtype=np.int64)
+        v = np_rng.integers(0, n, size=batch, dtype=np.int64)
+        keep = u != v
+        u, v = u[keep], v[keep]
+        if not directed:
+            u, v = np.minimum(u, v), np.maximum(u, v)
+        keys = u * n + v
+        keys = keys[~np.isin(keys, existing) & ~np.isin(keys, chosen)]
+        _unique, first = np.unique(keys, return_index=True)
+        chosen = np.concatenate([chosen, keys[np.sort(first)][:need]])
+    return np.sort(chosen)
+
+
+def _np_chain_keys(n: int):
+    nodes = np.arange(max(0, n - 1), dtype=np.int64)
+    return nodes * n + nodes + 1
+
+
+def _np_grid_keys(n: int):
+    # Same lattice as _generate_grid_undirected, whose "right" step also links a row's
+    # last node to the next row's first.
+    _rows, cols = _grid_shape(n)
+    nodes = np.arange(n, dtype=np.int64)
+    right = nodes[nodes + 1 < n]
+    down = nodes[nodes + cols < n]
+    return np.unique(np.concatenate([right * n + right + 1, down * n + down + cols]))
+
+
+def _np_barabasi_albert_keys(n: int, density: float, np_rng):
+    # Batagelj-Brandes edge-slot array: each new edge's far end copies a uniformly chosen
+    # earlier slot, i.e. a degree-proportional node. Copies of copies are resolved by
+    # pointer doubling, and multi-edges/self-loops are dropped by np.unique on the keys.
+    m = max(1, min(n - 1, int(round(float(density) * float(max(2, n - 1)) / 2.0))))
+    seed_size = min(n, max(2, m + 1))
+    seed_u, seed_v = np.triu_indices(seed_size, k=1)
+    seed_slots = np.column_stack([seed_u, seed_v]).ravel().astype(np.int64)
+    new_nodes = np.repeat(np.arange(seed_size, n, dtype=np.int64), m)
+    slot_count = seed_slots.size + 2 * new_nodes.size
+    values = np.full(slot_count, -1, dtype=np.int64)
+    values[: seed_slots.size] = seed_slots
+    near = seed_slots.size + 2 * np.arange(new_nodes.size, dtype=np.int64)
+    values[near] = new_nodes
+    far = near + 1
+    pointers = np.arange(slot_count, dtype=np.int64)
+    pointers[far] = (np_rng.random(far.size) * near).astype(np.int64)
+    while True:
+        unresolved = values[pointers] < 0
+        if not unresolved.any():
+            break
+        pointers[unresolved] = pointers[pointers[unresolved]]
+    values[far] = values[pointers[far]]
+    u = np.concatenate([seed_u.astype(np.int64), new_nodes])
+    v = np.concatenate([seed_v.astype(np.int64), values[far]])
+    keep = u != v
+    lo, hi = np.minimum(u[keep], v[keep]), np.maximum(u[keep], v[keep])
+    return np.unique(lo * n + hi)
+
+
+def _np_rmat_draw(n: int, np_rng):
+    scale = max(1, (n - 1).bit_length())
+    a, b, c, _d = RMAT_PROBABILITIES
+    ab, abc = a + b, a + b + c
+    perm = np_rng.permutation(n).astype(np.int64)
+
+    def draw(size: int):
+        u = np.zeros(size, dtype=np.int64)
+        v = np.zeros(size, dtype=np.int64)
+        for _ in range(scale):
+            r = np_rng.random(size)
+            u = (u << 1) | (r >= ab)
+            v = (v << 1) | (((r >= a) & (r < ab)) | (r >= abc))
+        keep = (u < n) & (v < n)
+        return perm[u[keep]], perm[v[keep]]
+
+    return draw
+
+
+def _np_chung_lu_draw(n: int, np_rng):
+    # Endpoint counts come from one multinomial draw per side and are shuffled into
+    # place: the same i.i.d. weighted endpoints as a per-draw search, in O(N + size).
+    weights = np.asarray(_chung_lu_weights(n), dtype=np.float64)
+    weights /= weights.sum()
+    perm = np_rng.permutation(n).astype(np.int64)
+
+    def endpoints(size: int):
+        return np_rng.permutation(np.repeat(perm, np_rng.multinomial(size, weights)))
+
+    def draw(size: int):
+        return endpoints(size), endpoints(size)
+
+    return draw
+
+
+_NP_PAIR_DRAWS = {"rmat": _np_rmat_draw, "chung_lu": _np_chung_lu_draw}
+
+
+def _np_sample_drawn_pairs(n: int, count: int, existing, np_rng, draw, *, directed: bool, max_rounds: int = 32):
+    """Sorted keys of ``count`` new pairs proposed by ``draw``, topped up uniformly.
+
+    Mirrors _add_sampled_undirected_edges: batches are deduplicated with ``np.unique``
+    in draw order, and after ``max_rounds`` batches the rest is sampled uniformly.
+    """
+    total = n * (n - 1) if directed else (n * (n - 1)) // 2
+    count = int(min(max(0, count), total - int(existing.size)))
+    chosen = np.empty(0, dtype=np.int64)
+    for _round in range(max_rounds):
+        if chosen.size >= count:
+            break
+        need = count - int(chosen.size)
+        u, v = draw(need + need // 4 + 16)
+        keep = u != v
+        u, v = u[keep], v[keep]
+        if not directed:
+            u, v = np.minimum(u, v), np.maximum(u, v)
+        keys = u * n + v
+        keys = keys[~np.isin(keys, existing) & ~np.isin(keys, chosen)]
+        _unique, first = np.unique(keys, return_index=True)
+        chosen = np.concatenate([chosen, keys[np.sort(first)][:need]])
+    chosen = np.sort(chosen)
+    rest = _np_sample_new_pairs(n, count - int(chosen.size), np.union1d(existing, chosen), np_rng, directed=directed)
+    return np.union1d(chosen, rest)
+
+
+def _np_random_geometric_keys(n: int, density: float, np_rng, *, block_pairs: int = 1 << 22):
+    # Same bucketing and snake relabelling as _generate_random_geometric_undirected. Each
+    # stencil offset expands node -> neighbour-cell candidates with np.repeat, in node
+    # blocks of at most ``block_pairs`` candidates so memory stays O(N + E).
+    radius = _geometric_radius(density)
+    cells = _geometric_cells(n, radius)
+    x = np_rng.random(n)
+    y = np_rng.random(n)
+    cx = np.minimum((x * cells).astype(np.int64), cells - 1)
+    cy = np.minimum((y * cells).astype(np.int64), cells - 1)
+    odd = (cy % 2) == 1
+    order = np.lexsort((np.where(odd, -x, x), np.where(odd, cells - 1 - cx, cx), cy))
+    x, y, cx, cy = x[order], y[order], cx[order], cy[order]
+    cell = cy * cells + cx
+    counts = np.bincount(cell, minlength=cells * cells)
+    starts = np.zeros(cells * cells, dtype=np.int64)
+    first_seen = np.unique(cell, return_index=True)
+    starts[first_seen[0]] = first_seen[1]
+    nodes = np.arange(n, dtype=np.int64)
+    radius_sq = radius * radius
+    parts = [_np_chain_keys(n)]
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        ncx, ncy = cx + dx, cy + dy
+        valid = (ncx >= 0) & (ncx < cells) & (ncy < cells)
+        neighbour = np.where(valid, ncy * cells + ncx, 0)
+        if dx == 0 and dy == 0:
+            first = nodes + 1
+            span = starts[cell] + counts[cell] - first
+        else:
+            first = starts[neighbour]
+            span = np.where(valid, counts[neighbour], 0)
+        cumulative = np.cumsum(span)
+        lo = 0
+        while lo < n:
+            done = int(cumulative[lo - 1]) if lo else 0
+            hi = max(lo + 1, int(np.searchsorted(cumulative, done + block_pairs, side="right")))
+            block_span = span[lo:hi]
+            total = int(cumulative[hi - 1]) - done
+            if total:
+                src = np.repeat(nodes[lo:hi], block_span)
+                offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(block_span) - block_span, block_span)
+                dst = np.repeat(first[lo:hi], block_span) + offsets
+                close = (x[src] - x[dst]) ** 2 + (y[src] - y[dst]) ** 2 <= radius_sq
+                parts.append(np.minimum(src[close], dst[close]) * n + np.maximum(src[close], dst[close]))
+            lo = hi
+    return np.unique(np.concatenate(parts))
+
+
+def _np_undirected_keys(n: int, np_rng, density: float, family: str):
+    if family == "barabasi_albert":
+        return _np_barabasi_albert_keys(n, density, np_rng)
+    if family == "random_geometric":
+        return _np_random_geometric_keys(n, density, np_rng)
+    if family in _NP_PAIR_DRAWS:
+        base = _np_chain_keys(n)
+        extra = max(n - 1, _target_edge_budget(n, density, directed=False)) - int(base.size)
+        draw = _NP_PAIR_DRAWS[family](n, np_rng)
+        return np.union1d(base, _np_sample_drawn_pairs(n, extra, base, np_rng, draw, directed=False))
+    base = _np_grid_keys(n) if family == "grid" else _np_chain_keys(n)
+    if family == "erdos_renyi":
+        free = (n * (n - 1)) // 2 - int(base.size)
+        extra = int(np_rng.binomial(free, min(1.0, float(density)))) if free > 0 else 0
+    else:
+        extra = max(int(base.size), _target_edge_budget(n, density, directed=False)) - int(base.size)
+    return np.union1d(base, _np_sample_new_pairs(n, extra, base, np_rng, directed=False))
+
+
+def numpy_rng_from(rng: random.Random):
+    # NumPy-backend seed semantics: PCG64 seeded with the next 64 bits of the
+    # run's random.Random(seed), so later Python draws stay deterministic too.
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def generate_adjacency_csr(n: int, rng: random.Random, density: float, graph_family: str = "random_density"):
+    """NumPy backend: undirected ``(indptr, indices)`` CSR arrays with sorted rows."""
+    if np is None:
+        raise RuntimeError("the numpy generator backend requires numpy")
+    family = normalize_graph_family(graph_family)
+    keys = _np_undirected_keys(n, numpy_rng_from(rng), density, family) if n > 1 else np.empty(0, dtype=np.int64)
+    lo, hi = np.divmod(keys, n)
+    # Keys are sorted, so a stable sort by source leaves every row sorted: each row's
+    # smaller neighbours (from the `hi` half) precede its larger ones.
+    src = np.concatenate([hi, lo])
+    dst = np.concatenate([lo, hi])
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst[order]
+
+
+def generate_directed_csr(n: int, rng: random.Random, density: float, graph_family: str = "random_density"):
+    """NumPy backend: directed ``(indptr, indices, weights)`` CSR arrays with sorted rows."""
+    if np is None:
+        raise RuntimeError("the numpy generator backend requires numpy")
+    family = normalize_graph_family(graph_family)
+    np_rng = numpy_rng_from(rng)
+    chain = _np_chain_keys(n)
+    if family in {"barabasi_albert", "grid", "random_geometric"}:
+        # Orient each undirected edge forward, backward or both (34/34/32%), as the Python sampler does.
+        lo, hi = np.divmod(_np_undirected_keys(n, np_rng, density, family), n)
+        mode = np_rng.random(lo.size)
+        forward = lo[mode < 0.34] * n + hi[mode < 0.34]
+        backward = hi[(mode >= 0.34) & (mode < 0.68)] * n + lo[(mode >= 0.34) & (mode < 0.68)]
+        both = mode >= 0.68
+        base = np.unique(np.concatenate([chain, forward, backward, lo[both] * n + hi[both], hi[both] * n + lo[both]]))
+    else:
+        base = chain
+    free = n * (n - 1) - int(base.size)
+    if family == "erdos_renyi":
+        extra = int(np_rng.binomial(free, min(1.0, float(density)))) if free > 0 else 0
+    else:
+        extra = max(n - 1, _target_edge_budget(n, density, directed=True)) - int(base.size)
+    if family in _NP_PAIR_DRAWS:
+        draw = _NP_PAIR_DRAWS[family](n, np_rng)
+        keys = np.union1d(base, _np_sample_drawn_pairs(n, extra, base, np_rng, draw, directed=True))
+    else:
+        keys = np.union1d(base, _np_sample_new_pairs(n, extra, base, np_rng, directed=True))
+    src, dst = np.divmod(keys, n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst, np_rng.integers(1, 21, size=dst.size, dtype=np.int64)
+
+
+def csr_to_adjacency(indptr, indices) -> list[list[int]]:
+    return [row.tolist() for row in np.split(indices, indptr[1:-1])]
+
+
+def csr_to_edges(indptr, indices, weights) -> list[tuple[int, int, int]]:
+    src = np.repeat(np.arange(indptr.size - 1, dtype=np.int64), np.diff(indptr))
+    return list(zip(src.tolist(), indices.tolist(), weights.tolist()))
+
+
 def generate_directed_edges(
     n: int,
     rng: random.Random,
     density: float,
     graph_family: str = "random_density",
+    *,
+    engine: str = DEFAULT_GENERATOR_ENGINE,
+    backend: str = DEFAULT_GENERATOR_BACKEND,
 ) -> list[tuple[int, int, int]]:
     family = normalize_graph_family(graph_family)
+    if resolve_generator_backend(backend) == "numpy":
+        return csr_to_edges(*generate_directed_csr(n, rng, density, family))
     if family == "random_density":
         return _generate_random_density_directed_edges(n, rng, density)
     if family == "erdos_renyi":
-        return _generate_erdos_renyi_directed_edges(n, rng, density)
+        return _generate_erdos_renyi_directed_edges(n, rng, density, engine)
     if family == "barabasi_albert":
         return _directed_edges_from_undirected(
             _generate_barabasi_albert_undirected(n, rng, density),
             rng=rng,
             density=density,
         )
+    if family in _PAIR_SAMPLERS:
+        return _generate_sampled_directed_edges(n, rng, density, family)
+    if family == "random_geometric":
+        return _directed_edges_from_undirected(_generate_random_geometric_undirected(n, rng, density), rng=rng, density=density)
     return _directed_edges_from_undirected(_generate_grid_undirected(n), rng=rng, density=density)
 
 
+def _directed_row_capacity(n: int, u: int) -> int:
+    # Targets left for source u once itself and its chain successor u + 1 are excluded.
+    return n - 2 if u < n - 1 else n - 1
+
+
+def _stream_random_density_directed_edges(n: int, rng: random.Random, density: float):
+    # - Row out-degrees are drawn first, picking each extra edge's source with
+    #   probability proportional to the row's remaining free pairs; that is exactly the
+    #   row split of a uniformly random edge set of the budgeted size.
+    # - Each row then samples its own distinct targets, so duplicate suppression only
+    #   spans one source block and the state kept across rows is one count per source.
+    # - Dense budgets draw the pairs to leave out instead, as the linear undirected fill does.
+    if n <= 1:
+        return
+    target_edges = max(n - 1, _target_edge_budget(n, density, directed=True))
+    extra = target_edges - (n - 1)
+    free_pairs = n * (n - 1) - (n - 1)
+    complement = extra * 2 > free_pairs
+    remaining = free_pairs - extra if complement else extra
+    counts = array("q", bytes(8 * n))
+    max_capacity = n - 1
+    while remaining > 0:
+        u = rng.randrange(n)
+        left = _directed_row_capacity(n, u) - counts[u]
+        if left <= 0 or (left < max_capacity and rng.randrange(max_capacity) >= left):
+            continue
+        counts[u] += 1
+        remaining -= 1
+    for u in range(n):
+        if u < n - 1:
+            yield u, u + 1, rng.randint(1, 20)
+        capacity = _directed_row_capacity(n, u)
+        if complement:
+            left_out = set(rng.sample(range(capacity), counts[u]))
+            picks = [r for r in range(capacity) if r not in left_out]
+        else:
+            picks = sorted(rng.sample(range(capacity), counts[u]))
+        skip = 2 if u < n - 1 else 1
+        for r in picks:
+            yield u, (r if r < u else r + skip), rng.randint(1, 20)
+
+
+def _stream_erdos_renyi_directed_edges(n: int, rng: random.Random, density: float):
+    # Geometric skips visit ordered pairs in row-major order, so rows are finished in
+    # sequence and a sampled chain pair is the only duplicate to suppress.
+    row = -1
+    for index in _geometric_skip_indices(n * (n - 1), float(density), rng):
+        u, col = divmod(index, n - 1)
+        while row < u:
+            row += 1
+            if row < n - 1:
+                yield row, row + 1, rng.randint(1, 20)
+        v = col if col < u else col + 1
+        if v != u + 1:
+            yield u, v, rng.randint(1, 20)
+    while row < n - 2:
+        row += 1
+        yield row, row + 1, rng.randint(1, 20)
+
+
+def stream_directed_edges(
+    n: int,
+    rng: random.Random,
+    density: float,
+    graph_family: str = "random_density",
+    *,
+    engine: str = DEFAULT_GENERATOR_ENGINE,
+    backend: str = DEFAULT_GENERATOR_BACKEND,
+):
+    """Yield ``(u, v, weight)`` edges as they are sampled.
+
+    Families in ``STREAMING_GRAPH_FAMILIES`` hold O(N) state regardless of the edge
+    count; the others, and the NumPy backend, build their edges in memory first.
+    """
+    family = normalize_graph_family(graph_family)
+    if resolve_generator_backend(backend) == "numpy":
+        indptr, indices, weights = generate_directed_csr(n, rng, density, family)
+        src = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+        yield from zip(src.tolist(), indices.tolist(), weights.tolist())
+    elif family == "random_density":
+        yield from _stream_random_density_directed_edges(n, rng, density)
+    elif family == "erdos_renyi":
+        yield from _stream_erdos_renyi_directed_edges(n, rng, density)
+    else:
+        yield from generate_directed_edges(n, rng, density, graph_family=family, engine=engine)
+
+
+def write_serialized(path: Path, text: str, *, newline: str | None = None) -> None:
+    # Whole-file buffers go out in one write instead of one write per line or edge.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline=newline) as fh:
+        fh.write(text)
+
+
+def serialize_dijkstra_csv(
+    edges: list[tuple[int, int, int]],
+    labels: list[str],
+    *,
+    via_label: str | None = None,
+) -> str:
+    buffer = io.StringIO()
+    header = f"# start={labels[0]} target={labels[-1]}"
+    if via_label:
+        header += f" via={via_label}"
+    buffer.write(header + "\n")
+    writer = csv.writer(buffer)
+    writer.writerow(["source", "target", "weight"])
+    writer.writerows((labels[u], labels[v], w) for u, v, w in edges)
+    return buffer.getvalue()
+
+
 def write_dijkstra_csv(
     path: Path,
     edges: list[tuple[int, int, int]],
@@ -225,16 +1044,39 @@ def write_dijkstra_csv(
     *,
     via_label: str | None = None,
 ) -> None:
+    write_serialized(path, serialize_dijkstra_csv(edges, labels, via_label=via_label), newline="")
+
+
+def write_dijkstra_csv_stream(
+    path: Path,
+    edges: Iterable[tuple[int, int, int]],
+    n: int,
+    *,
+    via_label: str | None = None,
+    chunk_edges: int = DEFAULT_STREAM_CHUNK_EDGES,
+) -> int:
+    """Write ``v<i>``-labelled edges in chunks as they arrive; returns the edge count.
+
+    The bytes match ``write_dijkstra_csv`` for the same edge order (these labels need
+    no CSV quoting), while only ``chunk_edges`` rows are ever buffered.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as fh:
-        header = f"# start={labels[0]} target={labels[-1]}"
-        if via_label:
-            header += f" via={via_label}"
-        fh.write(header + "\n")
-        writer = csv.writer(fh)
-        writer.writerow(["source", "target", "weight"])
+    header = f"# start=v0 target=v{n - 1}"
+    if via_label:
+        header += f" via={via_label}"
+    written = 0
+    chunk: list[str] = []
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        fh.write(header + "\nsource,target,weight\r\n")
         for u, v, w in edges:
-            writer.writerow([labels[u], labels[v], w])
+            chunk.append(f"v{u},v{v},{w}\r\n")
+            if len(chunk) >= chunk_edges:
+                fh.write("".join(chunk))
+                written += len(chunk)
+                chunk.clear()
+        fh.write("".join(chunk))
+        written += len(chunk)
+    return written
 
 
 def generate_adjacency(
@@ -242,21 +1084,29 @@ def generate_adjacency(
     rng: random.Random,
     density: float,
     graph_family: str = "random_density",
+    *,
+    engine: str = DEFAULT_GENERATOR_ENGINE,
+    backend: str = DEFAULT_GENERATOR_BACKEND,
 ) -> list[list[int]]:
     family = normalize_graph_family(graph_family)
+    if resolve_generator_backend(backend) == "numpy":
+        return csr_to_adjacency(*generate_adjacency_csr(n, rng, density, family))
     if family == "random_density":
         adj_sets = [set() for _ in range(n)]
         for i in range(n - 1):
             adj_sets[i].add(i + 1)
             adj_sets[i + 1].add(i)
         target_edges = max(n - 1, _target_edge_budget(n, density, directed=False))
-        _add_random_undirected_edges(adj_sets, rng=rng, target_edges=target_edges)
+        _fill_undirected_edges(adj_sets, rng=rng, target_edges=target_edges, existing_edges=max(0, n - 1), engine=engine)
         return _adj_sets_to_lists(adj_sets)
     if family == "erdos_renyi":
         adj_sets = [set() for _ in range(n)]
         for i in range(n - 1):
             adj_sets[i].add(i + 1)
             adj_sets[i + 1].add(i)
+        if normalize_generator_engine(engine) != "legacy":
+            _add_erdos_renyi_undirected_edges(adj_sets, rng=rng, density=density)
+            return _adj_sets_to_lists(adj_sets)
         for u in range(n):
             for v in range(u + 1, n):
                 if v in adj_sets[u]:
@@ -267,10 +1117,15 @@ def generate_adjacency(
         return _adj_sets_to_lists(adj_sets)
     if family == "barabasi_albert":
         return _generate_barabasi_albert_undirected(n, rng, density)
+    if family in _PAIR_SAMPLERS:
+        return _generate_sampled_undirected(n, rng, density, family)
+    if family == "random_geometric":
+        return _generate_random_geometric_undirected(n, rng, density)
     adj = _generate_grid_undirected(n)
     adj_sets = [set(row) for row in adj]
-    target_edges = max(_count_undirected_edges(adj), _target_edge_budget(n, density, directed=False))
-    _add_random_undirected_edges(adj_sets, rng=rng, target_edges=target_edges)
+    grid_edges = _count_undirected_edges(adj)
+    target_edges = max(grid_edges, _target_edge_budget(n, density, directed=False))
+    _fill_undirected_edges(adj_sets, rng=rng, target_edges=target_edges, existing_edges=grid_edges, engine=engine)
     return _adj_sets_to_lists(adj_sets)
 
 
@@ -378,26 +1233,40 @@ def pick_connected_nodes(undirected_adj: list[list[int]], k: int, rng: random.Ra
     return list(selected)
 
 
+def _lad_row(neighbors: list[int]) -> str:
+    if not neighbors:
+        return "0"
+    return f"{len(neighbors)} " + " ".join(map(str, neighbors))
+
+
+def serialize_lad(adj: list[list[int]]) -> str:
+    rows = [str(len(adj))]
+    rows.extend(_lad_row(neighbors) for neighbors in adj)
+    return "\n".join(rows) + "\n"
+
+
+def serialize_vertex_labelled_lad(adj: list[list[int]], labels: list[int]) -> str:
+    rows = [str(len(adj))]
+    rows.extend(f"{labels[i]} {_lad_row(neighbors)}" for i, neighbors in enumerate(adj))
+    return "\n".join(rows) + "\n"
+
+
+def serialize_vf(adj: list[list[int]], labels: list[int]) -> str:
+    rows = [str(len(adj))]
+    rows.extend(f"{i} {label}" for i, label in enumerate(labels))
+    for i, neighbors in enumerate(adj):
+        rows.append(str(len(neighbors)))
+        prefix = f"{i} "
+        rows.extend(prefix + str(v) for v in neighbors)
+    return "\n".join(rows) + "\n"
+
+
 def write_lad(path: Path, adj: list[list[int]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        fh.write(f"{len(adj)}\n")
-        for neighbors in adj:
-            line = f"{len(neighbors)}"
-            if neighbors:
-                line += " " + " ".join(str(v) for v in neighbors)
-            fh.write(line + "\n")
+    write_serialized(path, serialize_lad(adj))
 
 
 def write_vertex_labelled_lad(path: Path, adj: list[list[int]], labels: list[int]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        fh.write(f"{len(adj)}\n")
-        for i, neighbors in enumerate(adj):
-            line = f"{labels[i]} {len(neighbors)}"
-            if neighbors:
-                line += " " + " ".join(str(v) for v in neighbors)
-            fh.write(line + "\n")
+    write_serialized(path, serialize_vertex_labelled_lad(adj, labels))
 
 
 def write_grf(path: Path, adj: list[list[int]], labels: list[int]) -> None:
@@ -413,73 +1282,157 @@ def write_grf(path: Path, adj: list[list[int]], labels: list[int]) -> None:
 
 
 def write_vf(path: Path, adj: list[list[int]], labels: list[int]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        fh.write(f"{len(adj)}\n")
-        for i, label in enumerate(labels):
-            fh.write(f"{i} {label}\n")
-        for i, neighbors in enumerate(adj):
-            fh.write(f"{len(neighbors)}\n")
-            for v in neighbors:
-                fh.write(f"{i} {v}\n")
-
-
-def main() -> None:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--algorithm", required=True)
-    parser.add_argument("--n", required=True)
-    parser.add_argument("--k", default="")
-    parser.add_argument("--out-dir", required=True)
-    parser.add_argument("--density", default="0.05")
-    parser.add_argument("--graph-family", default="random_density")
-    parser.add_argument("--seed", default="")
-    args = parser.parse_args()
-
-    algorithm = args.algorithm.strip().lower()
-    if algorithm not in {"dijkstra", "sp_via", "glasgow", "vf3", "subgraph"}:
+    write_serialized(path, serialize_vf(adj, labels))
+
+
+# Subgraph input formats and the file each one produces per graph role.
+SUBGRAPH_FORMATS = ("lad", "vf")
+SUBGRAPH_FORMAT_FILES = {
+    "lad": {"pattern": ("lad_pattern", "glasgow_pattern.lad"), "target": ("lad_target", "glasgow_target.lad")},
+    "vf": {"pattern": ("vf_pattern", "vf3_pattern.vf"), "target": ("vf_target", "vf3_target.vf")},
+}
+_SUBGRAPH_SERIALIZERS = {"lad": serialize_vertex_labelled_lad, "vf": serialize_vf}
+
+
+def normalize_subgraph_formats(formats) -> tuple[str, ...]:
+    if formats is None:
+        return SUBGRAPH_FORMATS
+    requested = {str(item).strip().lower() for item in formats}
+    unknown = requested.difference(SUBGRAPH_FORMATS)
+    if unknown:
+        raise ValueError(f"subgraph formats must be drawn from: {', '.join(SUBGRAPH_FORMATS)}")
+    if not requested:
+        raise ValueError("at least one subgraph format is required")
+    return tuple(fmt for fmt in SUBGRAPH_FORMATS if fmt in requested)
+
+
+def write_subgraph_graph(out_dir: Path, role: str, adj: list[list[int]], labels: list[int], formats=None) -> dict[str, Path]:
+    """Write one labelled subgraph input graph (``role`` is pattern or target)."""
+    written: dict[str, Path] = {}
+    for fmt in normalize_subgraph_formats(formats):
+        key, name = SUBGRAPH_FORMAT_FILES[fmt][role]
+        written[key] = out_dir / name
+        write_serialized(written[key], _SUBGRAPH_SERIALIZERS[fmt](adj, labels))
+    return written
+
+
+def write_subgraph_formats(
+    out_dir: Path,
+    *,
+    target_adj: list[list[int]],
+    pattern_adj: list[list[int]],
+    target_labels: list[int],
+    pattern_labels: list[int],
+    formats=None,
+) -> dict[str, Path]:
+    """Write the labelled pattern/target pair only in the requested formats."""
+    written: dict[str, Path] = {}
+    for fmt in normalize_subgraph_formats(formats):
+        written.update(write_subgraph_graph(out_dir, "pattern", pattern_adj, pattern_labels, [fmt]))
+        written.update(write_subgraph_graph(out_dir, "target", target_adj, target_labels, [fmt]))
+    return written
+
+
+SUPPORTED_ALGORITHMS = ("dijkstra", "sp_via", "glasgow", "vf3", "subgraph")
+
+
+@dataclass(frozen=True)
+class GenerationRequest:
+    algorithm: str
+    out_dir: Path
+    n: int
+    density: float
+    seed: int
+    k: int | None = None
+    graph_family: str = "random_density"
+    engine: str = DEFAULT_GENERATOR_ENGINE
+    stream: bool = False
+    backend: str = DEFAULT_GENERATOR_BACKEND
+
+
+@dataclass(frozen=True)
+class GeneratedInputs:
+    """Files written for one request.
+
+    ``files`` keeps the CLI order (LAD pattern/target, then VF pattern/target, or the
+    single CSV); ``paths`` names them (`dijkstra`/`sp_via`, `lad_pattern`,
+    `lad_target`, `vf_pattern`, `vf_target`).
+    """
+
+    request: GenerationRequest
+    files: tuple[Path, ...]
+    paths: dict[str, Path]
+    metadata: dict
+    metadata_path: Path
+
+
+def _validated_request(request: GenerationRequest) -> GenerationRequest:
+    algorithm = str(request.algorithm).strip().lower()
+    if algorithm not in SUPPORTED_ALGORITHMS:
         raise ValueError("Unknown algorithm for generation")
-
-    n = parse_int(args.n, "N", minimum=2)
+    n = parse_int(request.n, "N", minimum=2)
     k = None
     if algorithm in {"glasgow", "vf3", "subgraph"}:
-        if args.k is None or str(args.k).strip() == "":
+        if request.k is None or str(request.k).strip() == "":
             raise ValueError("k is required for subgraph generation")
-        k = parse_int(args.k, "k", minimum=1)
+        k = parse_int(request.k, "k", minimum=1)
         if k >= n:
             raise ValueError("k must be smaller than N")
-
     try:
-        density = float(args.density)
+        density = float(request.density)
     except (TypeError, ValueError):
         raise ValueError("density must be a number between 0 and 1")
     if density <= 0 or density > 1:
         raise ValueError("density must be in the range (0, 1]")
-    graph_family = normalize_graph_family(args.graph_family)
-
-    seed = int(args.seed) if str(args.seed).strip() else int(time.time() * 1000) & 0xFFFFFFFF
+    return GenerationRequest(
+        algorithm=algorithm,
+        out_dir=Path(request.out_dir),
+        n=n,
+        density=density,
+        seed=int(request.seed),
+        k=k,
+        graph_family=normalize_graph_family(request.graph_family),
+        engine=normalize_generator_engine(request.engine),
+        stream=bool(request.stream),
+        backend=resolve_generator_backend(request.backend),
+    )
+
+
+def generate_inputs(request: GenerationRequest) -> GeneratedInputs:
+    request = _validated_request(request)
+    algorithm, n, k, density, seed = request.algorithm, request.n, request.k, request.density, request.seed
+    graph_family = request.graph_family
     rng = random.Random(seed)
-    out_dir = Path(args.out_dir)
+    out_dir = request.out_dir
 
-    generated = []
+    generated: list[Path] = []
+    named: dict[str, Path] = {}
 
     pattern_nodes = None
     metadata_via_label: str | None = None
+    # The numpy backend always writes shortest-path edges through the streaming CSV path.
+    streamed = bool(request.stream) or request.backend == "numpy"
     if algorithm in {"dijkstra", "sp_via"}:
-        labels = [f"v{i}" for i in range(n)]
-        edges = generate_directed_edges(n, rng, density, graph_family=graph_family)
         via_label = None
         if algorithm == "sp_via":
             via_index = max(0, min(n - 1, n // 2))
             if n > 2 and via_index in {0, n - 1}:
                 via_index = 1
-            via_label = labels[via_index]
+            via_label = f"v{via_index}"
         path = out_dir / ("sp_via_generated.csv" if algorithm == "sp_via" else "dijkstra_generated.csv")
-        write_dijkstra_csv(path, edges, labels, via_label=via_label)
+        if streamed:
+            edges = stream_directed_edges(n, rng, density, graph_family=graph_family, engine=request.engine, backend=request.backend)
+            edge_count = write_dijkstra_csv_stream(path, edges, n, via_label=via_label)
+        else:
+            edges = generate_directed_edges(n, rng, density, graph_family=graph_family, engine=request.engine)
+            write_dijkstra_csv(path, edges, [f"v{i}" for i in range(n)], via_label=via_label)
+            edge_count = len(edges)
         generated.append(path)
+        named[algorithm] = path
         metadata_via_label = via_label
     else:
         labels = None
-        target_adj = generate_adjacency(n, rng, density, graph_family=graph_family)
+        target_adj = generate_adjacency(n, rng, density, graph_family=graph_family, engine=request.engine, backend=request.backend)
         undirected_adj = sanitize_undirected_simple_adj(build_undirected_adj(target_adj))
         assert_undirected_simple_adj(undirected_adj, "target_adj")
         if algorithm in {"glasgow", "vf3", "subgraph"}:
@@ -510,6 +1463,8 @@ def main() -> None:
                 write_vertex_labelled_lad(target_path, target_adj, labels)
                 write_vertex_labelled_lad(pattern_path, pattern_adj, pattern_labels)
             generated.extend([pattern_path, target_path])
+            named["lad_pattern"] = pattern_path
+            named["lad_target"] = target_path
 
         if algorithm in {"vf3", "subgraph"}:
             if labels is None:
@@ -520,6 +1475,8 @@ def main() -> None:
             write_vf(target_path, target_adj, labels)
             write_vf(pattern_path, pattern_adj, pattern_labels)
             generated.extend([pattern_path, target_path])
+            named["vf_pattern"] = pattern_path
+            named["vf_target"] = target_path
 
     metadata = {
         "algorithm": algorithm,
@@ -528,11 +1485,22 @@ def main() -> None:
         "k": k,
         "density": density,
         "seed": seed,
+        "generator_engine": request.engine,
+        "generator_algorithm": generator_algorithm(
+            graph_family,
+            request.engine,
+            directed=algorithm in {"dijkstra", "sp_via"},
+            streaming=streamed,
+            backend=request.backend,
+        ),
+        "generator_backend": request.backend,
+        "generator_rng": generator_rng_semantics(request.backend),
         "files": [p.as_posix() for p in generated],
     }
     if algorithm in {"dijkstra", "sp_via"}:
         max_edges = n * (n - 1)
-        metadata["actual_density"] = 0.0 if max_edges <= 0 else float(len(edges)) / float(max_edges)
+        metadata["generator_streaming"] = streamed
+        metadata["actual_density"] = 0.0 if max_edges <= 0 else float(edge_count) / float(max_edges)
     else:
         max_edges = (n * (n - 1)) // 2
         actual_edges = _count_undirected_edges(undirected_adj)
@@ -542,9 +1510,54 @@ def main() -> None:
             metadata["via"] = metadata_via_label
     if pattern_nodes is not None:
         metadata["pattern_nodes"] = [int(x) for x in pattern_nodes]
-    (out_dir / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+    metadata_path = out_dir / "metadata.json"
+    metadata_path.write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+    return GeneratedInputs(request=request, files=tuple(generated), paths=named, metadata=metadata, metadata_path=metadata_path)
+
+
+def generate_inputs_batch(requests: Iterable[GenerationRequest], *, max_workers: int = 1) -> list[GeneratedInputs]:
+    """Generate many requests in this process, or across ``max_workers`` processes.
+
+    Results are returned in request order either way.
+    """
+    requests = list(requests)
+    workers = int(max(1, min(int(max_workers or 1), len(requests) or 1)))
+    if workers == 1:
+        return [generate_inputs(request) for request in requests]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_inputs, requests))
 
-    print(",".join(p.as_posix() for p in generated))
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--algorithm", required=True)
+    parser.add_argument("--n", required=True)
+    parser.add_argument("--k", default="")
+    parser.add_argument("--out-dir", required=True)
+    parser.add_argument("--density", default="0.05")
+    parser.add_argument("--graph-family", default="random_density")
+    parser.add_argument("--seed", default="")
+    parser.add_argument("--engine", default=DEFAULT_GENERATOR_ENGINE, choices=list(GENERATOR_ENGINES))
+    parser.add_argument("--backend", default=DEFAULT_GENERATOR_BACKEND, choices=list(GENERATOR_BACKENDS), help="numpy falls back to python when NumPy is not installed.")
+    parser.add_argument("--stream", action="store_true", help="Stream shortest-path edges to the CSV in chunks (bounded memory).")
+    args = parser.parse_args()
+
+    seed = int(args.seed) if str(args.seed).strip() else int(time.time() * 1000) & 0xFFFFFFFF
+    result = generate_inputs(
+        GenerationRequest(
+            algorithm=args.algorithm,
+            out_dir=Path(args.out_dir),
+            n=args.n,
+            density=args.density,
+            seed=seed,
+            k=None if str(args.k).strip() == "" else args.k,
+            graph_family=args.graph_family,
+            engine=args.engine,
+            stream=args.stream,
+            backend=args.backend,
+        )
+    )
+    print(",".join(p.as_posix() for p in result.files))
 
 
 if __name__ == "__main__":
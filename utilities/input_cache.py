@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+# - Generated benchmark inputs are a pure function of the generator parameters
+#   and the generator code, so identical requests share one cached entry.
+# - Entries are built in a private temp directory and published with a single
+#   directory rename; readers never observe a half-written entry, and a losing
+#   concurrent publisher simply discards its copy.
+# - Trial directories receive hard links (reflink or copy as fallbacks), so
+#   deleting a run's generated inputs never touches the cache.
+# - Eviction is least-recently-used by the entry marker's mtime, which every
+#   cache hit refreshes.
+# - A pre-generated input store is the same layout opened without a size cap to
+#   fill it, and read-only to consume it: misses then build straight into the
+#   trial directory and nothing under the store is written or touched.
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import fcntl
+except Exception:
+    fcntl = None
+
+
+ENTRY_MARKER = "_entry.json"
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)); shares extents on btrfs/XFS.
+_FICLONE = 0x40049409
+
+
+def cache_key(params: dict[str, Any], code_version: str) -> str:
+    payload = json.dumps({"params": params, "code_version": str(code_version)}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(src, "rb") as src_fh, open(dst, "wb") as dst_fh:
+            fcntl.ioctl(dst_fh.fileno(), _FICLONE, src_fh.fileno())
+        return True
+    except OSError:
+        try:
+            dst.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    if _reflink(src, dst):
+        return "reflink"
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _encode_result(result: dict[str, Any], build_dir: Path) -> dict[str, dict[str, str]]:
+    encoded: dict[str, dict[str, str]] = {}
+    for name, value in result.items():
+        if isinstance(value, Path):
+            try:
+                encoded[name] = {"file": Path(value).resolve().relative_to(build_dir.resolve()).as_posix()}
+                continue
+            except ValueError:
+                pass
+        encoded[name] = {"value": str(value)}
+    return encoded
+
+
+def _decode_result(encoded: dict[str, dict[str, str]], out_dir: Path) -> dict[str, Path | str]:
+    result: dict[str, Path | str] = {}
+    for name, item in encoded.items():
+        if "file" in item:
+            result[name] = out_dir / item["file"]
+        else:
+            result[name] = item.get("value", "")
+    return result
+
+
+class InputCache:
+    """On-disk, size-capped cache of generated input directories.
+
+    ``materialize(key, out_dir, build)`` fills ``out_dir`` with the files of the
+    entry for ``key``, calling ``build(directory)`` to create the entry on a miss.
+    ``build`` returns the usual generator result dict; ``Path`` values inside the
+    build directory are mapped to the matching files under ``out_dir``.
+    ``max_bytes=None`` never evicts; ``read_only=True`` never publishes.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int | None, read_only: bool = False) -> None:
+        self.root = Path(root)
+        self.max_bytes = None if max_bytes is None else int(max(0, max_bytes))
+        self.read_only = bool(read_only)
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def entries_dir(self) -> Path:
+        return self.root / "entries"
+
+    def entry_dir(self, key: str) -> Path:
+        return self.entries_dir / key[:2] / key
+
+    def _read_entry(self, key: str) -> dict | None:
+        marker = self.entry_dir(key) / ENTRY_MARKER
+        try:
+            return json.loads(marker.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _publish(self, key: str, build: Callable[[Path], dict[str, Any]]) -> dict:
+        tmp_root = self.root / "tmp"
+        tmp_root.mkdir(parents=True, exist_ok=True)
+        build_dir = tmp_root / f"{key}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        build_dir.mkdir(parents=True)
+        try:
+            result = build(build_dir)
+            size_bytes = 0
+            for path in build_dir.rglob("*"):
+                if path.is_file():
+                    size_bytes += int(path.stat().st_size)
+            entry = {"key": key, "size_bytes": size_bytes, "result": _encode_result(result, build_dir)}
+            (build_dir / ENTRY_MARKER).write_text(json.dumps(entry, indent=2) + "\n", encoding="utf-8")
+            final_dir = self.entry_dir(key)
+            final_dir.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(build_dir, final_dir)
+            except OSError:
+                # Another process published the same key first; its entry is identical.
+                if not (final_dir / ENTRY_MARKER).exists():
+                    raise
+            return entry
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+    def materialize(self, key: str, out_dir: Path, build: Callable[[Path], dict[str, Any]]) -> dict[str, Path | str]:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        entry = self._read_entry(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            if self.read_only:
+                return build(out_dir)
+            entry = self._publish(key, build)
+            self.evict()
+        else:
+            self.stats["hits"] += 1
+        source_dir = self.entry_dir(key)
+        try:
+            if not self.read_only:
+                os.utime(source_dir / ENTRY_MARKER)
+            for path in source_dir.rglob("*"):
+                if path.is_file() and path.name != ENTRY_MARKER:
+                    link_or_copy(path, out_dir / path.relative_to(source_dir))
+        except OSError:
+            # Entry evicted underneath us: generate straight into the trial directory.
+            return build(out_dir)
+        return _decode_result(entry["result"], out_dir)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        if not self.entries_dir.exists():
+            return entries
+        for marker in self.entries_dir.glob(f"*/*/{ENTRY_MARKER}"):
+            try:
+                stat = marker.stat()
+                size_bytes = int(json.loads(marker.read_text(encoding="utf-8")).get("size_bytes") or 0)
+            except (OSError, ValueError):
+                continue
+            entries.append((float(stat.st_mtime), size_bytes, marker.parent))
+        return entries
+
+    def total_bytes(self) -> int:
+        return sum(size for _mtime, size, _path in self._entries())
+
+    def evict(self) -> int:
+        if self.max_bytes is None:
+            self._sweep_stale_tmp()
+            return 0
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        # The newest entry always survives so an oversized input is still reusable once.
+        while total > self.max_bytes and len(entries) > 1:
+            _mtime, size_bytes, path = entries.pop(0)
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size_bytes
+            removed += 1
+        self.stats["evictions"] += removed
+        self._sweep_stale_tmp()
+        return removed
+
+    def _sweep_stale_tmp(self, max_age_seconds: float = 24 * 3600.0) -> None:
+        tmp_root = self.root / "tmp"
+        if not tmp_root.exists():
+            return
+        cutoff = time.time() - max_age_seconds
+        for child in tmp_root.iterdir():
+            try:
+                if child.stat().st_mtime < cutoff:
+                    shutil.rmtree(child, ignore_errors=True)
+            except OSError:
+                continue
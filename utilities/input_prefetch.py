@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+# - Input generation is pure Python and can take seconds at large N; running it in
+#   worker processes keeps the solver scheduler free to submit trials meanwhile.
+# - Jobs carry the exact output directory and seed the synchronous path would use,
+#   so prefetching never changes which inputs a trial sees.
+# - Consumers must take jobs in the order the job iterator yields them; a key
+#   mismatch returns None and the caller generates synchronously instead.
+
+import concurrent.futures
+import multiprocessing
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+
+@dataclass
+class PrefetchJob:
+    key: Hashable
+    out_dir: Path
+    fn: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+
+
+def _run_job(out_dir: Path, fn: Callable[..., Any], args: tuple, kwargs: dict) -> tuple[Any, int]:
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    result = fn(*args, **kwargs)
+    return result, directory_size_bytes(Path(out_dir))
+
+
+def directory_size_bytes(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+class InputPrefetcher:
+    """Generates upcoming input sets in a process pool, strictly in job order.
+
+    ``lookahead`` bounds how many generated-but-untaken sets may exist at once;
+    ``disk_budget_bytes`` stops new prefetches while the untaken sets (pending ones
+    estimated from the average finished size) would exceed it. One job is always
+    allowed so the run makes progress whatever the budget.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[PrefetchJob],
+        *,
+        lookahead: int,
+        disk_budget_bytes: int | None = None,
+        max_processes: int | None = None,
+    ) -> None:
+        self._jobs: Iterator[PrefetchJob] = iter(jobs)
+        self.lookahead = int(max(1, lookahead))
+        self.disk_budget_bytes = None if disk_budget_bytes is None else int(max(0, disk_budget_bytes))
+        processes = max_processes if max_processes is not None else min(self.lookahead, max(1, (os.cpu_count() or 2) // 2))
+        # Spawned workers avoid forking a parent that already runs solver and Tk threads.
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=int(max(1, processes)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._queue: list[tuple[PrefetchJob, concurrent.futures.Future]] = []
+        self._exhausted = False
+        self._finished_sizes: list[int] = []
+        self.stats = {"prefetched": 0, "taken": 0, "fallbacks": 0, "budget_stalls": 0}
+        self._top_up()
+
+    def _queued_bytes(self) -> int:
+        average = (sum(self._finished_sizes) / len(self._finished_sizes)) if self._finished_sizes else 0.0
+        total = 0.0
+        for _job, future in self._queue:
+            if future.done() and future.exception() is None:
+                total += future.result()[1]
+            else:
+                total += average
+        return int(total)
+
+    def _top_up(self) -> None:
+        while not self._exhausted and len(self._queue) < self.lookahead:
+            if self._queue and self.disk_budget_bytes is not None and self._queued_bytes() >= self.disk_budget_bytes:
+                self.stats["budget_stalls"] += 1
+                return
+            job = next(self._jobs, None)
+            if job is None:
+                self._exhausted = True
+                return
+            future = self._executor.submit(_run_job, job.out_dir, job.fn, job.args, job.kwargs)
+            self._queue.append((job, future))
+            self.stats["prefetched"] += 1
+
+    def take(self, key: Hashable) -> Any | None:
+        if not self._queue or self._queue[0][0].key != key:
+            self.stats["fallbacks"] += 1
+            return None
+        _job, future = self._queue.pop(0)
+        result, size_bytes = future.result()
+        self._finished_sizes.append(int(size_bytes))
+        self.stats["taken"] += 1
+        self._top_up()
+        return result
+
+    def close(self, *, delete_untaken: bool = True) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if delete_untaken:
+            for job, _future in self._queue:
+                shutil.rmtree(job.out_dir, ignore_errors=True)
+        self._queue.clear()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+# - Kernel accounting from os.wait4 is exact and free while the solver runs;
+#   sampling is only the fallback for hosts without wait4 (Windows).
+# - Linux seeds a child's ru_maxrss with the spawning process's own RSS
+#   high-water mark, so kernel values at or below that floor are ambiguous and
+#   the sampled VmHWM of the child's fresh address space is reported instead.
+# - Field names are embedded in trial NDJSON rows; keep them stable.
+
+import os
+import sys
+from pathlib import Path
+
+try:
+    import psutil  # type: ignore
+except Exception:
+    psutil = None
+
+try:
+    import resource
+except Exception:
+    resource = None
+
+
+MEMORY_BACKEND_WAIT4 = "wait4_rusage"
+# Kernel value at or below the inherited floor with no usable sample: an upper bound only.
+MEMORY_BACKEND_WAIT4_UPPER_BOUND = "wait4_rusage_upper_bound"
+MEMORY_BACKEND_PROC_STATUS = "proc_status_poll"
+MEMORY_BACKEND_PSUTIL = "psutil_poll"
+MEMORY_BACKEND_UNAVAILABLE = "unavailable"
+
+
+def wait4_available() -> bool:
+    return hasattr(os, "wait4") and hasattr(os, "WNOHANG") and not sys.platform.startswith("win")
+
+
+def _maxrss_to_kb(value) -> float:
+    # macOS reports ru_maxrss in bytes; Linux and the BSDs report KiB.
+    if sys.platform == "darwin":
+        return float(value) / 1024.0
+    return float(value)
+
+
+def rusage_to_dict(usage) -> dict:
+    return {
+        "max_rss_kb": _maxrss_to_kb(usage.ru_maxrss),
+        "user_cpu_ms": float(usage.ru_utime) * 1000.0,
+        "system_cpu_ms": float(usage.ru_stime) * 1000.0,
+        "minor_faults": int(usage.ru_minflt),
+        "major_faults": int(usage.ru_majflt),
+        "voluntary_context_switches": int(usage.ru_nvcsw),
+        "involuntary_context_switches": int(usage.ru_nivcsw),
+        "block_input_ops": int(usage.ru_inblock),
+        "block_output_ops": int(usage.ru_oublock),
+    }
+
+
+def self_max_rss_kb() -> float | None:
+    if resource is None:
+        return None
+    try:
+        return _maxrss_to_kb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    except Exception:
+        return None
+
+
+def read_proc_status_kb(pid: int, field: str) -> int | None:
+    prefix = f"{field}:"
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                if not line.startswith(prefix):
+                    continue
+                parts = line.split()
+                return max(0, int(parts[1])) if len(parts) >= 2 else None
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+class ChildResourceMonitor:
+    """Reaps one Popen child and reports its peak memory and kernel rusage.
+
+    Call ``poll()`` in place of ``Popen.poll()`` and ``sample()`` while the
+    child is alive; ``peak_kb()`` and ``measurement()`` are final once
+    ``poll()`` has returned an exit code.
+    """
+
+    def __init__(self, proc, *, allow_sampling: bool = True) -> None:
+        self.proc = proc
+        self.rusage: dict | None = None
+        self.sampled_peak_kb = 0.0
+        self.use_wait4 = wait4_available()
+        # Upper bound for the RSS floor the child inherited when it was spawned.
+        self.inherited_floor_kb = self_max_rss_kb() if self.use_wait4 else None
+        self._proc_status = sys.platform.startswith("linux") and Path(f"/proc/{proc.pid}").exists()
+        self._ps_proc = None
+        if allow_sampling and not self._proc_status and psutil is not None:
+            try:
+                self._ps_proc = psutil.Process(proc.pid)
+            except psutil.Error:
+                # Child can exit before psutil attaches; rely on rusage only.
+                self._ps_proc = None
+        self._sampling = bool(allow_sampling and (self._proc_status or self._ps_proc is not None))
+        # Popen returns after exec, so one immediate sample already sees the solver image.
+        self.sample()
+
+    def poll(self) -> int | None:
+        if self.proc.returncode is not None:
+            return self.proc.returncode
+        if not self.use_wait4:
+            return self.proc.poll()
+        try:
+            pid, status, usage = os.wait4(self.proc.pid, os.WNOHANG)
+        except ChildProcessError:
+            return self.proc.poll()
+        if pid == 0:
+            return None
+        self.rusage = rusage_to_dict(usage)
+        self.proc.returncode = os.waitstatus_to_exitcode(status)
+        return self.proc.returncode
+
+    @property
+    def needs_samples(self) -> bool:
+        return self._sampling
+
+    def sample(self) -> None:
+        if not self._sampling:
+            return
+        if self.inherited_floor_kb is not None and self.sampled_peak_kb > self.inherited_floor_kb:
+            # The kernel value will clear the inherited floor, so it is exact.
+            self._sampling = False
+            return
+        candidate_kb = None
+        if self._proc_status:
+            candidate_kb = read_proc_status_kb(self.proc.pid, "VmHWM")
+        elif self._ps_proc is not None:
+            try:
+                mem_info = self._ps_proc.memory_info()
+                candidate = getattr(mem_info, "peak_wset", None)
+                if candidate is None:
+                    candidate = mem_info.rss
+                candidate_kb = float(candidate) / 1024.0
+            except psutil.Error:
+                self._ps_proc = None
+        if candidate_kb is not None:
+            self.sampled_peak_kb = max(self.sampled_peak_kb, float(candidate_kb))
+
+    def _kernel_peak_is_exact(self) -> bool:
+        if self.rusage is None:
+            return False
+        floor_kb = self.inherited_floor_kb
+        return floor_kb is None or float(self.rusage["max_rss_kb"]) > floor_kb
+
+    def _kernel_peak_is_fallback(self) -> bool:
+        return self.rusage is not None and self.sampled_peak_kb <= 0
+
+    def peak_kb(self) -> float:
+        if self._kernel_peak_is_exact() or self._kernel_peak_is_fallback():
+            return max(0.0, float(self.rusage["max_rss_kb"]))
+        return max(0.0, self.sampled_peak_kb)
+
+    def memory_backend(self) -> str:
+        if self._kernel_peak_is_exact():
+            return MEMORY_BACKEND_WAIT4
+        if self._kernel_peak_is_fallback():
+            return MEMORY_BACKEND_WAIT4_UPPER_BOUND
+        if self._proc_status:
+            return MEMORY_BACKEND_PROC_STATUS
+        if self._ps_proc is not None or self.sampled_peak_kb > 0:
+            return MEMORY_BACKEND_PSUTIL
+        return MEMORY_BACKEND_UNAVAILABLE
+
+    def measurement(self) -> dict:
+        return {
+            "memory_backend": self.memory_backend(),
+            "rusage": dict(self.rusage) if self.rusage is not None else None,
+        }
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+# - One daemon thread supervises every in-flight solver process: exits arrive
+#   through pidfd (Linux), output through a selector, and timeouts, heartbeats,
+#   memory sampling and pause/abort checks share a single timer heap, so trial
+#   threads block on an event instead of spinning in sleep/poll loops.
+# - Hosts without pidfd fall back to a short exit-poll timer in that same
+#   thread; Windows pipes are not selectable, so there the trial thread drains
+#   output with communicate() while the supervisor handles everything else.
+# - Reaping belongs to the supervisor (rusage is collected by the monitor);
+#   other code should read Popen.returncode instead of calling poll().
+
+import heapq
+import itertools
+import os
+import selectors
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable
+
+from utilities.process_metrics import ChildResourceMonitor
+
+OUTCOME_EXITED = "exited"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ABORTED = "aborted"
+
+EXIT_POLL_INTERVAL_SECONDS = 0.02
+SAMPLE_INTERVAL_SECONDS = 0.02
+CONTROL_INTERVAL_SECONDS = 0.1
+HEARTBEAT_AFTER_SECONDS = 15
+KILL_GRACE_SECONDS = 2.0
+
+
+def decode_process_output(chunks: list[bytes]) -> str:
+    # Matches Popen(text=True, encoding="utf-8", errors="replace") universal newlines.
+    text = b"".join(chunks).decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class SupervisedProcess:
+    """Handle for one watched child; ``wait()`` blocks until an outcome is known."""
+
+    def __init__(
+        self,
+        proc: subprocess.Popen,
+        *,
+        started: float,
+        stop_event: threading.Event | None,
+        pause_event: threading.Event | None,
+        timeout_seconds: float | None,
+        on_heartbeat: Callable[[int], None] | None,
+        on_pause: Callable[[], None] | None,
+    ) -> None:
+        self.proc = proc
+        self.monitor = ChildResourceMonitor(proc)
+        self.started = float(started)
+        self.ended: float | None = None
+        self.outcome: str | None = None
+        self.timeout_seconds = None if timeout_seconds is None else float(timeout_seconds)
+        self.timeout_elapsed_seconds: float | None = None
+        self.stop_event = stop_event
+        self.pause_event = pause_event
+        self.on_heartbeat = on_heartbeat
+        self.on_pause = on_pause
+        self.paused_accumulated = 0.0
+        self.paused_since: float | None = None
+        self.last_heartbeat_second = -1
+        self.drains_pipes = False
+        self.stdout_chunks: list[bytes] = []
+        self.stderr_chunks: list[bytes] = []
+        self._open_pipes = 0
+        self._exited = threading.Event()
+        self._decided = threading.Event()
+        self._finished = threading.Event()
+        self._pidfd: int | None = None
+
+    def active_elapsed(self, now: float) -> float:
+        paused = self.paused_accumulated
+        if self.paused_since is not None:
+            paused += max(0.0, now - self.paused_since)
+        return max(0.0, now - self.started - paused)
+
+    def wait(self) -> str:
+        # Timeouts and aborts still block until the child is reaped (SIGKILL after the
+        # grace period), so a lingering solver never overlaps the next trial's measurements.
+        self._decided.wait()
+        self._exited.wait()
+        if self.outcome == OUTCOME_EXITED:
+            self._finished.wait()
+        return str(self.outcome)
+
+    def take_output(self) -> tuple[str, str]:
+        # Pending timers may outlive the trial, so hand the buffers over instead of keeping them.
+        stdout_chunks, self.stdout_chunks = self.stdout_chunks, []
+        stderr_chunks, self.stderr_chunks = self.stderr_chunks, []
+        return decode_process_output(stdout_chunks), decode_process_output(stderr_chunks)
+
+    @property
+    def retired(self) -> bool:
+        return self._exited.is_set() and (not self.drains_pipes or self._open_pipes <= 0)
+
+
+class ProcessSupervisor:
+    """Single-threaded event loop that watches solver processes."""
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending: list[SupervisedProcess] = []
+        self._watched: set[SupervisedProcess] = set()
+        self._timers: list[tuple[float, int, Callable[[], None]]] = []
+        self._timer_seq = itertools.count()
+        self._control_scheduled = False
+        self._thread: threading.Thread | None = None
+        # A socket pair is selectable on every platform, unlike pipes on Windows.
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._selector.register(self._wake_recv, selectors.EVENT_READ, self._drain_wake)
+        self._pipes_selectable = os.name == "posix"
+
+    def watch(
+        self,
+        proc: subprocess.Popen,
+        *,
+        started: float | None = None,
+        stop_event: threading.Event | None = None,
+        pause_event: threading.Event | None = None,
+        timeout_seconds: float | None = None,
+        on_heartbeat: Callable[[int], None] | None = None,
+        on_pause: Callable[[], None] | None = None,
+    ) -> SupervisedProcess:
+        handle = SupervisedProcess(
+            proc,
+            started=time.perf_counter() if started is None else started,
+            stop_event=stop_event,
+            pause_event=pause_event,
+            timeout_seconds=timeout_seconds,
+            on_heartbeat=on_heartbeat,
+            on_pause=on_pause,
+        )
+        handle.drains_pipes = self._pipes_selectable
+        with self._lock:
+            self._pending.append(handle)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="process-supervisor", daemon=True)
+                self._thread.start()
+        self._wake()
+        return handle
+
+    def _wake(self) -> None:
+        try:
+            self._wake_send.send(b"\0")
+        except (BlockingIOError, OSError):
+            # A full wake buffer already guarantees a pending wake-up.
+            pass
+
+    def _drain_wake(self, _key) -> None:
+        try:
+            while self._wake_recv.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        heapq.heappush(self._timers, (time.perf_counter() + max(0.0, float(delay)), next(self._timer_seq), callback))
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            for handle in pending:
+                self._register(handle)
+            timeout = None
+            if self._timers:
+                timeout = max(0.0, self._timers[0][0] - time.perf_counter())
+            for key, _mask in self._selector.select(timeout):
+                self._guard(key.data, key)
+            now = time.perf_counter()
+            while self._timers and self._timers[0][0] <= now:
+                _deadline, _seq, callback = heapq.heappop(self._timers)
+                self._guard(callback)
+
+    @staticmethod
+    def _guard(callback, *args) -> None:
+        try:
+            callback(*args)
+        except Exception as exc:
+            print(f"Warning: process supervisor callback failed: {exc}", file=sys.stderr)
+
+    def _register(self, handle: SupervisedProcess) -> None:
+        self._watched.add(handle)
+        proc = handle.proc
+        if handle.drains_pipes:
+            for stream, sink in ((proc.stdout, handle.stdout_chunks), (proc.stderr, handle.stderr_chunks)):
+                if stream is None:
+                    continue
+                handle._open_pipes += 1
+                self._selector.register(stream, selectors.EVENT_READ, self._make_pipe_reader(handle, stream, sink))
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is not None:
+            try:
+                handle._pidfd = pidfd_open(proc.pid)
+            except OSError:
+                handle._pidfd = None
+        if handle._pidfd is not None:
+            self._selector.register(handle._pidfd, selectors.EVENT_READ, lambda _key, h=handle: self._reap(h))
+        self._schedule_tick(handle, 0.0)
+        if handle.timeout_seconds is not None:
+            self._call_later(handle.timeout_seconds, lambda h=handle: self._check_timeout(h))
+        if handle.on_heartbeat is not None:
+            self._call_later(HEARTBEAT_AFTER_SECONDS, lambda h=handle: self._heartbeat(h))
+        if not self._control_scheduled:
+            self._control_scheduled = True
+            self._call_later(CONTROL_INTERVAL_SECONDS, self._control_tick)
+
+    def _make_pipe_reader(self, handle: SupervisedProcess, stream, sink: list[bytes]):
+        fd = stream.fileno()
+
+        def _read(_key) -> None:
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                return
+            except OSError:
+                chunk = b""
+            if chunk:
+                sink.append(chunk)
+                return
+            self._selector.unregister(stream)
+            try:
+                stream.close()
+            except OSError:
+                pass
+            handle._open_pipes -= 1
+            if handle._open_pipes <= 0 and not handle._exited.is_set():
+                # Both pipes closed: the child is usually exiting, so check now.
+                self._reap(handle)
+            self._retire_if_finished(handle)
+
+        return _read
+
+    def _schedule_tick(self, handle: SupervisedProcess, delay: float) -> None:
+        needs_exit_poll = handle._pidfd is None
+        if handle._exited.is_set():
+            return
+        if needs_exit_poll or handle.monitor.needs_samples:
+            self._call_later(delay, lambda h=handle: self._tick(h))
+
+    def _tick(self, handle: SupervisedProcess) -> None:
+        if handle._exited.is_set():
+            return
+        handle.monitor.sample()
+        if handle._pidfd is None:
+            self._reap(handle)
+        interval = EXIT_POLL_INTERVAL_SECONDS if handle._pidfd is None else SAMPLE_INTERVAL_SECONDS
+        self._schedule_tick(handle, interval)
+
+    def _reap(self, handle: SupervisedProcess) -> None:
+        if handle._exited.is_set():
+            return
+        if handle.monitor.poll() is None:
+            return
+        handle.ended = time.perf_counter()
+        if handle._pidfd is not None:
+            self._selector.unregister(handle._pidfd)
+            os.close(handle._pidfd)
+            handle._pidfd = None
+        handle._exited.set()
+        self._decide(handle, OUTCOME_EXITED)
+        self._retire_if_finished(handle)
+
+    def _decide(self, handle: SupervisedProcess, outcome: str) -> None:
+        if handle._decided.is_set():
+            return
+        handle.outcome = outcome
+        handle._decided.set()
+
+    def _retire_if_finished(self, handle: SupervisedProcess) -> None:
+        if handle.retired:
+            self._watched.discard(handle)
+            handle._finished.set()
+
+    def _terminate(self, handle: SupervisedProcess, *, escalate: bool) -> None:
+        if handle._exited.is_set():
+            return
+        try:
+            handle.proc.terminate()
+        except Exception:
+            pass
+        if escalate:
+            self._call_later(KILL_GRACE_SECONDS, lambda h=handle: self._kill(h))
+
+    def _kill(self, handle: SupervisedProcess) -> None:
+        if handle._exited.is_set():
+            return
+        try:
+            handle.proc.kill()
+        except Exception:
+            pass
+
+    def _check_timeout(self, handle: SupervisedProcess) -> None:
+        if handle._decided.is_set():
+            return
+        now = time.perf_counter()
+        if handle.paused_since is not None:
+            self._call_later(CONTROL_INTERVAL_SECONDS, lambda h=handle: self._check_timeout(h))
+            return
+        elapsed = handle.active_elapsed(now)
+        if elapsed < float(handle.timeout_seconds):
+            self._call_later(float(handle.timeout_seconds) - elapsed, lambda h=handle: self._check_timeout(h))
+            return
+        handle.timeout_elapsed_seconds = elapsed
+        self._decide(handle, OUTCOME_TIMEOUT)
+        self._terminate(handle, escalate=True)
+
+    def _heartbeat(self, handle: SupervisedProcess) -> None:
+        if handle._decided.is_set():
+            return
+        now = time.perf_counter()
+        elapsed = handle.active_elapsed(now)
+        if handle.paused_since is None:
+            elapsed_int = int(elapsed)
+            if elapsed_int >= HEARTBEAT_AFTER_SECONDS and elapsed_int != handle.last_heartbeat_second:
+                handle.last_heartbeat_second = elapsed_int
+                handle.on_heartbeat(elapsed_int)
+        self._call_later(max(0.05, float(int(elapsed) + 1) - elapsed), lambda h=handle: self._heartbeat(h))
+
+    def _control_tick(self) -> None:
+        now = time.perf_counter()
+        for handle in list(self._watched):
+            if handle._decided.is_set():
+                continue
+            if handle.stop_event is not None and handle.stop_event.is_set():
+                self._decide(handle, OUTCOME_ABORTED)
+                self._terminate(handle, escalate=True)
+                continue
+            paused = handle.pause_event is not None and handle.pause_event.is_set()
+            if paused and handle.paused_since is None:
+                handle.paused_since = now
+                if handle.on_pause is not None:
+                    self._guard(handle.on_pause)
+            elif not paused and handle.paused_since is not None:
+                handle.paused_accumulated += max(0.0, now - handle.paused_since)
+                handle.paused_since = None
+                handle.last_heartbeat_second = -1
+        if self._watched:
+            self._call_later(CONTROL_INTERVAL_SECONDS, self._control_tick)
+        else:
+            self._control_scheduled = False
+
+
+_DEFAULT_SUPERVISOR: ProcessSupervisor | None = None
+_DEFAULT_SUPERVISOR_LOCK = threading.Lock()
+
+
+def get_process_supervisor() -> ProcessSupervisor:
+    global _DEFAULT_SUPERVISOR
+    with _DEFAULT_SUPERVISOR_LOCK:
+        if _DEFAULT_SUPERVISOR is None:
+            _DEFAULT_SUPERVISOR = ProcessSupervisor()
+        return _DEFAULT_SUPERVISOR
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+# - A session store is one SQLite file per session holding the same datapoint
+#   and trial rows as the NDJSON streams, one typed column per row key, so a
+#   reader can select only the columns it needs instead of parsing every row.
+# - Numeric sample lists are packed little-endian float64/int64 BLOBs; readers
+#   view them with NumPy (np.frombuffer, no parsing) or unpack them with array.
+#   Nested objects and mixed lists are JSON text, and paths are stored as text.
+# - Columns are added as new row keys appear. A column whose values stop fitting
+#   its kind is widened once (integer -> real, int64 -> float64, otherwise
+#   JSON), rewriting the cells already stored, so rows always read back as
+#   they were written.
+# - Rows are appended in one transaction per flush with WAL journaling, so the
+#   file is usable (and readable from another process) while a run is still
+#   writing it. The NDJSON streams remain the canonical interchange format.
+
+import json
+import sqlite3
+import sys
+import threading
+from array import array
+from pathlib import Path, PurePath
+from typing import Any, Iterable, Iterator
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+SESSION_STORE_NAME = "benchmark-session.sqlite"
+SESSION_STORE_FORMAT = "capstone-session-store-v1"
+SESSION_STORE_TABLES = ("datapoints", "trials")
+ARRAY_KINDS = {"f8": "d", "i8": "q"}
+_READ_MMAP_BYTES = 256 * 1024 * 1024
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def value_kind(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if _is_int(value):
+        return "integer" if _INT64_MIN <= value <= _INT64_MAX else "json"
+    if isinstance(value, float):
+        return "real"
+    if isinstance(value, (str, PurePath)):
+        return "text"
+    if isinstance(value, (list, tuple)):
+        # An empty list is int64 so that it never widens a column on its own.
+        if all(_is_int(item) and _INT64_MIN <= item <= _INT64_MAX for item in value):
+            return "i8"
+        if all(_is_int(item) or isinstance(item, float) for item in value):
+            return "f8"
+    return "json"
+
+
+def join_kinds(current: str, incoming: str) -> str:
+    if incoming == current or incoming == "null":
+        return current
+    if current == "null":
+        return incoming
+    if {current, incoming} == {"integer", "real"}:
+        return "real"
+    if {current, incoming} == {"i8", "f8"}:
+        return "f8"
+    return "json"
+
+
+def _pack(typecode: str, values) -> bytes:
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(typecode: str, blob: bytes) -> list:
+    values = array(typecode)
+    values.frombytes(blob)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+def encode_cell(kind: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if kind in ARRAY_KINDS:
+        return _pack(ARRAY_KINDS[kind], [float(item) for item in value] if kind == "f8" else value)
+    if kind == "json":
+        return json.dumps(value, default=str)
+    if kind == "bool":
+        return int(bool(value))
+    if kind == "real":
+        return float(value)
+    if kind == "text":
+        return str(value)
+    return value
+
+
+def decode_cell(kind: str, cell: Any) -> Any:
+    if cell is None:
+        return None
+    if kind in ARRAY_KINDS:
+        return _unpack(ARRAY_KINDS[kind], cell)
+    if kind == "json":
+        return json.loads(cell)
+    if kind == "bool":
+        return bool(cell)
+    if kind == "real":
+        return float(cell)
+    return cell
+
+
+def _connect(path: Path, *, read_only: bool) -> sqlite3.Connection:
+    if read_only:
+        conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size={_READ_MMAP_BYTES}")
+    else:
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SessionStore:
+    """Incremental writer for ``benchmark-session.sqlite``.
+
+    ``append(table, rows)`` stores dict rows in ``datapoints`` or ``trials`` in one
+    transaction; ``set_payload(payload)`` records the session payload without its
+    ``datapoints`` list once the run has finished. An existing file is replaced.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(self.path) + suffix).unlink(missing_ok=True)
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path, read_only=False)
+        self._kinds: dict[str, dict[str, str]] = {table: {} for table in SESSION_STORE_TABLES}
+        with self._conn:
+            self._conn.execute("CREATE TABLE store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.execute(
+                "CREATE TABLE store_columns (table_name TEXT NOT NULL, column_name TEXT NOT NULL, kind TEXT NOT NULL, "
+                "position INTEGER NOT NULL, PRIMARY KEY (table_name, column_name))"
+            )
+            for table in SESSION_STORE_TABLES:
+                self._conn.execute(f"CREATE TABLE {_quote(table)} (row_id INTEGER PRIMARY KEY)")
+            self._conn.execute("INSERT INTO store_meta VALUES ('format', ?)", (json.dumps(SESSION_STORE_FORMAT),))
+
+    def _widen(self, table: str, column: str, kind: str) -> None:
+        old_kind = self._kinds[table][column]
+        # NULL-only columns hold nothing to rewrite, and integer cells already read back as reals.
+        if old_kind != "null" and (old_kind, kind) != ("integer", "real"):
+            cells = self._conn.execute(f"SELECT row_id, {_quote(column)} FROM {_quote(table)} WHERE {_quote(column)} IS NOT NULL").fetchall()
+            self._conn.executemany(
+                f"UPDATE {_quote(table)} SET {_quote(column)} = ? WHERE row_id = ?",
+                [(encode_cell(kind, decode_cell(old_kind, cell)), row_id) for row_id, cell in cells],
+            )
+        self._conn.execute("UPDATE store_columns SET kind = ? WHERE table_name = ? AND column_name = ?", (kind, table, column))
+        self._kinds[table][column] = kind
+
+    def _prepare_columns(self, table: str, rows: list[dict[str, Any]]) -> None:
+        kinds = self._kinds[table]
+        for row in rows:
+            for column, value in row.items():
+                incoming = value_kind(value)
+                if column not in kinds:
+                    # Untyped columns keep each cell's native SQLite type.
+                    self._conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)}")
+                    self._conn.execute("INSERT INTO store_columns VALUES (?, ?, ?, ?)", (table, column, incoming, len(kinds)))
+                    kinds[column] = incoming
+                    continue
+                joined = join_kinds(kinds[column], incoming)
+                if joined != kinds[column]:
+                    self._widen(table, column, joined)
+
+    def append(self, table: str, rows: Iterable[dict[str, Any]]) -> int:
+        if table not in self._kinds:
+            raise ValueError(f"Unknown session store table: {table}")
+        rows = [dict(row) for row in rows]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._prepare_columns(table, rows)
+            kinds = self._kinds[table]
+            for row in rows:
+                columns = list(row)
+                self._conn.execute(
+                    f"INSERT INTO {_quote(table)} ({', '.join(_quote(column) for column in columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                    [encode_cell(kinds[column], row[column]) for column in columns],
+                )
+        return len(rows)
+
+    def set_payload(self, payload: dict[str, Any]) -> None:
+        summary = {key: value for key, value in payload.items() if key != "datapoints"}
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO store_meta VALUES ('payload', ?)", (json.dumps(summary, default=str),))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            # Fold the WAL back so the finished session is a single file.
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "SessionStore":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class SessionStoreReader:
+    """Read-only, memory-mapped view of a session store."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._conn = _connect(self.path, read_only=True)
+        try:
+            store_format = self._meta("format")
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+        if store_format != SESSION_STORE_FORMAT:
+            self._conn.close()
+            raise ValueError(f"{self.path} is not a {SESSION_STORE_FORMAT} session store.")
+
+    def _meta(self, key: str) -> Any:
+        found = self._conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return None if found is None else json.loads(found[0])
+
+    def columns(self, table: str) -> dict[str, str]:
+        """Column name -> kind (``integer``, ``real``, ``text``, ``bool``, ``json``, ``f8``, ``i8``, ``null``).
+
+        Re-read on every call, so a reader opened mid-run sees columns added or widened since.
+        """
+        found = self._conn.execute("SELECT column_name, kind FROM store_columns WHERE table_name = ? ORDER BY position", (table,))
+        return dict(found.fetchall())
+
+    def count(self, table: str) -> int:
+        return int(self._conn.execute(f"SELECT COUNT(*) FROM {_quote(table)}").fetchone()[0])
+
+    def payload(self) -> dict | None:
+        """Session payload recorded at the end of the run (without ``datapoints``), or ``None`` mid-run."""
+        payload = self._meta("payload")
+        return payload if isinstance(payload, dict) else None
+
+    def _select(self, table: str, kinds: dict[str, str], columns: list[str], equals: dict[str, Any] | None) -> Iterator[tuple]:
+        clauses, params = [], []
+        for column, value in dict(equals or {}).items():
+            if column not in kinds:
+                return
+            clauses.append(f"{_quote(column)} = ?")
+            params.append(encode_cell(kinds[column], value))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        selected = ", ".join(_quote(column) for column in columns) or "row_id"
+        yield from self._conn.execute(f"SELECT {selected} FROM {_quote(table)}{where} ORDER BY row_id", params)
+
+    def iter_rows(
+        self,
+        table: str,
+        columns: Iterable[str] | None = None,
+        *,
+        include_samples: bool = True,
+        equals: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield rows in write order with only ``columns`` (default: every column).
+
+        ``include_samples=False`` skips the packed sample-list columns unless they
+        are named in ``columns``; ``equals`` keeps rows whose columns equal the given values.
+        Rows omit keys the table does not have, and keys a row was written without read as ``None``.
+        """
+        kinds = self.columns(table)
+        if columns is None:
+            names = [name for name, kind in kinds.items() if include_samples or kind not in ARRAY_KINDS]
+        else:
+            names = [name for name in columns if name in kinds]
+        for cells in self._select(table, kinds, names, equals):
+            yield {name: decode_cell(kinds[name], cell) for name, cell in zip(names, cells)}
+
+    def column(self, table: str, name: str, *, equals: dict[str, Any] | None = None) -> list[Any]:
+        kinds = self.columns(table)
+        if name not in kinds:
+            return []
+        return [decode_cell(kinds[name], cells[0]) for cells in self._select(table, kinds, [name], equals)]
+
+    def sample_arrays(self, table: str, name: str, *, equals: dict[str, Any] | None = None) -> list:
+        """Per-row sample arrays of a packed column, as zero-copy NumPy views when NumPy is available."""
+        kinds = self.columns(table)
+        kind = kinds.get(name)
+        if kind not in ARRAY_KINDS or np is None:
+            return self.column(table, name, equals=equals)
+        dtype = np.dtype("<f8" if kind == "f8" else "<i8")
+        return [None if cells[0] is None else np.frombuffer(cells[0], dtype=dtype) for cells in self._select(table, kinds, [name], equals)]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SessionStoreReader":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def open_session_store(path: Path | str | None) -> SessionStoreReader | None:
+    """Reader for ``path`` (a store file or a session directory); ``None`` when there is no readable store."""
+    if not path:
+        return None
+    path = Path(path)
+    if path.is_dir():
+        path = path / SESSION_STORE_NAME
+    if not path.is_file():
+        return None
+    try:
+        return SessionStoreReader(path)
+    except (sqlite3.Error, ValueError):
+        return None
+
+
+def load_session_payload(path: Path | str) -> dict | None:
+    """Session payload from a finished store, with ``datapoints`` left to be read from the store."""
+    reader = open_session_store(path)
+    if reader is None:
+        return None
+    with reader:
+        payload = reader.payload()
+    if payload is None:
+        return None
+    payload["datapoints"] = []
+    payload["session_store_path"] = str(reader.path)
+    return payload
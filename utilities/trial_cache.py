@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+# - A trial's measurements can be reused while nothing that could change them
+#   has changed: the solver binary bytes, the input file bytes and the host. The
+#   key hashes exactly those, plus the variant id and the input roles (which
+#   file is the pattern and which the target, say).
+# - The binary hash is the only authority on how a solver was built. Compiler
+#   flags and toolchain changes show up in its bytes; the runner's own build
+#   environment does not describe a binary built elsewhere or earlier, so it is
+#   not part of the key.
+# - Only successful trials are stored; failed and timed-out trials always run
+#   again.
+# - Each key holds a list of samples. Within one session the n-th trial with a
+#   key reuses the n-th stored sample, so iterations over the same dataset inputs
+#   get distinct measurements instead of one sample repeated; trials beyond the
+#   stored samples run and extend the list.
+# - Entries are small JSON files replaced atomically (temp file + os.replace).
+#   Concurrent sessions writing one key race, and the last writer wins.
+# - File digests are memoized by (path, size, mtime_ns) for the lifetime of the
+#   cache object, so binaries and dataset inputs are hashed once per session.
+
+import datetime as dt
+import hashlib
+import json
+import os
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+TRIAL_CACHE_FORMAT = "capstone-trial-cache-v1"
+# Measured trial fields a reused sample carries; everything else describes the current session.
+CACHED_TRIAL_FIELDS = (
+    "runtime_ms",
+    "internal_runtime_ms",
+    "internal_first_solution_ms",
+    "peak_kb",
+    "return_code",
+    "memory_backend",
+    "rusage",
+    "normalized_result",
+    "answer_signature",
+)
+_DIGEST_CHUNK_BYTES = 1 << 20
+
+
+def _sha256(payload: Any) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class TrialCache:
+    """On-disk cache of successful trial measurements.
+
+    ``slot(variant_id, binary_path, inputs)`` returns the ``(key, index)`` a trial
+    occupies in this session, or ``None`` when a binary or input file is missing
+    and the trial cannot be keyed. ``load`` returns the stored sample for a slot,
+    ``store`` records a fresh one. ``context`` (the host fingerprint) is folded
+    into every key.
+    """
+
+    def __init__(self, root: Path, *, context: dict[str, Any]) -> None:
+        self.root = Path(root)
+        self.context_digest = _sha256(context)
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "forced_fresh": 0}
+        self._digests: dict[str, tuple[int, int, str]] = {}
+        self._occurrences: Counter[str] = Counter()
+
+    def entry_path(self, key: str) -> Path:
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def file_digest(self, path: Path) -> str | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        name = os.fspath(path)
+        memo = self._digests.get(name)
+        if memo is not None and memo[:2] == (stat.st_size, stat.st_mtime_ns):
+            return memo[2]
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as fh:
+                while chunk := fh.read(_DIGEST_CHUNK_BYTES):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        self._digests[name] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+        return digest.hexdigest()
+
+    def trial_key(self, variant_id: str, binary_path: Path, inputs: dict[str, Path | str]) -> str | None:
+        binary_digest = self.file_digest(Path(binary_path))
+        if binary_digest is None:
+            return None
+        input_digests: dict[str, str] = {}
+        for role, value in sorted(inputs.items()):
+            if isinstance(value, Path):
+                digest = self.file_digest(value)
+                if digest is None:
+                    return None
+                input_digests[role] = f"sha256:{digest}"
+            else:
+                input_digests[role] = f"value:{value}"
+        return _sha256({
+            "format": TRIAL_CACHE_FORMAT,
+            "variant_id": variant_id,
+            "binary": binary_digest,
+            "context": self.context_digest,
+            "inputs": input_digests,
+        })
+
+    def slot(self, variant_id: str, binary_path: Path, inputs: dict[str, Path | str]) -> tuple[str, int] | None:
+        key = self.trial_key(variant_id, binary_path, inputs)
+        if key is None:
+            return None
+        index = self._occurrences[key]
+        self._occurrences[key] += 1
+        return key, index
+
+    def _read_samples(self, key: str) -> list[dict[str, Any]]:
+        try:
+            entry = json.loads(self.entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        if not isinstance(entry, dict) or entry.get("format") != TRIAL_CACHE_FORMAT:
+            return []
+        return [sample for sample in list(entry.get("samples") or []) if isinstance(sample, dict)]
+
+    def load(self, key: str, index: int) -> dict[str, Any] | None:
+        samples = self._read_samples(key)
+        if index >= len(samples):
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        sample = dict(samples[index])
+        if isinstance(sample.get("answer_signature"), list):
+            sample["answer_signature"] = tuple(sample["answer_signature"])
+        return sample
+
+    def store(self, key: str, index: int, trial: dict[str, Any], *, source: dict[str, Any]) -> None:
+        sample = {field: trial.get(field) for field in CACHED_TRIAL_FIELDS}
+        sample["cached_at_utc"] = dt.datetime.now(dt.timezone.utc).isoformat()
+        sample["source"] = dict(source)
+        samples = self._read_samples(key)
+        if index < len(samples):
+            samples[index] = sample
+        else:
+            samples.append(sample)
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp_path.write_text(json.dumps({"format": TRIAL_CACHE_FORMAT, "key": key, "variant_id": trial.get("variant_id"), "samples": samples}, default=str) + "\n", encoding="utf-8")
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self.stats["stored"] += 1